@@ -8,15 +8,18 @@
 
 # pylint: disable=W0613
 import re
+from typing import List
 
 from pcluster.api.controllers.common import configure_aws_region, convert_errors, validate_cluster, validate_timestamp
 from pcluster.api.errors import BadRequestException
 from pcluster.api.models import (
+    FilteredLogEvent,
     GetClusterLogEventsResponseContent,
     GetClusterStackEventsResponseContent,
     ListClusterLogStreamsResponseContent,
     LogEvent,
     LogStream,
+    SearchClusterLogsResponseContent,
     StackEvent,
 )
 from pcluster.models.cluster import Cluster
@@ -179,3 +182,67 @@ def list_cluster_log_streams(cluster_name, region=None, filters=None, next_token
     log_streams = [convert_log(log) for log in cluster_logs.log_streams]
     next_token = cluster_logs.next_token
     return ListClusterLogStreamsResponseContent(log_streams=log_streams, next_token=next_token)
+
+
+@configure_aws_region()
+@convert_errors()
+def search_cluster_logs(
+    cluster_name,
+    pattern,
+    region: str = None,
+    filters: List[str] = None,
+    start_time: str = None,
+    end_time: str = None,
+    next_token: str = None,
+):
+    """
+    Search the events matching a filter pattern across the log streams of a cluster.
+
+    :param cluster_name: Name of the cluster
+    :type cluster_name: str
+    :param pattern: The CloudWatch Logs filter pattern the log events must match (e.g. &#39;ERROR&#39;).
+    :type pattern: str
+    :param region: Region that the given cluster belongs to.
+    :type region: str
+    :param filters: Filter the log streams to search. Format: (Name&#x3D;a,Values&#x3D;1 Name&#x3D;b,Values&#x3D;2,3).
+    :type filters: List[str]
+    :param start_time: The start of the time range, expressed in ISO 8601 format
+                       (e.g. &#39;2021-01-01T20:00:00Z&#39;). Events with a timestamp equal to this time or later
+                       than this time are included. (Defaults to the creation time of the log group.)
+    :type start_time: str
+    :param end_time: The end of the time range, expressed in ISO 8601 format (e.g. &#39;2021-01-01T20:00:00Z&#39;).
+                     Events with a timestamp equal to or later than this time are not included.
+                     (Defaults to the current time.)
+    :type end_time: str
+    :param next_token: Token to use for paginated requests.
+    :type next_token: str
+
+    :rtype: SearchClusterLogsResponseContent
+    """
+    start_dt = start_time and validate_timestamp(start_time, "start_time")
+    end_dt = end_time and validate_timestamp(end_time, "end_time")
+
+    if start_time and end_time and start_dt >= end_dt:
+        raise BadRequestException("start_time filter must be earlier than end_time filter.")
+
+    accepted_filters = ["private-dns-name", "node-type"]
+    filters = validate_filters(accepted_filters, filters) if filters else None
+    cluster = Cluster(cluster_name)
+    validate_cluster(cluster)
+
+    try:
+        log_events = cluster.search_log_events(
+            filter_pattern=pattern, start_time=start_dt, end_time=end_dt, filters=filters, next_token=next_token
+        )
+    except FiltersParserError as e:
+        raise BadRequestException(str(e))
+
+    def convert_log_event(event):
+        return FilteredLogEvent(
+            timestamp=to_iso_timestr(to_utc_datetime(event["timestamp"])),
+            message=event["message"],
+            log_stream_name=event["logStreamName"],
+        )
+
+    events = [convert_log_event(e) for e in log_events.events]
+    return SearchClusterLogsResponseContent(events=events, next_token=log_events.next_token)
@@ -9,6 +9,9 @@
 # pylint: disable=W0613
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, List
 
 from pcluster.api.controllers.common import (
@@ -22,6 +25,7 @@ from pcluster.api.controllers.common import (
 )
 from pcluster.api.converters import (
     cloud_formation_status_to_cluster_status,
+    cluster_status_to_cloud_formation_statuses,
     validation_results_to_config_validation_errors,
 )
 from pcluster.api.errors import (
@@ -35,6 +39,7 @@ from pcluster.api.models import (
     Change,
     CloudFormationStackStatus,
     ClusterConfigurationStructure,
+    ClusterDescriptionError,
     ClusterInfoSummary,
     ClusterStatus,
     CreateClusterBadRequestExceptionResponseContent,
@@ -42,6 +47,7 @@ from pcluster.api.models import (
     CreateClusterResponseContent,
     DeleteClusterResponseContent,
     DescribeClusterResponseContent,
+    DescribeClustersResponseContent,
     EC2Instance,
     Failure,
     InstanceState,
@@ -56,7 +62,7 @@ from pcluster.api.models import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import StackNotFoundError
+from pcluster.aws.common import AWSClientError, StackNotFoundError
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.models.cluster import (
@@ -67,11 +73,17 @@ from pcluster.models.cluster import (
     NotFoundClusterActionError,
 )
 from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.utils import get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum time in seconds to wait for each of the lookups of DescribeCluster before returning a degraded field
+DESCRIBE_CLUSTER_SUB_QUERY_TIMEOUT = 10
+# Maximum number of concurrent lookups of DescribeClusters
+DESCRIBE_CLUSTERS_CONCURRENCY = 16
+
 
 @convert_errors()
 @http_success_status_code(202)
@@ -212,48 +224,84 @@ def describe_cluster(cluster_name, region=None):
     cluster = Cluster(cluster_name)
     validate_cluster(cluster)
     cfn_stack = cluster.stack
+    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
 
-    fleet_status = cluster.compute_fleet_status
+    # The lookups below only depend on the cluster stack, so they are run concurrently
+    sub_queries = {
+        "fleet_status": (lambda: cluster.compute_fleet_status, ComputeFleetStatus.UNKNOWN),
+        "config_url": (lambda: _get_config_presigned_url(cluster), "NOT_AVAILABLE"),
+        "metadata": (lambda: _get_plugin_metadata(cluster), None),
+        "failures": (
+            lambda: _get_creation_failures(cluster_status, cfn_stack),
+            _get_creation_failures(cluster_status, cfn_stack, failure_reason_available=False),
+        ),
+        "head_node": (lambda: _get_head_node(cluster), None),
+    }
+    results = _run_sub_queries(cluster_name, sub_queries, DESCRIBE_CLUSTER_SUB_QUERY_TIMEOUT)
+
+    return _build_describe_cluster_response(
+        cluster,
+        fleet_status=results["fleet_status"],
+        config_url=results["config_url"],
+        metadata=results["metadata"],
+        failures=results["failures"],
+        head_node=results["head_node"],
+    )
 
-    config_url = "NOT_AVAILABLE"
-    try:
-        config_url = cluster.config_presigned_url
-    except ClusterActionError as e:
-        # Do not fail request when S3 bucket is not available
-        LOGGER.error(e)
 
-    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
-    response = DescribeClusterResponseContent(
-        creation_time=to_utc_datetime(cfn_stack.creation_time),
-        version=cfn_stack.version,
-        cluster_configuration=ClusterConfigurationStructure(url=config_url),
-        tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
-        cloud_formation_stack_status=cfn_stack.status,
-        cluster_name=cluster_name,
-        compute_fleet_status=fleet_status.value,
-        cloudformation_stack_arn=cfn_stack.id,
-        last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
-        region=os.environ.get("AWS_DEFAULT_REGION"),
-        cluster_status=cluster_status,
-        scheduler=Scheduler(type=cluster.stack.scheduler, metadata=cluster.get_plugin_metadata()),
-        failures=_get_creation_failures(cluster_status, cfn_stack),
-    )
+@configure_aws_region()
+@convert_errors()
+def describe_clusters(cluster_names, region=None):
+    """
+    Get detailed information about many existing clusters with a single request.
 
-    try:
-        head_node = cluster.head_node_instance
-        response.head_node = EC2Instance(
-            instance_id=head_node.id,
-            launch_time=to_utc_datetime(head_node.launch_time),
-            public_ip_address=head_node.public_ip,
-            instance_type=head_node.instance_type,
-            state=InstanceState.from_dict(head_node.state),
-            private_ip_address=head_node.private_ip,
-        )
-    except ClusterActionError as e:
-        # This should not be treated as a failure cause head node might not be running in some cases
-        LOGGER.info(e)
+    :param cluster_names: Names of the clusters to describe.
+    :type cluster_names: List[str]
+    :param region: AWS Region that the operation corresponds to.
+    :type region: str
 
-    return response
+    :rtype: DescribeClustersResponseContent
+    """
+    cluster_names = list(dict.fromkeys(cluster_names))
+    # A single listing of the stacks is shared by all the clusters
+    stacks = AWSApi.instance().cfn.describe_root_stacks(cluster_names)
+
+    clusters, errors = [], []
+    for cluster_name in cluster_names:
+        try:
+            clusters.append(_get_listed_cluster(cluster_name, stacks.get(cluster_name)))
+        except (NotFoundException, BadRequestException) as e:
+            errors.append(ClusterDescriptionError(cluster_name=cluster_name, message=e.content.message))
+
+    descriptions = []
+    if clusters:
+        with ThreadPoolExecutor(max_workers=DESCRIBE_CLUSTERS_CONCURRENCY) as executor:
+            # Head nodes and compute fleet statuses are retrieved with batched requests for all the clusters
+            head_nodes = executor.submit(Cluster.get_head_node_instances, clusters)
+            fleet_statuses = executor.submit(Cluster.get_compute_fleet_statuses, clusters)
+            details = [executor.submit(_get_cluster_details, cluster) for cluster in clusters]
+            # Do not fail the description of the clusters if the batched requests fail
+            head_nodes = _get_batched_result(head_nodes, "head nodes")
+            fleet_statuses = _get_batched_result(fleet_statuses, "compute fleet statuses")
+            for cluster, cluster_details in zip(clusters, details):
+                try:
+                    config_url, metadata, failures = cluster_details.result()
+                except (AWSClientError, ClusterActionError) as e:
+                    errors.append(ClusterDescriptionError(cluster_name=cluster.name, message=str(e)))
+                    continue
+                head_node = head_nodes.get(cluster.name)
+                descriptions.append(
+                    _build_describe_cluster_response(
+                        cluster,
+                        fleet_status=fleet_statuses.get(cluster.name, ComputeFleetStatus.UNKNOWN),
+                        config_url=config_url,
+                        metadata=metadata,
+                        failures=failures,
+                        head_node=_to_ec2_instance(head_node) if head_node else None,
+                    )
+                )
+
+    return DescribeClustersResponseContent(clusters=descriptions, errors=errors)
 
 
 @configure_aws_region()
@@ -271,7 +319,11 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
 
     :rtype: ListClustersResponseContent
     """
-    stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+    # Filter the stacks by status server-side, the filter is applied again below to the mapped cluster status
+    stack_statuses = cluster_status_to_cloud_formation_statuses(cluster_status) if cluster_status else None
+    stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(
+        next_token=next_token, stack_statuses=stack_statuses
+    )
     stacks = [ClusterStack(stack) for stack in stacks]
 
     clusters = []
@@ -447,9 +499,121 @@ def _create_message(failure_reason, action_needed):
     return message or "Error during update"
 
 
-def _get_creation_failures(cluster_status, cfn_stack):
+def _build_describe_cluster_response(cluster, fleet_status, config_url, metadata, failures, head_node):
+    cfn_stack = cluster.stack
+    response = DescribeClusterResponseContent(
+        creation_time=to_utc_datetime(cfn_stack.creation_time),
+        version=cfn_stack.version,
+        cluster_configuration=ClusterConfigurationStructure(url=config_url),
+        tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
+        cloud_formation_stack_status=cfn_stack.status,
+        cluster_name=cluster.name,
+        compute_fleet_status=fleet_status.value,
+        cloudformation_stack_arn=cfn_stack.id,
+        last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
+        region=os.environ.get("AWS_DEFAULT_REGION"),
+        cluster_status=cloud_formation_status_to_cluster_status(cfn_stack.status),
+        scheduler=Scheduler(type=cfn_stack.scheduler, metadata=metadata),
+        failures=failures,
+    )
+    if head_node:
+        response.head_node = head_node
+    return response
+
+
+def _get_listed_cluster(cluster_name, stack):
+    """Return the cluster of the given stack, raising the errors of DescribeCluster for invalid clusters."""
+    if not stack:
+        raise NotFoundException(
+            f"Cluster '{cluster_name}' does not exist or belongs to an incompatible ParallelCluster major version."
+        )
+    cluster = Cluster(cluster_name, stack=ClusterStack(stack))
+    validate_cluster(cluster)
+    return cluster
+
+
+def _get_cluster_details(cluster):
+    """Return the configuration URL, the scheduler metadata and the creation failures of the given cluster."""
+    cluster_status = cloud_formation_status_to_cluster_status(cluster.stack.status)
+    return (
+        _get_config_presigned_url(cluster),
+        _get_plugin_metadata(cluster),
+        _get_creation_failures(cluster_status, cluster.stack),
+    )
+
+
+def _to_ec2_instance(instance):
+    return EC2Instance(
+        instance_id=instance.id,
+        launch_time=to_utc_datetime(instance.launch_time),
+        public_ip_address=instance.public_ip,
+        instance_type=instance.instance_type,
+        state=InstanceState.from_dict(instance.state),
+        private_ip_address=instance.private_ip,
+    )
+
+
+def _run_sub_queries(cluster_name, sub_queries, timeout):
+    """
+    Run the given independent lookups concurrently and return their results by name.
+
+    :param sub_queries: dict of name -> (function, value to return if the function does not complete within timeout)
+    Errors raised by the lookups are propagated.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(sub_queries))
+    try:
+        futures = {name: executor.submit(query) for name, (query, _) in sub_queries.items()}
+        deadline = time.monotonic() + timeout
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                LOGGER.warning("Timed out retrieving %s of cluster %s", name, cluster_name)
+                results[name] = sub_queries[name][1]
+        return results
+    finally:
+        # Do not wait for the lookups that timed out
+        executor.shutdown(wait=False)
+
+
+def _get_batched_result(future, description):
+    """Return the result of a lookup shared by many clusters, an empty dict if it failed."""
+    try:
+        return future.result()
+    except (AWSClientError, ClusterActionError) as e:
+        LOGGER.error("Failed to retrieve the %s of the clusters: %s", description, e)
+        return {}
+
+
+def _get_config_presigned_url(cluster):
+    try:
+        return cluster.config_presigned_url
+    except ClusterActionError as e:
+        # Do not fail request when S3 bucket is not available
+        LOGGER.error(e)
+        return "NOT_AVAILABLE"
+
+
+def _get_plugin_metadata(cluster):
+    # Only plugin clusters have metadata, do not download the cluster configuration for the other schedulers
+    return cluster.get_plugin_metadata() if cluster.stack.scheduler == "plugin" else None
+
+
+def _get_head_node(cluster):
+    try:
+        return _to_ec2_instance(cluster.head_node_instance)
+    except ClusterActionError as e:
+        # This should not be treated as a failure cause head node might not be running in some cases
+        LOGGER.info(e)
+        return None
+
+
+def _get_creation_failures(cluster_status, cfn_stack, failure_reason_available=True):
     """Get a list of Failure objects containing failure code and reason when cluster creation failed."""
     if cluster_status != ClusterStatus.CREATE_FAILED:
         return None
+    if not failure_reason_available:
+        return [Failure(failure_code="ClusterCreationFailure", failure_reason="Failed to create the cluster.")]
     failure_code, failure_reason = cfn_stack.get_cluster_creation_failure()
     return [Failure(failure_code=failure_code, failure_reason=failure_reason)]
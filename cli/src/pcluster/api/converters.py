@@ -10,6 +10,7 @@ from typing import List
 from pcluster.api.models import CloudFormationStackStatus, ClusterStatus, ConfigValidationMessage, ImageBuildStatus
 from pcluster.api.models import NodeType as ApiNodeType
 from pcluster.api.models import ValidationLevel
+from pcluster.aws.cfn import STACK_STATUSES_WITHOUT_DELETED
 from pcluster.models.cluster import NodeType
 from pcluster.validators.common import ValidationResult
 
@@ -28,6 +29,15 @@ def cloud_formation_status_to_cluster_status(cfn_status):
     return mapping.get(cfn_status, cfn_status)
 
 
+def cluster_status_to_cloud_formation_statuses(cluster_statuses):
+    """Return the statuses of the stacks of the clusters in the given statuses."""
+    return [
+        cfn_status
+        for cfn_status in STACK_STATUSES_WITHOUT_DELETED
+        if cloud_formation_status_to_cluster_status(cfn_status) in cluster_statuses
+    ]
+
+
 def cloud_formation_status_to_image_status(cfn_status):
     mapping = {
         CloudFormationStackStatus.CREATE_IN_PROGRESS: ImageBuildStatus.BUILD_IN_PROGRESS,
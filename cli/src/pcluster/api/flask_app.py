@@ -93,9 +93,11 @@ class ParallelClusterFlaskApp:
 
         @self.flask_app.before_request
         def _clear_cache():
-            # Cache is meant to be reused only within a single request
-            Cache.clear_all()
-            AWSApi.reset()
+            # AWS clients and cached results with a time to live are reused across requests,
+            # the other cached results are meant to be reused only within a single request.
+            # Only the instance serving this request is cleared, the other ones may be in use by concurrent requests
+            Cache.clear_without_ttl()
+            AWSApi.instance().clear_caches()
 
         @self.flask_app.before_request
         def _log_request():  # pylint: disable=unused-variable
@@ -22,6 +22,7 @@ from pcluster.api.models.build_image_response_content import BuildImageResponseC
 from pcluster.api.models.change import Change
 from pcluster.api.models.cloud_formation_stack_status import CloudFormationStackStatus
 from pcluster.api.models.cluster_configuration_structure import ClusterConfigurationStructure
+from pcluster.api.models.cluster_description_error import ClusterDescriptionError
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
 from pcluster.api.models.cluster_instance import ClusterInstance
 from pcluster.api.models.cluster_status import ClusterStatus
@@ -38,6 +39,7 @@ from pcluster.api.models.delete_cluster_response_content import DeleteClusterRes
 from pcluster.api.models.delete_image_response_content import DeleteImageResponseContent
 from pcluster.api.models.describe_cluster_instances_response_content import DescribeClusterInstancesResponseContent
 from pcluster.api.models.describe_cluster_response_content import DescribeClusterResponseContent
+from pcluster.api.models.describe_clusters_response_content import DescribeClustersResponseContent
 from pcluster.api.models.describe_compute_fleet_response_content import DescribeComputeFleetResponseContent
 from pcluster.api.models.describe_image_response_content import DescribeImageResponseContent
 from pcluster.api.models.dryrun_operation_exception_response_content import DryrunOperationExceptionResponseContent
@@ -46,6 +48,7 @@ from pcluster.api.models.ec2_ami_info_summary import Ec2AmiInfoSummary
 from pcluster.api.models.ec2_ami_state import Ec2AmiState
 from pcluster.api.models.ec2_instance import EC2Instance
 from pcluster.api.models.failure import Failure
+from pcluster.api.models.filtered_log_event import FilteredLogEvent
 from pcluster.api.models.get_cluster_log_events_response_content import GetClusterLogEventsResponseContent
 from pcluster.api.models.get_cluster_stack_events_response_content import GetClusterStackEventsResponseContent
 from pcluster.api.models.get_image_log_events_response_content import GetImageLogEventsResponseContent
@@ -70,6 +73,7 @@ from pcluster.api.models.node_type import NodeType
 from pcluster.api.models.not_found_exception_response_content import NotFoundExceptionResponseContent
 from pcluster.api.models.requested_compute_fleet_status import RequestedComputeFleetStatus
 from pcluster.api.models.scheduler import Scheduler
+from pcluster.api.models.search_cluster_logs_response_content import SearchClusterLogsResponseContent
 from pcluster.api.models.stack_event import StackEvent
 from pcluster.api.models.tag import Tag
 from pcluster.api.models.unauthorized_client_error_response_content import UnauthorizedClientErrorResponseContent
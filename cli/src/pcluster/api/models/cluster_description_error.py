@@ -0,0 +1,97 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import re
+from datetime import date, datetime  # noqa: F401
+from typing import Dict, List  # noqa: F401
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class ClusterDescriptionError(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, cluster_name=None, message=None):  # noqa: E501
+        """ClusterDescriptionError - a model defined in OpenAPI
+
+        :param cluster_name: The cluster_name of this ClusterDescriptionError.  # noqa: E501
+        :type cluster_name: str
+        :param message: The message of this ClusterDescriptionError.  # noqa: E501
+        :type message: str
+        """
+        self.openapi_types = {"cluster_name": str, "message": str}
+
+        self.attribute_map = {"cluster_name": "clusterName", "message": "message"}
+
+        self._cluster_name = cluster_name
+        self._message = message
+
+    @classmethod
+    def from_dict(cls, dikt) -> "ClusterDescriptionError":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The ClusterDescriptionError of this ClusterDescriptionError.  # noqa: E501
+        :rtype: ClusterDescriptionError
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def cluster_name(self):
+        """Gets the cluster_name of this ClusterDescriptionError.
+
+        Name of the cluster.  # noqa: E501
+
+        :return: The cluster_name of this ClusterDescriptionError.
+        :rtype: str
+        """
+        return self._cluster_name
+
+    @cluster_name.setter
+    def cluster_name(self, cluster_name):
+        """Sets the cluster_name of this ClusterDescriptionError.
+
+        Name of the cluster.  # noqa: E501
+
+        :param cluster_name: The cluster_name of this ClusterDescriptionError.
+        :type cluster_name: str
+        """
+        if cluster_name is None:
+            raise ValueError("Invalid value for `cluster_name`, must not be `None`")  # noqa: E501
+        if cluster_name is not None and not re.search(r"^[a-zA-Z][a-zA-Z0-9-]+$", cluster_name):  # noqa: E501
+            raise ValueError(
+                "Invalid value for `cluster_name`, must be a follow pattern or equal to `/^[a-zA-Z][a-zA-Z0-9-]+$/`"
+            )  # noqa: E501
+
+        self._cluster_name = cluster_name
+
+    @property
+    def message(self):
+        """Gets the message of this ClusterDescriptionError.
+
+        Reason why the cluster could not be described.  # noqa: E501
+
+        :return: The message of this ClusterDescriptionError.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        """Sets the message of this ClusterDescriptionError.
+
+        Reason why the cluster could not be described.  # noqa: E501
+
+        :param message: The message of this ClusterDescriptionError.
+        :type message: str
+        """
+        if message is None:
+            raise ValueError("Invalid value for `message`, must not be `None`")  # noqa: E501
+
+        self._message = message
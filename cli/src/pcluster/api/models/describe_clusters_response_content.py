@@ -0,0 +1,92 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+from datetime import date, datetime  # noqa: F401
+from typing import Dict, List  # noqa: F401
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.cluster_description_error import ClusterDescriptionError  # noqa: E501
+from pcluster.api.models.describe_cluster_response_content import DescribeClusterResponseContent  # noqa: E501
+
+
+class DescribeClustersResponseContent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, clusters=None, errors=None):  # noqa: E501
+        """DescribeClustersResponseContent - a model defined in OpenAPI
+
+        :param clusters: The clusters of this DescribeClustersResponseContent.  # noqa: E501
+        :type clusters: List[DescribeClusterResponseContent]
+        :param errors: The errors of this DescribeClustersResponseContent.  # noqa: E501
+        :type errors: List[ClusterDescriptionError]
+        """
+        self.openapi_types = {"clusters": List[DescribeClusterResponseContent], "errors": List[ClusterDescriptionError]}
+
+        self.attribute_map = {"clusters": "clusters", "errors": "errors"}
+
+        self._clusters = clusters
+        self._errors = errors
+
+    @classmethod
+    def from_dict(cls, dikt) -> "DescribeClustersResponseContent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The DescribeClustersResponseContent of this DescribeClustersResponseContent.  # noqa: E501
+        :rtype: DescribeClustersResponseContent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def clusters(self):
+        """Gets the clusters of this DescribeClustersResponseContent.
+
+        Detailed information about the clusters that were found.  # noqa: E501
+
+        :return: The clusters of this DescribeClustersResponseContent.
+        :rtype: List[DescribeClusterResponseContent]
+        """
+        return self._clusters
+
+    @clusters.setter
+    def clusters(self, clusters):
+        """Sets the clusters of this DescribeClustersResponseContent.
+
+        Detailed information about the clusters that were found.  # noqa: E501
+
+        :param clusters: The clusters of this DescribeClustersResponseContent.
+        :type clusters: List[DescribeClusterResponseContent]
+        """
+        if clusters is None:
+            raise ValueError("Invalid value for `clusters`, must not be `None`")  # noqa: E501
+
+        self._clusters = clusters
+
+    @property
+    def errors(self):
+        """Gets the errors of this DescribeClustersResponseContent.
+
+        Clusters that could not be described, with the reason.  # noqa: E501
+
+        :return: The errors of this DescribeClustersResponseContent.
+        :rtype: List[ClusterDescriptionError]
+        """
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors):
+        """Sets the errors of this DescribeClustersResponseContent.
+
+        Clusters that could not be described, with the reason.  # noqa: E501
+
+        :param errors: The errors of this DescribeClustersResponseContent.
+        :type errors: List[ClusterDescriptionError]
+        """
+
+        self._errors = errors
@@ -0,0 +1,116 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+from datetime import date, datetime  # noqa: F401
+from typing import Dict, List  # noqa: F401
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+
+
+class FilteredLogEvent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, timestamp=None, message=None, log_stream_name=None):  # noqa: E501
+        """FilteredLogEvent - a model defined in OpenAPI
+
+        :param timestamp: The timestamp of this FilteredLogEvent.  # noqa: E501
+        :type timestamp: datetime
+        :param message: The message of this FilteredLogEvent.  # noqa: E501
+        :type message: str
+        :param log_stream_name: The log_stream_name of this FilteredLogEvent.  # noqa: E501
+        :type log_stream_name: str
+        """
+        self.openapi_types = {"timestamp": datetime, "message": str, "log_stream_name": str}
+
+        self.attribute_map = {"timestamp": "timestamp", "message": "message", "log_stream_name": "logStreamName"}
+
+        self._timestamp = timestamp
+        self._message = message
+        self._log_stream_name = log_stream_name
+
+    @classmethod
+    def from_dict(cls, dikt) -> "FilteredLogEvent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The FilteredLogEvent of this FilteredLogEvent.  # noqa: E501
+        :rtype: FilteredLogEvent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def timestamp(self):
+        """Gets the timestamp of this FilteredLogEvent.
+
+
+        :return: The timestamp of this FilteredLogEvent.
+        :rtype: datetime
+        """
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, timestamp):
+        """Sets the timestamp of this FilteredLogEvent.
+
+
+        :param timestamp: The timestamp of this FilteredLogEvent.
+        :type timestamp: datetime
+        """
+        if timestamp is None:
+            raise ValueError("Invalid value for `timestamp`, must not be `None`")  # noqa: E501
+
+        self._timestamp = timestamp
+
+    @property
+    def message(self):
+        """Gets the message of this FilteredLogEvent.
+
+
+        :return: The message of this FilteredLogEvent.
+        :rtype: str
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        """Sets the message of this FilteredLogEvent.
+
+
+        :param message: The message of this FilteredLogEvent.
+        :type message: str
+        """
+        if message is None:
+            raise ValueError("Invalid value for `message`, must not be `None`")  # noqa: E501
+
+        self._message = message
+
+    @property
+    def log_stream_name(self):
+        """Gets the log_stream_name of this FilteredLogEvent.
+
+        Name of the log stream the event belongs to.  # noqa: E501
+
+        :return: The log_stream_name of this FilteredLogEvent.
+        :rtype: str
+        """
+        return self._log_stream_name
+
+    @log_stream_name.setter
+    def log_stream_name(self, log_stream_name):
+        """Sets the log_stream_name of this FilteredLogEvent.
+
+        Name of the log stream the event belongs to.  # noqa: E501
+
+        :param log_stream_name: The log_stream_name of this FilteredLogEvent.
+        :type log_stream_name: str
+        """
+        if log_stream_name is None:
+            raise ValueError("Invalid value for `log_stream_name`, must not be `None`")  # noqa: E501
+
+        self._log_stream_name = log_stream_name
@@ -0,0 +1,91 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+from datetime import date, datetime  # noqa: F401
+from typing import Dict, List  # noqa: F401
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.filtered_log_event import FilteredLogEvent  # noqa: E501
+
+
+class SearchClusterLogsResponseContent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, next_token=None, events=None):  # noqa: E501
+        """SearchClusterLogsResponseContent - a model defined in OpenAPI
+
+        :param next_token: The next_token of this SearchClusterLogsResponseContent.  # noqa: E501
+        :type next_token: str
+        :param events: The events of this SearchClusterLogsResponseContent.  # noqa: E501
+        :type events: List[FilteredLogEvent]
+        """
+        self.openapi_types = {"next_token": str, "events": List[FilteredLogEvent]}
+
+        self.attribute_map = {"next_token": "nextToken", "events": "events"}
+
+        self._next_token = next_token
+        self._events = events
+
+    @classmethod
+    def from_dict(cls, dikt) -> "SearchClusterLogsResponseContent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The SearchClusterLogsResponseContent of this SearchClusterLogsResponseContent.  # noqa: E501
+        :rtype: SearchClusterLogsResponseContent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def next_token(self):
+        """Gets the next_token of this SearchClusterLogsResponseContent.
+
+        Token to use for paginated requests.  # noqa: E501
+
+        :return: The next_token of this SearchClusterLogsResponseContent.
+        :rtype: str
+        """
+        return self._next_token
+
+    @next_token.setter
+    def next_token(self, next_token):
+        """Sets the next_token of this SearchClusterLogsResponseContent.
+
+        Token to use for paginated requests.  # noqa: E501
+
+        :param next_token: The next_token of this SearchClusterLogsResponseContent.
+        :type next_token: str
+        """
+
+        self._next_token = next_token
+
+    @property
+    def events(self):
+        """Gets the events of this SearchClusterLogsResponseContent.
+
+        The matching log events, sorted by timestamp.  # noqa: E501
+
+        :return: The events of this SearchClusterLogsResponseContent.
+        :rtype: List[FilteredLogEvent]
+        """
+        return self._events
+
+    @events.setter
+    def events(self, events):
+        """Sets the events of this SearchClusterLogsResponseContent.
+
+        The matching log events, sorted by timestamp.  # noqa: E501
+
+        :param events: The events of this SearchClusterLogsResponseContent.
+        :type events: List[FilteredLogEvent]
+        """
+        if events is None:
+            raise ValueError("Invalid value for `events`, must not be `None`")  # noqa: E501
+
+        self._events = events
@@ -8,10 +8,14 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 
 from pcluster.aws.batch import BatchClient
 from pcluster.aws.cfn import CfnClient
+from pcluster.aws.common import create_boto3_session
 from pcluster.aws.dynamo import DynamoResource
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.aws.efs import EfsClient
@@ -28,20 +32,38 @@ from pcluster.aws.secretsmanager import SecretsManagerClient
 from pcluster.aws.ssm import SsmClient
 from pcluster.aws.sts import StsClient
 
+# Maximum number of AWSApi instances kept in the pool, the least recently used ones are discarded first
+MAX_POOLED_INSTANCES = 16
+
+
+def credentials_fingerprint():
+    """Return a digest identifying the credentials configured through the environment."""
+    credentials = "|".join(
+        os.environ.get(variable, "")
+        for variable in ("AWS_PROFILE", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN")
+    )
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
 
 class AWSApi:
     """
     Proxy class for all AWS API clients used in the CLI.
 
-    A singleton instance can be retrieved from everywhere in the code by calling AWSApi.instance().
-    Specific API client wrappers are provided through properties of this instance; for instance AWSApi.instance().ec2
-    will return the client wrapper for EC2 service.
+    An instance for the current region and credentials can be retrieved from everywhere in the code by calling
+    AWSApi.instance(). Specific API client wrappers are provided through properties of this instance; for instance
+    AWSApi.instance().ec2 will return the client wrapper for EC2 service.
+    Instances are kept in a thread-safe pool keyed by region and credentials, so that the client wrappers, together
+    with their connection pools and caches, are reused when switching back to a region, e.g. across API requests.
     """
 
-    _instance = None
+    _instances = OrderedDict()
+    _lock = threading.Lock()
 
-    def __init__(self):
-        self.aws_region = os.environ.get("AWS_DEFAULT_REGION")
+    def __init__(self, region: str = None):
+        self.aws_region = region or os.environ.get("AWS_DEFAULT_REGION")
+        self._clients_lock = threading.RLock()
+        # boto3 sessions are not thread safe, each instance creates its clients from its own session
+        self._session = None
 
         self._batch = None
         self._cfn = None
@@ -62,133 +84,140 @@ class AWSApi:
         self._ssm = None
         self._resource_groups = None
 
+    def _get_client(self, attribute: str, factory):
+        """Return the client wrapper stored in the given attribute, creating it on first use."""
+        client = getattr(self, attribute)
+        if not client:
+            with self._clients_lock:
+                client = getattr(self, attribute)
+                if not client:
+                    if not self._session:
+                        self._session = create_boto3_session()
+                    client = factory()
+                    setattr(self, attribute, client)
+        return client
+
     @property
     def cfn(self):
         """CloudFormation client."""  # noqa: D403
-        if not self._cfn:
-            self._cfn = CfnClient()
-        return self._cfn
+        return self._get_client("_cfn", lambda: CfnClient(region=self.aws_region, session=self._session))
 
     @property
     def batch(self):
         """AWS Batch client."""
-        if not self._batch:
-            self._batch = BatchClient()
-        return self._batch
+        return self._get_client("_batch", lambda: BatchClient(region=self.aws_region, session=self._session))
 
     @property
     def ec2(self):
         """EC2 client."""
-        if not self._ec2:
-            self._ec2 = Ec2Client()
-        return self._ec2
+        return self._get_client("_ec2", lambda: Ec2Client(region=self.aws_region, session=self._session))
 
     @property
     def efs(self):
         """EFS client."""
-        if not self._efs:
-            self._efs = EfsClient(ec2_client=self.ec2)
-        return self._efs
+        return self._get_client(
+            "_efs", lambda: EfsClient(ec2_client=self.ec2, region=self.aws_region, session=self._session)
+        )
 
     @property
     def fsx(self):
         """FSX client."""
-        if not self._fsx:
-            self._fsx = FSxClient()
-        return self._fsx
+        return self._get_client("_fsx", lambda: FSxClient(region=self.aws_region, session=self._session))
 
     @property
     def s3(self):  # pylint: disable=C0103
         """S3 client."""
-        if not self._s3:
-            self._s3 = S3Client()
-        return self._s3
+        return self._get_client("_s3", lambda: S3Client(region=self.aws_region, session=self._session))
 
     @property
     def kms(self):
         """KMS client."""
-        if not self._kms:
-            self._kms = KmsClient()
-        return self._kms
+        return self._get_client("_kms", lambda: KmsClient(region=self.aws_region, session=self._session))
 
     @property
     def imagebuilder(self):
         """ImageBuilder client."""  # noqa: D403
-        if not self._imagebuilder:
-            self._imagebuilder = ImageBuilderClient()
-        return self._imagebuilder
+        return self._get_client(
+            "_imagebuilder", lambda: ImageBuilderClient(region=self.aws_region, session=self._session)
+        )
 
     @property
     def sts(self):
         """STS client."""
-        if not self._sts:
-            self._sts = StsClient()
-        return self._sts
+        return self._get_client("_sts", lambda: StsClient(region=self.aws_region, session=self._session))
 
     @property
     def s3_resource(self):
         """S3Resource client."""
-        if not self._s3_resource:
-            self._s3_resource = S3Resource()
-        return self._s3_resource
+        return self._get_client("_s3_resource", lambda: S3Resource(region=self.aws_region, session=self._session))
 
     @property
     def iam(self):
         """IAM client."""
-        if not self._iam:
-            self._iam = IamClient()
-        return self._iam
+        return self._get_client("_iam", lambda: IamClient(region=self.aws_region, session=self._session))
 
     @property
     def ddb_resource(self):
         """DynamoResource client."""  # noqa: D403
-        if not self._ddb_resource:
-            self._ddb_resource = DynamoResource()
-        return self._ddb_resource
+        return self._get_client("_ddb_resource", lambda: DynamoResource(region=self.aws_region, session=self._session))
 
     @property
     def logs(self):
         """Log client."""
-        if not self._logs:
-            self._logs = LogsClient()
-        return self._logs
+        return self._get_client("_logs", lambda: LogsClient(region=self.aws_region, session=self._session))
 
     @property
     def route53(self):
         """Route53 client."""
-        if not self._route53:
-            self._route53 = Route53Client()
-        return self._route53
+        return self._get_client("_route53", lambda: Route53Client(region=self.aws_region, session=self._session))
 
     @property
     def secretsmanager(self):
         """Secrets Manager client."""
-        if not self._secretsmanager:
-            self._secretsmanager = SecretsManagerClient()
-        return self._secretsmanager
+        return self._get_client(
+            "_secretsmanager", lambda: SecretsManagerClient(region=self.aws_region, session=self._session)
+        )
 
     @property
     def ssm(self):
         """SSM client."""
-        if not self._ssm:
-            self._ssm = SsmClient()
-        return self._ssm
+        return self._get_client("_ssm", lambda: SsmClient(region=self.aws_region, session=self._session))
 
     @property
     def resource_groups(self):
         """Resource Groups client."""
-        if not self._resource_groups:
-            self._resource_groups = ResourceGroupsClient()
-        return self._resource_groups
+        return self._get_client(
+            "_resource_groups", lambda: ResourceGroupsClient(region=self.aws_region, session=self._session)
+        )
+
+    def clear_caches(self):
+        """Clear the resources cached by the client wrappers created so far."""
+        for client in list(vars(self).values()):
+            if hasattr(client, "clear_cache"):
+                client.clear_cache()
 
     @staticmethod
     def instance():
-        """Return the singleton AWSApi instance."""
-        if not AWSApi._instance or AWSApi._instance.aws_region != os.environ.get("AWS_DEFAULT_REGION"):
-            AWSApi._instance = AWSApi()
-        return AWSApi._instance
+        """Return the AWSApi instance for the current region and credentials."""
+        key = (os.environ.get("AWS_DEFAULT_REGION"), credentials_fingerprint())
+        with AWSApi._lock:
+            instance = AWSApi._instances.get(key)
+            if instance:
+                AWSApi._instances.move_to_end(key)
+            else:
+                instance = AWSApi._instances[key] = AWSApi(region=key[0])
+                if len(AWSApi._instances) > MAX_POOLED_INSTANCES:
+                    AWSApi._instances.popitem(last=False)
+            return instance
+
+    @staticmethod
+    def instances():
+        """Return the pooled AWSApi instances."""
+        with AWSApi._lock:
+            return list(AWSApi._instances.values())
 
     @staticmethod
     def reset():
-        """Reset the instance to clear all caches."""
-        AWSApi._instance = None
+        """Reset the pool of instances to clear all caches."""
+        with AWSApi._lock:
+            AWSApi._instances = OrderedDict()
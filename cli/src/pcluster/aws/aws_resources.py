@@ -112,6 +112,8 @@ class StackInfo:
 class InstanceInfo:
     """Object to store Instance information, initialized with a describe_instances call."""
 
+    __slots__ = ("_instance_data", "_tags")
+
     def __init__(self, instance_data: dict):
         self._instance_data = instance_data
         self._tags = self._instance_data.get("Tags", [])
@@ -11,6 +11,7 @@
 import logging
 import re
 
+from boto3.session import Session
 from botocore.exceptions import ClientError, EndpointConnectionError
 
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client, get_region
@@ -21,8 +22,8 @@ LOGGER = logging.getLogger(__name__)
 class BatchClient(Boto3Client):
     """Batch Boto3 client."""
 
-    def __init__(self):
-        super().__init__("batch")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("batch", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def enable_compute_environment(self, ce_name: str, min_vcpus: int, max_vcpus: int, desired_vcpus: int):
@@ -10,22 +10,54 @@
 # limitations under the License.
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
+from boto3.session import Session
 from botocore.exceptions import ClientError
 
 from pcluster.aws.aws_resources import StackInfo
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, StackNotFoundError
+from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache, StackNotFoundError
 from pcluster.constants import PCLUSTER_IMAGE_ID_TAG, PCLUSTER_VERSION_TAG
 from pcluster.utils import remove_none_values
 
 LOGGER = logging.getLogger(__name__)
 
+# All the statuses of the stacks but DELETE_COMPLETE, since deleted stacks are not listed by describe_stacks either
+STACK_STATUSES_WITHOUT_DELETED = [
+    "CREATE_IN_PROGRESS",
+    "CREATE_FAILED",
+    "CREATE_COMPLETE",
+    "ROLLBACK_IN_PROGRESS",
+    "ROLLBACK_FAILED",
+    "ROLLBACK_COMPLETE",
+    "DELETE_IN_PROGRESS",
+    "DELETE_FAILED",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_IN_PROGRESS",
+    "UPDATE_ROLLBACK_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "REVIEW_IN_PROGRESS",
+    "IMPORT_IN_PROGRESS",
+    "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_IN_PROGRESS",
+    "IMPORT_ROLLBACK_FAILED",
+    "IMPORT_ROLLBACK_COMPLETE",
+]
+# Time to live of the index of the root stacks that are clusters
+STACK_INDEX_TTL = 10 * 60
+LIST_STACKS_DESCRIBE_CONCURRENCY = 8
+
 
 class CfnClient(Boto3Client):
     """Implement CFN Boto3 client."""
 
-    def __init__(self):
-        super().__init__("cloudformation")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("cloudformation", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def create_stack(
@@ -113,6 +145,23 @@ class CfnClient(Boto3Client):
                 raise StackNotFoundError(function_name="describe_stack", stack_name=stack_name)
             raise
 
+    @AWSExceptionHandler.handle_client_exception
+    def describe_root_stacks(self, stack_names: List[str]):
+        """
+        Return the root stacks with the given names, indexed by name.
+
+        All the stacks are retrieved with a single paginated listing, stopped as soon as all the stacks are found.
+        """
+        remaining_names = set(stack_names)
+        stacks = {}
+        for stack in self._paginate_results(self._client.describe_stacks):
+            if stack.get("StackName") in remaining_names and stack.get("ParentId") is None:
+                stacks[stack["StackName"]] = stack
+                remaining_names.discard(stack["StackName"])
+                if not remaining_names:
+                    break
+        return stacks
+
     @AWSExceptionHandler.handle_client_exception
     @AWSExceptionHandler.retry_on_boto3_throttling
     def get_stack_events(self, stack_name, next_token=None):
@@ -147,11 +196,53 @@ class CfnClient(Boto3Client):
         return self._client.get_template(StackName=stack_name).get("TemplateBody")
 
     @AWSExceptionHandler.handle_client_exception
-    def list_pcluster_stacks(self, next_token=None):
-        """List existing pcluster cluster stacks."""
-        stacks, result_token = self._list_parentless_stacks_with_tag(PCLUSTER_VERSION_TAG, next_token)
-        # Only return stacks without image-id tag, which means they are cluster stacks.
-        return [stack for stack in stacks if StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG) is None], result_token
+    def list_pcluster_stacks(self, next_token=None, stack_statuses=None):
+        """
+        List existing pcluster cluster stacks, optionally only the ones in the given statuses.
+
+        The stacks are listed by list_stacks, that filters them by status server-side and tells nested stacks apart.
+        Only the root stacks are described, concurrently, to retrieve their tags.
+        """
+        list_stacks_kwargs = {"StackStatusFilter": stack_statuses or STACK_STATUSES_WITHOUT_DELETED}
+        if next_token:
+            list_stacks_kwargs["NextToken"] = next_token
+
+        result = self._client.list_stacks(**list_stacks_kwargs)
+        root_stacks = [summary for summary in result.get("StackSummaries", []) if summary.get("ParentId") is None]
+        with ThreadPoolExecutor(max_workers=LIST_STACKS_DESCRIBE_CONCURRENCY) as executor:
+            stacks = executor.map(
+                lambda summary: self._describe_cluster_stack(summary["StackId"], self._stack_version(summary)),
+                root_stacks,
+            )
+            return [stack for stack in stacks if stack], result.get("NextToken")
+
+    @staticmethod
+    def _stack_version(stack_summary):
+        """Return a string identifying the state of a stack, which changes every time the stack is updated."""
+        last_update = stack_summary.get("LastUpdatedTime") or stack_summary.get("CreationTime")
+        return f"{stack_summary.get('StackStatus')}/{last_update.isoformat() if last_update else ''}"
+
+    @Cache.cached(ttl=STACK_INDEX_TTL, persistent=True)
+    @AWSExceptionHandler.retry_on_boto3_throttling
+    def _describe_cluster_stack(self, stack_id: str, stack_version: str):
+        """
+        Return the given root stack if it is a cluster stack, None otherwise.
+
+        Results are cached by stack version, so that every stack is described again only when it changes. The stacks
+        that are not clusters, which can be serialized, are also stored in the persistent cache.
+        """
+        try:
+            stack = self._client.describe_stacks(StackName=stack_id).get("Stacks")[0]
+        except ClientError as e:
+            if e.response["Error"]["Code"] == AWSClientError.ErrorCode.VALIDATION_ERROR.value:
+                LOGGER.debug("Stack %s deleted while listing the clusters: %s", stack_id, e)
+                return None
+            raise
+        stack_info = StackInfo(stack)
+        # Stacks with the image-id tag are image builder stacks.
+        if stack_info.get_tag(PCLUSTER_VERSION_TAG) and stack_info.get_tag(PCLUSTER_IMAGE_ID_TAG) is None:
+            return stack
+        return None
 
     def describe_stack_resource(self, stack_name: str, logic_resource_id: str):
         """Get stack resource information."""
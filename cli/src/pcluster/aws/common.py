@@ -10,10 +10,13 @@
 # limitations under the License.
 
 import functools
+import inspect
 import logging
 import os
 import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 from typing import Dict
 
@@ -21,8 +24,18 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
 
+from pcluster.aws.persistent_cache import PersistentCache
+from pcluster.aws.rate_limiter import RateLimiter, backoff_delay
+
 LOGGER = logging.getLogger(__name__)
 
+# Standard retry mode retries throttled and transient errors with exponential backoff and jitter,
+# within a retry quota that stops retrying when most of the requests are failing
+BOTOCORE_RETRIES_CONFIG = {"mode": "standard", "max_attempts": 5}
+RETRY_ON_THROTTLING_MAX_DELAY = 5  # seconds
+# Attempts of retry_on_boto3_throttling, each one already including the botocore retries
+RETRY_ON_THROTTLING_MAX_ATTEMPTS = 10
+
 
 class AWSClientError(Exception):
     """Error during execution of some AWS calls."""
@@ -33,12 +46,19 @@ class AWSClientError(Exception):
         VALIDATION_ERROR = "ValidationError"
         REQUEST_LIMIT_EXCEEDED = "RequestLimitExceeded"
         THROTTLING_EXCEPTION = "ThrottlingException"
+        THROTTLING = "Throttling"
+        TOO_MANY_REQUESTS_EXCEPTION = "TooManyRequestsException"
         CONDITIONAL_CHECK_FAILED_EXCEPTION = "ConditionalCheckFailedException"
 
         @classmethod
         def throttling_error_codes(cls):
             """Return a set of error codes returned when service rate limits are exceeded."""
-            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value}
+            return {
+                cls.REQUEST_LIMIT_EXCEEDED.value,
+                cls.THROTTLING_EXCEPTION.value,
+                cls.THROTTLING.value,
+                cls.TOO_MANY_REQUESTS_EXCEPTION.value,
+            }
 
     def __init__(self, function_name: str, message: str, error_code: str = None):
         super().__init__(message)
@@ -111,22 +131,43 @@ class AWSExceptionHandler:
 
     @staticmethod
     def retry_on_boto3_throttling(func):
-        """Retry boto3 calls on throttling, can be used as a decorator."""
+        """
+        Retry boto3 calls on throttling with exponential backoff and jitter, can be used as a decorator.
+
+        The throttling error is raised when the call is still throttled after RETRY_ON_THROTTLING_MAX_ATTEMPTS attempts.
+        """
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            attempt = 1
             while True:
                 try:
                     return func(*args, **kwargs)
                 except ClientError as e:
-                    if e.response["Error"]["Code"] != "Throttling":
+                    if (
+                        e.response["Error"]["Code"] not in AWSClientError.ErrorCode.throttling_error_codes()
+                        or attempt >= RETRY_ON_THROTTLING_MAX_ATTEMPTS
+                    ):
                         raise
-                    LOGGER.debug("Throttling when calling %s function. Will retry in %d seconds.", func.__name__, 5)
-                    time.sleep(5)
+                    delay = backoff_delay(attempt, cap=RETRY_ON_THROTTLING_MAX_DELAY)
+                    LOGGER.debug(
+                        "Throttling when calling %s function. Will retry in %.2f seconds.", func.__name__, delay
+                    )
+                    RateLimiter.record_retry(_get_service_id(args[0]) if args else None)
+                    time.sleep(delay)
+                    attempt += 1
 
         return wrapper
 
 
+def _get_service_id(client_wrapper):
+    """Return the id of the service called by the given Boto3Client, as used in botocore event names."""
+    try:
+        return client_wrapper._client.meta.service_model.service_id.hyphenize()
+    except AttributeError:
+        return None
+
+
 def _log_boto3_calls(params, **kwargs):
     service = kwargs["event_name"].split(".")[-2]
     operation = kwargs["event_name"].split(".")[-1]
@@ -136,14 +177,35 @@ def _log_boto3_calls(params, **kwargs):
     )
 
 
+def _register_rate_limiter(events):
+    RateLimiter.register(events, AWSClientError.ErrorCode.throttling_error_codes())
+
+
+def create_boto3_session():
+    """Return a new boto3 session, to be used instead of the default one when clients are created in parallel."""
+    return boto3.session.Session()
+
+
 class Boto3Client:
     """Boto3 client Class."""
 
-    def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
+    def __init__(
+        self,
+        client_name: str,
+        botocore_config_kwargs: Dict = None,
+        region: str = None,
+        session: boto3.session.Session = None,
+    ):
+        self._client = (session or boto3).client(
+            client_name,
+            region_name=region,
+            config=Config(**{"retries": BOTOCORE_RETRIES_CONFIG, **(botocore_config_kwargs or {})}),
         )
         self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        _register_rate_limiter(self._client.meta.events)
+
+    def clear_cache(self):
+        """Clear the resources cached by the client, if any."""
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -162,14 +224,150 @@ class Boto3Client:
 class Boto3Resource:
     """Boto3 resource Class."""
 
-    def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
+    def __init__(self, resource_name: str, region: str = None, session: boto3.session.Session = None):
+        self._resource = (session or boto3).resource(
+            resource_name, region_name=region, config=Config(retries=BOTOCORE_RETRIES_CONFIG)
+        )
         self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        _register_rate_limiter(self._resource.meta.client.meta.events)
+
+    def clear_cache(self):
+        """Clear the resources cached by the resource, if any."""
+
+
+class CacheStats:
+    """Hit/miss/eviction counters of a single cached function."""
+
+    def __init__(self, name: str, ttl: float = None, maxsize: int = None):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.size = 0
+
+    def to_dict(self):
+        """Return the counters as a plain dictionary."""
+        return {
+            "name": self.name,
+            "ttl": self.ttl,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": self.size,
+        }
+
+
+class _CacheEntry:
+    """Value stored in a FunctionCache together with its expiration time and hit counter."""
+
+    __slots__ = ("value", "expires_at", "hits")
+
+    def __init__(self, value, expires_at):
+        self.value = value
+        self.expires_at = expires_at
+        self.hits = 0
+
+
+class FunctionCache:
+    """
+    Results cache of a single function, with optional TTL expiration and LRU eviction.
+
+    Entries are kept in access order: the least recently used entry is evicted first once maxsize is exceeded.
+    Per-key mutexes are reference counted and dropped as soon as no thread is waiting on them.
+    """
+
+    def __init__(self, name: str, ttl: float = None, maxsize: int = None):
+        self._entries = OrderedDict()
+        self._mutexes = {}
+        self._lock = threading.Lock()
+        self.stats = CacheStats(name, ttl, maxsize)
+
+    @property
+    def ttl(self):
+        """Return the time to live of the entries, in seconds. None means entries never expire."""
+        return self.stats.ttl
+
+    @property
+    def maxsize(self):
+        """Return the maximum number of entries. None means unbounded."""
+        return self.stats.maxsize
+
+    def __len__(self):
+        return len(self._entries)
+
+    @contextmanager
+    def key_lock(self, key):
+        """Serialize the executions for the same key, removing the mutex when it is no longer used."""
+        with self._lock:
+            mutex = self._mutexes.get(key)
+            if mutex is None:
+                mutex = self._mutexes[key] = [threading.Lock(), 0]
+            mutex[1] += 1
+        try:
+            with mutex[0]:
+                yield
+        finally:
+            with self._lock:
+                mutex[1] -= 1
+                if mutex[1] == 0:
+                    del self._mutexes[key]
+
+    def get(self, key):
+        """Return a tuple (found, value) for the given key, updating the counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                self.stats.size = len(self._entries)
+                return False, None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self.stats.hits += 1
+            return True, entry.value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries if the cache is full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = _CacheEntry(value, expires_at)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.stats.evictions += 1
+            self.stats.size = len(self._entries)
+
+    def entry_hits(self):
+        """Return the number of hits of every entry currently stored, keyed by cache key."""
+        with self._lock:
+            return {key: entry.hits for key, entry in self._entries.items()}
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self.stats.size = 0
 
 
 class Cache:
     """Simple utility class providing a cache mechanism for expensive functions."""
 
+    # Default bound on the number of entries of each cached function
+    DEFAULT_MAXSIZE = 1024
+    # Time to live for data that is not expected to change, e.g. instance types metadata or official images
+    STATIC_METADATA_TTL = 6 * 60 * 60
+    # Time to live for data describing the state of a resource, e.g. volumes or file systems
+    RESOURCE_STATE_TTL = 30
+
     _caches = []
 
     @staticmethod
@@ -183,48 +381,130 @@ class Cache:
         for cache in Cache._caches:
             cache.clear()
 
+    @staticmethod
+    def clear_without_ttl():
+        """Clear the content of the caches whose results never expire, keeping the ones with a time to live."""
+        for cache in Cache._caches:
+            if cache.ttl is None:
+                cache.clear()
+
+    @staticmethod
+    def stats():
+        """Return the statistics of all the cached functions."""
+        return [cache.stats.to_dict() for cache in Cache._caches]
+
     @staticmethod
     def _make_key(val):
+        """
+        Build a hashable key representing the given value.
+
+        Containers are converted to tagged tuples rather than hashed and scalars are tagged with their type, so that
+        different arguments never share a key, e.g. 1, 1.0 and True.
+        """
         if isinstance(val, list):
-            key = hash(tuple(Cache._make_key(x) for x in val))
+            key = (list, tuple(Cache._make_key(x) for x in val))
         elif isinstance(val, tuple):
-            key = hash(val)
+            key = (tuple, tuple(Cache._make_key(x) for x in val))
         elif isinstance(val, dict):
-            key = hash(tuple((key, Cache._make_key(val[key])) for key in sorted(val.keys())))
+            key = (dict, tuple((Cache._make_key(key), Cache._make_key(val[key])) for key in sorted(val.keys())))
+        elif isinstance(val, (set, frozenset)):
+            key = (frozenset, frozenset(Cache._make_key(x) for x in val))
         else:
-            key = hash(val)
+            hash(val)  # Fail early for unhashable values
+            key = (type(val), val)
         return key
 
     @staticmethod
-    def cached(function):
+    def cached(function=None, *, ttl: float = None, maxsize: int = DEFAULT_MAXSIZE, persistent: bool = False):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
+        Can be used either as @Cache.cached or as @Cache.cached(ttl=..., maxsize=...).
+        :param ttl: time to live of the cached results, in seconds. None means results never expire.
+        :param maxsize: maximum number of cached results; least recently used ones are evicted first.
+        :param persistent: also store the results in the on-disk PersistentCache shared across CLI invocations.
+          Only meant for methods of the AWS client wrappers returning JSON serializable data: the first positional
+          argument (the client instance) is not part of the persistent key.
+
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
         """
-        cache = {}
-        mutexes = {}
-        lock = threading.Lock()
-        Cache._caches.append(cache)
 
-        @functools.wraps(function)
-        def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
-            with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
-
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
-                else:
-                    return_value = function(*args, **kwargs)
-                if Cache.is_enabled():
-                    cache[cache_key] = return_value
-                return return_value
+        def decorator(func):
+            cache = FunctionCache(func.__qualname__, ttl=ttl, maxsize=maxsize)
+            Cache._caches.append(cache)
+            signature = inspect.signature(func)
 
-        return wrapper
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    arguments = Cache._bind_arguments(signature, args, kwargs)
+                except TypeError:
+                    # Let the function raise the error for the invalid arguments
+                    return func(*args, **kwargs)
+                cache_key = Cache._make_key(arguments)
+                with cache.key_lock(cache_key):
+                    if Cache.is_enabled():
+                        found, return_value = cache.get(cache_key)
+                        if found:
+                            return return_value
+                    if persistent and PersistentCache.is_enabled():
+                        return_value = Cache._call_persistent(func, ttl, args, kwargs, arguments)
+                    else:
+                        return_value = func(*args, **kwargs)
+                    if Cache.is_enabled():
+                        cache.put(cache_key, return_value)
+                    return return_value
+
+            Cache._add_cache_accessors(wrapper, cache, signature)
+            return wrapper
+
+        if function is None:
+            return decorator
+        return decorator(function)
+
+    @staticmethod
+    def _bind_arguments(signature: inspect.Signature, args, kwargs):
+        """
+        Return the values of all the parameters of a call, defaults included, in the order they are declared.
+
+        Calls passing the same values positionally or by keyword, or omitting the default ones, share the same key.
+        """
+        bound_arguments = signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        return tuple(bound_arguments.arguments.values())
+
+    @staticmethod
+    def _add_cache_accessors(wrapper, cache: FunctionCache, signature: inspect.Signature):
+        """Expose the cache of a decorated function, e.g. to store results retrieved by a batched call."""
+
+        def seed(value, *args, **kwargs):
+            """Store the result of a call with the given arguments."""
+            if Cache.is_enabled():
+                cache.put(Cache._make_key(Cache._bind_arguments(signature, args, kwargs)), value)
+
+        def is_cached(*args, **kwargs):
+            """Tell if the result of a call with the given arguments is in the cache."""
+            return Cache.is_enabled() and cache.get(Cache._make_key(Cache._bind_arguments(signature, args, kwargs)))[0]
+
+        wrapper.cache = cache
+        wrapper.seed = seed
+        wrapper.is_cached = is_cached
+
+    @staticmethod
+    def _call_persistent(func, ttl, args, kwargs, arguments):
+        """Return the result of the function from the PersistentCache, calling it and storing the result if missing."""
+        store = PersistentCache.instance()
+        scope = PersistentCache.scope()
+        try:
+            key = PersistentCache.make_key(arguments[1:], {})
+        except (TypeError, ValueError):
+            return func(*args, **kwargs)
+        found, return_value = store.get(scope, func.__qualname__, key)
+        if not found:
+            return_value = func(*args, **kwargs)
+            store.put(scope, func.__qualname__, key, return_value, ttl)
+        return return_value
 
 
 def get_region():
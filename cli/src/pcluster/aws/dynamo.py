@@ -8,20 +8,52 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import time
+
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Resource
 
+# Maximum number of items that can be retrieved with a single BatchGetItem request
+BATCH_GET_ITEM_MAX_KEYS = 100
+
 
 class DynamoResource(Boto3Resource):
     """DynamoDB Boto3 resource."""
 
-    def __init__(self):
-        super().__init__("dynamodb")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("dynamodb", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def get_item(self, table_name, key):
         """Get item from a DynamoDB table."""
         return self._resource.Table(table_name).get_item(ConsistentRead=True, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def batch_get_items(self, keys, max_attempts=5):
+        """
+        Get items from many DynamoDB tables with consistent BatchGetItem reads.
+
+        :param keys: list of (table_name, key) pairs
+        :return: dict of table name -> list of the items found in the table
+        """
+        items = {}
+        for chunk_start in range(0, len(keys), BATCH_GET_ITEM_MAX_KEYS):
+            request_items = {}
+            for table_name, key in keys[chunk_start : chunk_start + BATCH_GET_ITEM_MAX_KEYS]:  # noqa: E203
+                request_items.setdefault(table_name, {"Keys": [], "ConsistentRead": True})["Keys"].append(key)
+            attempt = 0
+            while request_items and attempt < max_attempts:
+                if attempt:
+                    # Back off before retrying the keys not processed because of the provisioned throughput
+                    time.sleep(0.1 * 2**attempt)
+                response = self._resource.batch_get_item(RequestItems=request_items)
+                for table_name, table_items in response.get("Responses", {}).items():
+                    items.setdefault(table_name, []).extend(table_items)
+                request_items = response.get("UnprocessedKeys")
+                attempt += 1
+        return items
+
     @AWSExceptionHandler.handle_client_exception
     def put_item(self, table_name, item, condition_expression=None):
         """Put item into a DynamoDB table."""
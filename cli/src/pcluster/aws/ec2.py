@@ -13,6 +13,7 @@ import re
 from datetime import datetime
 from typing import Any, List, Tuple
 
+from boto3.session import Session
 from botocore.exceptions import ClientError
 
 from pcluster import utils
@@ -28,19 +29,26 @@ from pcluster.constants import (
 )
 from pcluster.utils import get_partition
 
+# Maximum number of instance types that can be described by a single DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_MAX_ITEMS = 100
+
 
 class Ec2Client(Boto3Client):
     """Implement EC2 Boto3 client."""
 
-    def __init__(self):
-        super().__init__("ec2")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("ec2", region=region, session=session)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear the cached resources and the additional instance types data."""
         self.additional_instance_types_data = {}
         self.security_groups_cache = {}
         self.subnets_cache = {}
         self.capacity_reservations_cache = {}
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL)
     def list_instance_types(self) -> List[str]:
         """Return a list of instance types."""
         return [offering.get("InstanceType") for offering in self.describe_instance_type_offerings()] + list(
@@ -48,6 +56,7 @@ class Ec2Client(Boto3Client):
         )
 
     @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL, persistent=True)
     def describe_instance_type_offerings(self, filters=None, location_type=None):
         """Return a list of instance types."""
         kwargs = {"Filters": filters} if filters else {}
@@ -56,7 +65,7 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_instance_type_offerings, **kwargs))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL, persistent=True)
     def get_default_instance_type(self):
         """If current region support free tier, return the free tier instance type. Otherwise, return t3.micro."""
         kwargs = {
@@ -150,6 +159,20 @@ class Ec2Client(Boto3Client):
             return ImageInfo(result.get("Images")[0])
         raise AWSClientError(function_name="describe_images", message=f"Image {ami_id} not found")
 
+    @AWSExceptionHandler.handle_client_exception
+    def describe_images_by_ids(self, ami_ids):
+        """
+        Return a list of objects of ImageInfo for the given image ids.
+
+        The images not retrieved yet are described with a single call, storing the results in the cache
+        used by describe_image.
+        """
+        missed_ami_ids = [ami_id for ami_id in ami_ids if not self.describe_image.is_cached(self, ami_id)]
+        if missed_ami_ids:
+            for image in self._client.describe_images(ImageIds=missed_ami_ids).get("Images", []):
+                self.describe_image.seed(ImageInfo(image), self, image.get("ImageId"))
+        return [self.describe_image(ami_id) for ami_id in ami_ids]
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def describe_images(self, ami_ids, filters, owners):
@@ -270,16 +293,39 @@ class Ec2Client(Boto3Client):
         )
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL)
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
         return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+            self.additional_instance_types_data.get(instance_type) or self._describe_instance_type(instance_type)
         )
 
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL, persistent=True)
+    def _describe_instance_type(self, instance_type):
+        return self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    def get_instance_types_info(self, instance_types: List[str]):
+        """
+        Return a dict mapping the given instance types to their InstanceTypeInfo.
+
+        The instance types not retrieved yet are described with as few calls as possible, storing the results in the
+        cache used by get_instance_type_info.
+        """
+        missed_instance_types = [
+            instance_type
+            for instance_type in instance_types
+            if instance_type not in self.additional_instance_types_data
+            and not self._describe_instance_type.is_cached(self, instance_type)
+        ]
+        for chunk_start in range(0, len(missed_instance_types), DESCRIBE_INSTANCE_TYPES_MAX_ITEMS):
+            chunk = missed_instance_types[chunk_start : chunk_start + DESCRIBE_INSTANCE_TYPES_MAX_ITEMS]  # noqa: E203
+            for instance_type_data in self._paginate_results(self._client.describe_instance_types, InstanceTypes=chunk):
+                self._describe_instance_type.seed(instance_type_data, self, instance_type_data.get("InstanceType"))
+        return {instance_type: self.get_instance_type_info(instance_type) for instance_type in instance_types}
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL)
     def get_supported_architectures(self, instance_type):
         """Return a list of architectures supported for the given instance type."""
         instance_info = self.get_instance_type_info(instance_type)
@@ -293,7 +339,7 @@ class Ec2Client(Boto3Client):
         return max(images, key=lambda image: ("0" if self._is_image_deprecated(image) else "1") + image["CreationDate"])
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL)
     def get_official_image_id(self, os, architecture, filters=None):
         """Return the id of the current official image, for the provided os-architecture combination."""
         owner = filters.owner if filters and filters.owner else "amazon"
@@ -307,20 +353,24 @@ class Ec2Client(Boto3Client):
         return self._find_valid_official_image(images).get("ImageId")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL)
     def get_official_images(self, os=None, architecture=None):
         """Get the list of official images, optionally filtered by os and architecture."""
-        owners = ["amazon"]
-        name = f"{self._get_official_image_name_prefix(os, architecture)}*"
-        filters = [{"Name": "name", "Values": [name]}]
         return [
             ImageInfo(self._find_valid_official_image(images_os_arch))
             for _, images_os_arch in itertools.groupby(
-                self._client.describe_images(Owners=owners, Filters=filters, IncludeDeprecated=True).get("Images"),
+                self._describe_official_images(os, architecture),
                 key=lambda image: f'{self.extract_os_from_official_image_name(image["Name"])}-{image["Architecture"]}',
             )
         ]
 
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL, persistent=True)
+    def _describe_official_images(self, os=None, architecture=None):
+        owners = ["amazon"]
+        name = f"{self._get_official_image_name_prefix(os, architecture)}*"
+        filters = [{"Name": "name", "Values": [name]}]
+        return self._client.describe_images(Owners=owners, Filters=filters, IncludeDeprecated=True).get("Images")
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_eip_allocation_id(self, eip):
@@ -358,11 +408,13 @@ class Ec2Client(Boto3Client):
         ]
 
     @AWSExceptionHandler.handle_client_exception
-    def describe_instances(self, filters, next_token=None) -> Tuple[List[Any], str]:
+    def describe_instances(self, filters, next_token=None, max_results=None) -> Tuple[List[Any], str]:
         """Retrieve a filtered list of instances."""
         describe_stacks_kwargs = {}
         if next_token:
             describe_stacks_kwargs["NextToken"] = next_token
+        if max_results:
+            describe_stacks_kwargs["MaxResults"] = max_results
         response = self._client.describe_instances(Filters=filters, **describe_stacks_kwargs)
         instances = []
         for reservation in response["Reservations"]:
@@ -370,7 +422,7 @@ class Ec2Client(Boto3Client):
         return instances, response.get("NextToken")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.STATIC_METADATA_TTL)
     def get_supported_az_for_instance_type(self, instance_type: str):
         """
         Return a tuple of availability zones that have the instance_type.
@@ -474,7 +526,23 @@ class Ec2Client(Boto3Client):
         )
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    def describe_volumes(self, volume_ids):
+        """
+        Describe the given volumes.
+
+        The volumes not retrieved yet are described with a single call, storing the results in the cache
+        used by describe_volume.
+        """
+        missed_volume_ids = [
+            volume_id for volume_id in volume_ids if not self.describe_volume.is_cached(self, volume_id)
+        ]
+        if missed_volume_ids:
+            for volume in self._paginate_results(self._client.describe_volumes, VolumeIds=missed_volume_ids):
+                self.describe_volume.seed(volume, self, volume.get("VolumeId"))
+        return [self.describe_volume(volume_id) for volume_id in volume_ids]
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(ttl=Cache.RESOURCE_STATE_TTL)
     def describe_volume(self, volume_id):
         """Describe a volume."""
         return self._client.describe_volumes(VolumeIds=[volume_id]).get("Volumes")[0]
@@ -8,6 +8,8 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client, Cache
 from pcluster.aws.ec2 import Ec2Client
 
@@ -15,8 +17,8 @@ from pcluster.aws.ec2 import Ec2Client
 class EfsClient(Boto3Client):
     """S3 Boto3 client."""
 
-    def __init__(self, ec2_client: Ec2Client):
-        super().__init__("efs")
+    def __init__(self, ec2_client: Ec2Client, region: str = None, session: Session = None):
+        super().__init__("efs", region=region, session=session)
         self._ec2_client = ec2_client
 
     @AWSExceptionHandler.handle_client_exception
@@ -41,7 +43,7 @@ class EfsClient(Boto3Client):
         return mount_target_id
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.RESOURCE_STATE_TTL)
     def describe_mount_targets(self, efs_fs_id):
         """
         Search for Mount Targets information for the given EFS file system id.
@@ -71,7 +73,7 @@ class EfsClient(Boto3Client):
         return availability_zone_name is None
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=Cache.RESOURCE_STATE_TTL)
     def describe_file_system(self, efs_fs_id):
         """
         Describe file system for the given EFS file system id.
@@ -8,6 +8,8 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.session import Session
+
 from pcluster.aws.aws_resources import FsxStorageInfo
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client
 
@@ -15,8 +17,12 @@ from pcluster.aws.common import AWSExceptionHandler, Boto3Client
 class FSxClient(Boto3Client):
     """S3 Boto3 client."""
 
-    def __init__(self):
-        super().__init__("fsx")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("fsx", region=region, session=session)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear the cached resources."""
         self.cache = {}
         self.svm_cache = {}
         self.volume_cache = {}
@@ -9,14 +9,16 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client
 
 
 class IamClient(Boto3Client):
     """Iam Boto3 client."""
 
-    def __init__(self):
-        super().__init__("iam")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("iam", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def get_policy(self, iam_policy):
@@ -1,11 +1,13 @@
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client
 
 
 class ImageBuilderClient(Boto3Client):
     """Imagebuilder Boto3 client."""
 
-    def __init__(self):
-        super().__init__("imagebuilder")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("imagebuilder", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def get_image_resources(self, image_arn):
@@ -9,14 +9,16 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client
 
 
 class KmsClient(Boto3Client):
     """KMS Boto3 client."""
 
-    def __init__(self):
-        super().__init__("kms")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("kms", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def describe_key(self, kms_key_id):
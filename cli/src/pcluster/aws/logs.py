@@ -11,6 +11,8 @@
 import datetime
 import json
 
+from boto3.session import Session
+
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
 from pcluster.utils import datetime_to_epoch
 
@@ -18,8 +20,8 @@ from pcluster.utils import datetime_to_epoch
 class LogsClient(Boto3Client):
     """Logs Boto3 client."""
 
-    def __init__(self):
-        super().__init__("logs")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("logs", region=region, session=session)
 
     def log_group_exists(self, log_group_name):
         """Return true if log group exists, false otherwise."""
@@ -59,6 +61,33 @@ class LogsClient(Boto3Client):
             kwargs["logStreamNamePrefix"] = log_stream_name_prefix
         return self._client.filter_log_events(**kwargs).get("events")
 
+    @AWSExceptionHandler.handle_client_exception
+    def search_log_events(
+        self,
+        log_group_name,
+        filter_pattern=None,
+        start_time=None,
+        end_time=None,
+        log_stream_name_prefix=None,
+        next_token=None,
+        limit=None,
+    ):
+        """Return a page of the events of a log group matching the filter pattern, along with the next token."""
+        kwargs = {"logGroupName": log_group_name}
+        if filter_pattern:
+            kwargs["filterPattern"] = filter_pattern
+        if start_time is not None:
+            kwargs["startTime"] = start_time
+        if end_time is not None:
+            kwargs["endTime"] = end_time
+        if log_stream_name_prefix:
+            kwargs["logStreamNamePrefix"] = log_stream_name_prefix
+        if next_token:
+            kwargs["nextToken"] = next_token
+        if limit:
+            kwargs["limit"] = limit
+        return self._client.filter_log_events(**kwargs)
+
     @AWSExceptionHandler.handle_client_exception
     def get_log_events(
         self,
@@ -0,0 +1,166 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump this value whenever the layout of the stored entries changes, to ignore entries written by older versions
+SCHEMA_VERSION = 1
+
+
+class PersistentCache:
+    """
+    On-disk cache of results that are shared across CLI invocations, e.g. static EC2 metadata.
+
+    Entries are stored as JSON documents in a sqlite database, one file per ParallelCluster version.
+    Every entry is scoped to the AWS account and region it was retrieved for and expires after its own TTL.
+    The cache is disabled unless the PCLUSTER_PERSISTENT_CACHE environment variable is set.
+    Storage errors are never propagated: a failure to read or write the cache behaves as a cache miss.
+    """
+
+    _instance = None
+    _scopes = {}
+    _lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the persistent cache is enabled."""
+        return bool(os.environ.get("PCLUSTER_PERSISTENT_CACHE")) and not os.environ.get("PCLUSTER_CACHE_DISABLED")
+
+    @staticmethod
+    def cache_dir():
+        """Return the directory of the on-disk caches, overridden by the PCLUSTER_CACHE_DIR environment variable."""
+        default_cache_dir = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache"))
+        return os.environ.get("PCLUSTER_CACHE_DIR") or default_cache_dir
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _installed_version():
+        # Imported here to avoid a circular import, pcluster.utils depends on the AWS client wrappers
+        from pcluster.utils import get_installed_version  # pylint: disable=import-outside-toplevel
+
+        return get_installed_version()
+
+    @staticmethod
+    def default_path():
+        """Return the path of the cache file for the installed ParallelCluster version."""
+        version = PersistentCache._installed_version()
+        return os.path.join(PersistentCache.cache_dir(), f"aws-metadata-v{SCHEMA_VERSION}-{version}.sqlite")
+
+    @staticmethod
+    def instance():
+        """Return the PersistentCache instance for the current process."""
+        with PersistentCache._lock:
+            path = PersistentCache.default_path()
+            if not PersistentCache._instance or PersistentCache._instance.path != path:
+                PersistentCache._instance = PersistentCache(path)
+            return PersistentCache._instance
+
+    @staticmethod
+    def scope():
+        """Return the account/region pair the entries retrieved with the current credentials belong to."""
+        # Imported here to avoid a circular import, the AWS client wrappers depend on this module
+        from pcluster.aws.aws_api import AWSApi, credentials_fingerprint  # pylint: disable=import-outside-toplevel
+        from pcluster.aws.common import get_region  # pylint: disable=import-outside-toplevel
+
+        aws_api = AWSApi.instance()
+        region = aws_api.aws_region or get_region()
+        scope_key = (region, credentials_fingerprint())
+        scope = PersistentCache._scopes.get(scope_key)
+        if scope is None:
+            # The account is retrieved without holding the lock, not to block the other threads accessing the cache
+            scope = f"{aws_api.sts.get_account_id()}/{region}"
+            with PersistentCache._lock:
+                scope = PersistentCache._scopes.setdefault(scope_key, scope)
+        return scope
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "scope TEXT NOT NULL, name TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL, PRIMARY KEY (scope, name, key))"
+            )
+            connection.commit()
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def make_key(args, kwargs):
+        """Return the key of the given arguments as a canonical JSON document."""
+        return json.dumps([args, kwargs], sort_keys=True, separators=(",", ":"))
+
+    def get(self, scope: str, name: str, key: str):
+        """Return a tuple (found, value) for the given entry."""
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, expires_at FROM entries WHERE scope = ? AND name = ? AND key = ?", (scope, name, key)
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            LOGGER.debug("Unable to read from persistent cache %s: %s", self.path, e)
+            return False, None
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return False, None
+        return True, json.loads(row[0])
+
+    def put(self, scope: str, name: str, key: str, value, ttl: float = None):
+        """Store the given value; values that cannot be serialized to JSON are not stored."""
+        try:
+            serialized_value = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            LOGGER.debug("Skipping persistent cache for %s, value is not serializable: %s", name, e)
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (scope, name, key, value, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (scope, name, key, serialized_value, expires_at),
+                )
+        except (sqlite3.Error, OSError) as e:
+            LOGGER.debug("Unable to write to persistent cache %s: %s", self.path, e)
+
+    def clear(self, region: str = None):
+        """Remove all the entries, or only the ones of the given region, returning the number of removed entries."""
+        if not os.path.isfile(self.path):
+            return 0
+        with self._connection() as connection:
+            if region:
+                cursor = connection.execute("DELETE FROM entries WHERE scope LIKE ?", (f"%/{region}",))
+            else:
+                cursor = connection.execute("DELETE FROM entries")
+        return cursor.rowcount
+
+    def purge_expired(self):
+        """Remove the expired entries, returning the number of removed entries."""
+        if not os.path.isfile(self.path):
+            return 0
+        with self._connection() as connection:
+            cursor = connection.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
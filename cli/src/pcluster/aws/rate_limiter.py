@@ -0,0 +1,185 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import random
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_REQUEST_RATE = 25.0  # requests per second, per service
+MIN_REQUEST_RATE = 0.5
+# Fraction of the request rate kept after a throttling response and rate added back after a successful one
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_STEP = 0.5
+
+BACKOFF_BASE = 0.5  # seconds
+BACKOFF_CAP = 20  # seconds
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP):
+    """Return the delay before the given retry attempt (starting from 1): exponential backoff with full jitter."""
+    # A nosec comment is appended to the following line since random is only used as backoff jitter.
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))  # nosec B311
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose fill rate adapts to the responses of the service.
+
+    The rate is halved on every throttling response and slowly increased back on successful responses,
+    up to the maximum rate.
+    """
+
+    def __init__(self, max_rate: float, min_rate: float = MIN_REQUEST_RATE):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        self._capacity = max(1.0, max_rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """Take a token, waiting for it to be available; return the waited time in seconds."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            # A negative balance reserves the next tokens, so that waiting callers are served in order
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait_time:
+            time.sleep(wait_time)
+        return wait_time
+
+    def on_throttle(self):
+        """Reduce the rate after a throttling response."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * RATE_DECREASE_FACTOR)
+            self._tokens = min(self._tokens, 0)
+
+    def on_success(self):
+        """Increase the rate after a successful response."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + RATE_INCREASE_STEP)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiters of the AWS services, shared by all the AWS client wrappers of the process.
+
+    Every request, retries included, takes a token from the bucket of its service before being sent.
+    The maximum rate of each service can be set with the PCLUSTER_AWS_MAX_REQUEST_RATE environment variable,
+    a value of 0 disables the rate limiting.
+    """
+
+    _buckets = {}
+    _counters = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def max_request_rate():
+        """Return the configured maximum request rate per service."""
+        try:
+            return float(os.environ.get("PCLUSTER_AWS_MAX_REQUEST_RATE", DEFAULT_MAX_REQUEST_RATE))
+        except ValueError:
+            return DEFAULT_MAX_REQUEST_RATE
+
+    @staticmethod
+    def bucket(service: str):
+        """Return the token bucket of the given service, None if rate limiting is disabled."""
+        max_rate = RateLimiter.max_request_rate()
+        if max_rate <= 0:
+            return None
+        with RateLimiter._lock:
+            bucket = RateLimiter._buckets.get(service)
+            if not bucket or bucket.max_rate != max_rate:
+                bucket = RateLimiter._buckets[service] = TokenBucket(max_rate)
+            return bucket
+
+    @staticmethod
+    def _increment(service: str, counter: str, value=1):
+        with RateLimiter._lock:
+            counters = RateLimiter._counters.setdefault(
+                service, {"requests": 0, "throttles": 0, "retries": 0, "waitTime": 0.0}
+            )
+            counters[counter] += value
+
+    @staticmethod
+    def register(events, throttling_error_codes):
+        """Register the rate limiting handlers on the event system of a botocore client."""
+        events.register("before-send.*.*", RateLimiter._before_send)
+        events.register(
+            "response-received.*.*",
+            lambda **kwargs: RateLimiter._on_response(throttling_error_codes=throttling_error_codes, **kwargs),
+        )
+
+    @staticmethod
+    def _before_send(event_name, **kwargs):
+        service = event_name.split(".")[1]
+        RateLimiter._increment(service, "requests")
+        bucket = RateLimiter.bucket(service)
+        if bucket:
+            wait_time = bucket.acquire()
+            if wait_time:
+                RateLimiter._increment(service, "waitTime", wait_time)
+
+    @staticmethod
+    def _on_response(event_name, parsed_response=None, context=None, throttling_error_codes=(), **kwargs):
+        service = event_name.split(".")[1]
+        if context and context.get("retries", {}).get("attempt", 1) > 1:
+            RateLimiter._increment(service, "retries")
+        bucket = RateLimiter.bucket(service)
+        error_code = (parsed_response or {}).get("Error", {}).get("Code")
+        if error_code in throttling_error_codes:
+            LOGGER.debug("Request to %s throttled with error code %s", service, error_code)
+            RateLimiter._increment(service, "throttles")
+            if bucket:
+                bucket.on_throttle()
+        elif bucket and parsed_response is not None and not error_code:
+            bucket.on_success()
+
+    @staticmethod
+    def record_retry(service: str = None, throttled: bool = True):
+        """Record a retry performed outside of botocore, e.g. by a retry decorator."""
+        service = service or "unknown"
+        RateLimiter._increment(service, "retries")
+        if throttled:
+            RateLimiter._increment(service, "throttles")
+            bucket = RateLimiter.bucket(service)
+            if bucket:
+                bucket.on_throttle()
+
+    @staticmethod
+    def stats():
+        """Return the counters and the current request rate of every service."""
+        with RateLimiter._lock:
+            stats = {service: dict(counters) for service, counters in RateLimiter._counters.items()}
+            for service, bucket in RateLimiter._buckets.items():
+                stats.setdefault(service, {"requests": 0, "throttles": 0, "retries": 0, "waitTime": 0.0})
+                stats[service]["rate"] = bucket.rate
+        return stats
+
+    @staticmethod
+    def reset():
+        """Reset the rate limiters and their counters."""
+        with RateLimiter._lock:
+            RateLimiter._buckets = {}
+            RateLimiter._counters = {}
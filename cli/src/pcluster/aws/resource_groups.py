@@ -10,14 +10,16 @@
 # limitations under the License.
 import re
 
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client, Cache
 
 
 class ResourceGroupsClient(Boto3Client):
     """Implement Resource Groups Boto3 client."""
 
-    def __init__(self):
-        super().__init__("resource-groups")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("resource-groups", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
@@ -8,6 +8,8 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.s3.transfer import TransferConfig
+from boto3.session import Session
 from botocore.exceptions import ClientError
 
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
@@ -16,8 +18,10 @@ from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
 class S3Client(Boto3Client):
     """S3 Boto3 client."""
 
-    def __init__(self):
-        super().__init__("s3", botocore_config_kwargs={"s3": {"addressing_style": "virtual"}})
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__(
+            "s3", botocore_config_kwargs={"s3": {"addressing_style": "virtual"}}, region=region, session=session
+        )
 
     @AWSExceptionHandler.handle_client_exception
     def download_file(self, bucket_name, object_name, file_name):
@@ -51,9 +55,10 @@ class S3Client(Boto3Client):
             )
 
     @AWSExceptionHandler.handle_client_exception
-    def put_object(self, bucket_name, body, key):
+    def put_object(self, bucket_name, body, key, metadata=None):
         """Upload object content to s3."""
-        return self._client.put_object(Bucket=bucket_name, Body=body, Key=key)
+        kwargs = {"Metadata": metadata} if metadata else {}
+        return self._client.put_object(Bucket=bucket_name, Body=body, Key=key, **kwargs)
 
     @AWSExceptionHandler.handle_client_exception
     def get_object(self, bucket_name, key, version_id=None, expected_bucket_owner=None):
@@ -114,9 +119,25 @@ class S3Client(Boto3Client):
         self._client.put_bucket_policy(Bucket=bucket_name, Policy=policy)
 
     @AWSExceptionHandler.handle_client_exception
-    def upload_fileobj(self, bucket_name, file_obj, key):
-        """Upload file-like object to S3 bucket."""
-        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key)
+    def upload_fileobj(self, bucket_name, file_obj, key, part_size=None, max_concurrency=None):
+        """
+        Upload file-like object to S3 bucket.
+
+        Objects larger than part_size are uploaded with a multipart upload. The object does not need to be seekable:
+        non-seekable objects are read in parts and at most max_concurrency parts are kept in memory.
+        """
+        kwargs = {}
+        transfer_config = {
+            "multipart_threshold": part_size,
+            "multipart_chunksize": part_size,
+            "max_concurrency": max_concurrency,
+        }
+        if part_size or max_concurrency:
+            config = TransferConfig(**{name: value for name, value in transfer_config.items() if value})
+            if max_concurrency:
+                config.max_in_memory_upload_chunks = max_concurrency
+            kwargs["Config"] = config
+        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key, **kwargs)
 
     @AWSExceptionHandler.handle_client_exception
     def upload_file(self, bucket_name, file_path, key):
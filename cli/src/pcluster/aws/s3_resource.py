@@ -8,14 +8,16 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Resource, Cache
 
 
 class S3Resource(Boto3Resource):
     """S3 Boto3 resource."""
 
-    def __init__(self):
-        super().__init__("s3")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("s3", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
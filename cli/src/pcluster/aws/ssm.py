@@ -8,14 +8,16 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.session import Session
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client
 
 
 class SsmClient(Boto3Client):
     """SSM Boto3 client."""
 
-    def __init__(self):
-        super().__init__("ssm")
+    def __init__(self, region: str = None, session: Session = None):
+        super().__init__("ssm", region=region, session=session)
 
     @AWSExceptionHandler.handle_client_exception
     def get_parameter(self, name: str):
@@ -0,0 +1,88 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import os
+from typing import List
+
+from argparse import ArgumentParser, Namespace
+
+from pcluster import utils
+from pcluster.aws.common import get_region
+from pcluster.cli.commands.common import CliCommand
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CacheCommand(CliCommand):
+    """Implement pcluster cache command."""
+
+    # CLI
+    name = "cache"
+    help = "Manage the local cache of static AWS metadata shared across pcluster invocations."
+    description = (
+        "Manage the local cache of static AWS metadata (e.g. instance types and official images) shared across "
+        "pcluster invocations. The cache is used only when the PCLUSTER_PERSISTENT_CACHE environment variable is set."
+    )
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, name=self.name, help=self.help, description=self.description)
+
+    def register_command_args(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "action",
+            choices=["clear", "warm"],
+            help="clear: remove the cached entries, optionally only the ones of the given region. "
+            "warm: retrieve and store the metadata of the given region.",
+        )
+        parser.add_argument(
+            "--instance-types",
+            nargs="+",
+            default=[],
+            help="Instance types to retrieve the metadata of when warming the cache.",
+        )
+
+    def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        try:
+            if args.action == "clear":
+                return self._clear(args)
+            return self._warm(args)
+        except Exception as e:
+            utils.error(f"Unable to {args.action} the cache.\n{e}")
+            return None
+
+    @staticmethod
+    def _clear(args: Namespace):
+        from pcluster.aws.persistent_cache import PersistentCache  # pylint: disable=import-outside-toplevel
+
+        cache = PersistentCache.instance()
+        removed_entries = cache.clear(region=args.region)
+        return {"path": cache.path, "removedEntries": removed_entries}
+
+    @staticmethod
+    def _warm(args: Namespace):
+        from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+        from pcluster.aws.persistent_cache import PersistentCache  # pylint: disable=import-outside-toplevel
+
+        # Warming the cache always writes to it, regardless of it being enabled for the other commands
+        os.environ["PCLUSTER_PERSISTENT_CACHE"] = "true"
+        ec2 = AWSApi.instance().ec2
+        cache = PersistentCache.instance()
+        cache.purge_expired()
+        ec2.get_default_instance_type()
+        instance_types = ec2.list_instance_types()
+        ec2.get_official_images()
+        for instance_type in args.instance_types:
+            ec2.get_instance_type_info(instance_type)
+        if args.instance_types:
+            ec2.get_supported_az_for_instance_types(args.instance_types)
+        return {
+            "path": cache.path,
+            "region": get_region(),
+            "instanceTypes": len(instance_types),
+        }
@@ -16,7 +16,7 @@ from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
-from pcluster.models.cluster import Cluster
+from pcluster.constants import LOGS_EXPORT_MODE_DIRECT, LOGS_EXPORT_MODE_TASK, LOGS_EXPORT_MODES
 
 LOGGER = logging.getLogger(__name__)
 
@@ -39,8 +39,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
         # Export options
         parser.add_argument(
             "--bucket",
-            required=True,
-            help="S3 bucket to export cluster logs data to. It must be in the same region of the cluster",
+            help="S3 bucket to export cluster logs data to. It must be in the same region of the cluster. "
+            "Not required in direct export mode when --output-file is provided",
         )
         # Export options
         parser.add_argument(
@@ -48,6 +48,14 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             help="Keypath under which exported logs data will be stored in s3 bucket. Defaults to "
             "<cluster_name>-logs-<current time in the format of yyyyMMddHHmm>",
         )
+        parser.add_argument(
+            "--export-mode",
+            choices=LOGS_EXPORT_MODES,
+            default=LOGS_EXPORT_MODE_TASK,
+            help="Engine used to export the CloudWatch logs: export-task exports them through a CloudWatch Logs "
+            "export task to the S3 bucket, direct retrieves the log events straight from CloudWatch Logs and is "
+            "faster for small time windows. (Defaults to 'export-task'.)",
+        )
         super()._register_common_command_args(parser)
         # Filters
         filters_arg = _FiltersArg(accepted_filters=["private-dns-name", "node-type"])
@@ -64,6 +72,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
 
     def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
         try:
+            if not args.bucket and (args.export_mode != LOGS_EXPORT_MODE_DIRECT or not args.output_file):
+                utils.error("--bucket is required, unless --export-mode is direct and --output-file is provided.")
             if args.output_file:
                 self._validate_output_file_path(args.output_file)
             return self._export_cluster_logs(args, args.output_file)
@@ -74,6 +84,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_cluster_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the cluster."""
+        from pcluster.models.cluster import Cluster  # pylint: disable=import-outside-toplevel
+
         LOGGER.debug("Beginning export of logs for the cluster: %s", args.cluster_name)
         cluster = Cluster(args.cluster_name)
         url = cluster.export_logs(
@@ -84,6 +96,7 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             end_time=args.end_time,
             filters=args.filters,
             output_file=output_file,
+            export_mode=args.export_mode,
         )
         LOGGER.debug("Cluster's logs exported correctly to %s", url)
         return {"path": output_file} if output_file is not None else {"url": url}
@@ -13,6 +13,7 @@
 
 # flake8: noqa
 
+from pcluster.cli.commands.cache import CacheCommand
 from pcluster.cli.commands.cluster_logs import ExportClusterLogsCommand
 from pcluster.cli.commands.configure.command import ConfigureCommand
 from pcluster.cli.commands.dcv_connect import DcvConnectCommand
@@ -13,11 +13,9 @@ from typing import List
 from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
-from pcluster.api.controllers.common import assert_supported_operation
 from pcluster.aws.common import get_region
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.constants import Operation
-from pcluster.models.imagebuilder import ImageBuilder
 
 LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +52,8 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
         )
 
     def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        from pcluster.api.controllers.common import assert_supported_operation  # pylint: disable=C0415
+
         assert_supported_operation(operation=Operation.EXPORT_IMAGE_LOGS, region=args.region or get_region())
         try:
             if args.output_file:
@@ -66,6 +66,8 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_image_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the image."""
+        from pcluster.models.imagebuilder import ImageBuilder  # pylint: disable=import-outside-toplevel
+
         LOGGER.debug("Beginning export of logs for the image: %s", args.image_id)
 
         # retrieve imagebuilder config and generate model
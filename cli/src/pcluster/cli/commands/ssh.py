@@ -26,7 +26,6 @@ from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, to_bool
-from pcluster.models.cluster import Cluster
 
 LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +42,7 @@ def _ssh(args, extra_args):
         from shlex import quote as cmd_quote
     except ImportError:
         from pipes import quote as cmd_quote
+    from pcluster.models.cluster import Cluster  # pylint: disable=import-outside-toplevel
 
     try:
         head_node = Cluster(args.cluster_name).head_node_instance
@@ -24,26 +24,24 @@ import argparse
 from botocore.exceptions import NoCredentialsError  # TODO: remove
 
 import pcluster.cli.logger as pcluster_logging
+from pcluster.cli import profiling
 from pcluster.cli.logger import redirect_stdouterr_to_logger
 
+profiling.start_if_requested(sys.argv[1:])
 pcluster_logging.config_logger()
 
 # Redirect console output from imports to log file (https://github.com/aws/jsii/issues/4065)
 with redirect_stdouterr_to_logger():
-    # Controllers
-    import pcluster.api.controllers.cluster_compute_fleet_controller
-    import pcluster.api.controllers.cluster_instances_controller
-    import pcluster.api.controllers.cluster_operations_controller
-    import pcluster.api.controllers.image_operations_controller
-    import pcluster.api.errors
+    # Controllers, API models and the modules needed by a single command are imported only when dispatching it
     import pcluster.cli.commands.commands as cli_commands
     import pcluster.cli.model
-    from pcluster.api import encoder
     from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number
     from pcluster.cli.exceptions import APIOperationException, ParameterException
     from pcluster.cli.middleware import add_additional_args, middleware_hooks
     from pcluster.utils import to_camel_case, to_snake_case
 
+profiling.end_phase("imports")
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -203,6 +201,16 @@ def add_cli_commands(parser_map):
     add_additional_args(parser_map)
 
 
+def _api_exception(exception):
+    """Format exception messages in the same manner as the api."""
+    import pcluster.api.errors  # pylint: disable=import-outside-toplevel
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
+    message = pcluster.api.errors.exception_message(exception)
+    error_encoded = encoder.JSONEncoder().encode(message)
+    return APIOperationException(json.loads(error_encoded))
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
@@ -215,28 +223,28 @@ def _run_operation(model, args, extra_args):
         except ParameterException as e:
             raise e
         except Exception as e:
-            # format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
+            raise _api_exception(e)
     else:
         try:
             return args.func(args, extra_args)
-        except pcluster.api.errors.ParallelClusterApiException as e:
-            # Format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
         except Exception as e:
+            import pcluster.api.errors  # pylint: disable=import-outside-toplevel
+
+            if isinstance(e, pcluster.api.errors.ParallelClusterApiException):
+                raise _api_exception(e)
             raise e
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
-    parser, parser_map = gen_parser(model)
-    add_cli_commands(parser_map)
-    args, extra_args = parser.parse_known_args(sys_args)
+    profiling.start_if_requested(sys_args)
+    sys_args = profiling.remove_flag(sys_args)
+
+    with profiling.phase("model load"):
+        model = model or pcluster.cli.model.load_cached_model()
+    with profiling.phase("parse"):
+        parser, parser_map = gen_parser(model)
+        add_cli_commands(parser_map)
+        args, extra_args = parser.parse_known_args(sys_args)
 
     # some commands (e.g. ssh and those defined as CliCommand objects) require 'extra_args'
     if extra_args and (not hasattr(args, "expects_extra_args") or not args.expects_extra_args):
@@ -259,7 +267,8 @@ def run(sys_args, model=None):
 
     LOGGER.info("Handling CLI command %s", args.operation)
     LOGGER.info("Parsed CLI arguments: args(%s), extra_args(%s)", args, extra_args)
-    return _run_operation(model, args, extra_args)
+    with profiling.phase("dispatch"):
+        return _run_operation(model, args, extra_args)
 
 
 def main():
@@ -289,6 +298,7 @@ def main():
         LOGGER.exception("Unexpected error of type %s: %s", type(e).__name__, e)
         sys.exit(1)
     finally:
+        profiling.print_report()
         # If an external process has closed the other end of this pipe, flush
         # now to see if we'd get a BrokenPipeError on exit and if so, dup2 a
         # devnull over that output.
@@ -17,12 +17,12 @@ import os
 import sys
 from contextlib import contextmanager
 
-from pcluster.utils import get_cli_log_file
-
 LOGGER = logging.getLogger(__name__)
 
 
 def config_logger():
+    from pcluster.utils import get_cli_log_file  # pylint: disable=import-outside-toplevel
+
     logfile = get_cli_log_file()
     logging_config = {
         "version": 1,
@@ -78,11 +78,16 @@ class LogWriter:
         pass
 
 
+# Standard outputs replaced by the active redirections to the logger, the outermost first
+_redirected_stdouts = []
+
+
 @contextmanager
 def redirect_stdouterr_to_logger():
     """Redirect default stdout and stderr to logger."""
     stdout_backup = sys.stdout
     stderr_backup = sys.stderr
+    _redirected_stdouts.append(stdout_backup)
     try:
         sys.stdout = LogWriter(logging.INFO, LOGGER)
         sys.stderr = LogWriter(logging.ERROR, LOGGER)
@@ -90,3 +95,9 @@ def redirect_stdouterr_to_logger():
     finally:
         sys.stdout = stdout_backup
         sys.stderr = stderr_backup
+        _redirected_stdouts.pop()
+
+
+def console_stdout():
+    """Return the standard output of the process, even when it is redirected to the logger."""
+    return _redirected_stdouts[0] if _redirected_stdouts else sys.stdout
@@ -19,7 +19,9 @@ function that is provided as the first argument and passing the **kwargs
 provided.
 """
 
+import json
 import logging
+import textwrap
 
 import argparse
 import boto3
@@ -28,6 +30,8 @@ from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
 from pcluster.cli.exceptions import APIOperationException, ParameterException
+from pcluster.cli.logger import console_stdout
+from pcluster.utils import to_iso_timestr, to_kebab_case, to_utc_datetime
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +53,26 @@ def add_additional_args(parser_map):
     parser_map["create-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["delete-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["update-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
+    parser_map["describe-cluster-instances"].add_argument(
+        "--all-pages",
+        action="store_true",
+        help="Print the instances of all the pages as they are retrieved, instead of a single page and the token "
+        "of the next one.",
+    )
+    for operation in ("get-cluster-log-events", "get-image-log-events"):
+        parser_map[operation].add_argument(
+            "--follow",
+            action="store_true",
+            help="Keep printing the events of the log stream as they are ingested, until interrupted. "
+            "By default the follow starts from the last events of the log stream.",
+        )
+        parser_map[operation].add_argument(
+            "--additional-log-stream-names",
+            nargs="+",
+            metavar="LOG_STREAM_NAME",
+            help="Names of other log streams to follow, whose events are merged by timestamp with the ones of the "
+            "log stream given with --log-stream-name. Only valid with --follow.",
+        )
 
 
 def middleware_hooks():
@@ -56,7 +80,14 @@ def middleware_hooks():
 
     The map has operation names as the keys and functions as values.
     """
-    return {"create-cluster": create_cluster, "delete-cluster": delete_cluster, "update-cluster": update_cluster}
+    return {
+        "create-cluster": create_cluster,
+        "delete-cluster": delete_cluster,
+        "update-cluster": update_cluster,
+        "describe-cluster-instances": describe_cluster_instances,
+        "get-cluster-log-events": get_cluster_log_events,
+        "get-image-log-events": get_image_log_events,
+    }
 
 
 def queryable(func):
@@ -118,3 +149,90 @@ def delete_cluster(func, _body, kwargs):
         return {"message": f"Successfully deleted cluster '{kwargs['cluster_name']}'."}
     else:
         return ret
+
+
+def describe_cluster_instances(func, _body, kwargs):
+    if not kwargs.pop("all_pages", False):
+        return func(**kwargs)
+
+    for unsupported_arg in ("next_token", "query"):
+        if kwargs.get(unsupported_arg):
+            raise ParameterException(
+                {"message": f"--{to_kebab_case(unsupported_arg)} cannot be used with --all-pages."}
+            )
+
+    # The instances are printed page by page with the same layout as a single JSON document, so that the whole
+    # fleet is never held in memory
+    stdout = console_stdout()
+    printed_instances = 0
+    print('{\n  "instances": [', end="", file=stdout)
+    while True:
+        page = func(**kwargs)
+        for instance in page.get("instances", []):
+            separator = ",\n" if printed_instances else "\n"
+            print(separator + textwrap.indent(json.dumps(instance, indent=2), "    "), end="", file=stdout, flush=True)
+            printed_instances += 1
+        kwargs["next_token"] = page.get("nextToken")
+        if not kwargs["next_token"]:
+            break
+    print("\n  ]\n}" if printed_instances else "]\n}", file=stdout, flush=True)
+    return None
+
+
+def get_cluster_log_events(func, _body, kwargs):
+    follow, log_stream_names = _pop_follow_args(kwargs)
+    if not follow:
+        return func(**kwargs)
+
+    from pcluster.models.cluster import Cluster  # pylint: disable=import-outside-toplevel
+
+    return _follow_log_events(Cluster(kwargs["cluster_name"]), log_stream_names, kwargs)
+
+
+def get_image_log_events(func, _body, kwargs):
+    follow, log_stream_names = _pop_follow_args(kwargs)
+    if not follow:
+        return func(**kwargs)
+
+    from pcluster.api.controllers.common import assert_supported_operation  # pylint: disable=import-outside-toplevel
+    from pcluster.constants import Operation  # pylint: disable=import-outside-toplevel
+    from pcluster.models.imagebuilder import ImageBuilder  # pylint: disable=import-outside-toplevel
+
+    assert_supported_operation(operation=Operation.GET_IMAGE_LOG_EVENTS, region=kwargs.get("region"))
+    return _follow_log_events(ImageBuilder(image_id=kwargs["image_id"]), log_stream_names, kwargs)
+
+
+def _pop_follow_args(kwargs):
+    """Remove the follow arguments, which are not part of the specification, and return them."""
+    follow = kwargs.pop("follow", False)
+    additional_log_stream_names = kwargs.pop("additional_log_stream_names", None) or []
+    if additional_log_stream_names and not follow:
+        raise ParameterException({"message": "--additional-log-stream-names can only be used with --follow."})
+    return follow, [kwargs["log_stream_name"]] + additional_log_stream_names
+
+
+def _follow_log_events(resource, log_stream_names, kwargs):
+    """Print the events of the log streams of the given cluster or image as text as they are ingested."""
+    from pcluster.api.controllers.common import validate_timestamp  # pylint: disable=import-outside-toplevel
+
+    for unsupported_arg in ("next_token", "end_time", "query"):
+        if kwargs.get(unsupported_arg):
+            raise ParameterException({"message": f"--{to_kebab_case(unsupported_arg)} cannot be used with --follow."})
+    start_time = kwargs.get("start_time") and validate_timestamp(kwargs["start_time"], "start_time")
+    limit = kwargs.get("limit")
+    if limit is not None and limit <= 0:
+        raise ParameterException({"message": "'limit' must be a positive integer."})
+
+    # Events are printed as they arrive, bypassing the redirection of the output to the logger
+    stdout = console_stdout()
+    try:
+        for event in resource.follow_log_events(
+            log_stream_names, start_time=start_time, start_from_head=bool(kwargs.get("start_from_head")), limit=limit
+        ):
+            prefix = to_iso_timestr(to_utc_datetime(event["timestamp"]))
+            if len(log_stream_names) > 1:
+                prefix += f" {event['logStreamName']}"
+            print(f"{prefix} {event['message']}", file=stdout, flush=True)
+    except KeyboardInterrupt:
+        LOGGER.info("Received KeyboardInterrupt. Stopped following log events.")
+    return None
@@ -11,14 +11,20 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import glob
+import hashlib
 import importlib
 import json
+import logging
+import os
+import tempfile
 
 import jmespath
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
+from pcluster.aws.persistent_cache import PersistentCache
 from pcluster.cli.exceptions import APIOperationException
-from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
+from pcluster.utils import get_installed_version, to_kebab_case, to_snake_case, yaml_load
 
 # For importing package resources
 try:
@@ -26,6 +32,12 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+LOGGER = logging.getLogger(__name__)
+
+# Bump this value whenever the layout of the model changes, to ignore the models compiled by older versions
+MODEL_SCHEMA_VERSION = 1
+MODEL_FILE_PREFIX = "cli-model-"
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -150,6 +162,70 @@ def load_model(spec):
     return model
 
 
+def _model_cache_path(spec_data: bytes):
+    """Return the path of the compiled model for the given specification and the installed ParallelCluster version."""
+    spec_digest = hashlib.sha256(spec_data).hexdigest()[:16]
+    return os.path.join(
+        PersistentCache.cache_dir(),
+        f"{MODEL_FILE_PREFIX}v{MODEL_SCHEMA_VERSION}-{get_installed_version()}-{spec_digest}.json",
+    )
+
+
+def _read_cached_model(path):
+    try:
+        with open(path, encoding="utf-8") as model_file:
+            return json.load(model_file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        LOGGER.debug("Unable to read compiled CLI model %s: %s", path, e)
+        return None
+
+
+def _write_cached_model(path, model):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, so that concurrent invocations never read a partially written model
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as model_file:
+            json.dump(model, model_file)
+        os.replace(model_file.name, path)
+    except OSError as e:
+        LOGGER.debug("Unable to write compiled CLI model %s: %s", path, e)
+        return
+    _delete_stale_models(path)
+
+
+def _delete_stale_models(path):
+    """Delete the models compiled for other versions or specifications than the one stored in the given path."""
+    for stale_path in glob.glob(os.path.join(os.path.dirname(path), f"{MODEL_FILE_PREFIX}*.json")):
+        if stale_path != path:
+            try:
+                os.remove(stale_path)
+            except OSError as e:
+                LOGGER.debug("Unable to delete stale compiled CLI model %s: %s", stale_path, e)
+
+
+def load_cached_model():
+    """
+    Return the model of the packaged specification, compiling it only on the first invocation.
+
+    The compiled model is stored as JSON next to the persistent cache, keyed by the package version and by a digest
+    of the specification, so that the specification is parsed again only when it changes.
+    Storage errors are never propagated and the caching can be disabled with the PCLUSTER_CACHE_DISABLED environment
+    variable.
+    """
+    spec_data = pkg_resources.read_binary(openapi, "openapi.yaml")
+    path = None if os.environ.get("PCLUSTER_CACHE_DISABLED") else _model_cache_path(spec_data)
+    model = _read_cached_model(path) if path else None
+    if model is None:
+        model = load_model(yaml_load(spec_data.decode("utf-8")))
+        if path:
+            _write_cached_model(path, model)
+    return model
+
+
 def get_function_from_name(function_name):
     """
     Get function by fully qualified name (e.g. "mymodule.myobj.myfunc").
@@ -205,6 +281,8 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
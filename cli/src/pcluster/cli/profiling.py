@@ -0,0 +1,144 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module profiles the startup of the pcluster CLI.
+
+The profiling is enabled by setting the PCLUSTER_PROFILE_IMPORTS environment variable or by passing the
+--profile-startup flag to any command. It reports to stderr the time spent importing every module and in every phase
+of the command (imports, model load, parse, dispatch).
+This module must only depend on the standard library, since it is imported before any other pcluster module.
+"""
+
+import builtins
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+MAX_REPORTED_IMPORTS = 25
+
+
+class StartupProfiler:
+    """Record the time spent importing modules and in the startup phases of the CLI."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._original_import = None
+        self.phases = []
+        self.imports = {}
+
+    def start_import_tracking(self):
+        """Time the first import of every module by wrapping the builtin import function."""
+        if self._original_import:
+            return
+        self._original_import = original_import = builtins.__import__
+
+        def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):  # pylint: disable=redefined-builtin
+            if level or name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+            start = time.perf_counter()
+            try:
+                return original_import(name, globals, locals, fromlist, level)
+            finally:
+                self.imports.setdefault(name, time.perf_counter() - start)
+
+        builtins.__import__ = _timed_import
+
+    def stop_import_tracking(self):
+        """Restore the builtin import function."""
+        if self._original_import:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def end_phase(self, name):
+        """Record a phase starting with the profiling and ending now."""
+        self.phases.append((name, time.perf_counter() - self._start))
+
+    @contextmanager
+    def phase(self, name):
+        """Record the time spent in the wrapped block as a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self):
+        """Return the recorded timings, imports sorted by decreasing cumulative time."""
+        slowest_imports = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "total": time.perf_counter() - self._start,
+            "phases": list(self.phases),
+            "imports": slowest_imports[:MAX_REPORTED_IMPORTS],
+        }
+
+    def print_report(self, stream=None):
+        """Print the recorded timings in a human readable format."""
+        stream = stream or sys.stderr
+        report = self.report()
+        lines = ["Startup profile (seconds):"]
+        lines.extend(f"  {name:<12} {duration:8.3f}" for name, duration in report["phases"])
+        lines.append(f"  {'total':<12} {report['total']:8.3f}")
+        lines.append("Slowest imports (cumulative seconds):")
+        lines.extend(f"  {duration:8.3f} {name}" for name, duration in report["imports"])
+        LOGGER.info("\n".join(lines))
+        print("\n".join(lines), file=stream)
+
+
+_profiler = None
+
+
+def is_requested(args):
+    """Tell if the startup profiling has been requested through the environment or the command line arguments."""
+    return bool(os.environ.get("PCLUSTER_PROFILE_IMPORTS")) or PROFILE_STARTUP_FLAG in args
+
+
+def start_if_requested(args):
+    """Start the profiling of the process if requested, return the profiler or None."""
+    global _profiler  # pylint: disable=global-statement
+    if _profiler is None and is_requested(args):
+        _profiler = StartupProfiler()
+        _profiler.start_import_tracking()
+    return _profiler
+
+
+def remove_flag(args):
+    """Return the command line arguments without the profiling flag, which is not part of any command."""
+    return [arg for arg in args if arg != PROFILE_STARTUP_FLAG]
+
+
+@contextmanager
+def phase(name):
+    """Record the wrapped block as a phase when profiling, do nothing otherwise."""
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name):
+            yield
+
+
+def end_phase(name):
+    """Record a phase ending now when profiling."""
+    if _profiler is not None:
+        _profiler.end_phase(name)
+
+
+def print_report():
+    """Stop the profiling and print its report, if profiling."""
+    global _profiler  # pylint: disable=global-statement
+    if _profiler is not None:
+        _profiler.stop_import_tracking()
+        _profiler.print_report()
+        _profiler = None
@@ -22,7 +22,7 @@ import pkg_resources
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
-from pcluster.aws.common import AWSClientError, get_region
+from pcluster.aws.common import AWSClientError, Cache, get_region
 from pcluster.config.common import AdditionalIamPolicy, BaseDevSettings, BaseTag, DeploymentSettings
 from pcluster.config.common import Imds as TopLevelImds
 from pcluster.config.common import Resource
@@ -43,7 +43,9 @@ from pcluster.constants import (
     EBS_VOLUME_TYPE_IOPS_DEFAULT,
     FILECACHE,
     LUSTRE,
+    MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE,
     MAX_COMPUTE_RESOURCES_PER_QUEUE,
+    MAX_CONCURRENT_DEPLOYMENT_WAVES,
     MAX_EBS_COUNT,
     MAX_EXISTING_STORAGE_COUNT,
     MAX_NEW_STORAGE_COUNT,
@@ -1091,6 +1093,15 @@ class CapacityReservationTarget(Resource):
         self.capacity_reservation_resource_group_arn = Resource.init_param(capacity_reservation_resource_group_arn)
 
 
+class ComputeFleetDeployment(Resource):
+    """Represent the configuration of the waves deploying the compute fleet."""
+
+    def __init__(self, wave_size: int = None, max_concurrent_waves: int = None):
+        super().__init__()
+        self.wave_size = Resource.init_param(wave_size, default=MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE)
+        self.max_concurrent_waves = Resource.init_param(max_concurrent_waves, default=MAX_CONCURRENT_DEPLOYMENT_WAVES)
+
+
 class ClusterDevSettings(BaseDevSettings):
     """Represent the dev settings configuration."""
 
@@ -1100,6 +1111,7 @@ class ClusterDevSettings(BaseDevSettings):
         ami_search_filters: AmiSearchFilters = None,
         instance_types_data: str = None,
         timeouts: Timeouts = None,
+        compute_fleet_deployment: ComputeFleetDeployment = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -1107,6 +1119,7 @@ class ClusterDevSettings(BaseDevSettings):
         self.ami_search_filters = Resource.init_param(ami_search_filters)
         self.instance_types_data = Resource.init_param(instance_types_data)
         self.timeouts = Resource.init_param(timeouts)
+        self.compute_fleet_deployment = Resource.init_param(compute_fleet_deployment)
 
     def _register_validators(self, context: ValidatorContext = None):
         super()._register_validators(context)
@@ -1576,6 +1589,66 @@ class BaseClusterConfig(Resource):
         if volume_ids:
             AWSApi.instance().fsx.describe_volumes(volume_ids)
 
+    def prefetch_aws_resources(self):
+        """
+        Retrieve the AWS resources referenced by the configuration with one batched call per kind of resource.
+
+        The results are stored in the caches of the AWS clients, so that validators describing a single resource
+        do not call the AWS services again. Failures are ignored since the validators report them for each resource.
+        Capacity reservations are not included: they are already described with a single call, together with the ones
+        of the capacity reservation resource groups, when the configuration is created.
+        """
+        if not Cache.is_enabled():
+            return
+        ec2 = AWSApi.instance().ec2
+        fsx = AWSApi.instance().fsx
+        prefetches = [
+            (ec2.describe_subnets, self._prefetch_subnet_ids()),
+            (ec2.describe_security_groups, self._prefetch_security_group_ids()),
+            (ec2.get_instance_types_info, self._prefetch_instance_types()),
+            (ec2.describe_images_by_ids, self._prefetch_image_ids()),
+            (ec2.describe_volumes, self._prefetch_storage_ids(SharedEbs, "volume_id")),
+            (fsx.describe_volumes, self._prefetch_storage_ids((ExistingFsxOpenZfs, ExistingFsxOntap), "volume_id")),
+            (fsx.get_file_systems_info, self._prefetch_storage_ids(SharedFsxLustre, "file_system_id")),
+            (fsx.describe_file_caches, self._prefetch_storage_ids(ExistingFsxFileCache, "file_cache_id")),
+        ]
+        for describe_function, resource_ids in prefetches:
+            resource_ids = list(dict.fromkeys(resource_id for resource_id in resource_ids if resource_id))
+            if not resource_ids:
+                continue
+            try:
+                describe_function(resource_ids)
+            except AWSClientError as e:
+                LOGGER.debug("Unable to prefetch resources %s: %s", resource_ids, e)
+
+    def _prefetch_storage_ids(self, storage_types, id_attribute):
+        return [
+            getattr(storage, id_attribute)
+            for storage in self.shared_storage or []
+            if isinstance(storage, storage_types)
+        ]
+
+    def _prefetch_subnet_ids(self):
+        subnet_ids = [self.head_node.networking.subnet_id] + self.compute_subnet_ids
+        if self.lambda_functions_vpc_config:
+            subnet_ids.extend(self.lambda_functions_vpc_config.subnet_ids or [])
+        return subnet_ids
+
+    def _prefetch_security_group_ids(self):
+        security_group_ids = []
+        for networking in [self.head_node.networking] + [queue.networking for queue in self.scheduling.queues]:
+            security_group_ids.extend(networking.security_groups or [])
+            security_group_ids.extend(networking.additional_security_groups or [])
+        if self.lambda_functions_vpc_config:
+            security_group_ids.extend(self.lambda_functions_vpc_config.security_group_ids or [])
+        return security_group_ids
+
+    def _prefetch_instance_types(self):
+        return [self.head_node.instance_type]
+
+    def _prefetch_image_ids(self):
+        return [self.head_node_ami]
+
     @property
     def region(self):
         """Retrieve region from environment if not set."""
@@ -2882,21 +2955,29 @@ class SchedulerPluginScheduling(Resource):
 class CommonSchedulerClusterConfig(BaseClusterConfig):
     """Represent the common Cluster configuration between Slurm Config and Scheduler Plugin Config."""
 
+    def _prefetch_instance_types(self):
+        instance_types = super()._prefetch_instance_types()
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types)
+        return instance_types
+
+    def _prefetch_image_ids(self):
+        return super()._prefetch_image_ids() + list(self.image_dict.values())
+
     def _register_validators(self, context: ValidatorContext = None):
         super()._register_validators(context)
         checked_images = []
-        for index, queue in enumerate(self.scheduling.queues):
+        for dry_run in ComputeResourceLaunchTemplateValidator.build_dry_runs(
+            queues=self.scheduling.queues,
+            os=self.image.os,
+            ami_ids=self.image_dict,
+            tags=self.get_tags(),
+            imds_support=self.imds.imds_support,
+        ):
+            self._register_validator(ComputeResourceLaunchTemplateValidator, **dry_run)
+        for queue in self.scheduling.queues:
             queue_image = self.image_dict[queue.name]
-            if index == 0:
-                # Execute LaunchTemplateValidator only for the first queue
-                self._register_validator(
-                    ComputeResourceLaunchTemplateValidator,
-                    queue=queue,
-                    ami_id=queue_image,
-                    os=self.image.os,
-                    tags=self.get_tags(),
-                    imds_support=self.imds.imds_support,
-                )
             ami_volume_size = AWSApi.instance().ec2.describe_image(queue_image).volume_size
             root_volume = queue.compute_settings.local_storage.root_volume
             root_volume_size = root_volume.size
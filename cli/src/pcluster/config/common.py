@@ -13,13 +13,23 @@
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
 import asyncio
-import itertools
+import collections
+import contextlib
 import json
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Set
 
-from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationResult, Validator, ValidatorContext
+from pcluster.validators.common import (
+    VALIDATION_MAX_CONCURRENCY,
+    VALIDATION_SERVICE_MAX_CONCURRENCY,
+    AsyncValidator,
+    FailureLevel,
+    ValidationResult,
+    Validator,
+    ValidatorContext,
+)
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
 from pcluster.validators.s3_validators import UrlValidator
@@ -68,6 +78,92 @@ class TypeMatchValidatorsSuppressor(ValidatorSuppressor):
         return validator.type in self._validators_to_suppress
 
 
+class ValidationScheduler:
+    """
+    Execute a list of (validator_class, validator_args) jobs and return their failures in a deterministic order.
+
+    Validators that do not call AWS services are executed inline, in order.
+    Validators declaring aws_services are executed concurrently on a bounded thread pool, with at most
+    service_max_concurrency validators calling the same service at a given time.
+    Async validators are executed on the event loop together with the above ones.
+    The failures of the sync validators are returned first, followed by the ones of the async validators, each group
+    in the order the jobs were given, regardless of the order the validators complete.
+    """
+
+    def __init__(
+        self,
+        suppressors: List[ValidatorSuppressor] = None,
+        max_concurrency: int = VALIDATION_MAX_CONCURRENCY,
+        service_max_concurrency: int = VALIDATION_SERVICE_MAX_CONCURRENCY,
+    ):
+        self._suppressors = suppressors or []
+        self._max_concurrency = max_concurrency
+        self._service_max_concurrency = service_max_concurrency
+
+    def _is_suppressed(self, validator: Validator):
+        if any(suppressor.suppress_validator(validator) for suppressor in self._suppressors):
+            LOGGER.debug("Suppressing validator %s", validator.type)
+            return True
+        return False
+
+    @staticmethod
+    def _execute_sync(validator: Validator, validator_args):
+        LOGGER.debug("Executing validator %s", validator.type)
+        try:
+            return validator.execute(**validator_args)
+        except Exception as e:
+            LOGGER.debug("Validator %s unexpected failure: %s", validator.type, e)
+            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
+
+    @staticmethod
+    async def _execute_async(validator: AsyncValidator, validator_args):
+        LOGGER.debug("Executing validator %s", validator.type)
+        try:
+            return await validator.execute_async(**validator_args)
+        except Exception as e:
+            LOGGER.debug("Validator %s unexpected failure: %s", validator.type, e)
+            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
+
+    async def _execute_in_executor(self, executor, semaphores, validator: Validator, validator_args):
+        async with contextlib.AsyncExitStack() as stack:
+            # Acquire the semaphores always in the same order to avoid deadlocks
+            for service in sorted(set(validator.aws_services)):
+                await stack.enter_async_context(semaphores[service])
+            return await asyncio.get_event_loop().run_in_executor(
+                executor, self._execute_sync, validator, validator_args
+            )
+
+    async def _run(self, jobs, executor):
+        semaphores = collections.defaultdict(lambda: asyncio.Semaphore(self._service_max_concurrency))
+        sync_results, async_results = [], []
+        for validator_class, validator_args in jobs:
+            validator = validator_class()
+            if self._is_suppressed(validator):
+                continue
+            if isinstance(validator, AsyncValidator):
+                async_results.append(asyncio.ensure_future(self._execute_async(validator, validator_args)))
+            elif validator.aws_services and executor:
+                sync_results.append(
+                    asyncio.ensure_future(self._execute_in_executor(executor, semaphores, validator, validator_args))
+                )
+            else:
+                sync_results.append(self._execute_sync(validator, validator_args))
+
+        failures = []
+        for result in sync_results + async_results:
+            failures.extend((await result if asyncio.isfuture(result) else result) or [])
+        return failures
+
+    def run(self, jobs) -> List[ValidationResult]:
+        """Execute the given jobs and return the list of validation failures."""
+        executor = ThreadPoolExecutor(max_workers=self._max_concurrency) if self._max_concurrency > 1 else None
+        try:
+            return asyncio.get_event_loop().run_until_complete(self._run(jobs, executor))
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+
 class Resource:
     """Represent an abstract Resource entity."""
 
@@ -124,8 +220,6 @@ class Resource:
     def __init__(self, implied: bool = False):
         # Parameters registry
         self.__params = {}
-        self._validation_futures = []
-        self._validation_failures: List[ValidationResult] = []
         self._validators: List = []
         self.implied = implied
 
@@ -170,40 +264,6 @@ class Resource:
         """Create a resource attribute backed by a Configuration Parameter."""
         return Resource.Param(value, default=default, update_policy=update_policy)
 
-    @staticmethod
-    def _validator_execute(validator_class, validator_args, suppressors, validation_executor):
-        validator = validator_class()
-
-        if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
-            LOGGER.debug("Suppressing validator %s", validator_class.__name__)
-            return None
-
-        LOGGER.debug("Executing validator %s", validator_class.__name__)
-        return validation_executor(validator_args, validator)
-
-    @staticmethod
-    def _validator_execute_sync(validator_args, validator):
-        try:
-            return validator.execute(**validator_args)
-        except Exception as e:
-            LOGGER.debug("Validator %s unexpected failure: %s", validator.type, e)
-            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
-
-    @staticmethod
-    def _validator_execute_async(validator_args, validator):
-        return validator.execute_async(**validator_args)
-
-    def _await_async_validators(self):
-        # here could be a good spot to add a cascading timeout for the async validators
-        # if they are taking too long to execute for a resource and its children since the use of
-        # get_async_timed_validator_type_for allows to decorate only on single validator at a time and
-        # does not cascade to child resources
-        return list(
-            itertools.chain.from_iterable(
-                asyncio.get_event_loop().run_until_complete(asyncio.gather(*self._validation_futures))
-            )
-        )
-
     def _nested_resources(self):
         nested_resources = []
         for _, value in self.__dict__.items():
@@ -213,53 +273,24 @@ class Resource:
                 nested_resources.extend(item for item in value if isinstance(item, Resource))
         return nested_resources
 
-    def validate(
-        self, suppressors: List[ValidatorSuppressor] = None, context: ValidatorContext = None, nested: bool = False
-    ):
+    def validate(self, suppressors: List[ValidatorSuppressor] = None, context: ValidatorContext = None):
         """
-        Execute registered validators.
+        Execute registered validators of the resource and of all its nested resources.
 
-        The "nested" parameter is used only for internal recursive calls to distinguish those from the top level
-        one where the async validators results should be awaited for.
+        The validators are first collected from the whole resource tree and then executed by a ValidationScheduler,
+        so that the ones calling AWS services run concurrently while results are kept in a deterministic order.
         """
-        # this validation logic is a responsibility that could be completely separated from the resource tree
-        # also until we need to support both sync and async validation this logic will be unnecessarily complex
-        # embracing async validation completely is possible and will greatly simplify this
-        self._validation_futures.clear()
-        self._validation_failures.clear()
+        return ValidationScheduler(suppressors).run(self._collect_validation_jobs(context))
 
-        try:
-            self._validate_nested_resources(context, suppressors)
-            self._validate_self(context, suppressors)
-        finally:
-            if nested:
-                result = self._validation_failures, self._validation_futures.copy()
-            else:
-                self._validation_failures.extend(self._await_async_validators())
-                result = self._validation_failures
-            self._validation_futures.clear()
-
-        return result
-
-    def _validate_nested_resources(self, context, suppressors):
-        # Call validators for nested resources
+    def _collect_validation_jobs(self, context: ValidatorContext = None):
+        """Return the (validator_class, validator_args) jobs of the nested resources first, then the ones of self."""
+        jobs = []
         for nested_resource in self._nested_resources():
-            failures, futures = nested_resource.validate(suppressors, context, nested=True)
-            self._validation_futures.extend(futures)
-            self._validation_failures.extend(failures)
-
-    def _validate_self(self, context, suppressors):
+            jobs.extend(nested_resource._collect_validation_jobs(context))  # pylint: disable=protected-access
         self._validators.clear()
         self._register_validators(context)
-        for validator in self._validators:
-            if issubclass(validator[0], AsyncValidator):
-                result = self._validator_execute(*validator, suppressors, self._validator_execute_async)
-                if result:
-                    self._validation_futures.extend([result])
-            else:
-                self._validation_failures.extend(
-                    self._validator_execute(*validator, suppressors, self._validator_execute_sync) or []
-                )
+        jobs.extend(self._validators)
+        return jobs
 
     def _register_validators(self, context: ValidatorContext = None):
         """
@@ -8,26 +8,17 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
-import copy
 import logging
-import re
-import sys
 from collections import namedtuple
-from typing import List
+from typing import Tuple
 
-from pcluster.config.update_policy import UpdatePolicy
+from pcluster.config.update_policy import UpdateCheckContext, UpdatePolicy
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.schemas.common_schema import BaseSchema
 
 # Represents a single parameter change in a ConfigPatch instance
 Change = namedtuple("Change", ["path", "key", "old_value", "new_value", "update_policy", "is_list"])
 
-# Patch for deepcopy bug - Issue10076 in Python < 3.7
-# see https://bugs.python.org/issue10076
-# see https://docs.python.org/3/whatsnew/3.7.html#re
-if sys.version_info <= (3, 7):
-    copy._deepcopy_dispatch[type(re.compile(""))] = lambda r, _: r  # pylint: disable=protected-access
-
 LOGGER = logging.getLogger(__name__)
 
 
@@ -62,13 +53,17 @@ class ConfigPatch:
         self.cluster = cluster
         # Cached condition results
         self.condition_results = {}
+        # Live cluster facts read by the update policy checks
+        self.context = UpdateCheckContext(cluster)
 
-        # Make a deep copy of the basic and target configurations to avoid changing the original ones
-        self.base_config = copy.deepcopy(base_config)
-        self.target_config = copy.deepcopy(target_config)
+        # The comparison never modifies the configurations, so there is no need to copy them
+        self.base_config = base_config
+        self.target_config = target_config
 
         self.cluster_schema = ClusterSchema(cluster_name=cluster.name)
         self.changes = []
+        # Structural hashes of the sections being compared, by object id
+        self._structural_hashes = {}
         self._compare()
 
     @property
@@ -88,17 +83,56 @@ class ConfigPatch:
         All detected changes are added to the internal changes list, ready to be checked  through the public check()
         method.
         """
-        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=[])
+        try:
+            self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=())
+        finally:
+            self._structural_hashes.clear()
+
+    def _structural_hash(self, value):
+        """
+        Return a hash of the given configuration value that only depends on its content.
 
-    def _compare_section(self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: List):
+        Hashes of dicts and lists are computed once and cached, so that nested sections are hashed only once no matter
+        how deep the comparison goes.
+        """
+        if isinstance(value, dict):
+            value_hash = self._structural_hashes.get(id(value))
+            if value_hash is None:
+                value_hash = hash(frozenset((key, self._structural_hash(item)) for key, item in value.items()))
+                self._structural_hashes[id(value)] = value_hash
+            return value_hash
+        if isinstance(value, list):
+            value_hash = self._structural_hashes.get(id(value))
+            if value_hash is None:
+                value_hash = hash(tuple(self._structural_hash(item) for item in value))
+                self._structural_hashes[id(value)] = value_hash
+            return value_hash
+        try:
+            return hash(value)
+        except TypeError:
+            return hash(repr(value))
+
+    def _is_identical(self, base_value, target_value):
+        """Tell if two configuration values are identical, using their structural hashes to rule out differences."""
+        if base_value is target_value:
+            return True
+        return self._structural_hash(base_value) == self._structural_hash(target_value) and base_value == target_value
+
+    def _compare_section(
+        self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: Tuple[str, ...]
+    ):
         """
         Compare the provided base and target sections and append the detected changes to the internal changes list.
 
         :param base_section: The section in the base configuration
         :param target_section: The corresponding section in the target configuration
         :param section_schema: schema corresponding to the section to be analyzed (contains all the resources/params)
-        :param param_path: A list on which the items correspond to the path of the param in the configuration schema
+        :param param_path: A tuple on which the items correspond to the path of the param in the configuration schema
         """
+        if self._is_identical(base_section, target_section):
+            # Nothing to compare in identical sections
+            return
+
         for _, field_obj in section_schema.declared_fields.items():
             data_key = field_obj.data_key
             is_nested_section = hasattr(field_obj, "nested")
@@ -127,7 +161,7 @@ class ConfigPatch:
                             # Add section change information
                             self.changes.append(
                                 Change(
-                                    param_path,
+                                    list(param_path),
                                     data_key,
                                     base_value if base_value else "-",
                                     target_value if target_value else "-",
@@ -143,14 +177,14 @@ class ConfigPatch:
                 if target_value != base_value:
                     # Add param change information
                     self.changes.append(
-                        Change(param_path, data_key, base_value, target_value, change_update_policy, is_list=False)
+                        Change(
+                            list(param_path), data_key, base_value, target_value, change_update_policy, is_list=False
+                        )
                     )
 
     def _compare_nested_section(self, param_path, data_key, base_value, target_value, field_obj):
         # Compare nested sections and params
-        nested_path = copy.deepcopy(param_path)
-        nested_path.append(data_key)
-        self._compare_section(base_value, target_value, field_obj.schema, nested_path)
+        self._compare_section(base_value, target_value, field_obj.schema, param_path + (data_key,))
 
     def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
         """
@@ -159,28 +193,30 @@ class ConfigPatch:
         If update_key is not set we're considering Name as identifier.
         """
         update_key = field_obj.metadata.get("update_key")
+        base_nested_sections = base_section.get(data_key, [])
 
-        # Compare items in the list by searching the right item to compare through update_key value
-        # First, compare all sections from target vs base config and mark visited base sections.
+        # Index the base sections by update_key value, keeping the first section when the value is repeated
+        base_indexes = {}
+        for index, base_nested_section in enumerate(base_nested_sections):
+            base_indexes.setdefault(base_nested_section.get(update_key), index)
+
+        # First, compare all sections from target vs base config and keep track of the matched base sections.
+        matched_indexes = set()
         for target_nested_section in target_section.get(data_key, []):
             update_key_value = target_nested_section.get(update_key)
-            base_nested_section = next(
-                (
-                    nested_section
-                    for nested_section in base_section.get(data_key, [])
-                    if nested_section.get(update_key) == update_key_value
-                ),
-                None,
-            )
-            if base_nested_section:
-                nested_path = copy.deepcopy(param_path)
-                nested_path.append(f"{data_key}[{update_key_value}]")
-                self._compare_section(base_nested_section, target_nested_section, field_obj.schema, nested_path)
-                base_nested_section["visited"] = True
+            base_index = base_indexes.get(update_key_value)
+            if base_index is not None and base_nested_sections[base_index]:
+                self._compare_section(
+                    base_nested_sections[base_index],
+                    target_nested_section,
+                    field_obj.schema,
+                    param_path + (f"{data_key}[{update_key_value}]",),
+                )
+                matched_indexes.add(base_index)
             else:
                 self.changes.append(
                     Change(
-                        param_path,
+                        list(param_path),
                         data_key,
                         None,
                         target_nested_section,
@@ -188,12 +224,12 @@ class ConfigPatch:
                         is_list=True,
                     )
                 )
-        # Then, compare all non visited base sections vs target config.
-        for base_nested_section in base_section.get(data_key, []):
-            if not base_nested_section.get("visited", False):
+        # Then, compare all unmatched base sections vs target config.
+        for index, base_nested_section in enumerate(base_nested_sections):
+            if index not in matched_indexes:
                 self.changes.append(
                     Change(
-                        param_path,
+                        list(param_path),
                         data_key,
                         base_nested_section,
                         None,
@@ -224,6 +260,8 @@ class ConfigPatch:
         All changes in the patch are checked against the existing cluster; their conditions are verified and a detailed
         report is generated. Each line of the report will contain all the details about the detected change, together
         with the corresponding reason if the change is not applicable and any action needed to unlock the problem.
+        The cluster facts the checks depend on are retrieved once for the whole patch, and the ones used for each
+        change are logged.
 
         :return: A tuple containing the patch applicability and the report rows.
         """
@@ -233,8 +271,19 @@ class ConfigPatch:
 
         patch_allowed = True
 
+        # Retrieve the cluster facts needed by the checks at once, instead of on every change
+        self.context.gather({fact for change in self.changes for fact in change.update_policy.facts})
+
         for change in self.changes:
-            check_result, reason, action_needed, print_change = change.update_policy.check(change, self)
+            with self.context.record_used_facts() as used_facts:
+                check_result, reason, action_needed, print_change = change.update_policy.check(change, self)
+            if used_facts:
+                LOGGER.info(
+                    "Change of %s checked with result %s based on cluster facts %s",
+                    self.build_config_param_path(change.path, change.key),
+                    check_result.value,
+                    used_facts,
+                )
 
             if check_result != UpdatePolicy.CheckResult.SUCCEEDED:
                 patch_allowed = False
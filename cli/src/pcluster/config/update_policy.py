@@ -8,12 +8,117 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 
 from pcluster.config.cluster_config import QueueUpdateStrategy
 from pcluster.constants import AWSBATCH, DEFAULT_MAX_COUNT, SLURM
 
+LOGGER = logging.getLogger(__name__)
+
+
+class UpdateCheckContext:
+    """
+    Snapshot of the live cluster facts the update policy checks depend on.
+
+    Each fact is retrieved at most once, so that checking many changes doesn't repeat the same AWS calls. The facts
+    needed by a patch can be retrieved concurrently in advance with gather(), the missing ones are retrieved on first
+    access.
+    """
+
+    SCHEDULER = "scheduler"
+    HAS_RUNNING_CAPACITY = "has_running_capacity"
+    RUNNING_CAPACITY = "running_capacity"
+    HEAD_NODE_STATE = "head_node_state"
+
+    _FACT_GETTERS = {
+        SCHEDULER: lambda cluster: cluster.stack.scheduler,
+        HAS_RUNNING_CAPACITY: lambda cluster: cluster.has_running_capacity(),
+        RUNNING_CAPACITY: lambda cluster: cluster.get_running_capacity(),
+        HEAD_NODE_STATE: lambda cluster: cluster.head_node_instance.state,
+    }
+
+    def __init__(self, cluster):
+        self._cluster = cluster
+        self._facts = {}
+        self._used_facts = None
+
+    @property
+    def scheduler(self):
+        """Return the scheduler of the cluster."""
+        return self.get(self.SCHEDULER)
+
+    @property
+    def has_running_capacity(self):
+        """Return True if the cluster has running capacity."""
+        return self.get(self.HAS_RUNNING_CAPACITY)
+
+    @property
+    def running_capacity(self):
+        """Return the number of compute instances or the desired vCPUs of the cluster."""
+        return self.get(self.RUNNING_CAPACITY)
+
+    @property
+    def head_node_state(self):
+        """Return the state of the head node instance."""
+        return self.get(self.HEAD_NODE_STATE)
+
+    def get(self, fact):
+        """Return the value of the given fact, retrieving it from the cluster the first time."""
+        if fact not in self._facts:
+            self._facts[fact] = self._FACT_GETTERS[fact](self._cluster)
+        if self._used_facts is not None:
+            self._used_facts[fact] = self._facts[fact]
+        return self._facts[fact]
+
+    def gather(self, facts):
+        """
+        Retrieve the given facts concurrently.
+
+        Failures are not raised here: the fact is retrieved again, and the error raised, when a check reads it.
+        """
+        missing_facts = [fact for fact in self._FACT_GETTERS if fact in facts and fact not in self._facts]
+        if not missing_facts:
+            return
+        # The other facts depend on the cluster stack, retrieve it once before looking up the other facts
+        if self.SCHEDULER in missing_facts or len(missing_facts) > 1:
+            self.get(self.SCHEDULER)
+        missing_facts = [fact for fact in missing_facts if fact != self.SCHEDULER]
+        if not missing_facts:
+            return
+        # Whether AWS Batch clusters have running capacity is derived from their running capacity,
+        # derive it afterwards rather than looking up the compute environment twice concurrently
+        derive_has_running_capacity = (
+            self._facts.get(self.SCHEDULER) == AWSBATCH
+            and self.HAS_RUNNING_CAPACITY in missing_facts
+            and self.RUNNING_CAPACITY in missing_facts
+        )
+        if derive_has_running_capacity:
+            missing_facts.remove(self.HAS_RUNNING_CAPACITY)
+
+        with ThreadPoolExecutor(max_workers=len(missing_facts)) as executor:
+            futures = {fact: executor.submit(self._FACT_GETTERS[fact], self._cluster) for fact in missing_facts}
+        for fact, future in futures.items():
+            try:
+                self._facts[fact] = future.result()
+            except Exception as e:
+                LOGGER.debug("Unable to retrieve cluster fact %s: %s", fact, e)
+        if derive_has_running_capacity and self.RUNNING_CAPACITY in self._facts:
+            # The running capacity is cached by the cluster, no further lookup is made
+            self._facts[self.HAS_RUNNING_CAPACITY] = self._FACT_GETTERS[self.HAS_RUNNING_CAPACITY](self._cluster)
+
+    @contextmanager
+    def record_used_facts(self):
+        """Collect the facts read in the block, by name, into the yielded dictionary."""
+        self._used_facts = {}
+        try:
+            yield self._used_facts
+        finally:
+            self._used_facts = None
+
 
 class UpdatePolicy:
     """Describes the policy that rules the update of a configuration parameter."""
@@ -34,6 +139,7 @@ class UpdatePolicy:
         action_needed=None,
         condition_checker=None,
         print_succeeded=True,
+        facts=None,
     ):
         self.name = None
         self.fail_reason = None
@@ -41,6 +147,8 @@ class UpdatePolicy:
         self.condition_checker = None
         self.print_succeeded = print_succeeded
         self.level = 0
+        # Cluster facts (see UpdateCheckContext) read by the checks of the policy
+        self.facts = ()
 
         if base_policy:
             self.name = base_policy.name
@@ -48,6 +156,7 @@ class UpdatePolicy:
             self.action_needed = base_policy.action_needed
             self.condition_checker = base_policy.condition_checker
             self.level = base_policy.level
+            self.facts = base_policy.facts
 
         if name:
             self.name = name
@@ -59,6 +168,8 @@ class UpdatePolicy:
             self.action_needed = action_needed
         if condition_checker:
             self.condition_checker = condition_checker
+        if facts:
+            self.facts = facts
 
     def check(self, change, patch):
         """
@@ -122,7 +233,7 @@ def actions_needed_managed_placement_group(change, patch):
 
 
 def condition_checker_compute_fleet_stop_on_remove(change, patch):
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.context.has_running_capacity
     # SlurmQueue or ComputeResource can be added but removal require compute fleet stop
     if change.is_list and (is_slurm_queues_change(change) or change.key == "SlurmQueues"):
         result = result or (change.old_value is None and change.new_value is not None)
@@ -206,11 +317,11 @@ def unchanged_managed_fsx_lustre_names(_, patch):
 
 
 def is_slurm_scheduler(patch):
-    return patch.cluster.stack.scheduler == SLURM
+    return patch.context.scheduler == SLURM
 
 
 def is_awsbatch_scheduler(_, patch):
-    return patch.cluster.stack.scheduler == AWSBATCH
+    return patch.context.scheduler == AWSBATCH
 
 
 def is_stop_required_for_shared_storage(change):
@@ -277,7 +388,7 @@ def is_queue_update_strategy_set(patch):
 
 
 def condition_checker_queue_update_strategy(change, patch):
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.context.has_running_capacity
     # QueueUpdateStrategy can override UpdatePolicy of parameters under SlurmQueues
     if is_slurm_queues_change(change):
         result = result or is_queue_update_strategy_set(patch)
@@ -286,7 +397,7 @@ def condition_checker_queue_update_strategy(change, patch):
 
 
 def condition_checker_queue_update_strategy_on_remove(change, patch):
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.context.has_running_capacity
     # Update of list element value is possible if one of the following is verified:
     # - fleet is stopped
     # - queue update strategy is set (different from default)
@@ -302,7 +413,7 @@ def condition_checker_queue_update_strategy_on_remove(change, patch):
 
 
 def condition_checker_managed_placement_group(change, patch):
-    if is_managed_placement_group_deletion(change, patch) and patch.cluster.has_running_capacity():
+    if is_managed_placement_group_deletion(change, patch) and patch.context.has_running_capacity:
         result = False
     else:
         result = condition_checker_queue_update_strategy(change, patch)
@@ -353,7 +464,7 @@ def condition_checker_shared_storage_update_policy(change, patch):
     """
     if is_awsbatch_scheduler(change, patch):
         return False
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.context.has_running_capacity
     if is_slurm_scheduler(patch) and not is_stop_required_for_shared_storage(change):
         result = result or is_queue_update_strategy_set(patch)
 
@@ -406,11 +517,12 @@ UpdatePolicy.AWSBATCH_CE_MAX_RESIZE = UpdatePolicy(
     name="AWSBATCH_CE_MAX_RESIZE",
     level=1,
     fail_reason=lambda change, patch: "Max vCPUs can not be lower than the current Desired vCPUs ({0})".format(
-        patch.cluster.get_running_capacity()
+        patch.context.running_capacity
     ),
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: patch.cluster.get_running_capacity()
+    condition_checker=lambda change, patch: patch.context.running_capacity
     <= patch.target_config["Scheduling"]["AwsBatchQueues"][0]["ComputeResources"][0]["MaxvCpus"],
+    facts=(UpdateCheckContext.RUNNING_CAPACITY,),
 )
 
 # Checks resize of max_count
@@ -419,9 +531,10 @@ UpdatePolicy.MAX_COUNT = UpdatePolicy(
     level=1,
     fail_reason=lambda change, patch: "Shrinking a queue requires the compute fleet to be stopped first",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: not patch.cluster.has_running_capacity()
+    condition_checker=lambda change, patch: not patch.context.has_running_capacity
     or (int(change.new_value) if change.new_value is not None else DEFAULT_MAX_COUNT)
     >= (int(change.old_value) if change.old_value is not None else DEFAULT_MAX_COUNT),
+    facts=(UpdateCheckContext.HAS_RUNNING_CAPACITY,),
 )
 
 # Update supported only with all compute nodes down or with replacement policy set different from COMPUTE_FLEET_STOP
@@ -431,6 +544,7 @@ UpdatePolicy.QUEUE_UPDATE_STRATEGY = UpdatePolicy(
     fail_reason=fail_reason_queue_update_strategy,
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop_conditional"],
     condition_checker=condition_checker_queue_update_strategy,
+    facts=(UpdateCheckContext.HAS_RUNNING_CAPACITY,),
 )
 
 # We must force COMPUTE_FLEET_STOP for the deletion of managed groups, otherwise fall back to QUEUE_UPDATE_STRATEGY
@@ -440,6 +554,7 @@ UpdatePolicy.MANAGED_PLACEMENT_GROUP = UpdatePolicy(
     fail_reason=fail_reason_managed_placement_group,
     action_needed=UpdatePolicy.ACTIONS_NEEDED["managed_placement_group"],
     condition_checker=condition_checker_managed_placement_group,
+    facts=(UpdateCheckContext.HAS_RUNNING_CAPACITY,),
 )
 
 # Update policy for updating SharedStorage
@@ -449,6 +564,7 @@ UpdatePolicy.SHARED_STORAGE_UPDATE_POLICY = UpdatePolicy(
     fail_reason=fail_reason_shared_storage_update_policy,
     action_needed=UpdatePolicy.ACTIONS_NEEDED["shared_storage_update_conditional"],
     condition_checker=condition_checker_shared_storage_update_policy,
+    facts=(UpdateCheckContext.SCHEDULER, UpdateCheckContext.HAS_RUNNING_CAPACITY),
 )
 
 # Update supported on new addition or on removal only with all compute nodes down
@@ -458,6 +574,7 @@ UpdatePolicy.COMPUTE_FLEET_STOP_ON_REMOVE = UpdatePolicy(
     fail_reason="All compute nodes must be stopped",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
     condition_checker=condition_checker_compute_fleet_stop_on_remove,
+    facts=(UpdateCheckContext.HAS_RUNNING_CAPACITY,),
 )
 
 # Update supported only with all compute nodes down
@@ -466,7 +583,8 @@ UpdatePolicy.COMPUTE_FLEET_STOP = UpdatePolicy(
     level=10,
     fail_reason="All compute nodes must be stopped",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: not patch.cluster.has_running_capacity(),
+    condition_checker=lambda change, patch: not patch.context.has_running_capacity,
+    facts=(UpdateCheckContext.HAS_RUNNING_CAPACITY,),
 )
 
 # Update supported only with head node down
@@ -475,7 +593,8 @@ UpdatePolicy.HEAD_NODE_STOP = UpdatePolicy(
     level=20,
     fail_reason="To perform this update action, the head node must be in a stopped state",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: patch.cluster.head_node_instance.state == "stopped",
+    condition_checker=lambda change, patch: patch.context.head_node_state == "stopped",
+    facts=(UpdateCheckContext.HEAD_NODE_STATE,),
 )
 
 # Expected Behavior:
@@ -525,4 +644,5 @@ UpdatePolicy.MANAGED_FSX = UpdatePolicy(
     fail_reason=fail_reason_managed_fsx,
     action_needed=UpdatePolicy.ACTIONS_NEEDED["managed_fsx"],
     condition_checker=condition_checker_managed_fsx,
+    facts=(UpdateCheckContext.HAS_RUNNING_CAPACITY,),
 )
@@ -104,7 +104,10 @@ MAX_NUMBER_OF_QUEUES = 100
 SCHEDULER_PLUGIN_MAX_NUMBER_OF_QUEUES = 10
 SCHEDULER_PLUGIN_MAX_NUMBER_OF_COMPUTE_RESOURCES = 5
 MAX_NUMBER_OF_COMPUTE_RESOURCES_PER_CLUSTER = 150  # Based on API timeout limitations
-MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE = 150  # Maximum compute resources that can be deployed at the same time
+# Default maximum compute resources deployed by a single wave, configurable in DevSettings/ComputeFleetDeployment
+MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE = 150
+# Default maximum compute fleet deployment waves deployed at the same time, configurable in the same section
+MAX_CONCURRENT_DEPLOYMENT_WAVES = 1
 MAX_COMPUTE_RESOURCES_PER_QUEUE = 40  # Ensures that each queue will share the same stack as its compute resources
 
 MAX_EBS_COUNT = 5
@@ -132,6 +135,10 @@ CW_ALARM_DATAPOINTS_TO_ALARM_DEFAULT = 1
 DETAILED_MONITORING_ENABLED_DEFAULT = False
 
 STACK_EVENTS_LOG_STREAM_NAME_FORMAT = "{}-cfn-events"
+# Engines used to export the CloudWatch logs: S3 export task or direct retrieval of the log events
+LOGS_EXPORT_MODE_TASK = "export-task"
+LOGS_EXPORT_MODE_DIRECT = "direct"
+LOGS_EXPORT_MODES = [LOGS_EXPORT_MODE_TASK, LOGS_EXPORT_MODE_DIRECT]
 
 PCLUSTER_IMAGE_NAME_REGEX = r"^[-_A-Za-z0-9{][-_A-Za-z0-9\s:{}\.]+[-_A-Za-z0-9}]$"
 PCLUSTER_IMAGE_ID_REGEX = r"^([a-zA-Z][a-zA-Z0-9-]{0,127})$"
@@ -78,8 +78,7 @@ def _gen_func_map(model: Dict) -> Dict[str, Callable]:
 
 def _load_model():
     """Load the ParallelCluster model from the package spec."""
-    spec = pcluster.cli.model.package_spec()
-    return pcluster.cli.model.load_model(spec)
+    return pcluster.cli.model.load_cached_model()
 
 
 def _add_functions(model, obj):
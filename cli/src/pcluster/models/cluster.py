@@ -18,10 +18,11 @@ import logging
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from urllib.request import urlopen
 
 import pkg_resources
@@ -36,6 +37,8 @@ from pcluster.config.cluster_config import BaseClusterConfig, SchedulerPluginSch
 from pcluster.config.common import ValidatorSuppressor
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.constants import (
+    LOGS_EXPORT_MODE_DIRECT,
+    LOGS_EXPORT_MODE_TASK,
     PCLUSTER_CLUSTER_NAME_TAG,
     PCLUSTER_NODE_TYPE_TAG,
     PCLUSTER_QUEUE_NAME_TAG,
@@ -52,18 +55,27 @@ from pcluster.models.cluster_resources import (
 from pcluster.models.common import (
     BadRequest,
     CloudWatchLogsExporter,
+    CloudWatchLogsPuller,
     Conflict,
     LimitExceeded,
+    LogEventsFollower,
+    LogEventsSearch,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
     export_stack_events,
+    open_logs_archive,
     parse_config,
-    upload_archive,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
-from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url, parse_bucket_url
+from pcluster.models.s3_bucket import (
+    S3_UPLOAD_CONCURRENCY,
+    S3Bucket,
+    S3BucketFactory,
+    S3FileFormat,
+    create_s3_presigned_url,
+    parse_bucket_url,
+)
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.templates.cdk_builder import CDKTemplateBuilder
 from pcluster.templates.import_cdk import start as start_cdk_import
@@ -83,6 +95,10 @@ LOGGER = logging.getLogger(__name__)
 
 # pylint: disable=C0302
 
+DESCRIBE_INSTANCES_PAGE_SIZE = 1000
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_CONCURRENCY = 10
+
 
 class NodeType(Enum):
     """Enum that identifies the cluster node type."""
@@ -288,7 +304,7 @@ class Cluster:
     @property
     def compute_fleet_status_with_last_updated_time(self) -> Tuple[ComputeFleetStatus, str]:
         """Status of the cluster compute fleet and the last compute fleet status updated time."""
-        if self.stack.is_working_status or self.stack.status == "UPDATE_IN_PROGRESS":
+        if self._is_compute_fleet_status_available:
             if self.stack.scheduler == "awsbatch":
                 status = ComputeFleetStatus(
                     AWSApi.instance().batch.get_compute_environment_state(self.stack.batch_compute_environment)
@@ -303,6 +319,10 @@ class Cluster:
             )
             return ComputeFleetStatus.UNKNOWN, None
 
+    @property
+    def _is_compute_fleet_status_available(self):
+        return self.stack.is_working_status or self.stack.status == "UPDATE_IN_PROGRESS"
+
     @property
     def stack_name(self):
         """Return stack name."""
@@ -488,6 +508,7 @@ class Cluster:
                 config.managed_head_node_security_group = self.stack.get_resource_physical_id("HeadNodeSecurityGroup")
                 config.managed_compute_security_group = self.stack.get_resource_physical_id("ComputeSecurityGroup")
 
+            config.prefetch_aws_resources()
             validation_failures = config.validate(validator_suppressors, context)
             if any(f.level.value >= FailureLevel(validation_failure_level).value for f in validation_failures):
                 raise ConfigValidationError("Invalid cluster configuration.", validation_failures=validation_failures)
@@ -513,22 +534,23 @@ class Cluster:
         try:
             # Upload config with default values and sections
             if self.config:
-                result = self.bucket.upload_config(
-                    config=ClusterSchema(cluster_name=self.name).dump(deepcopy(self.config)),
-                    config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("config_name"),
-                )
-
-                self.config.config_version = result.get("VersionId")
-
-                # Upload original config
-                result = self.bucket.upload_config(
-                    config=self.source_config_text,
-                    config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("source_config_name"),
-                    format=S3FileFormat.TEXT,
-                )
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    config_future = executor.submit(
+                        self.bucket.upload_config,
+                        config=ClusterSchema(cluster_name=self.name).dump(deepcopy(self.config)),
+                        config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("config_name"),
+                    )
+                    # Upload original config
+                    original_config_future = executor.submit(
+                        self.bucket.upload_config,
+                        config=self.source_config_text,
+                        config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("source_config_name"),
+                        format=S3FileFormat.TEXT,
+                    )
 
+                self.config.config_version = config_future.result().get("VersionId")
                 # original config version will be stored in CloudFormation Parameters
-                self.config.original_config_version = result.get("VersionId")
+                self.config.original_config_version = original_config_future.result().get("VersionId")
         except Exception as e:
             raise _cluster_error_mapper(
                 e, f"Unable to upload cluster config to the S3 bucket {self.bucket.name} due to exception: {e}"
@@ -563,29 +585,50 @@ class Cluster:
         LOGGER.info("Uploading cluster artifacts to S3...")
         self._check_bucket_existence()
         try:
-            resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
-            self.bucket.upload_resources(
-                resource_dir=resources, custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name")
-            )
-            if self.config.scheduler_resources:
-                self.bucket.upload_resources(
-                    resource_dir=self.config.scheduler_resources,
-                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
-                )
+            # The artifacts are independent of each other, upload them concurrently
+            with ThreadPoolExecutor(max_workers=S3_UPLOAD_CONCURRENCY) as executor:
+                resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
+                futures = [
+                    executor.submit(
+                        self.bucket.upload_resources,
+                        resource_dir=resources,
+                        custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name"),
+                        cache_archives=True,
+                    )
+                ]
+                if self.config.scheduler_resources:
+                    futures.append(
+                        executor.submit(
+                            self.bucket.upload_resources,
+                            resource_dir=self.config.scheduler_resources,
+                            custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                        )
+                    )
 
-            # Upload template
-            if self.template_body:
-                self.bucket.upload_cfn_template(self.template_body, PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"))
+                # Upload template
+                if self.template_body:
+                    futures.append(
+                        executor.submit(
+                            self.bucket.upload_cfn_template,
+                            self.template_body,
+                            PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"),
+                        )
+                    )
 
-            # upload instance types data
-            self.bucket.upload_config(
-                self.config.get_instance_types_data(),
-                PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
-                format=S3FileFormat.JSON,
-            )
+                # upload instance types data
+                futures.append(
+                    executor.submit(
+                        self.bucket.upload_config,
+                        self.config.get_instance_types_data(),
+                        PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
+                        format=S3FileFormat.JSON,
+                    )
+                )
 
-            if isinstance(self.config.scheduling, SchedulerPluginScheduling):
-                self._render_and_upload_scheduler_plugin_template()
+                if isinstance(self.config.scheduling, SchedulerPluginScheduling):
+                    futures.append(executor.submit(self._render_and_upload_scheduler_plugin_template))
+            for future in futures:
+                future.result()
             LOGGER.info("Cluster artifacts uploaded correctly.")
         except BadRequestClusterActionError:
             raise
@@ -734,12 +777,21 @@ class Cluster:
         try:
             LOGGER.info("\nChecking if there are running compute nodes that require termination...")
             filters = self._get_instance_filters(node_type=NodeType.COMPUTE)
-            instances = AWSApi.instance().ec2.list_instance_ids(filters)
+            ec2 = AWSApi.instance().ec2
+            instances = ec2.list_instance_ids(filters)
 
-            for instance_ids in grouper(instances, 100):
+            def _terminate(instance_ids):
                 LOGGER.info("Terminating following instances: %s", instance_ids)
-                if instance_ids:
-                    AWSApi.instance().ec2.terminate_instances(instance_ids)
+                ec2.terminate_instances(instance_ids)
+
+            # Terminate the batches concurrently and wait for all of them before reporting the first failure
+            with ThreadPoolExecutor(max_workers=TERMINATE_INSTANCES_CONCURRENCY) as executor:
+                futures = [
+                    executor.submit(_terminate, instance_ids)
+                    for instance_ids in grouper(instances, TERMINATE_INSTANCES_BATCH_SIZE)
+                ]
+            for future in futures:
+                future.result()
 
             LOGGER.info("Compute fleet cleaned up.")
         except Exception as e:
@@ -749,8 +801,7 @@ class Cluster:
     @property
     def compute_instances(self) -> List[ClusterInstance]:
         """Get compute instances."""
-        instances, _ = self.describe_instances(node_type=NodeType.COMPUTE)
-        return instances
+        return list(self.iter_instances(node_type=NodeType.COMPUTE))
 
     @property
     def head_node_instance(self) -> ClusterInstance:
@@ -761,9 +812,50 @@ class Cluster:
         else:
             raise ClusterActionError("Unable to retrieve head node information.")
 
+    @staticmethod
+    def get_head_node_instances(clusters) -> Dict[str, ClusterInstance]:
+        """Return the head node instances of the given clusters by cluster name, retrieved with shared requests."""
+        try:
+            filters = Cluster._get_instance_filters_for_stacks(
+                [cluster.stack_name for cluster in clusters], NodeType.HEAD_NODE
+            )
+            head_nodes, next_token = {}, None
+            while True:
+                instances, next_token = AWSApi.instance().ec2.describe_instances(filters, next_token)
+                for instance in map(ClusterInstance, instances):
+                    head_nodes.setdefault(instance.cluster_name, instance)
+                if not next_token:
+                    return head_nodes
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve head node instances. {e}")
+
+    @staticmethod
+    def get_compute_fleet_statuses(clusters) -> Dict[str, ComputeFleetStatus]:
+        """Return the compute fleet status of the given clusters by cluster name, read in batch from DynamoDB."""
+        statuses = {}
+        batch_read_clusters = []
+        for cluster in clusters:
+            if cluster._is_compute_fleet_status_available and cluster.stack.scheduler != "awsbatch":
+                batch_read_clusters.append(cluster)
+                continue
+            try:
+                statuses[cluster.name] = cluster.compute_fleet_status
+            except AWSClientError as e:
+                LOGGER.warning("Failed when retrieving fleet status of cluster %s with error %s", cluster.name, e)
+                statuses[cluster.name] = ComputeFleetStatus.UNKNOWN
+        batch_read_statuses = ComputeFleetStatusManager.get_statuses(
+            [cluster.compute_fleet_status_manager for cluster in batch_read_clusters]
+        )
+        statuses.update(zip([cluster.name for cluster in batch_read_clusters], batch_read_statuses))
+        return statuses
+
     def _get_instance_filters(self, node_type: NodeType, queue_name: str = None):
+        return self._get_instance_filters_for_stacks([self.stack_name], node_type, queue_name)
+
+    @staticmethod
+    def _get_instance_filters_for_stacks(stack_names: List[str], node_type: NodeType, queue_name: str = None):
         filters = [
-            {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": [self.stack_name]},
+            {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": stack_names},
             {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
         ]
         if node_type:
@@ -783,6 +875,21 @@ class Cluster:
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
 
+    def iter_instances(self, node_type: NodeType = None, queue_name: str = None) -> Iterator[ClusterInstance]:
+        """Return a generator over the cluster instances of all the pages, filtered by node type and queue name."""
+        try:
+            filters = self._get_instance_filters(node_type, queue_name)
+            next_token = None
+            while True:
+                instances, next_token = AWSApi.instance().ec2.describe_instances(
+                    filters, next_token, max_results=DESCRIBE_INSTANCES_PAGE_SIZE
+                )
+                yield from map(ClusterInstance, instances)
+                if not next_token:
+                    return
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
+
     def has_running_capacity(self, updated_value: bool = False) -> bool:
         """Return True if the cluster has running capacity. Note: the value will be cached."""
         if self.__has_running_capacity is None or updated_value:
@@ -798,7 +905,7 @@ class Cluster:
         """Return the number of instances or desired capacity. Note: the value will be cached."""
         if self.__running_capacity is None or updated_value:
             if self.stack.scheduler == "slurm":
-                self.__running_capacity = len(self.compute_instances)
+                self.__running_capacity = sum(1 for _ in self.iter_instances(node_type=NodeType.COMPUTE))
             elif self.stack.scheduler == "awsbatch":
                 self.__running_capacity = AWSApi.instance().batch.get_compute_environment_capacity(
                     ce_name=self.stack.batch_compute_environment
@@ -1024,19 +1131,21 @@ class Cluster:
 
     def export_logs(
         self,
-        bucket: str,
+        bucket: str = None,
         bucket_prefix: str = None,
         keep_s3_objects: bool = False,
         start_time: datetime = None,
         end_time: datetime = None,
         filters: List[str] = None,
         output_file: str = None,
+        export_mode: str = LOGS_EXPORT_MODE_TASK,
     ):
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
 
         :param output: file path to save log file archive to
-        :param bucket: Temporary S3 bucket to be used to export cluster logs data
+        :param bucket: Temporary S3 bucket to be used to export cluster logs data,
+               not required in direct export mode when an output file is given
         :param bucket_prefix: Key path under which exported logs data will be stored in s3 bucket,
                also serves as top-level directory in resulting archive
         :param keep_s3_objects: Keep the exported objects exports to S3. The default behavior is to delete them
@@ -1044,7 +1153,13 @@ class Cluster:
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param filters: Filters in the format ["Name=name,Values=value1,value2"]
                Accepted filters are: private_dns_name, node_type==HeadNode
+        :param export_mode: export-task to export CloudWatch logs through an S3 export task,
+               direct to retrieve the log events straight from CloudWatch Logs
         """
+        if not bucket and (export_mode != LOGS_EXPORT_MODE_DIRECT or not output_file):
+            raise BadRequestClusterActionError(
+                "A bucket is required, unless the logs are exported in direct mode to an output file."
+            )
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
             raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
@@ -1056,38 +1171,44 @@ class Cluster:
                 root_archive_dir = os.path.join(output_tempdir, archive_name)
                 os.makedirs(root_archive_dir, exist_ok=True)
 
-                if self.stack.log_group_name:
-                    # Export logs from CloudWatch
-                    export_logs_filters = self._init_export_logs_filters(start_time, end_time, filters)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.name,
-                        log_group_name=self.stack.log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
-                    logs_exporter.execute(
-                        log_stream_prefix=export_logs_filters.log_stream_prefix,
-                        start_time=export_logs_filters.start_time,
-                        end_time=export_logs_filters.end_time,
-                    )
-                else:
-                    LOGGER.debug(
-                        "CloudWatch logging is not enabled for cluster %s, only CFN Stack events will be exported.",
-                        {self.name},
-                    )
-
-                # Get stack events and write them into a file
-                stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                export_stack_events(self.stack_name, stack_events_file)
-
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+                # CloudWatch logs are streamed straight into the archive, the other files are written to the
+                # archive directory and added at the end. The archive is streamed to S3 if there's no output file
+                with open_logs_archive(root_archive_dir, output_file, bucket, bucket_prefix) as logs_archive:
+                    if self.stack.log_group_name:
+                        # Export logs from CloudWatch
+                        export_logs_filters = self._init_export_logs_filters(start_time, end_time, filters)
+                        if export_mode == LOGS_EXPORT_MODE_DIRECT:
+                            logs_exporter = CloudWatchLogsPuller(
+                                log_group_name=self.stack.log_group_name, output_dir=root_archive_dir
+                            )
+                        else:
+                            logs_exporter = CloudWatchLogsExporter(
+                                resource_id=self.name,
+                                log_group_name=self.stack.log_group_name,
+                                bucket=bucket,
+                                output_dir=root_archive_dir,
+                                bucket_prefix=bucket_prefix,
+                                keep_s3_objects=keep_s3_objects,
+                            )
+                        logs_exporter.execute(
+                            log_stream_prefix=export_logs_filters.log_stream_prefix,
+                            start_time=export_logs_filters.start_time,
+                            end_time=export_logs_filters.end_time,
+                            archive=logs_archive,
+                        )
+                    else:
+                        LOGGER.debug(
+                            "CloudWatch logging is not enabled for cluster %s, only CFN Stack events will be exported.",
+                            {self.name},
+                        )
+
+                    # Get stack events and write them into a file
+                    stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
+                    export_stack_events(self.stack_name, stack_events_file)
+                    logs_archive.add_directory()
+
+                # Without output file the archive has been uploaded to S3 while being created
+                return output_file or create_s3_presigned_url(logs_archive.path)
         except Exception as e:
             raise ClusterActionError(f"Unexpected error when exporting cluster's logs: {e}")
 
@@ -1206,13 +1327,84 @@ class Cluster:
 
             return LogStream(self.stack_name, log_stream_name, log_events_response)
         except AWSClientError as e:
-            if e.message.startswith("The specified log group"):
-                LOGGER.debug("Log Group %s doesn't exist.", self.stack.log_group_name)
-                raise NotFoundClusterActionError(f"CloudWatch logging is not enabled for cluster {self.name}.")
-            if e.message.startswith("The specified log stream"):
-                LOGGER.debug("Log Stream %s doesn't exist.", log_stream_name)
-                raise NotFoundClusterActionError(f"The specified log stream {log_stream_name} does not exist.")
-            raise _cluster_error_mapper(e, f"Unexpected error when retrieving log events: {e}.")
+            raise self._log_events_error(e, log_stream_name)
+
+    def follow_log_events(
+        self,
+        log_stream_names: List[str],
+        start_time: datetime = None,
+        start_from_head: bool = False,
+        limit: int = None,
+    ):
+        """
+        Yield the events of the given log streams as they are ingested, merged by timestamp. Never returns.
+
+        The cluster stack is described only once, at the beginning of the follow.
+        :param log_stream_names: Names of the log streams to follow
+        :param start_time: Start time of the first events to yield. By default the last events are yielded first.
+        :param start_from_head: If the value is true, the follow starts from the earliest log events.
+        :param limit: The maximum number of log events of every log stream initially yielded.
+        """
+        if not AWSApi.instance().cfn.stack_exists(self.stack_name):
+            raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
+        log_group_name = self.stack.log_group_name
+        if not log_group_name:
+            raise BadRequestClusterActionError(f"CloudWatch logging is not enabled for cluster {self.name}.")
+
+        follower = LogEventsFollower(log_group_name, log_stream_names, start_time, start_from_head, limit)
+        try:
+            yield from follower.follow()
+        except AWSClientError as e:
+            raise self._log_events_error(e, ", ".join(log_stream_names))
+
+    def search_log_events(
+        self,
+        filter_pattern: str,
+        start_time: datetime = None,
+        end_time: datetime = None,
+        filters: List[str] = None,
+        next_token: str = None,
+    ):
+        """
+        Search the events matching a filter pattern across the cluster's log streams.
+
+        :param filter_pattern: CloudWatch Logs filter pattern the events must match
+        :param start_time: Start time of interval of interest for log events, by default the creation of the log group
+        :param end_time: End time of interval of interest for log events, by default now
+        :param filters: Filters in the format Name=name,Values=value
+        Accepted filters are: private_dns_name, node_type==HeadNode
+        :param next_token: Token for paginated requests.
+        :returns a FilteredLogEvents with the matching events sorted by timestamp
+        """
+        if not AWSApi.instance().cfn.stack_exists(self.stack_name):
+            raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
+        if not self.stack.log_group_name:
+            raise BadRequestClusterActionError(f"CloudWatch logging is not enabled for cluster {self.name}.")
+
+        search_filters = self._init_list_logs_filters(filters)
+        search = LogEventsSearch(
+            self.stack.log_group_name,
+            filter_pattern,
+            start_time=start_time,
+            end_time=end_time,
+            log_stream_prefix=search_filters.log_stream_prefix,
+        )
+        try:
+            return search.search(next_token)
+        except BadRequest as e:
+            raise _cluster_error_mapper(e)
+        except AWSClientError as e:
+            raise self._log_events_error(e, search_filters.log_stream_prefix)
+
+    def _log_events_error(self, error: AWSClientError, log_stream_name: str):
+        """Return the cluster error corresponding to an error retrieving log events."""
+        if error.message.startswith("The specified log group"):
+            LOGGER.debug("Log Group %s doesn't exist.", self.stack.log_group_name)
+            return NotFoundClusterActionError(f"CloudWatch logging is not enabled for cluster {self.name}.")
+        if error.message.startswith("The specified log stream"):
+            LOGGER.debug("Log Stream %s doesn't exist.", log_stream_name)
+            return NotFoundClusterActionError(f"The specified log stream {log_stream_name} does not exist.")
+        return _cluster_error_mapper(error, f"Unexpected error when retrieving log events: {error}.")
 
     @property
     def _stack_events_stream_name(self):
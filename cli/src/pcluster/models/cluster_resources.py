@@ -16,7 +16,14 @@ from typing import List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceInfo, StackInfo
-from pcluster.constants import CW_LOGS_CFN_PARAM_NAME, OS_MAPPING, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    CW_LOGS_CFN_PARAM_NAME,
+    OS_MAPPING,
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_PREFIX,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.models.common import FiltersParserError, LogGroupTimeFiltersParser, get_all_stack_events
 
 
@@ -183,10 +190,25 @@ class ClusterStack(StackInfo):
 
 
 class ClusterInstance(InstanceInfo):
-    """Object to store cluster Instance info, initialized with a describe_instances call and other cluster info."""
+    """
+    Object to store cluster Instance info, initialized with a describe_instances call and other cluster info.
+
+    Only the fields used for the cluster instances are kept from the describe_instances data, so that listing a large
+    fleet does not retain the whole instance descriptions.
+    """
+
+    __slots__ = ()
+
+    _FIELDS = ("InstanceId", "InstanceType", "LaunchTime", "PrivateDnsName", "PrivateIpAddress", "PublicIpAddress")
 
     def __init__(self, instance_data: dict):
-        super().__init__(instance_data)
+        projected_data = {field: instance_data[field] for field in self._FIELDS if field in instance_data}
+        if "State" in instance_data:
+            projected_data["State"] = {"Name": instance_data["State"].get("Name")}
+        projected_data["Tags"] = [
+            tag for tag in instance_data.get("Tags", []) if tag["Key"].startswith(PCLUSTER_PREFIX)
+        ]
+        super().__init__(projected_data)
 
     @property
     def default_user(self) -> str:
@@ -208,6 +230,11 @@ class ClusterInstance(InstanceInfo):
         """Return os of the instance."""
         return self._get_tag(PCLUSTER_NODE_TYPE_TAG)
 
+    @property
+    def cluster_name(self) -> str:
+        """Return the name of the cluster the instance belongs to."""
+        return self._get_tag(PCLUSTER_CLUSTER_NAME_TAG)
+
     def _get_tag(self, tag_key: str):
         return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
 
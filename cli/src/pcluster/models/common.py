@@ -8,14 +8,21 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import base64
 import datetime
 import gzip
+import heapq
 import json
 import logging
 import os
 import os.path
+import shutil
 import tarfile
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List
 
 import configparser
@@ -23,10 +30,18 @@ import configparser
 from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
+from pcluster.utils import datetime_to_epoch, to_iso_timestr, to_utc_datetime, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
+# Size of the chunks used to stream log files, and of the files spooled in memory before being added to an archive
+LOGS_STREAM_CHUNK_SIZE = 1024 * 1024
+LOGS_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+# Size of the parts of the archives uploaded to S3 (S3 multipart uploads require at least 5 MiB) and their concurrency
+LOGS_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+LOGS_UPLOAD_MIN_PART_SIZE = 5 * 1024 * 1024
+LOGS_UPLOAD_MAX_CONCURRENCY = 4
+
 
 class LimitExceeded(Exception):
     """Base exception type for errors caused by exceeding the limit of some underlying AWS service."""
@@ -135,7 +150,16 @@ class LogsExporterError(Exception):
 
 
 class CloudWatchLogsExporter:
-    """Utility class used to export log group logs."""
+    """
+    Utility class used to export log group logs.
+
+    Exported S3 objects are downloaded and decompressed concurrently, streaming them in bounded chunks either to
+    files under the output dir or, when an archive is given, straight into the archive.
+    """
+
+    download_concurrency = 8
+    poll_interval = 1  # seconds
+    max_poll_interval = 15  # seconds
 
     def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
         # check bucket
@@ -160,15 +184,25 @@ class CloudWatchLogsExporter:
             self.bucket_prefix = f"{resource_id}-logs-{datetime.datetime.now().strftime('%Y%m%d%H%M')}"
             self.delete_everything_under_prefix = AWSApi.instance().s3_resource.is_empty(bucket, self.bucket_prefix)
 
-    def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
-        """Start export task. Returns logs streams folder."""
+    def execute(
+        self,
+        log_stream_prefix=None,
+        start_time: datetime.datetime = None,
+        end_time: datetime.datetime = None,
+        archive: "LogsArchive" = None,
+    ):
+        """
+        Start export task. Returns logs streams folder.
+
+        :param archive: archive to write the logs into, instead of writing them under the output dir
+        """
         # Export logs to S3
         task_id = self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
         LOGGER.info("Log export task id: %s", task_id)
         # Download exported S3 objects to output dir subfolder
         try:
             log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
-            self._download_s3_objects_with_prefix(task_id, log_streams_dir)
+            self._download_s3_objects_with_prefix(task_id, log_streams_dir, archive)
             LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
         except OSError:
             raise LogsExporterError("Unable to download archive logs from S3, double check your filters are correct.")
@@ -210,39 +244,154 @@ class CloudWatchLogsExporter:
                 )
             raise LogsExporterError(f"Unexpected error when starting export task: {e}")
 
-    @staticmethod
-    def _wait_for_task_completion(task_id):
-        """Wait for the CloudWatch logs export task given by task_id to finish."""
+    def _wait_for_task_completion(self, task_id):
+        """Wait for the CloudWatch logs export task given by task_id to finish, polling with exponential backoff."""
         LOGGER.debug("Waiting for export task with task ID=%s to finish...", task_id)
         status = "PENDING"
         still_running_statuses = ("PENDING", "PENDING_CANCEL", "RUNNING")
+        poll_interval = self.poll_interval
         while status in still_running_statuses:
-            time.sleep(1)
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, self.max_poll_interval)
             status = AWSApi.instance().logs.get_export_task_status(task_id)
         return status
 
-    def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+    def _download_s3_objects_with_prefix(self, task_id, destdir, archive: "LogsArchive" = None):
+        """Download all object in bucket with given prefix into destdir, or into the archive if given."""
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        downloads = []
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
             decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
             decompressed_path = decompressed_path.replace(
                 r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
             )
-            compressed_path = f"{decompressed_path}.gz"
+            downloads.append((archive_object.key, decompressed_path))
+
+        with ThreadPoolExecutor(max_workers=self.download_concurrency) as executor:
+            futures = [
+                executor.submit(self._download_s3_object, key, decompressed_path, archive)
+                for key, decompressed_path in downloads
+            ]
+            for future in futures:
+                future.result()
+
+    def _download_s3_object(self, key, decompressed_path, archive: "LogsArchive" = None):
+        """Download and decompress the given object, streaming it in chunks to decompressed_path or to the archive."""
+        LOGGER.debug("Downloading and extracting object with key=%s to %s", key, decompressed_path)
+        body = AWSApi.instance().s3.get_object(bucket_name=self.bucket, key=key)["Body"]
+        with gzip.GzipFile(fileobj=body, mode="rb") as gfile:
+            if archive:
+                archive.add_stream(gfile, decompressed_path)
+            else:
+                os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+                with open(decompressed_path, "wb") as outfile:
+                    shutil.copyfileobj(gfile, outfile, LOGS_STREAM_CHUNK_SIZE)
+
+
+class CloudWatchLogsPuller:
+    """
+    Utility class used to retrieve log group logs directly from CloudWatch Logs.
+
+    Unlike CloudWatchLogsExporter, it needs neither an S3 bucket nor an export task, which CloudWatch Logs runs
+    one at a time per account. The events of the matching log streams are retrieved concurrently and written in the
+    same layout and format of the exported logs, either to files under the output dir or straight into the archive.
+    Suited for small time windows, since every event is transferred through the CloudWatch Logs API.
+    """
+
+    download_concurrency = 8
+
+    def __init__(self, log_group_name, output_dir):
+        self.log_group_name = log_group_name
+        self.output_dir = output_dir
 
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
+    def execute(
+        self,
+        log_stream_prefix=None,
+        start_time: datetime.datetime = None,
+        end_time: datetime.datetime = None,
+        archive: "LogsArchive" = None,
+    ):
+        """
+        Retrieve the events of the log streams matching the given filters. Returns the number of log streams.
+
+        :param archive: archive to write the logs into, instead of writing them under the output dir
+        """
+        start_time = start_time and datetime_to_epoch(start_time)
+        end_time = end_time and datetime_to_epoch(end_time)
+        log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
+        try:
+            log_stream_names = self._list_log_streams(log_stream_prefix, start_time, end_time)
+            LOGGER.debug("Retrieving events of %d log streams of %s", len(log_stream_names), self.log_group_name)
+            with ThreadPoolExecutor(max_workers=self.download_concurrency) as executor:
+                futures = [
+                    executor.submit(
+                        self._pull_log_stream,
+                        log_stream_name,
+                        os.path.join(log_streams_dir, log_stream_name),
+                        start_time,
+                        end_time,
+                        archive,
+                    )
+                    for log_stream_name in log_stream_names
+                ]
+                for future in futures:
+                    future.result()
+        except AWSClientError as e:
+            raise LogsExporterError(f"Unexpected error when retrieving log events: {e}")
+        LOGGER.info("CloudWatch logs of %s saved to %s", self.log_group_name, self.output_dir)
+        return len(log_stream_names)
+
+    def _list_log_streams(self, log_stream_prefix=None, start_time: int = None, end_time: int = None):
+        """Return the names of the log streams with the given prefix that may have events in the time window."""
+        log_stream_names = []
+        next_token = None
+        while True:
+            response = AWSApi.instance().logs.describe_log_streams(
+                log_group_name=self.log_group_name, log_stream_name_prefix=log_stream_prefix, next_token=next_token
             )
-
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+            for log_stream in response.get("logStreams", []):
+                # Streams without events have no timestamps
+                first_event = log_stream.get("firstEventTimestamp")
+                last_event = log_stream.get("lastIngestionTime", log_stream.get("lastEventTimestamp"))
+                if first_event is None or (end_time and first_event > end_time):
+                    continue
+                if start_time and last_event is not None and last_event < start_time:
+                    continue
+                log_stream_names.append(log_stream["logStreamName"])
+            next_token = response.get("nextToken")
+            if not next_token:
+                return log_stream_names
+
+    def _pull_log_stream(self, log_stream_name, path, start_time=None, end_time=None, archive: "LogsArchive" = None):
+        """Write the events of the given log stream to path or to the archive."""
+        if archive:
+            with tempfile.SpooledTemporaryFile(max_size=LOGS_SPOOL_MAX_SIZE) as spool:
+                self._write_log_events(log_stream_name, spool, start_time, end_time)
+                archive.add_spool(spool, path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as outfile:
+                self._write_log_events(log_stream_name, outfile, start_time, end_time)
+
+    def _write_log_events(self, log_stream_name, outfile, start_time=None, end_time=None):
+        """Write the events of the log stream to the given binary file, one per line, as export tasks do."""
+        next_token = None
+        while True:
+            response = AWSApi.instance().logs.get_log_events(
+                log_group_name=self.log_group_name,
+                log_stream_name=log_stream_name,
+                start_time=start_time,
+                end_time=end_time,
+                start_from_head=True,
+                next_token=next_token,
+            )
+            for event in response.get("events", []):
+                outfile.write(f"{to_iso_timestr(to_utc_datetime(event['timestamp']))} {event['message']}\n".encode())
+            # The end of the stream is reached when the same token is returned
+            if not response.get("nextForwardToken") or response.get("nextForwardToken") == next_token:
+                return
+            next_token = response.get("nextForwardToken")
 
 
 def get_all_stack_events(stack_name: str):
@@ -264,23 +413,199 @@ def export_stack_events(stack_name: str, output_file: str):
         cfn_events_file.write(json.dumps(stack_events, cls=JSONEncoder, indent=2))
 
 
+class LogsArchive:
+    """
+    tar.gz archive of the logs stored in a directory, to which logs can also be streamed without staging them on disk.
+
+    Files are stored in the archive under the base name of the directory, with their path relative to it.
+    Logs can be added concurrently from multiple threads. The archive file is removed if writing it fails.
+    """
+
+    def __init__(self, directory: str, output_file: str = None, fileobj=None):
+        """
+        Initialize the archive, written to output_file or to the given writable stream.
+
+        :param fileobj: stream to write the archive to, sequentially, instead of a file
+        """
+        self.directory = directory
+        self.path = output_file or f"{directory}.tar.gz"
+        self._fileobj = fileobj
+        self._lock = threading.Lock()
+        self._tar = None
+
+    def __enter__(self):
+        if self._fileobj:
+            LOGGER.debug("Creating archive of logs and writing it to a stream")
+            self._tar = tarfile.open(fileobj=self._fileobj, mode="w|gz")
+        else:
+            LOGGER.debug("Creating archive of logs and saving it to %s", self.path)
+            self._tar = tarfile.open(self.path, "w:gz")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._tar.close()
+        if exc_type and not self._fileobj:
+            # Do not leave an incomplete archive that looks valid
+            LOGGER.debug("Removing incomplete archive of logs %s", self.path)
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                LOGGER.debug("Unable to remove incomplete archive of logs %s: %s", self.path, e)
+
+    def _arcname(self, path: str):
+        return os.path.join(os.path.basename(self.directory), os.path.relpath(path, self.directory))
+
+    def add_directory(self):
+        """Add all the files of the directory."""
+        with self._lock:
+            self._tar.add(self.directory, arcname=os.path.basename(self.directory))
+
+    def add_file(self, path: str):
+        """Add the file at the given path, which must be in the directory."""
+        with self._lock:
+            self._tar.add(path, arcname=self._arcname(path))
+
+    def add_stream(self, stream, path: str):
+        """
+        Add the content of the given stream as the file at the given path of the directory.
+
+        The content is spooled in memory, and on disk only if large, since the size of a member must be known before
+        writing it to the archive.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=LOGS_SPOOL_MAX_SIZE) as spool:
+            shutil.copyfileobj(stream, spool, LOGS_STREAM_CHUNK_SIZE)
+            self.add_spool(spool, path)
+
+    def add_spool(self, spool, path: str):
+        """Add the content written to the given seekable file, which must be positioned at its end."""
+        tarinfo = tarfile.TarInfo(self._arcname(path))
+        tarinfo.size = spool.tell()
+        tarinfo.mtime = int(time.time())
+        spool.seek(0)
+        with self._lock:
+            self._tar.addfile(tarinfo, spool)
+
+
 def create_logs_archive(directory: str, output_file: str = None):
-    base_directory = os.path.dirname(directory)
-    base_name = os.path.basename(directory)
-    output_file = output_file or f"{os.path.join(base_directory, base_name)}.tar.gz"
-    LOGGER.debug("Creating archive of logs and saving it to %s", output_file)
-    with tarfile.open(output_file, "w:gz") as tar:
-        tar.add(directory, arcname=base_name)
-    return output_file
+    with LogsArchive(directory, output_file) as archive:
+        archive.add_directory()
+    return archive.path
+
+
+class S3UploadStream:
+    """
+    Writable binary stream uploaded to S3 while it is written, through a multipart upload if large.
+
+    The written data flows through a pipe to a thread performing the upload, so that the memory used is bounded by
+    the part size times the upload concurrency, whatever the size of the uploaded content.
+    If the stream is exited because of an error, the upload is aborted and no object is created.
+    The part size (in MiB) and the concurrency can be set with the PCLUSTER_LOGS_UPLOAD_PART_SIZE and
+    PCLUSTER_LOGS_UPLOAD_CONCURRENCY environment variables.
+    """
 
+    def __init__(self, bucket: str, key: str, part_size: int = None, max_concurrency: int = None):
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size or _get_env_int("PCLUSTER_LOGS_UPLOAD_PART_SIZE", 0) * 1024 * 1024
+        self.part_size = max(self.part_size or LOGS_UPLOAD_PART_SIZE, LOGS_UPLOAD_MIN_PART_SIZE)
+        self.max_concurrency = max_concurrency or _get_env_int(
+            "PCLUSTER_LOGS_UPLOAD_CONCURRENCY", LOGS_UPLOAD_MAX_CONCURRENCY
+        )
+        self._reader = None
+        self._writer = None
+        self._thread = None
+        self._error = None
+        self._aborted = False
+
+    @property
+    def s3_path(self):
+        """Return the S3 URI of the uploaded object."""
+        return f"s3://{self.bucket}/{self.key}"
+
+    def __enter__(self):
+        LOGGER.debug("Uploading stream to %s", self.s3_path)
+        read_fd, write_fd = os.pipe()
+        self._reader = os.fdopen(read_fd, "rb")
+        self._writer = os.fdopen(write_fd, "wb")
+        self._thread = threading.Thread(target=self._upload, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # The flag must be set before closing the pipe, so that the upload sees it when reaching the end of the data
+        self._aborted = exc_type is not None
+        try:
+            self._writer.close()
+        except BrokenPipeError:
+            pass
+        self._thread.join()
+        if self._error and exc_type is None:
+            raise LogsExporterError(f"Unable to upload archive to {self.s3_path}: {self._error}")
+
+    def write(self, data):
+        """Write the given data, failing if the upload has failed."""
+        try:
+            return self._writer.write(data)
+        except BrokenPipeError:
+            self._thread.join()
+            raise LogsExporterError(f"Unable to upload archive to {self.s3_path}: {self._error}")
+
+    def _read(self, size=-1):
+        data = self._reader.read(size)
+        # A short read means that the writer has been closed
+        if self._aborted and (size < 0 or len(data) < size):
+            raise LogsExporterError(f"Upload to {self.s3_path} aborted")
+        return data
+
+    def _upload(self):
+        try:
+            AWSApi.instance().s3.upload_fileobj(
+                self.bucket,
+                _ReadOnlyStream(self._read),
+                self.key,
+                part_size=self.part_size,
+                max_concurrency=self.max_concurrency,
+            )
+        except Exception as e:
+            LOGGER.debug("Upload to %s failed: %s", self.s3_path, e)
+            self._error = e
+        finally:
+            # Make any further write fail rather than block
+            self._reader.close()
 
-def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
-    archive_filename = os.path.basename(archive_path)
-    with open(archive_path, "rb") as archive_file:
-        archive_data = archive_file.read()
-    bucket_path = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
-    AWSApi.instance().s3.put_object(bucket, archive_data, bucket_path)
-    return f"s3://{bucket}/{bucket_path}"
+
+class _ReadOnlyStream:
+    """Non-seekable readable stream, which makes the S3 transfer manager upload it in parts as it is read."""
+
+    def __init__(self, read):
+        self.read = read
+
+
+def _get_env_int(name: str, default: int):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@contextmanager
+def open_logs_archive(directory: str, output_file: str = None, bucket: str = None, bucket_prefix: str = None):
+    """
+    Open the archive of the logs of the given directory.
+
+    The archive is written to output_file if given, otherwise it is uploaded to the bucket while it is produced,
+    under the given prefix, so that it is never stored on disk nor in memory. The path of the yielded archive is
+    either the output file or the S3 URI of the uploaded archive.
+    """
+    if output_file:
+        with LogsArchive(directory, output_file) as archive:
+            yield archive
+    else:
+        archive_filename = f"{os.path.basename(directory)}.tar.gz"
+        key = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
+        with S3UploadStream(bucket, key) as upload, LogsArchive(directory, fileobj=upload) as archive:
+            archive.path = upload.s3_path
+            yield archive
 
 
 class LogStreams:
@@ -302,3 +627,237 @@ class LogStream:
         # The next_tokens are not present when the log stream is the Stack Events log stream
         self.next_ftoken = log_events_response.get("nextForwardToken", None)
         self.next_btoken = log_events_response.get("nextBackwardToken", None)
+
+
+class LogEventsFollower:
+    """
+    Class to tail one or more log streams of a log group, like tail -f.
+
+    Every log stream is read from its last position with forward tokens, and the new events of all the streams are
+    merged by timestamp at every poll. The poll interval is reset to the minimum when new events are found and doubled
+    otherwise, up to the maximum. Log streams that do not exist yet are polled until they are created.
+    """
+
+    min_poll_interval = 1  # seconds
+    max_poll_interval = 16  # seconds
+    default_limit = 10  # events of every log stream initially returned when no start time is given
+
+    def __init__(
+        self,
+        log_group_name: str,
+        log_stream_names: List[str],
+        start_time: datetime.datetime = None,
+        start_from_head: bool = False,
+        limit: int = None,
+    ):
+        """
+        Initialize the follower.
+
+        :param start_time: time of the first events to return, by default the follow starts from the last events
+        :param start_from_head: start the follow from the first events of the log streams
+        :param limit: maximum number of events of every log stream returned by the first poll
+        """
+        self.log_group_name = log_group_name
+        self.log_stream_names = log_stream_names
+        self.start_time = start_time
+        self.start_from_head = start_from_head
+        self.limit = limit
+        self._next_tokens = {}
+
+    def follow(self):
+        """Yield the events of the log streams, adding the logStreamName key to them. Never returns."""
+        poll_interval = self.min_poll_interval
+        while True:
+            new_events = [self._poll(log_stream_name) for log_stream_name in self.log_stream_names]
+            found_events = False
+            for event in heapq.merge(*new_events, key=lambda event: event["timestamp"]):
+                found_events = True
+                yield event
+            poll_interval = self.min_poll_interval if found_events else min(poll_interval * 2, self.max_poll_interval)
+            time.sleep(poll_interval)
+
+    def _poll(self, log_stream_name: str):
+        """Return the new events of the given log stream, sorted by timestamp."""
+        next_token = self._next_tokens.get(log_stream_name)
+        kwargs = {"start_from_head": True, "next_token": next_token}
+        if not next_token:
+            # The first poll returns the events following the start time or the head, or the last events of the stream
+            if self.start_time:
+                kwargs.update(start_time=datetime_to_epoch(self.start_time), limit=self.limit)
+            elif self.start_from_head:
+                kwargs.update(limit=self.limit)
+            else:
+                kwargs.update(start_from_head=False, limit=self.limit or self.default_limit)
+        try:
+            response = AWSApi.instance().logs.get_log_events(
+                log_group_name=self.log_group_name, log_stream_name=log_stream_name, **kwargs
+            )
+        except AWSClientError as e:
+            if e.message.startswith("The specified log stream"):
+                LOGGER.debug("Log stream %s does not exist yet", log_stream_name)
+                return []
+            raise
+        self._next_tokens[log_stream_name] = response.get("nextForwardToken")
+        return [{**event, "logStreamName": log_stream_name} for event in response.get("events", [])]
+
+
+class FilteredLogEvents:
+    """Class to manage a page of log events matching a search, along with next_token."""
+
+    def __init__(self, events: List[dict] = None, next_token: str = None):
+        self.events = events or []
+        self.next_token = next_token
+
+
+class LogEventsSearch:
+    """
+    Class to search the events matching a filter pattern across the log streams of a log group.
+
+    The time window is split into consecutive partitions that are searched concurrently with FilterLogEvents, which
+    scans all the log streams of the group, or the ones with the given prefix, server-side. Since the partitions do not
+    overlap, the matches of a partition are returned only once the previous partitions are completed, so that the
+    matches are sorted by timestamp across pages. The requests for the following partitions still run concurrently
+    to skip the portions of the window without matches; the partitions with matches waiting for the previous ones are
+    not searched again until they can be returned.
+    Every page is bounded by the number of events requested to each partition and by max_page_bytes.
+    The next token stores the time window, the position of the search in every partition and the partitions known to
+    have matches at their position.
+    """
+
+    search_concurrency = 8
+    min_partition_span = 60 * 1000  # milliseconds
+    max_empty_rounds = 5  # rounds of requests without matches before returning an empty page
+    partition_page_size = 1000  # max events requested to a partition at a time
+    max_page_bytes = 1024 * 1024  # max size of the messages of a page, exceeded only by a single partition page
+
+    def __init__(
+        self,
+        log_group_name: str,
+        filter_pattern: str,
+        start_time: datetime.datetime = None,
+        end_time: datetime.datetime = None,
+        log_stream_prefix: str = None,
+    ):
+        """
+        Initialize the search.
+
+        :param start_time: start of the time window, by default the creation time of the log group
+        :param end_time: end of the time window (excluded), by default now
+        :param log_stream_prefix: prefix of the log streams to search, by default all the log streams are searched
+        """
+        self.log_group_name = log_group_name
+        self.filter_pattern = filter_pattern
+        self.start_time = start_time
+        self.end_time = end_time
+        self.log_stream_prefix = log_stream_prefix
+
+    def search(self, next_token: str = None) -> FilteredLogEvents:
+        """Return the page of matching events following the given token."""
+        if next_token:
+            window, tokens, pending = self._decode_token(next_token)
+            partitions = self._partitions(*window)
+            if len(tokens) != len(partitions) or not pending.issubset(range(len(partitions))):
+                raise BadRequest("The provided next token is not valid.")
+        else:
+            window = self._window()
+            partitions = self._partitions(*window)
+            # None marks the partitions not started yet and False the completed ones
+            tokens = [None] * len(partitions)
+            pending = set()
+
+        events = []
+        with ThreadPoolExecutor(max_workers=self.search_concurrency) as executor:
+            for _ in range(self.max_empty_rounds):
+                open_partitions = [index for index, token in enumerate(tokens) if token is not False]
+                futures = {
+                    index: executor.submit(self._search_partition, partitions[index], tokens[index])
+                    for index in open_partitions
+                    if index == open_partitions[0] or index not in pending
+                }
+                self._consume_responses(
+                    {index: future.result() for index, future in futures.items()}, tokens, pending, events
+                )
+                if events or all(token is False for token in tokens):
+                    break
+
+        unique_events = {event["eventId"]: event for event in events}
+        sorted_events = sorted(unique_events.values(), key=lambda event: event["timestamp"])
+        if all(token is False for token in tokens):
+            return FilteredLogEvents(sorted_events)
+        return FilteredLogEvents(sorted_events, self._encode_token(window, tokens, pending))
+
+    def _consume_responses(self, responses, tokens, pending, events):
+        """
+        Add to events the matches that can be returned, in partition order, advancing the position of the partitions.
+
+        The matches of a partition are returned only if the previous partitions are completed and the page is not
+        full, otherwise the partition is marked as pending and searched again from the same position later.
+        The partitions without matches are always advanced.
+        """
+        blocked = False
+        page_bytes = sum(len(event.get("message", "")) for event in events)
+        for index in sorted(responses):
+            response = responses[index]
+            partition_events = response.get("events", [])
+            partition_bytes = sum(len(event.get("message", "")) for event in partition_events)
+            if partition_events and (blocked or (events and page_bytes + partition_bytes > self.max_page_bytes)):
+                pending.add(index)
+                blocked = True
+                continue
+            events.extend(partition_events)
+            page_bytes += partition_bytes
+            pending.discard(index)
+            tokens[index] = response.get("nextToken") or False
+            # The next matches of an open partition precede the ones of the following partitions
+            blocked = blocked or tokens[index] is not False
+
+    def _window(self):
+        """Return the time window of the search in milliseconds."""
+        if self.start_time:
+            start_time = datetime_to_epoch(self.start_time)
+        else:
+            start_time = AWSApi.instance().logs.describe_log_group(self.log_group_name).get("creationTime")
+        end_time = datetime_to_epoch(self.end_time or datetime.datetime.now(tz=datetime.timezone.utc))
+        if start_time >= end_time:
+            raise FiltersParserError("Start time must be earlier than end time.")
+        return start_time, end_time
+
+    def _partitions(self, start_time: int, end_time: int):
+        """Split the time window in consecutive (start, end) partitions, both included."""
+        span = end_time - start_time
+        count = max(1, min(self.search_concurrency, span // self.min_partition_span))
+        bounds = [start_time + span * index // count for index in range(count + 1)]
+        return [(bounds[index], bounds[index + 1] - 1) for index in range(count)]
+
+    def _search_partition(self, partition, next_token: str = None):
+        start_time, end_time = partition
+        return AWSApi.instance().logs.search_log_events(
+            log_group_name=self.log_group_name,
+            filter_pattern=self.filter_pattern,
+            start_time=start_time,
+            end_time=end_time,
+            log_stream_name_prefix=self.log_stream_prefix,
+            next_token=next_token,
+            limit=self.partition_page_size,
+        )
+
+    @staticmethod
+    def _encode_token(window, tokens, pending):
+        token = json.dumps(
+            {"window": list(window), "tokens": tokens, "pending": sorted(pending)}, separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(token.encode()).decode()
+
+    @staticmethod
+    def _decode_token(next_token: str):
+        try:
+            token = json.loads(base64.urlsafe_b64decode(next_token.encode()))
+            start_time, end_time = (int(value) for value in token["window"])
+            tokens = token["tokens"]
+            pending = set(int(index) for index in token.get("pending", []))
+            if start_time >= end_time or not isinstance(tokens, list):
+                raise ValueError("Invalid window or tokens")
+            return (start_time, end_time), tokens, pending
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            LOGGER.debug("Unable to decode next token %s: %s", next_token, e)
+            raise BadRequest("The provided next token is not valid.")
@@ -143,6 +143,52 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         """Get compute fleet status and the last compute fleet status updated time."""
         pass
 
+    @abstractmethod
+    def _status_key(self):
+        """Return the key of the compute fleet status item in the table."""
+        pass
+
+    @abstractmethod
+    def _parse_status_item(self, item):
+        """Return the compute fleet status and last updated time stored in the given table item."""
+        pass
+
+    @staticmethod
+    def get_statuses(managers, fallback=ComputeFleetStatus.UNKNOWN):
+        """
+        Get the compute fleet status of many clusters, in the order of the given managers.
+
+        The statuses are read with batched requests. If the batched read fails, for instance because the table of a
+        cluster being created or deleted does not exist, the statuses are read one by one.
+        """
+        try:
+            items = AWSApi.instance().ddb_resource.batch_get_items(
+                [(manager._table_name, manager._status_key()) for manager in managers]
+            )
+        except AWSClientError as e:
+            LOGGER.warning("Failed when retrieving fleet statuses from DynamoDB in batch with error %s", e)
+            return [manager.get_status(fallback) for manager in managers]
+
+        statuses = []
+        for manager in managers:
+            status_item = next(
+                (
+                    item
+                    for item in items.get(manager._table_name, [])
+                    if item.get("Id") == manager._status_key().get("Id")
+                ),
+                None,
+            )
+            try:
+                if status_item is None:
+                    raise Exception("COMPUTE_FLEET status not found in db table")
+                status, _ = manager._parse_status_item(status_item)
+            except Exception as e:
+                LOGGER.warning("Failed when retrieving fleet status of table %s with error %s", manager._table_name, e)
+                status = fallback
+            statuses.append(status)
+        return statuses
+
     @staticmethod
     def get_manager(cluster_name, version, scheduler):
         """Return compute fleet status manager based on version and plugin."""
@@ -185,15 +231,10 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, {"Id": self.DB_KEY})
+            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, self._status_key())
             if not compute_fleet_item or "Item" not in compute_fleet_item:
                 raise Exception("COMPUTE_FLEET data not found in db table")
-            return (
-                ComputeFleetStatus(
-                    compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)
-                ),
-                compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self._parse_status_item(compute_fleet_item["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -202,6 +243,15 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    def _status_key(self):
+        return {"Id": self.DB_KEY}
+
+    def _parse_status_item(self, item):
+        return (
+            ComputeFleetStatus(item.get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)),
+            item.get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
@@ -248,15 +298,10 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(
-                self._table_name, {"Id": self.COMPUTE_FLEET_STATUS_KEY}
-            )
+            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(self._table_name, self._status_key())
             if not compute_fleet_status or "Item" not in compute_fleet_status:
                 raise Exception("COMPUTE_FLEET status not found in db table")
-            return (
-                ComputeFleetStatus(compute_fleet_status["Item"][self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
-                compute_fleet_status["Item"].get(self.LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self._parse_status_item(compute_fleet_status["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -265,6 +310,12 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    def _status_key(self):
+        return {"Id": self.COMPUTE_FLEET_STATUS_KEY}
+
+    def _parse_status_item(self, item):
+        return ComputeFleetStatus(item[self.COMPUTE_FLEET_STATUS_ATTRIBUTE]), item.get(self.LAST_UPDATED_TIME_ATTRIBUTE)
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
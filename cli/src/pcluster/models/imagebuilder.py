@@ -19,7 +19,7 @@ import os.path
 import re
 import tempfile
 from datetime import datetime
-from typing import Set
+from typing import List, Set
 
 import pkg_resources
 from marshmallow.exceptions import ValidationError
@@ -54,14 +54,14 @@ from pcluster.models.common import (
     CloudWatchLogsExporter,
     Conflict,
     LimitExceeded,
+    LogEventsFollower,
     LogGroupTimeFiltersParser,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
     export_stack_events,
+    open_logs_archive,
     parse_config,
-    upload_archive,
 )
 from pcluster.models.imagebuilder_resources import (
     BadRequestStackError,
@@ -701,36 +701,39 @@ class ImageBuilder:
                 root_archive_dir = os.path.join(output_tempdir, archive_name)
                 os.makedirs(root_archive_dir, exist_ok=True)
 
-                if AWSApi.instance().logs.log_group_exists(self._log_group_name):
-                    # Export logs from CloudWatch
-                    export_logs_filters = self._init_export_logs_filters(start_time, end_time)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.image_id,
-                        log_group_name=self._log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
-                    logs_exporter.execute(
-                        start_time=export_logs_filters.start_time, end_time=export_logs_filters.end_time
-                    )
-                else:
-                    LOGGER.info(
-                        "Log streams not yet available for %s, only CFN Stack events will be exported.", {self.image_id}
-                    )
+                # CloudWatch logs are streamed straight into the archive, the other files are written to the
+                # archive directory and added at the end. The archive is streamed to S3 if there's no output file
+                with open_logs_archive(root_archive_dir, output_file, bucket, bucket_prefix) as logs_archive:
+                    if AWSApi.instance().logs.log_group_exists(self._log_group_name):
+                        # Export logs from CloudWatch
+                        export_logs_filters = self._init_export_logs_filters(start_time, end_time)
+                        logs_exporter = CloudWatchLogsExporter(
+                            resource_id=self.image_id,
+                            log_group_name=self._log_group_name,
+                            bucket=bucket,
+                            output_dir=root_archive_dir,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                        )
+                        logs_exporter.execute(
+                            start_time=export_logs_filters.start_time,
+                            end_time=export_logs_filters.end_time,
+                            archive=logs_archive,
+                        )
+                    else:
+                        LOGGER.info(
+                            "Log streams not yet available for %s, only CFN Stack events will be exported.",
+                            {self.image_id},
+                        )
 
-                if stack_exists:
-                    # Get stack events and write them into a file
-                    stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                    export_stack_events(self.stack.name, stack_events_file)
+                    if stack_exists:
+                        # Get stack events and write them into a file
+                        stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
+                        export_stack_events(self.stack.name, stack_events_file)
+                    logs_archive.add_directory()
 
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+                # Without output file the archive has been uploaded to S3 while being created
+                return output_file or create_s3_presigned_url(logs_archive.path)
         except Exception as e:
             raise ImageBuilderActionError(f"Unexpected error when exporting image's logs: {e}")
 
@@ -823,15 +826,40 @@ class ImageBuilder:
             )
             return LogStream(self.image_id, log_stream_name, log_events_response)
         except AWSClientError as e:
-            if e.message.startswith("The specified log group"):
-                LOGGER.debug("Log Group %s doesn't exist.", self._log_group_name)
-                raise NotFoundImageBuilderActionError(
-                    ("Unable to find image logs, please double check if image id=" f"{self.image_id} is correct.")
-                )
-            if e.message.startswith("The specified log stream"):
-                LOGGER.debug("Log Stream %s doesn't exist.", log_stream_name)
-                raise NotFoundImageBuilderActionError(f"The specified log stream {log_stream_name} does not exist.")
-            raise ImageBuilderActionError(f"Unexpected error when retrieving log events: {e}")
+            raise self._log_events_error(e, log_stream_name)
+
+    def follow_log_events(
+        self,
+        log_stream_names: List[str],
+        start_time: datetime = None,
+        start_from_head: bool = False,
+        limit: int = None,
+    ):
+        """
+        Yield the events of the given log streams as they are ingested, merged by timestamp. Never returns.
+
+        :param log_stream_names: Names of the log streams to follow
+        :param start_time: Start time of the first events to yield. By default the last events are yielded first.
+        :param start_from_head: If the value is true, the follow starts from the earliest log events.
+        :param limit: The maximum number of log events of every log stream initially yielded.
+        """
+        follower = LogEventsFollower(self._log_group_name, log_stream_names, start_time, start_from_head, limit)
+        try:
+            yield from follower.follow()
+        except AWSClientError as e:
+            raise self._log_events_error(e, ", ".join(log_stream_names))
+
+    def _log_events_error(self, error: AWSClientError, log_stream_name: str):
+        """Return the image builder error corresponding to an error retrieving log events."""
+        if error.message.startswith("The specified log group"):
+            LOGGER.debug("Log Group %s doesn't exist.", self._log_group_name)
+            return NotFoundImageBuilderActionError(
+                ("Unable to find image logs, please double check if image id=" f"{self.image_id} is correct.")
+            )
+        if error.message.startswith("The specified log stream"):
+            LOGGER.debug("Log Stream %s doesn't exist.", log_stream_name)
+            return NotFoundImageBuilderActionError(f"The specified log stream {log_stream_name} does not exist.")
+        return ImageBuilderActionError(f"Unexpected error when retrieving log events: {error}")
 
     @property
     def _stack_events_stream_name(self):
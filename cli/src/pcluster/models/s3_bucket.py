@@ -17,17 +17,23 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 
 import yaml
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
 from pcluster.constants import PCLUSTER_S3_BUCKET_VERSION
-from pcluster.utils import get_partition, get_url_domain_suffix, yaml_load, zip_dir
+from pcluster.utils import get_installed_version, get_partition, get_url_domain_suffix, yaml_load, zip_dir
 
 LOGGER = logging.getLogger(__name__)
 
+# Object metadata holding the SHA-256 digest of the content of the uploaded artifacts
+CONTENT_HASH_METADATA_KEY = "pcluster-content-sha256"
+S3_UPLOAD_CONCURRENCY = 8
+
 
 class S3FileFormat(Enum):
     """Define S3 file format."""
@@ -214,27 +220,34 @@ class S3Bucket:
             file_type=S3FileType.ASSETS, content=asset_file_content, file_name=asset_name, format=format
         )
 
-    def upload_resources(self, resource_dir, custom_artifacts_name):
+    def upload_resources(self, resource_dir, custom_artifacts_name, cache_archives=False):
         """
         Upload custom resources to S3 bucket.
 
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
+        :param cache_archives: reuse the archives built for the same directory by the installed pcluster version,
+          only valid for the resources packaged with pcluster
         """
-        for res in os.listdir(resource_dir):
-            path = os.path.join(resource_dir, res)
-            if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
-                )
-            elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
-                )
+        with ThreadPoolExecutor(max_workers=S3_UPLOAD_CONCURRENCY) as executor:
+            futures = []
+            for res in os.listdir(resource_dir):
+                path = os.path.join(resource_dir, res)
+                if os.path.isdir(path):
+                    archive = (
+                        _get_packaged_archive(path, get_installed_version())
+                        if cache_archives
+                        else zip_dir(path).getvalue()
+                    )
+                    key = self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name)
+                    futures.append(executor.submit(self._put_object_if_changed, archive, key))
+                elif os.path.isfile(path):
+                    with open(path, "rb") as resource_file:
+                        content = resource_file.read()
+                    key = self.get_object_key(S3FileType.CUSTOM_RESOURCES, res)
+                    futures.append(executor.submit(self._put_object_if_changed, content, key))
+        for future in futures:
+            future.result()
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
         """Get config file from S3 bucket."""
@@ -260,6 +273,10 @@ class S3Bucket:
             file_type=S3FileType.TEMPLATES, file_name=template_name, version_id=version_id, format=format
         )
 
+    def get_cfn_asset(self, asset_name: str, version_id=None, format=S3FileFormat.JSON):
+        """Get cloudformation asset from S3 bucket."""
+        return self._get_file(file_type=S3FileType.ASSETS, file_name=asset_name, version_id=version_id, format=format)
+
     def get_cfn_template_url(self, template_name):
         """Get cfn template http url from S3 bucket."""
         return self._get_file_url(file_type=S3FileType.TEMPLATES, file_name=template_name)
@@ -272,10 +289,26 @@ class S3Bucket:
 
     def upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML):
         """Upload file to S3 bucket."""
+        return self._put_object_if_changed(format_content(content, format), self.get_object_key(file_type, file_name))
+
+    def _put_object_if_changed(self, body, key):
+        """
+        Upload the object unless the bucket already holds an object with the same content under the same key.
+
+        The SHA-256 digest of the content is stored in the object metadata, since the ETag is not a content hash for
+        objects encrypted with SSE-KMS. When the upload is skipped, the version of the existing object is returned.
+        """
+        content = body.encode("utf-8") if isinstance(body, str) else body
+        digest = hashlib.sha256(content).hexdigest()
+        try:
+            existing_object = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key)
+            if existing_object.get("Metadata", {}).get(CONTENT_HASH_METADATA_KEY) == digest:
+                LOGGER.debug("Skipping upload of unchanged object %s/%s", self.name, key)
+                return {"ETag": existing_object.get("ETag"), "VersionId": existing_object.get("VersionId")}
+        except AWSClientError as e:
+            LOGGER.debug("Unable to retrieve object %s/%s: %s", self.name, key, e)
         return AWSApi.instance().s3.put_object(
-            bucket_name=self.name,
-            body=format_content(content, format),
-            key=self.get_object_key(file_type, file_name),
+            bucket_name=self.name, body=body, key=key, metadata={CONTENT_HASH_METADATA_KEY: digest}
         )
 
     def _get_file(self, file_name, file_type, version_id=None, format=S3FileFormat.YAML):
@@ -414,6 +447,12 @@ def create_s3_presigned_url(s3_uri, expiration=3600):
     )
 
 
+@lru_cache(maxsize=None)
+def _get_packaged_archive(path: str, version: str):  # pylint: disable=unused-argument
+    """Return the zip archive of a directory packaged with the given pcluster version, built once per process."""
+    return zip_dir(path).getvalue()
+
+
 def format_content(content, s3_file_format: S3FileFormat):
     """
     Return content formatted by the given S3 File Format.
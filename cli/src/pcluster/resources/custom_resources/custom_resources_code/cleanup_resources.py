@@ -8,19 +8,57 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.config import Config
 from crhelper import CfnResource
 
-helper = CfnResource(json_logging=False, log_level="INFO", boto_level="ERROR", sleep_on_delete=0)
 logger = logging.getLogger(__name__)
 boto3_config = Config(retries={"max_attempts": 60})
 
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_CONCURRENCY = 10
+DESCRIBE_INSTANCE_STATUS_BATCH_SIZE = 100
+POLL_INITIAL_INTERVAL = 2
+POLL_MAX_INTERVAL = 30
+# Seconds before the function timeout at which the remaining work is handed to a new invocation
+HANDOFF_TIME_MARGIN = 60
+# The CloudFormation custom resource request times out after one hour, i.e. four invocations of 15 minutes
+MAX_INVOCATIONS = 4
 
-def _delete_dns_records(event):
+INVOCATION_KEY = "CleanupInvocation"
+HANDED_OFF_KEY = "CleanupHandedOff"
+NODES_FOUND_KEY = "CleanupNodesFound"
+
+
+class CleanupResource(CfnResource):
+    """
+    CfnResource that lets a new invocation of the function reply to CloudFormation when the request is handed off.
+
+    The response is skipped by overriding the private CfnResource._cfn_response method of the vendored crhelper,
+    the requests are not handed off if a different crhelper does not define it.
+    """
+
+    @staticmethod
+    def can_skip_response():
+        """Tell if the response of the handed-off requests can be skipped with the crhelper in use."""
+        return callable(getattr(CfnResource, "_cfn_response", None))
+
+    def _cfn_response(self, event):
+        if event.get(HANDED_OFF_KEY):
+            logger.info("Request handed to a new invocation, skipping response")
+            return
+        super()._cfn_response(event)
+
+
+helper = CleanupResource(json_logging=False, log_level="INFO", boto_level="ERROR", sleep_on_delete=0)
+
+
+def _delete_dns_records(event, _):
     """Delete all DNS entries from the private Route53 hosted zone created within the cluster."""
     hosted_zone_id = event["ResourceProperties"]["ClusterHostedZone"]
     domain_name = event["ResourceProperties"]["ClusterDNSDomain"]
@@ -72,7 +110,7 @@ def _list_resource_record_sets_iterator(hosted_zone_id, domain_name):
         yield changes
 
 
-def _delete_s3_artifacts(event):
+def _delete_s3_artifacts(event, _):
     """
     Delete artifacts under the directory that is passed in.
 
@@ -99,33 +137,28 @@ def _delete_s3_artifacts(event):
         raise
 
 
-def _terminate_cluster_nodes(event):
+def _terminate_cluster_nodes(event, context):
+    """
+    Terminate the compute nodes of the cluster and wait for their shut-down.
+
+    When the function is about to time out, the remaining work is handed to a new invocation of the function,
+    which will reply to CloudFormation once all the nodes are terminated.
+    """
     try:
         logger.info("Compute fleet clean-up: STARTED")
         stack_name = event["ResourceProperties"]["StackName"]
         ec2 = boto3.client("ec2", config=boto3_config)
 
-        completed_successfully = False
-        while not completed_successfully:
-            completed_successfully = True
-            for instance_ids in _describe_instance_ids_iterator(stack_name):
-                logger.info("Terminating instances %s", instance_ids)
-                if instance_ids:
-                    try:
-                        ec2.terminate_instances(InstanceIds=instance_ids)
-                    except Exception as e:
-                        logger.error("Failed when terminating instances with error %s", e)
-                        completed_successfully = False
-                        continue
-            logger.info("Sleeping for 10 seconds to allow all instances to initiate shut-down")
-            time.sleep(10)
-
-        while _has_shuttingdown_instances(stack_name):
-            logger.info("Waiting for all nodes to shut-down...")
-            time.sleep(10)
+        deadline = time.time() + context.get_remaining_time_in_millis() / 1000 - HANDOFF_TIME_MARGIN
+        if not _terminate_and_wait(ec2, stack_name, event, deadline):
+            if _hand_off(event, context):
+                return
+            # The remaining work could not be handed off, keep going until the function times out
+            _terminate_and_wait(ec2, stack_name, event, time.time() + context.get_remaining_time_in_millis() / 1000)
 
-        # Sleep for 30 more seconds to give PlacementGroups the time to update
-        time.sleep(30)
+        if event.get(NODES_FOUND_KEY):
+            # Sleep for 30 more seconds to give PlacementGroups the time to update
+            time.sleep(30)
 
         logger.info("Compute fleet clean-up: COMPLETED")
     except Exception as e:
@@ -133,32 +166,126 @@ def _terminate_cluster_nodes(event):
         raise
 
 
-def _has_shuttingdown_instances(stack_name):
-    ec2 = boto3.client("ec2", config=boto3_config)
-    filters = [
-        {"Name": "tag:parallelcluster:cluster-name", "Values": [stack_name]},
-        {"Name": "instance-state-name", "Values": ["shutting-down"]},
+def _terminate_and_wait(ec2, stack_name, event, deadline):
+    """Terminate the nodes and wait for their shut-down, return False if the deadline is reached before."""
+    retry_interval = POLL_INITIAL_INTERVAL
+    while True:
+        instance_states = _describe_instance_states(ec2, stack_name)
+        if not instance_states:
+            return True
+        if time.time() >= deadline:
+            return False
+        event[NODES_FOUND_KEY] = True
+
+        instance_ids = [instance_id for instance_id, state in instance_states.items() if state != "shutting-down"]
+        terminated_ids = _terminate_instances(ec2, instance_ids)
+        shutting_down_ids = terminated_ids + [
+            instance_id for instance_id, state in instance_states.items() if state == "shutting-down"
+        ]
+        if not _wait_for_termination(ec2, stack_name, shutting_down_ids, deadline):
+            return False
+
+        if len(terminated_ids) < len(instance_ids):
+            # Back off before listing again the instances whose termination failed
+            time.sleep(min(retry_interval, max(deadline - time.time(), 0)))
+            retry_interval = min(retry_interval * 2, POLL_MAX_INTERVAL)
+
+
+def _terminate_instances(ec2, instance_ids):
+    """Terminate the instances with concurrent batched requests and return the ids of the terminated ones."""
+
+    def _terminate(batch):
+        logger.info("Terminating instances %s", batch)
+        try:
+            ec2.terminate_instances(InstanceIds=batch)
+            return batch
+        except Exception as e:
+            logger.error("Failed when terminating instances with error %s", e)
+            return []
+
+    batches = [
+        instance_ids[i : i + TERMINATE_INSTANCES_BATCH_SIZE]  # noqa: E203
+        for i in range(0, len(instance_ids), TERMINATE_INSTANCES_BATCH_SIZE)
     ]
-
-    result = ec2.describe_instances(Filters=filters)
-    return len(result.get("Reservations", [])) > 0
+    with ThreadPoolExecutor(max_workers=TERMINATE_INSTANCES_CONCURRENCY) as executor:
+        return [instance_id for batch in executor.map(_terminate, batches) for instance_id in batch]
+
+
+def _wait_for_termination(ec2, stack_name, instance_ids, deadline):
+    """Poll the state of the instances with an exponential interval, return False if the deadline is reached."""
+    remaining_ids = set(instance_ids)
+    poll_interval = POLL_INITIAL_INTERVAL
+    while remaining_ids:
+        if time.time() + poll_interval >= deadline:
+            return False
+        logger.info("Waiting for %s nodes to shut-down...", len(remaining_ids))
+        time.sleep(poll_interval)
+        remaining_ids = _get_unterminated_instance_ids(ec2, stack_name, remaining_ids)
+        poll_interval = min(poll_interval * 2, POLL_MAX_INTERVAL)
+    return True
+
+
+def _get_unterminated_instance_ids(ec2, stack_name, instance_ids):
+    """Return the ids of the instances that are not terminated yet."""
+    instance_ids = list(instance_ids)
+    unterminated_ids = set()
+    try:
+        for i in range(0, len(instance_ids), DESCRIBE_INSTANCE_STATUS_BATCH_SIZE):
+            response = ec2.describe_instance_status(
+                InstanceIds=instance_ids[i : i + DESCRIBE_INSTANCE_STATUS_BATCH_SIZE],  # noqa: E203
+                IncludeAllInstances=True,
+            )
+            unterminated_ids.update(
+                status["InstanceId"]
+                for status in response.get("InstanceStatuses", [])
+                if status["InstanceState"]["Name"] != "terminated"
+            )
+    except Exception as e:
+        # E.g. a custom Lambda role without ec2:DescribeInstanceStatus, fall back to the cluster instances listing
+        logger.warning("Failed when describing instance status with error %s", e)
+        unterminated_ids = set(_describe_instance_states(ec2, stack_name)) & set(instance_ids)
+    return unterminated_ids
 
 
-def _describe_instance_ids_iterator(stack_name, instance_state=("pending", "running", "stopping", "stopped")):
-    ec2 = boto3.client("ec2", config=boto3_config)
+def _describe_instance_states(
+    ec2, stack_name, instance_state=("pending", "running", "stopping", "stopped", "shutting-down")
+):
+    """Return a dict instance id -> state of the cluster instances in the given states."""
     filters = [
         {"Name": "tag:parallelcluster:cluster-name", "Values": [stack_name]},
         {"Name": "instance-state-name", "Values": list(instance_state)},
     ]
-    pagination_config = {"PageSize": 100}
+    pagination_config = {"PageSize": 1000}
 
     paginator = ec2.get_paginator("describe_instances")
+    instance_states = {}
     for page in paginator.paginate(Filters=filters, PaginationConfig=pagination_config):
-        instances = []
         for reservation in page.get("Reservations", []):
             for instance in reservation.get("Instances", []):
-                instances.append(instance.get("InstanceId"))
-        yield instances
+                instance_states[instance.get("InstanceId")] = instance.get("State", {}).get("Name")
+    return instance_states
+
+
+def _hand_off(event, context):
+    """Hand the request to a new asynchronous invocation of the function, return False if it cannot be invoked."""
+    if not CleanupResource.can_skip_response():
+        logger.warning("The response of the request cannot be skipped, not handing off the remaining work")
+        return False
+    invocation = event.get(INVOCATION_KEY, 1)
+    if invocation >= MAX_INVOCATIONS:
+        raise Exception(f"Compute fleet clean-up did not complete after {invocation} invocations")
+    try:
+        logger.info("Handing the remaining clean-up work to invocation %s", invocation + 1)
+        boto3.client("lambda", config=boto3_config).invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType="Event",
+            Payload=json.dumps({**event, INVOCATION_KEY: invocation + 1}),
+        )
+    except Exception as e:
+        logger.warning("Failed when invoking %s with error %s", context.invoked_function_arn, e)
+        return False
+    event[HANDED_OFF_KEY] = True
+    return True
 
 
 @helper.create
@@ -175,10 +302,10 @@ ACTION_HANDLERS = {
 
 
 @helper.delete
-def delete(event, _):
+def delete(event, context):
     action = event["ResourceProperties"]["Action"]
     if action in ACTION_HANDLERS:
-        ACTION_HANDLERS[action](event)
+        ACTION_HANDLERS[action](event, context)
     else:
         raise Exception(f"Unsupported action {action}")
 
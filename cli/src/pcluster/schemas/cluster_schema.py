@@ -42,6 +42,7 @@ from pcluster.config.cluster_config import (
     CloudWatchLogs,
     ClusterDevSettings,
     ClusterIam,
+    ComputeFleetDeployment,
     ComputeSettings,
     CustomAction,
     CustomActions,
@@ -127,6 +128,8 @@ from pcluster.constants import (
     FSX_OPENZFS,
     FSX_VOLUME_ID_REGEX,
     LUSTRE,
+    MAX_COMPUTE_RESOURCES_PER_QUEUE,
+    MAX_NUMBER_OF_COMPUTE_RESOURCES_PER_CLUSTER,
     ONTAP,
     OPENZFS,
     SCHEDULER_PLUGIN_MAX_NUMBER_OF_USERS,
@@ -1046,6 +1049,24 @@ class CapacityReservationTargetSchema(BaseSchema):
             )
 
 
+class ComputeFleetDeploymentSchema(BaseSchema):
+    """Represent the schema of the ComputeFleetDeployment section."""
+
+    # Every queue must fit in a single wave. Changing the waves moves the queue group stacks to different waves.
+    wave_size = fields.Int(
+        validate=validate.Range(min=MAX_COMPUTE_RESOURCES_PER_QUEUE, max=MAX_NUMBER_OF_COMPUTE_RESOURCES_PER_CLUSTER),
+        metadata={"update_policy": UpdatePolicy.UNSUPPORTED},
+    )
+    max_concurrent_waves = fields.Int(
+        validate=validate.Range(min=1), metadata={"update_policy": UpdatePolicy.SUPPORTED}
+    )
+
+    @post_load()
+    def make_resource(self, data, **kwargs):
+        """Generate resource."""
+        return ComputeFleetDeployment(**data)
+
+
 class ClusterDevSettingsSchema(BaseDevSettingsSchema):
     """Represent the schema of Dev Setting."""
 
@@ -1053,6 +1074,9 @@ class ClusterDevSettingsSchema(BaseDevSettingsSchema):
     ami_search_filters = fields.Nested(AmiSearchFiltersSchema, metadata={"update_policy": UpdatePolicy.UNSUPPORTED})
     instance_types_data = fields.Str(metadata={"update_policy": UpdatePolicy.SUPPORTED})
     timeouts = fields.Nested(TimeoutsSchema, metadata={"update_policy": UpdatePolicy.SUPPORTED})
+    compute_fleet_deployment = fields.Nested(
+        ComputeFleetDeploymentSchema, metadata={"update_policy": UpdatePolicy.SUPPORTED}
+    )
 
     @post_load
     def make_resource(self, data, **kwargs):
@@ -14,12 +14,13 @@
 #
 import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from typing import List
 
 from aws_cdk.cx_api import CloudAssembly, CloudFormationStackArtifact
 
-from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType
+from pcluster.models.s3_bucket import S3_UPLOAD_CONCURRENCY, S3Bucket, S3FileFormat, S3FileType
 from pcluster.utils import LOGGER, load_json_dict
 
 
@@ -133,30 +134,51 @@ class CDKArtifactsManager:
         ]
         ```
         """
-        cdk_assets = self.cluster_cdk_assembly.get_assets()
-        assets_metadata = []
+        return self.upload_asset_files(self.get_asset_files(), bucket)
 
-        for cdk_asset in cdk_assets:
+    def get_asset_files(self) -> List[dict]:
+        """Return the assets in the cloud assembly directory, with the content of their files."""
+        asset_files = []
+        for cdk_asset in self.cluster_cdk_assembly.get_assets():
             asset_file_path = os.path.join(self.cluster_cdk_assembly.get_cloud_assembly_directory(), cdk_asset.path)
-            asset_file_content = load_json_dict(asset_file_path)
-            asset_id = cdk_asset.id
+            asset_files.append({**asdict(cdk_asset), "content": load_json_dict(asset_file_path)})
+        return asset_files
+
+    @staticmethod
+    def upload_asset_files(asset_files: List[dict], bucket: S3Bucket):
+        """Upload the given asset files to the cluster artifacts S3 Bucket and return their parameters."""
+        assets_metadata = []
+
+        for asset_file in asset_files:
+            asset_file_content = asset_file["content"]
+            asset_id = asset_file["id"]
             assets_metadata.append(
                 {
                     # `artifactHashParameter` only needed when using `cdk deploy` to check the integrity of files
                     # uploaded to S3
-                    "hash_parameter": {"key": cdk_asset.artifact_hash_parameter, "value": ""},
-                    "s3_bucket_parameter": {"key": cdk_asset.s3_bucket_parameter, "value": bucket.name},
+                    "hash_parameter": {"key": asset_file["artifact_hash_parameter"], "value": ""},
+                    "s3_bucket_parameter": {"key": asset_file["s3_bucket_parameter"], "value": bucket.name},
                     "s3_object_key_parameter": {
-                        "key": cdk_asset.s3_key_parameter,
+                        "key": asset_file["s3_key_parameter"],
                         "value": bucket.get_object_key(S3FileType.ASSETS, asset_id),
                     },
                     "content": asset_file_content,
                 }
             )
-            LOGGER.info(f"Uploading asset {asset_id} to S3")
 
-            bucket.upload_cfn_asset(
-                asset_file_content=asset_file_content, asset_name=asset_id, format=S3FileFormat.MINIFIED_JSON
-            )
+        with ThreadPoolExecutor(max_workers=S3_UPLOAD_CONCURRENCY) as executor:
+            futures = []
+            for asset_file in asset_files:
+                LOGGER.info(f"Uploading asset {asset_file['id']} to S3")
+                futures.append(
+                    executor.submit(
+                        bucket.upload_cfn_asset,
+                        asset_file_content=asset_file["content"],
+                        asset_name=asset_file["id"],
+                        format=S3FileFormat.MINIFIED_JSON,
+                    )
+                )
+        for future in futures:
+            future.result()
 
         return assets_metadata
@@ -14,11 +14,13 @@
 import logging
 import os
 import tempfile
+from datetime import datetime
 
 from pcluster.config.cluster_config import BaseClusterConfig
 from pcluster.config.imagebuilder_config import ImageBuilderConfig
 from pcluster.models.s3_bucket import S3Bucket
 from pcluster.templates.cdk_artifacts_manager import CDKArtifactsManager
+from pcluster.templates.synthesis_cache import CDKSynthesisCache, QueueGroupTemplateStore
 from pcluster.utils import load_yaml_dict
 
 LOGGER = logging.getLogger(__name__)
@@ -32,6 +34,66 @@ class CDKTemplateBuilder:
         cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
     ):
         """Build template for the given cluster and return as output in Yaml format."""
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        cache_variables = (
+            CDKSynthesisCache.get_variables(cluster_config, bucket, timestamp, log_group_name)
+            if CDKSynthesisCache.is_enabled()
+            else None
+        )
+        cache_key = (
+            CDKSynthesisCache.compute_key(cluster_config, bucket, stack_name, log_group_name, cache_variables)
+            if cache_variables
+            else None
+        )
+        cached_synthesis = CDKSynthesisCache.get(cache_key) if cache_key else None
+        cached_synthesis = CDKSynthesisCache.restore(cached_synthesis, cache_variables) if cached_synthesis else None
+        if cached_synthesis:
+            LOGGER.info("Reusing CDK template previously generated for the same inputs (%s)", cache_key)
+            assets_metadata = CDKArtifactsManager.upload_asset_files(cached_synthesis["assets"], bucket)
+            return cached_synthesis["template"], assets_metadata
+
+        queue_group_templates = (
+            QueueGroupTemplateStore(cluster_config, bucket, stack_name)
+            if QueueGroupTemplateStore.is_supported(cluster_config)
+            else None
+        )
+        generated_template, asset_files = CDKTemplateBuilder._synth_cluster_template(
+            cluster_config, bucket, stack_name, log_group_name, queue_group_templates, timestamp
+        )
+        if queue_group_templates:
+            reused_asset_files = queue_group_templates.apply(asset_files)
+            if reused_asset_files is None:
+                queue_group_templates.disable_reuse()
+                generated_template, asset_files = CDKTemplateBuilder._synth_cluster_template(
+                    cluster_config, bucket, stack_name, log_group_name, queue_group_templates, timestamp
+                )
+                reused_asset_files = queue_group_templates.apply(asset_files)
+            asset_files = reused_asset_files
+
+        assets_metadata = CDKArtifactsManager.upload_asset_files(asset_files, bucket=bucket)
+        if queue_group_templates:
+            queue_group_templates.save()
+
+        normalized_synthesis = (
+            CDKSynthesisCache.normalize({"template": generated_template, "assets": asset_files}, cache_variables)
+            if cache_key
+            else None
+        )
+        if normalized_synthesis:
+            CDKSynthesisCache.put(cache_key, normalized_synthesis)
+
+        return generated_template, assets_metadata
+
+    @staticmethod
+    def _synth_cluster_template(
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str,
+        queue_group_templates: QueueGroupTemplateStore,
+        timestamp: str,
+    ):
+        """Synthesize the cluster stack and return its template with the content of its asset files."""
         LOGGER.info("Importing CDK...")
         from aws_cdk.core import App  # pylint: disable=C0415
 
@@ -42,16 +104,22 @@ class CDKTemplateBuilder:
         with tempfile.TemporaryDirectory() as cloud_assembly_dir:
             output_file = str(stack_name)
             app = App(outdir=str(cloud_assembly_dir))
-            ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
+            ClusterCdkStack(
+                app,
+                output_file,
+                stack_name,
+                cluster_config,
+                bucket,
+                log_group_name,
+                queue_group_templates=queue_group_templates,
+                timestamp=timestamp,
+            )
 
             cloud_assembly = app.synth()
             LOGGER.info("CDK template generation completed successfully")
 
             cdk_artifacts_manager = CDKArtifactsManager(cloud_assembly)
-            assets_metadata = cdk_artifacts_manager.upload_assets(bucket=bucket)
-            generated_template = cdk_artifacts_manager.get_template_body()
-
-        return generated_template, assets_metadata
+            return cdk_artifacts_manager.get_template_body(), cdk_artifacts_manager.get_asset_files()
 
     @staticmethod
     def build_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
@@ -112,14 +112,17 @@ class ClusterCdkStack:
         cluster_config: Union[SlurmClusterConfig, AwsBatchClusterConfig],
         bucket: S3Bucket,
         log_group_name=None,
+        queue_group_templates=None,
+        timestamp=None,
         **kwargs,
     ) -> None:
         self.stack = Stack(scope=scope, id=construct_id, **kwargs)
         self._stack_name = stack_name
+        self._queue_group_templates = queue_group_templates
         self._launch_template_builder = CdkLaunchTemplateBuilder()
         self.config = cluster_config
         self.bucket = bucket
-        self.timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        self.timestamp = timestamp or datetime.utcnow().strftime("%Y%m%d%H%M%S")
         if self.config.is_cw_logging_enabled:
             if log_group_name:
                 # pcluster update keep the log group,
@@ -127,8 +130,7 @@ class ClusterCdkStack:
                 self.log_group_name = log_group_name
             else:
                 # pcluster create create a log group with timestamp suffix
-                timestamp = f"{datetime.utcnow().strftime('%Y%m%d%H%M')}"
-                self.log_group_name = f"{CW_LOG_GROUP_NAME_PREFIX}{self.stack.stack_name}-{timestamp}"
+                self.log_group_name = f"{CW_LOG_GROUP_NAME_PREFIX}{self.stack.stack_name}-{self.timestamp[:12]}"
 
         self.shared_storage_infos = {storage_type: [] for storage_type in SharedStorageType}
         self.shared_storage_mount_dirs = {storage_type: [] for storage_type in SharedStorageType}
@@ -403,6 +405,7 @@ class ClusterCdkStack:
                 dynamodb_table=self.scheduler_resources.dynamodb_table if self.scheduler_resources else None,
                 head_eni=self._head_eni,
                 slurm_construct=self.scheduler_resources,
+                queue_group_templates=self._queue_group_templates,
             )
         self._add_scheduler_plugin_substack()
 
@@ -20,17 +20,20 @@ from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as awslambda
 from aws_cdk import aws_logs as logs
-from aws_cdk.core import CfnCustomResource, CfnResource, Construct, Stack
+from aws_cdk.core import ArnFormat, CfnCustomResource, CfnResource, Construct, Stack
 
 from pcluster.config.cluster_config import SlurmClusterConfig
 from pcluster.constants import (
     MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE,
     MAX_COMPUTE_RESOURCES_PER_QUEUE,
+    MAX_CONCURRENT_DEPLOYMENT_WAVES,
     PCLUSTER_CLUSTER_NAME_TAG,
 )
+from pcluster.templates.cdk_builder_utils import PCLUSTER_LAMBDA_PREFIX
 from pcluster.templates.queue_group_stack import QueueGroupStack
 from pcluster.templates.slurm_builder import SlurmConstruct
-from pcluster.utils import LOGGER, batch_by_property_callback
+from pcluster.templates.synthesis_cache import QueueGroupTemplateStore
+from pcluster.utils import LOGGER, batch_by_property_callback, get_attr
 
 
 class QueueBatchConstruct(Construct):
@@ -55,6 +58,7 @@ class QueueBatchConstruct(Construct):
         head_eni,
         slurm_construct: SlurmConstruct,
         compute_security_group,
+        queue_group_templates: QueueGroupTemplateStore = None,
     ):
         super().__init__(scope, id)
         self._config = cluster_config
@@ -67,6 +71,7 @@ class QueueBatchConstruct(Construct):
         self._head_eni = head_eni
         self._slurm_construct = slurm_construct
         self._compute_security_group = compute_security_group
+        self._queue_group_templates = queue_group_templates
 
         self.compute_fleet_launch_templates = {}
         self.managed_compute_fleet_instance_roles = {}
@@ -77,12 +82,20 @@ class QueueBatchConstruct(Construct):
 
     def _add_resources(self):
         queue_groups = batch_by_property_callback(
-            self._config.scheduling.queues,
+            self.queue_cohort,
             lambda q: len(q.compute_resources),
             MAX_COMPUTE_RESOURCES_PER_QUEUE,
         )
         for group_index, queue_group in enumerate(queue_groups):
             LOGGER.info(f"QueueGroup{group_index}: {[queue.name for queue in queue_group]}")
+            stored_template, template_key = None, None
+            if self._queue_group_templates:
+                template_key = self._queue_group_templates.compute_key(
+                    f"{self.node.path}/QueueGroup{group_index}",
+                    queue_group,
+                    self._log_group.log_group_name if self._log_group else None,
+                )
+                stored_template = self._queue_group_templates.lookup(template_key)
             queue_group_stack = QueueGroupStack(
                 scope=self,
                 id=f"QueueGroup{group_index}",
@@ -97,7 +110,10 @@ class QueueBatchConstruct(Construct):
                 head_eni=self._head_eni,
                 slurm_construct=self._slurm_construct,
                 compute_security_group=self._compute_security_group,
+                reuse_template=stored_template is not None,
             )
+            if self._queue_group_templates:
+                self._queue_group_templates.register(queue_group_stack.template_file, template_key, stored_template)
             self.managed_compute_fleet_instance_roles.update(queue_group_stack.managed_compute_instance_roles)
             self.compute_fleet_launch_templates.update(queue_group_stack.compute_launch_templates)
             self.managed_compute_fleet_placement_groups.update(queue_group_stack.managed_placement_groups)
@@ -123,6 +139,7 @@ class ComputeFleetConstruct(Construct):
         dynamodb_table,
         head_eni,
         slurm_construct: SlurmConstruct,
+        queue_group_templates: QueueGroupTemplateStore = None,
     ):
         super().__init__(scope, id)
         self._cleanup_lambda = cleanup_lambda
@@ -137,6 +154,7 @@ class ComputeFleetConstruct(Construct):
         self._dynamodb_table = dynamodb_table
         self._head_eni = head_eni
         self._slurm_construct = slurm_construct
+        self._queue_group_templates = queue_group_templates
 
         self.launch_templates = {}
         self.managed_compute_fleet_instance_roles = {}
@@ -160,7 +178,11 @@ class ComputeFleetConstruct(Construct):
         queue_batches = batch_by_property_callback(
             self._config.scheduling.queues,
             lambda q: len(q.compute_resources),
-            MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE,
+            get_attr(
+                self._config,
+                "dev_settings.compute_fleet_deployment.wave_size",
+                default=MAX_COMPUTE_RESOURCES_PER_DEPLOYMENT_WAVE,
+            ),
         )
 
         queue_deployment_groups = []
@@ -180,10 +202,11 @@ class ComputeFleetConstruct(Construct):
                     head_eni=self._head_eni,
                     slurm_construct=self._slurm_construct,
                     compute_security_group=self._compute_security_group,
+                    queue_group_templates=self._queue_group_templates,
                 )
             )
 
-        for group_index, queue_deployment_group in enumerate(queue_deployment_groups):
+        for queue_deployment_group in queue_deployment_groups:
             self.managed_compute_fleet_instance_roles.update(
                 queue_deployment_group.managed_compute_fleet_instance_roles
             )
@@ -191,16 +214,32 @@ class ComputeFleetConstruct(Construct):
             self.managed_compute_fleet_placement_groups.update(
                 queue_deployment_group.managed_compute_fleet_placement_groups
             )
-            # Make each deployment group dependent on the previous deployment group, this way the stack creation
-            # of all compute fleet resources will not happen concurrently (avoiding throttling)
-            if group_index < len(queue_deployment_groups) - 1:
-                queue_deployment_groups[group_index + 1].node.add_dependency(queue_deployment_groups[group_index])
+        self._add_deployment_wave_dependencies(
+            queue_deployment_groups,
+            get_attr(
+                self._config,
+                "dev_settings.compute_fleet_deployment.max_concurrent_waves",
+                default=MAX_CONCURRENT_DEPLOYMENT_WAVES,
+            ),
+        )
 
         custom_resource_deps = list(self.managed_compute_fleet_placement_groups.values())
         if self._compute_security_group:
             custom_resource_deps.append(self._compute_security_group)
         self._add_cleanup_custom_resource(dependencies=custom_resource_deps)
 
+    @staticmethod
+    def _add_deployment_wave_dependencies(
+        queue_deployment_groups: List[QueueBatchConstruct], max_concurrent_waves: int
+    ):
+        # Make each deployment group dependent on the one max_concurrent_waves positions before, this way
+        # the deployment groups form as many independent chains and the stack creation of all compute fleet resources
+        # will not happen concurrently (avoiding throttling)
+        for group_index in range(max_concurrent_waves, len(queue_deployment_groups)):
+            queue_deployment_groups[group_index].node.add_dependency(
+                queue_deployment_groups[group_index - max_concurrent_waves]
+            )
+
     def _add_cleanup_custom_resource(self, dependencies: List[CfnResource]):
         terminate_compute_fleet_custom_resource = CfnCustomResource(
             self,
@@ -218,7 +257,7 @@ class ComputeFleetConstruct(Construct):
     def _add_policies_to_cleanup_resources_lambda_role(self):
         self._cleanup_lambda_role.policies[0].policy_document.add_statements(
             iam.PolicyStatement(
-                actions=["ec2:DescribeInstances"],
+                actions=["ec2:DescribeInstances", "ec2:DescribeInstanceStatus"],
                 resources=["*"],
                 effect=iam.Effect.ALLOW,
                 sid="DescribeInstances",
@@ -230,4 +269,18 @@ class ComputeFleetConstruct(Construct):
                 conditions={"StringEquals": {f"ec2:ResourceTag/{PCLUSTER_CLUSTER_NAME_TAG}": self.stack_name}},
                 sid="FleetTerminatePolicy",
             ),
+            # Allow the function to hand the remaining clean-up work to a new invocation of itself
+            iam.PolicyStatement(
+                actions=["lambda:InvokeFunction"],
+                resources=[
+                    Stack.of(self).format_arn(
+                        service="lambda",
+                        resource="function",
+                        arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                        resource_name=f"{PCLUSTER_LAMBDA_PREFIX}CleanupResources-*",
+                    )
+                ],
+                effect=iam.Effect.ALLOW,
+                sid="InvokeCleanupFunction",
+            ),
         )
@@ -56,9 +56,12 @@ class QueueGroupStack(NestedStack):
         cluster_hosted_zone,
         dynamodb_table,
         head_eni,
+        reuse_template: bool = False,
     ):
         super().__init__(scope, id)
         self._queues = queues
+        self._reuse_template = reuse_template
+        self._stack_name = None
         self._slurm_construct = slurm_construct
         self._config = cluster_config
         self._shared_storage_infos = shared_storage_infos
@@ -82,7 +85,9 @@ class QueueGroupStack(NestedStack):
     @property
     def stack_name(self):
         """Name of the CFN stack."""
-        return Stack.of(self.nested_stack_parent).stack_name
+        if self._stack_name is None:
+            self._stack_name = Stack.of(self.nested_stack_parent).stack_name
+        return self._stack_name
 
     def _add_resources(self):
         self._add_compute_iam_resources()
@@ -120,19 +125,28 @@ class QueueGroupStack(NestedStack):
 
     def _add_launch_templates(self):
         self.compute_launch_templates = {}
+        launch_template = None
         for queue in self._queues:
             self.compute_launch_templates[queue.name] = {}
             queue_lt_security_groups = get_queue_security_groups_full(self._compute_security_group, queue)
 
             for resource in queue.compute_resources:
-                self.compute_launch_templates[queue.name][resource.name] = self._add_compute_resource_launch_template(
-                    queue,
-                    resource,
-                    queue_lt_security_groups,
-                    self._get_placement_group_for_compute_resource(queue, self.managed_placement_groups, resource),
-                    self._compute_instance_profiles,
-                    self._config.is_detailed_monitoring_enabled,
-                )
+                if self._reuse_template and launch_template:
+                    # A stored template is deployed in place of this one, only the references to the launch template
+                    # are needed. The first launch template is kept to reference the same cluster resources.
+                    launch_template = self._add_compute_resource_launch_template_placeholder(
+                        queue, resource, queue_lt_security_groups
+                    )
+                else:
+                    launch_template = self._add_compute_resource_launch_template(
+                        queue,
+                        resource,
+                        queue_lt_security_groups,
+                        self._get_placement_group_for_compute_resource(queue, self.managed_placement_groups, resource),
+                        self._compute_instance_profiles,
+                        self._config.is_detailed_monitoring_enabled,
+                    )
+                self.compute_launch_templates[queue.name][resource.name] = launch_template
 
     def _get_custom_compute_resource_tags(self, queue_config, compute_resource_config):
         """Compute resource tags and Queue Tags value on Cluster level tags if there are duplicated keys."""
@@ -141,6 +155,15 @@ class QueueGroupStack(NestedStack):
         compute_resource_tags = get_custom_tags(compute_resource_config, raw_dict=True)
         return dict_to_cfn_tags({**tags, **queue_tags, **compute_resource_tags})
 
+    def _add_compute_resource_launch_template_placeholder(self, queue, compute_resource, queue_lt_security_groups):
+        return ec2.CfnLaunchTemplate(
+            self,
+            f"LaunchTemplate{create_hash_suffix(queue.name + compute_resource.name)}",
+            launch_template_data=ec2.CfnLaunchTemplate.LaunchTemplateDataProperty(
+                security_group_ids=queue_lt_security_groups
+            ),
+        )
+
     def _add_compute_resource_launch_template(
         self,
         queue,
@@ -0,0 +1,359 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the caches of the templates synthesized by CDK.
+#
+import hashlib
+import json
+import logging
+import os
+from typing import List
+from urllib.parse import urlparse
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, get_region
+from pcluster.aws.persistent_cache import PersistentCache
+from pcluster.constants import AWSBATCH
+from pcluster.models.s3_bucket import S3FileFormat
+from pcluster.utils import get_installed_version
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump this value whenever the inputs of the synthesis or the layout of the entries change
+SCHEMA_VERSION = 1
+SYNTHESIS_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+PLACEHOLDER_PREFIX = "@@pcluster-synthesis-"
+# Values shorter than this could match unrelated content of the templates
+MIN_VARIABLE_LENGTH = 12
+# Prefix of the string encoding of the CDK tokens
+CDK_TOKEN_MARKER = "${Token["
+
+
+class CDKSynthesisCache:
+    """
+    Content-addressed cache of the cluster templates synthesized by CDK and of their assets.
+
+    Entries are keyed by a canonical hash of the cluster configuration and of every other input of the synthesis.
+    The values that change at every synthesis, like the artifact directory and the versions of the uploaded
+    configuration, are not part of the key and are replaced by placeholders in the stored entries.
+    They are stored in the persistent cache when the PCLUSTER_PERSISTENT_CACHE environment variable is set and,
+    when the PCLUSTER_CDK_CACHE_S3_URI environment variable is set to an s3://bucket/prefix URI, in S3 so that
+    they can be shared across hosts, e.g. by CI jobs. Storage errors are never propagated and behave as cache misses.
+    """
+
+    @staticmethod
+    def s3_location():
+        """Return the (bucket, prefix) pair of the S3 store, None if not configured."""
+        uri = os.environ.get("PCLUSTER_CDK_CACHE_S3_URI")
+        if not uri or os.environ.get("PCLUSTER_CACHE_DISABLED"):
+            return None
+        parsed_uri = urlparse(uri)
+        return parsed_uri.netloc, parsed_uri.path.strip("/")
+
+    @staticmethod
+    def is_enabled():
+        """Tell if at least a store is enabled."""
+        return PersistentCache.is_enabled() or CDKSynthesisCache.s3_location() is not None
+
+    @staticmethod
+    def get_variables(cluster_config, bucket, timestamp: str, log_group_name: str = None):
+        """
+        Return the values that change at every synthesis with the same inputs, by name.
+
+        These values are replaced by placeholders in the stored entries and by their current value in the retrieved
+        ones. Return None if any of them could not be replaced unambiguously, in which case the cache must be skipped.
+        """
+        variables = {
+            "artifactDirectory": bucket.artifact_directory,
+            "configVersion": cluster_config.config_version,
+            "originalConfigVersion": cluster_config.original_config_version,
+            "timestamp": timestamp,
+        }
+        if not log_group_name:
+            # The log group created with the cluster is suffixed with the timestamp of the synthesis, to the minute
+            variables["logGroupTimestamp"] = timestamp[:12]
+        values = list(variables.values())
+        if any(not value or len(value) < MIN_VARIABLE_LENGTH for value in values) or len(set(values)) < len(values):
+            return None
+        return variables
+
+    @staticmethod
+    def compute_key(cluster_config, bucket, stack_name: str, log_group_name: str = None, variables: dict = None):
+        """
+        Return the hash of the inputs of the synthesis of the given cluster.
+
+        The key is computed from the content of the configuration and from the values retrieved from AWS that the
+        synthesis depends on. Return None if any of these inputs cannot be pinned down, since the cache must be skipped.
+        """
+        if cluster_config.source_config is None or cluster_config.scheduling.scheduler == AWSBATCH:
+            # The AWS Batch resources are named after the time of the synthesis
+            return None
+        try:
+            try:
+                official_ami = cluster_config.official_ami
+            except AWSClientError:
+                # The official AMI is not required when custom AMIs are defined for every node
+                official_ami = None
+            inputs = {
+                "schemaVersion": SCHEMA_VERSION,
+                "version": get_installed_version(),
+                "region": get_region(),
+                "config": cluster_config.source_config,
+                "officialAmi": official_ami,
+                "headNodeAmi": cluster_config.head_node_ami,
+                "images": getattr(cluster_config, "image_dict", None),
+                "instanceTypesData": cluster_config.get_instance_types_data(),
+                "managedHeadNodeSecurityGroup": cluster_config.managed_head_node_security_group,
+                "managedComputeSecurityGroup": cluster_config.managed_compute_security_group,
+                "bucket": bucket.name,
+                "stackName": stack_name,
+                "logGroupName": log_group_name,
+                "variables": sorted(variables or {}),
+            }
+            canonical_inputs = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+        except (AWSClientError, TypeError, ValueError) as e:
+            LOGGER.debug("Unable to compute the inputs of the CDK synthesis, skipping cache: %s", e)
+            return None
+        return hashlib.sha256(canonical_inputs.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _placeholder(name: str):
+        return f"{PLACEHOLDER_PREFIX}{name}@@"
+
+    @staticmethod
+    def _replace_variables(entry: dict, replacements: List[tuple]):
+        entry_text = json.dumps(entry)
+        for old, new in replacements:
+            # Values are replaced in their JSON encoded form, to be consistent with the escaping of the document
+            entry_text = entry_text.replace(json.dumps(old)[1:-1], json.dumps(new)[1:-1])  # noqa: E203
+        return entry_text
+
+    @staticmethod
+    def normalize(entry: dict, variables: dict):
+        """Return the entry with the given variables replaced by placeholders, None if it cannot be normalized."""
+        try:
+            if PLACEHOLDER_PREFIX in json.dumps(entry):
+                return None
+        except (TypeError, ValueError) as e:
+            LOGGER.debug("Unable to serialize the CDK synthesis, skipping cache: %s", e)
+            return None
+        # Longest values first, so that values containing other ones are replaced as a whole
+        replacements = sorted(
+            ((value, CDKSynthesisCache._placeholder(name)) for name, value in variables.items()),
+            key=lambda replacement: len(replacement[0]),
+            reverse=True,
+        )
+        return json.loads(CDKSynthesisCache._replace_variables(entry, replacements))
+
+    @staticmethod
+    def restore(entry: dict, variables: dict):
+        """Return the entry with the placeholders replaced by the given variables, None if any is left."""
+        replacements = [(CDKSynthesisCache._placeholder(name), value) for name, value in variables.items()]
+        entry_text = CDKSynthesisCache._replace_variables(entry, replacements)
+        return None if PLACEHOLDER_PREFIX in entry_text else json.loads(entry_text)
+
+    @staticmethod
+    def _s3_key(prefix: str, key: str):
+        return "/".join(filter(None, [prefix, f"cdk-synthesis-v{SCHEMA_VERSION}", f"{key}.json"]))
+
+    @staticmethod
+    def _put_local(key: str, entry: dict):
+        if PersistentCache.is_enabled():
+            PersistentCache.instance().put(PersistentCache.scope(), "cdk-synthesis", key, entry, SYNTHESIS_CACHE_TTL)
+
+    @staticmethod
+    def get(key: str):
+        """Return the entry with the given key, looking it up in the persistent cache first and then in S3."""
+        if PersistentCache.is_enabled():
+            found, entry = PersistentCache.instance().get(PersistentCache.scope(), "cdk-synthesis", key)
+            if found:
+                return entry
+        s3_location = CDKSynthesisCache.s3_location()
+        if s3_location:
+            bucket_name, prefix = s3_location
+            try:
+                response = AWSApi.instance().s3.get_object(bucket_name, CDKSynthesisCache._s3_key(prefix, key))
+                entry = json.loads(response["Body"].read())
+            except (AWSClientError, ValueError) as e:
+                LOGGER.debug("CDK synthesis %s not found in s3://%s/%s: %s", key, bucket_name, prefix, e)
+                return None
+            CDKSynthesisCache._put_local(key, entry)
+            return entry
+        return None
+
+    @staticmethod
+    def put(key: str, entry: dict):
+        """Store the given entry in every enabled store."""
+        CDKSynthesisCache._put_local(key, entry)
+        s3_location = CDKSynthesisCache.s3_location()
+        if s3_location:
+            bucket_name, prefix = s3_location
+            try:
+                AWSApi.instance().s3.put_object(
+                    bucket_name, json.dumps(entry, default=str), CDKSynthesisCache._s3_key(prefix, key)
+                )
+            except AWSClientError as e:
+                LOGGER.debug("Unable to store CDK synthesis %s in s3://%s/%s: %s", key, bucket_name, prefix, e)
+
+
+class QueueGroupTemplateStore:
+    """
+    Index of the nested templates of the queue groups of a cluster, stored in the cluster artifacts bucket.
+
+    The nested template of each queue group is uploaded as an asset of the cluster stack. The index maps the hash of
+    the inputs of every queue group to its asset, so that the synthesis of a cluster update can reuse the templates of
+    the queue groups whose inputs did not change. The launch templates of these groups, which take most of the
+    synthesis time, are replaced by placeholders and the stored template is deployed in place of the synthesized one.
+    Storage errors are never propagated and behave as index misses.
+    """
+
+    INDEX_NAME = "queue-group-templates.json"
+    QUEUES_KEYS = ("SlurmQueues", "SchedulerQueues")
+
+    def __init__(self, cluster_config, bucket, stack_name: str):
+        self._bucket = bucket
+        self._images = getattr(cluster_config, "image_dict", None) or {}
+        scheduling = cluster_config.source_config.get("Scheduling", {})
+        self._source_queues = {
+            queue.get("Name"): queue for key in self.QUEUES_KEYS for queue in scheduling.get(key, None) or []
+        }
+        # Everything but the queues contributes to the templates of every queue group
+        shared_config = {
+            **cluster_config.source_config,
+            "Scheduling": {key: value for key, value in scheduling.items() if key not in self.QUEUES_KEYS},
+        }
+        self._shared_inputs = {
+            "schemaVersion": SCHEMA_VERSION,
+            "version": get_installed_version(),
+            "region": get_region(),
+            "config": shared_config,
+            "bucket": bucket.name,
+            "artifactDirectory": bucket.artifact_directory,
+            "stackName": stack_name,
+        }
+        self._index = None
+        self._reuse_enabled = True
+        self._queue_groups = []
+        self._new_index = None
+
+    @staticmethod
+    def is_supported(cluster_config):
+        """Tell if the templates of the queue groups of the given cluster can be indexed."""
+        return cluster_config.source_config is not None and cluster_config.scheduling.scheduler != AWSBATCH
+
+    def compute_key(self, queue_group_path: str, queues, log_group_name: str = None):
+        """
+        Return the hash of the inputs of the queue group with the given construct path.
+
+        Return None if the inputs cannot be hashed deterministically, in which case the queue group is not indexed.
+        """
+        inputs = {
+            **self._shared_inputs,
+            "path": queue_group_path,
+            "logGroupName": log_group_name,
+            "queues": [
+                {"config": self._source_queues.get(queue.name), "image": self._images.get(queue.name)}
+                for queue in queues
+            ],
+        }
+        try:
+            canonical_inputs = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            LOGGER.debug("Unable to compute the inputs of queue group %s: %s", queue_group_path, e)
+            return None
+        if CDK_TOKEN_MARKER in canonical_inputs:
+            # Tokens are resolved at synthesis time and their string encoding changes at every synthesis
+            LOGGER.debug("Inputs of queue group %s depend on unresolved values", queue_group_path)
+            return None
+        return hashlib.sha256(canonical_inputs.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str):
+        """Return the stored template of the queue group with the given key, None if it cannot be reused."""
+        if not self._reuse_enabled or not key:
+            return None
+        entry = self._load_index().get(key)
+        if not entry:
+            return None
+        try:
+            content = self._bucket.get_cfn_asset(entry["assetId"])
+        except (AWSClientError, ValueError) as e:
+            LOGGER.debug("Unable to retrieve queue group template %s: %s", entry["assetId"], e)
+            return None
+        return {**entry, "content": content}
+
+    def register(self, template_file: str, key: str, stored_entry: dict = None):
+        """Register a queue group synthesized in the given template file, reusing the given stored entry if any."""
+        self._queue_groups.append((template_file, key, stored_entry))
+
+    def disable_reuse(self):
+        """Synthesize the templates of every queue group from now on."""
+        self._reuse_enabled = False
+
+    def apply(self, asset_files: List[dict]):
+        """
+        Replace the assets of the reused queue groups with the stored templates and index the synthesized ones.
+
+        Return None if the placeholder template of a reused queue group doesn't have the same parameters and outputs
+        of the stored template, in which case the cluster must be synthesized again without reusing templates.
+        """
+        queue_groups, self._queue_groups = self._queue_groups, []
+        assets_by_path = {asset_file["path"]: asset_file for asset_file in asset_files}
+        index = {}
+        reused_assets = {}
+        for template_file, key, stored_entry in queue_groups:
+            if not key:
+                continue
+            asset_file = assets_by_path[template_file]
+            interface = self._get_template_interface(asset_file["content"])
+            if stored_entry:
+                if interface != stored_entry["interface"]:
+                    LOGGER.info("Stored template of queue group %s does not match the cluster stack", template_file)
+                    return None
+                LOGGER.info("Reusing stored template of queue group %s", template_file)
+                reused_assets[template_file] = {
+                    **asset_file,
+                    "id": stored_entry["assetId"],
+                    "content": stored_entry["content"],
+                }
+                index[key] = {"assetId": stored_entry["assetId"], "interface": interface}
+            else:
+                index[key] = {"assetId": asset_file["id"], "interface": interface}
+        self._new_index = index
+        return [reused_assets.get(asset_file["path"], asset_file) for asset_file in asset_files]
+
+    def save(self):
+        """Store the index of the queue group templates of the last synthesis in the cluster bucket."""
+        if self._new_index is None:
+            return
+        try:
+            self._bucket.upload_cfn_asset(
+                {"schemaVersion": SCHEMA_VERSION, "queueGroups": self._new_index},
+                self.INDEX_NAME,
+                format=S3FileFormat.JSON,
+            )
+        except AWSClientError as e:
+            LOGGER.debug("Unable to store the index of the queue group templates: %s", e)
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                index = self._bucket.get_cfn_asset(self.INDEX_NAME)
+            except (AWSClientError, ValueError) as e:
+                LOGGER.debug("Index of the queue group templates not found: %s", e)
+                index = {}
+            self._index = index.get("queueGroups", {}) if index.get("schemaVersion") == SCHEMA_VERSION else {}
+        return self._index
+
+    @staticmethod
+    def _get_template_interface(template: dict):
+        """Return the hash of the parameters and outputs of the template, that the cluster stack depends on."""
+        interface = {"Parameters": template.get("Parameters", {}), "Outputs": template.get("Outputs", {})}
+        return hashlib.sha256(json.dumps(interface, sort_keys=True).encode("utf-8")).hexdigest()
@@ -53,6 +53,8 @@ class AwsBatchComputeInstanceTypeValidator(Validator):
     Validate instance types and max vCPUs combination.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, instance_types: List[str], max_vcpus: int):
         supported_instances = _get_supported_batch_instance_types()
         if supported_instances:
@@ -146,6 +148,8 @@ class AwsBatchInstancesArchitectureCompatibilityValidator(Validator):
     With AWS Batch, compute instance type can contain a CSV list.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, instance_types: List[str], architecture: str):
         for instance_type in instance_types:
             # When awsbatch is used as the scheduler instance families can be used.
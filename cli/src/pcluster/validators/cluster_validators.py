@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import math
 import re
 from collections import defaultdict
@@ -139,6 +140,8 @@ class SchedulerOsValidator(Validator):
 class CustomAmiTagValidator(Validator):
     """Custom AMI tag validator to check if the AMI was created by pcluster to avoid runtime baking."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, custom_ami: str):
         tags = AWSApi.instance().ec2.describe_image(custom_ami).tags
         tags_dict = {}
@@ -317,6 +320,8 @@ class MaxCountValidator(Validator):
 class EfaValidator(Validator):
     """Check if EFA and EFA GDR are supported features in the given instance type."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, instance_type, efa_enabled, gdr_support, multiaz_enabled):
         instance_type_supports_efa = AWSApi.instance().ec2.get_instance_type_info(instance_type).is_efa_supported()
         if efa_enabled and not instance_type_supports_efa:
@@ -356,6 +361,8 @@ class EfaPlacementGroupValidator(Validator):
 class EfaSecurityGroupValidator(Validator):
     """Validate Security Group if EFA is enabled."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, efa_enabled, security_groups, additional_security_groups):
         if efa_enabled and security_groups:
             # Check security groups associated to the EFA
@@ -554,6 +561,8 @@ class ExistingFsxNetworkingValidator(Validator):
     The reason to have this structure is to make boto3 calls as few as possible.
     """
 
+    aws_services = ("ec2", "fsx")
+
     def _describe_network_interfaces(self, file_systems):
         all_network_interfaces = []
         for file_system in file_systems:
@@ -809,6 +818,8 @@ class EfsIdValidator(Validator):  # TODO add tests
     Validate if there are existing mount target in the cluster (head and computes) availability zone
     """
 
+    aws_services = ("efs",)
+
     def _validate(self, efs_id, avail_zones_mapping: dict, security_groups_by_nodes):
         availability_zones = avail_zones_mapping.keys()
         if len(availability_zones) > 1 and not AWSApi.instance().efs.is_efs_standard(efs_id):
@@ -1073,6 +1084,8 @@ class MixedSecurityGroupOverwriteValidator(Validator):
 class _LaunchTemplateValidator(Validator):
     """Abstract class to contain utility functions used by head node and queue LaunchTemplate validators."""
 
+    aws_services = ("ec2",)
+
     def __init__(self):
         super().__init__()
         self._launch_template_builder = DictLaunchTemplateBuilder()
@@ -1099,60 +1112,66 @@ class _LaunchTemplateValidator(Validator):
             network_interfaces[0]["AssociatePublicIpAddress"] = True
         return network_interfaces
 
-    def _ec2_run_instance(self, availability_zone: str, **kwargs):  # noqa: C901 FIXME!!!
+    def _ec2_run_instance(self, availability_zone: str, **kwargs):
         """Wrap ec2 run_instance call. Useful since a successful run_instance call signals 'DryRunOperation'."""
         try:
             AWSApi.instance().ec2.run_instances(**remove_none_values(kwargs))
         except AWSClientError as e:
-            code = e.error_code
-            message = str(e)
-            subnet_id = kwargs["NetworkInterfaces"][0]["SubnetId"]
-            if code == "InstanceLimitExceeded":
-                self._add_failure(
-                    "You've reached the limit on the number of instances you can run concurrently "
-                    f"for the configured instance type. {message}",
-                    FailureLevel.ERROR,
-                )
-            elif code == "InsufficientInstanceCapacity":
-                self._add_failure(
-                    f"There is not enough capacity to fulfill your request. {message}", FailureLevel.ERROR
-                )
-            elif code == "InsufficientFreeAddressesInSubnet":
-                self._add_failure(
-                    "The specified subnet does not contain enough free private IP addresses "
-                    f"to fulfill your request. {message}",
-                    FailureLevel.ERROR,
-                )
-            elif code == "InvalidParameterCombination":
-                if "associatePublicIPAddress" in message:
-                    # Instances with multiple Network Interfaces cannot currently take public IPs.
-                    # This check is meant to warn users about this problem until services are fixed.
-                    self._add_failure(
-                        f"The instance type {kwargs['InstanceType']} cannot take public IPs. "
-                        f"Please make sure that the subnet with id '{subnet_id}' has the proper routing configuration "
-                        "to allow private IPs reaching the Internet (e.g. a NAT Gateway and a valid route table).",
-                        FailureLevel.WARNING,
-                    )
-            elif (
-                code == "Unsupported"
-                and availability_zone
-                not in AWSApi.instance().ec2.get_supported_az_for_instance_type(kwargs["InstanceType"])
-            ):
-                # If an availability zone without desired instance type is selected, error code is "Unsupported"
-                # Therefore, we need to write our own code to tell the specific problem
-                qualified_az = AWSApi.instance().ec2.get_supported_az_for_instance_type(kwargs["InstanceType"])
-                self._add_failure(
-                    f"Your requested instance type ({kwargs['InstanceType']}) is not supported in the "
-                    f"Availability Zone ({availability_zone}) of your requested subnet ({subnet_id}). "
-                    f"Please retry your request by choosing a subnet in {qualified_az}. ",
-                    FailureLevel.ERROR,
-                )
-            else:
+            self._add_run_instance_failure(e, availability_zone, kwargs)
+
+    def _add_run_instance_failure(  # noqa: C901 FIXME!!!
+        self, error: AWSClientError, availability_zone: str, kwargs: dict, prefix: str = ""
+    ):
+        """Add the failure corresponding to the error returned by a dry-run run_instance call."""
+        code = error.error_code
+        message = str(error)
+        subnet_id = kwargs["NetworkInterfaces"][0]["SubnetId"]
+        if code == "InstanceLimitExceeded":
+            self._add_failure(
+                f"{prefix}You've reached the limit on the number of instances you can run concurrently "
+                f"for the configured instance type. {message}",
+                FailureLevel.ERROR,
+            )
+        elif code == "InsufficientInstanceCapacity":
+            self._add_failure(
+                f"{prefix}There is not enough capacity to fulfill your request. {message}", FailureLevel.ERROR
+            )
+        elif code == "InsufficientFreeAddressesInSubnet":
+            self._add_failure(
+                f"{prefix}The specified subnet does not contain enough free private IP addresses "
+                f"to fulfill your request. {message}",
+                FailureLevel.ERROR,
+            )
+        elif code == "InvalidParameterCombination":
+            if "associatePublicIPAddress" in message:
+                # Instances with multiple Network Interfaces cannot currently take public IPs.
+                # This check is meant to warn users about this problem until services are fixed.
                 self._add_failure(
-                    f"Unable to validate configuration parameters for instance type {kwargs['InstanceType']}. "
-                    f"Please double check your cluster configuration. {message}",
-                    FailureLevel.ERROR,
+                    f"{prefix}The instance type {kwargs['InstanceType']} cannot take public IPs. "
+                    f"Please make sure that the subnet with id '{subnet_id}' has the proper routing configuration "
+                    "to allow private IPs reaching the Internet (e.g. a NAT Gateway and a valid route table).",
+                    FailureLevel.WARNING,
                 )
+        elif (
+            code == "Unsupported"
+            and availability_zone
+            not in AWSApi.instance().ec2.get_supported_az_for_instance_type(kwargs["InstanceType"])
+        ):
+            # If an availability zone without desired instance type is selected, error code is "Unsupported"
+            # Therefore, we need to write our own code to tell the specific problem
+            qualified_az = AWSApi.instance().ec2.get_supported_az_for_instance_type(kwargs["InstanceType"])
+            self._add_failure(
+                f"{prefix}Your requested instance type ({kwargs['InstanceType']}) is not supported in the "
+                f"Availability Zone ({availability_zone}) of your requested subnet ({subnet_id}). "
+                f"Please retry your request by choosing a subnet in {qualified_az}. ",
+                FailureLevel.ERROR,
+            )
+        else:
+            self._add_failure(
+                f"{prefix}Unable to validate configuration parameters for instance type {kwargs['InstanceType']}. "
+                f"Please double check your cluster configuration. {message}",
+                FailureLevel.ERROR,
+            )
 
     @staticmethod
     def _generate_tag_specifications(tags):
@@ -1228,90 +1247,129 @@ class HeadNodeImdsValidator(Validator):
 
 
 class ComputeResourceLaunchTemplateValidator(_LaunchTemplateValidator):
-    """Try to launch the requested instances (in dry-run mode) to verify configuration parameters."""
+    """
+    Try to launch the requested instances (in dry-run mode) to verify configuration parameters.
 
-    def _validate(self, queue, os, ami_id, tags, imds_support):
-        try:
-            # Retrieve network parameters
-            queue_subnet_id = queue.networking.subnet_ids[0]
-            queue_security_groups = []
-            if queue.networking.security_groups:
-                queue_security_groups.extend(queue.networking.security_groups)
-            if queue.networking.additional_security_groups:
-                queue_security_groups.extend(queue.networking.additional_security_groups)
-
-            # Select the "best" compute resource to run dryrun tests against.
-            # Resources with multiple NICs are preferred among others.
-            # Temporarily limiting dryrun tests to 1 per queue to save boto3 calls.
-            dry_run_compute_resource = next(
-                (compute_res for compute_res in queue.compute_resources if compute_res.max_network_interface_count > 1),
-                queue.compute_resources[0],
-            )
-            compute_resource_placement_group = (
-                dry_run_compute_resource.networking.placement_group or queue.networking.placement_group
-            )
+    Every instance type of every compute resource is tested. The launch requests are built with build_dry_runs, so that
+    identical requests are sent only once and each request is executed as a separate validator by the validation
+    scheduler, within its limit of concurrent validators calling EC2.
+    """
 
-            placement_group_name = compute_resource_placement_group.assignment
-            # For SlurmFlexibleComputeResource test only the first InstanceType through a RunInstances
-            self._test_compute_resource(
-                queue=queue,
-                os=os,
-                compute_resource=dry_run_compute_resource,
-                use_public_ips=bool(queue.networking.assign_public_ip),
-                ami_id=ami_id,
-                subnet_id=queue_subnet_id,
-                security_groups_ids=queue_security_groups,
-                placement_group={"GroupName": placement_group_name} if placement_group_name else {},
-                tags=tags,
-                imds_support=imds_support,
-            )
-        except Exception as e:
-            self._add_failure(
-                f"Unable to validate configuration parameters for queue {queue.name}. {str(e)}", FailureLevel.ERROR
+    def _validate(self, compute_resources, request=None, error=None):
+        """
+        Send the dry-run launch request and add a failure for each of the compute resources it belongs to.
+
+        :param compute_resources: list of (queue name, compute resource name) the request belongs to
+        :param request: the RunInstances request, None if the requests of the queue could not be built
+        :param error: the error raised building the requests of the queue
+        """
+        if error is None:
+            try:
+                subnet_id = request["NetworkInterfaces"][0]["SubnetId"]
+                availability_zone = AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id)
+            except Exception as e:
+                error = e
+            else:
+                error = self._execute_dry_run(request)
+                if isinstance(error, AWSClientError):
+                    for queue_name, compute_resource_name in compute_resources:
+                        self._add_run_instance_failure(
+                            error,
+                            availability_zone,
+                            request,
+                            prefix=f"Compute resource {compute_resource_name} in queue {queue_name}: ",
+                        )
+                    return
+        if error is not None:
+            for queue_name in dict.fromkeys(queue_name for queue_name, _ in compute_resources):
+                self._add_failure(
+                    f"Unable to validate configuration parameters for queue {queue_name}. {str(error)}",
+                    FailureLevel.ERROR,
+                )
+
+    @classmethod
+    def build_dry_runs(cls, queues, os, ami_ids, tags, imds_support):
+        """
+        Return the arguments of the validators testing the instance types of the compute resources of the queues.
+
+        Identical launch requests are returned once, along with all the compute resources they belong to, in
+        configuration order. Queues whose requests cannot be built are returned with the corresponding error.
+        """
+        launch_template_builder = DictLaunchTemplateBuilder()
+        dry_runs = {}
+        for queue in queues:
+            try:
+                queue_dry_runs = cls._build_queue_dry_runs(
+                    launch_template_builder, queue, os, ami_ids[queue.name], tags, imds_support
+                )
+            except Exception as e:
+                dry_runs[("error", queue.name)] = {"compute_resources": [(queue.name, None)], "error": e}
+                continue
+            for compute_resource_name, request in queue_dry_runs:
+                dry_run = dry_runs.setdefault(
+                    json.dumps(request, sort_keys=True, default=str), {"compute_resources": [], "request": request}
+                )
+                if (queue.name, compute_resource_name) not in dry_run["compute_resources"]:
+                    dry_run["compute_resources"].append((queue.name, compute_resource_name))
+        return list(dry_runs.values())
+
+    @classmethod
+    def _build_queue_dry_runs(cls, launch_template_builder, queue, os, ami_id, tags, imds_support):
+        """Return the (compute resource name, launch request) of all the instance types of the queue."""
+        subnet_id = queue.networking.subnet_ids[0]
+        security_groups_ids = []
+        if queue.networking.security_groups:
+            security_groups_ids.extend(queue.networking.security_groups)
+        if queue.networking.additional_security_groups:
+            security_groups_ids.extend(queue.networking.additional_security_groups)
+
+        queue_dry_runs = []
+        for compute_resource in queue.compute_resources:
+            placement_group_name = (
+                compute_resource.networking.placement_group or queue.networking.placement_group
+            ).assignment
+            network_interfaces = cls._build_launch_network_interfaces(
+                compute_resource.max_network_interface_count,
+                compute_resource.efa.enabled,
+                security_groups_ids,
+                subnet_id,
+                bool(queue.networking.assign_public_ip),
             )
+            for instance_type in compute_resource.instance_types:
+                request = remove_none_values(
+                    dict(
+                        InstanceType=instance_type,
+                        MinCount=1,
+                        MaxCount=1,
+                        ImageId=ami_id,
+                        Placement={"GroupName": placement_group_name} if placement_group_name else {},
+                        NetworkInterfaces=network_interfaces,
+                        DryRun=True,
+                        TagSpecifications=cls._generate_tag_specifications(tags),
+                        InstanceMarketOptions=launch_template_builder.get_instance_market_options(
+                            queue, compute_resource
+                        ),
+                        CapacityReservationSpecification=launch_template_builder.get_capacity_reservation(
+                            queue, compute_resource
+                        ),
+                        BlockDeviceMappings=launch_template_builder.get_block_device_mappings(
+                            queue.compute_settings.local_storage.root_volume, os
+                        ),
+                        MetadataOptions={
+                            "HttpTokens": "required" if imds_support == "v2.0" else "optional",
+                        },
+                    )
+                )
+                queue_dry_runs.append((compute_resource.name, request))
+        return queue_dry_runs
 
-    def _test_compute_resource(
-        self,
-        queue,
-        os,
-        compute_resource,
-        use_public_ips,
-        ami_id,
-        subnet_id,
-        security_groups_ids,
-        placement_group,
-        tags,
-        imds_support,
-    ):
-        """Test Compute Resource Instance Configuration."""
-        network_interfaces = self._build_launch_network_interfaces(
-            compute_resource.max_network_interface_count,
-            compute_resource.efa.enabled,
-            security_groups_ids,
-            subnet_id,
-            use_public_ips,
-        )
-        self._ec2_run_instance(
-            availability_zone=AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id),
-            InstanceType=compute_resource.instance_types[0],
-            MinCount=1,
-            MaxCount=1,
-            ImageId=ami_id,
-            Placement=placement_group,
-            NetworkInterfaces=network_interfaces,
-            DryRun=True,
-            TagSpecifications=self._generate_tag_specifications(tags),
-            InstanceMarketOptions=self._launch_template_builder.get_instance_market_options(queue, compute_resource),
-            CapacityReservationSpecification=self._launch_template_builder.get_capacity_reservation(
-                queue, compute_resource
-            ),
-            BlockDeviceMappings=self._launch_template_builder.get_block_device_mappings(
-                queue.compute_settings.local_storage.root_volume, os
-            ),
-            MetadataOptions={
-                "HttpTokens": "required" if imds_support == "v2.0" else "optional",
-            },
-        )
+    @staticmethod
+    def _execute_dry_run(request):
+        try:
+            AWSApi.instance().ec2.run_instances(**request)
+            return None
+        except Exception as e:
+            return e
 
 
 class RootVolumeSizeValidator(Validator):
@@ -1330,6 +1388,8 @@ class RootVolumeSizeValidator(Validator):
 class HostedZoneValidator(Validator):
     """Validate custom private domain in the same VPC as head node."""
 
+    aws_services = ("route53",)
+
     def _validate(self, hosted_zone_id, cluster_vpc, cluster_name):
         if AWSApi.instance().route53.is_hosted_zone_private(hosted_zone_id):
             vpc_ids = AWSApi.instance().route53.get_hosted_zone_vpcs(hosted_zone_id)
@@ -1435,6 +1495,8 @@ class RootVolumeEncryptionConsistencyValidator(Validator):
 class MultiNetworkInterfacesInstancesValidator(Validator):
     """Verify that queues with multi nic compute resources don't auto-assign public IPs or contain subnets that do."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, queues):
         multi_nic_queues = [
             queue
@@ -19,6 +19,10 @@ from enum import Enum
 from typing import List
 
 ASYNC_TIMED_VALIDATORS_DEFAULT_TIMEOUT_SEC = 10
+# Max number of validators calling AWS services executed concurrently
+VALIDATION_MAX_CONCURRENCY = 16
+# Max number of validators calling the same AWS service executed concurrently
+VALIDATION_SERVICE_MAX_CONCURRENCY = 8
 
 
 class FailureLevel(Enum):
@@ -45,7 +49,14 @@ class ValidationResult:
 
 
 class Validator(ABC):
-    """Abstract validator. The children must implement the _validate method."""
+    """
+    Abstract validator. The children must implement the _validate method.
+
+    Validators calling AWS services must list them in aws_services (e.g. ("ec2",)), so that they can be executed
+    concurrently by the validation scheduler within the per-service concurrency limits.
+    """
+
+    aws_services = ()
 
     def __init__(self):
         self._failures = []
@@ -75,6 +75,8 @@ class DomainNameValidator(Validator):
 class PasswordSecretArnValidator(Validator):
     """PasswordSecretArn validator."""
 
+    aws_services = ("secretsmanager", "ssm")
+
     def _validate(self, password_secret_arn: str, region: str):
         """Validate that PasswordSecretArn contains a valid ARN for the given region.
 
@@ -135,6 +135,8 @@ class EbsVolumeSizeSnapshotValidator(Validator):
     - If users specify the volume size, the volume must be not smaller than the volume size of the EBS snapshot.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, snapshot_id: int, volume_size: int):
         if snapshot_id:
             try:
@@ -262,6 +264,8 @@ class SharedEbsVolumeIdValidator(Validator):
     Validate the volume exist and is available.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, volume_id: str, head_node_instance_id: str = None):
         if volume_id:
             try:
@@ -107,6 +107,8 @@ class InstanceTypeValidator(Validator):
     Verify the given instance type is a supported one.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, instance_type: str):
         if instance_type not in AWSApi.instance().ec2.list_instance_types():
             self._add_failure(f"The instance type '{instance_type}' is not supported.", FailureLevel.ERROR)
@@ -131,6 +133,8 @@ class InstanceTypeMemoryInfoValidator(Validator):
 class InstanceTypeBaseAMICompatibleValidator(Validator):
     """EC2 Instance type and base ami compatibility validator."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, instance_type: str, image: str):
         image_info = self._validate_base_ami(image)
         instance_architectures = self._validate_instance_type(instance_type)
@@ -171,6 +175,8 @@ class KeyPairValidator(Validator):
     Verify the given key pair is correct.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, key_name: str):
         if key_name:
             try:
@@ -188,6 +194,8 @@ class KeyPairValidator(Validator):
 class PlacementGroupNamingValidator(Validator):
     """Placement group naming validator."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, placement_group):
         if placement_group.id and placement_group.name:
             self._add_failure(
@@ -215,6 +223,8 @@ class PlacementGroupNamingValidator(Validator):
 class CapacityTypeValidator(Validator):
     """Compute type validator. Verify that specified compute type is compatible with specified instance type."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, capacity_type, instance_type):
         compute_type_value = capacity_type.value.lower()
         supported_usage_classes = AWSApi.instance().ec2.get_instance_type_info(instance_type).supported_usage_classes()
@@ -238,6 +248,8 @@ class AmiOsCompatibleValidator(Validator):
     If image has tag of OS, compare AMI OS with cluster OS, else print out a warning message.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, os: str, image_id: str):
         image_info = AWSApi.instance().ec2.describe_image(ami_id=image_id)
         image_os = image_info.image_os
@@ -258,6 +270,8 @@ class AmiOsCompatibleValidator(Validator):
 class CapacityReservationValidator(Validator):
     """Validate capacity reservation can be used with the instance type and subnet."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, capacity_reservation_id: str, instance_type: str, subnet: str):
         if capacity_reservation_id:
             if not instance_type:  # If the instance type doesn't exist, this is an invalid config
@@ -456,6 +470,8 @@ class CapacityReservationResourceGroupValidator(Validator):
 class PlacementGroupCapacityReservationValidator(Validator):
     """Validate the placement group is compatible with the capacity reservation target."""
 
+    aws_services = ("ec2",)
+
     def _validate_chosen_pg(self, subnet, instance_types, odcr_list, chosen_pg):
         pg_match, open_or_targeted = False, False
         for instance_type in instance_types:
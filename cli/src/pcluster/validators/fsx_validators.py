@@ -203,6 +203,8 @@ class FsxStorageCapacityValidator(Validator):
 class FsxBackupIdValidator(Validator):
     """Backup id validator."""
 
+    aws_services = ("fsx",)
+
     def _validate(self, backup_id):
         if backup_id:
             try:
@@ -217,6 +219,8 @@ class FsxBackupIdValidator(Validator):
 class FsxAutoImportValidator(Validator):
     """Auto import validator."""
 
+    aws_services = ("s3",)
+
     def _validate(self, auto_import_policy, import_path):
         if auto_import_policy is not None:
             bucket = get_bucket_name_from_s3_url(import_path)
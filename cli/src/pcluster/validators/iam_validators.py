@@ -25,6 +25,8 @@ class RoleValidator(Validator):
     Verify the given role exists.
     """
 
+    aws_services = ("iam",)
+
     def _validate(self, role_arn: str):
         try:
             AWSApi.instance().iam.get_role(get_resource_name_from_resource_arn(role_arn))
@@ -39,6 +41,8 @@ class InstanceProfileValidator(Validator):
     Verify the given instance profile exists.
     """
 
+    aws_services = ("iam",)
+
     def _validate(self, instance_profile_arn: str):
         try:
             AWSApi.instance().iam.get_instance_profile(get_resource_name_from_resource_arn(instance_profile_arn))
@@ -17,6 +17,8 @@ from pcluster.validators.common import FailureLevel, Validator
 class AMIVolumeSizeValidator(Validator):
     """AMI root volume size validator."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, volume_size: int, image: str):
         """Validate the volume size is larger than base ami volume size."""
         ami_id = imagebuilder_utils.get_ami_id(image)
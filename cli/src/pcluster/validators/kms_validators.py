@@ -17,6 +17,8 @@ from pcluster.validators.common import FailureLevel, Validator
 class KmsKeyValidator(Validator):
     """Kms key validator."""
 
+    aws_services = ("kms",)
+
     def _validate(self, kms_key_id: str):
         try:
             AWSApi.instance().kms.describe_key(kms_key_id=kms_key_id)
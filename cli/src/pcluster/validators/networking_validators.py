@@ -19,6 +19,8 @@ from pcluster.validators.common import FailureLevel, Validator
 class SecurityGroupsValidator(Validator):
     """Security groups validator."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, security_group_ids: List[str]):
         if security_group_ids:
             for sg_id in security_group_ids:
@@ -37,6 +39,8 @@ class SubnetsValidator(Validator):
     instances.
     """
 
+    aws_services = ("ec2",)
+
     def _validate(self, subnet_ids: List[str]):
         try:
             subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids=subnet_ids)
@@ -113,6 +117,8 @@ class QueueSubnetsValidator(Validator):
 class ElasticIpValidator(Validator):
     """Elastic Ip validator."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, elastic_ip: Union[str, bool]):
         if isinstance(elastic_ip, str):
             try:
@@ -155,6 +161,8 @@ class MultiAzPlacementGroupValidator(Validator):
 class LambdaFunctionsVpcConfigValidator(Validator):
     """Validator of Pcluster Lambda functions' VPC configuration."""
 
+    aws_services = ("ec2",)
+
     def _validate(self, security_group_ids: List[str], subnet_ids: List[str]):
         existing_security_groups = AWSApi.instance().ec2.describe_security_groups(security_group_ids)
         existing_subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids)
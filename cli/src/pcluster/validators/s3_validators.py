@@ -107,6 +107,8 @@ class UrlValidator(AsyncValidator):
 class S3BucketUriValidator(Validator):
     """S3 Bucket Url Validator."""
 
+    aws_services = ("s3",)
+
     def _validate(self, url):
         if get_url_scheme(url) == "s3":
             try:
@@ -128,6 +130,8 @@ class S3BucketUriValidator(Validator):
 class S3BucketValidator(Validator):
     """S3 Bucket Validator."""
 
+    aws_services = ("s3",)
+
     def _validate(self, bucket):
         try:
             AWSApi.instance().s3.head_bucket(bucket_name=bucket)
@@ -148,6 +152,8 @@ class S3BucketValidator(Validator):
 class S3BucketRegionValidator(Validator):
     """Validate S3 bucket is in the same region with the cloudformation stack."""
 
+    aws_services = ("s3",)
+
     def _validate(self, bucket, region):
         try:
             bucket_region = AWSApi.instance().s3.get_bucket_region(bucket)
@@ -31,12 +31,18 @@ def clear_env(mocker):
     mocker.patch("botocore.session.Session.get_scoped_config", return_value={})
 
 
+@pytest.fixture(autouse=True)
+def isolate_cache_dir(tmp_path_factory, monkeypatch):
+    """Store the on-disk caches in a temporary directory, to never read or write the ones of the user."""
+    monkeypatch.setenv("PCLUSTER_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture(autouse=True)
 def reset_aws_api():
-    """Reset AWSApi singleton to remove dependencies between tests."""
+    """Reset AWSApi instances to remove dependencies between tests."""
     from pcluster.aws.aws_api import AWSApi
 
-    AWSApi._instance = None
+    AWSApi.reset()
 
 
 @pytest.fixture
@@ -94,6 +100,8 @@ def boto3_stubber(mocker, boto3_stubber_path):
     # use **kwargs to skip parameters passed to the boto3.client other than the "service"
     # e.g. boto3.client("ec2", region_name=region, ...) --> x = ec2
     mocked_client_factory.client.side_effect = lambda x, **kwargs: mocked_clients[x]
+    # AWSApi creates its clients from its own session
+    mocked_client_factory.session.Session.return_value.client.side_effect = lambda x, **kwargs: mocked_clients[x]
 
     def _boto3_stubber(service, mocked_requests):
         if "AWS_DEFAULT_REGION" not in os.environ:
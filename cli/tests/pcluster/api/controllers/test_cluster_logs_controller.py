@@ -451,3 +451,127 @@ class TestListClusterLogStreams:
         out = response.get_json()
         assert_that(out).contains("message")
         assert_that(out["message"]).matches(expected_response)
+
+
+class TestSearchClusterLogs:
+    method = "GET"
+
+    @staticmethod
+    def url(cluster_name: str):
+        return f"/v3/clusters/{cluster_name}/logevents"
+
+    def _send_test_request(
+        self,
+        client,
+        cluster_name: str,
+        pattern: str = "ERROR",
+        filters: List[str] = None,
+        start_time: str = None,
+        end_time: str = None,
+        next_token: str = None,
+    ):
+        query_string = [("region", "us-east-1")]
+        if pattern:
+            query_string.append(("pattern", pattern))
+        if filters:
+            query_string.extend([("filters", filter_) for filter_ in filters])
+        if start_time:
+            query_string.append(("startTime", start_time))
+        if end_time:
+            query_string.append(("endTime", end_time))
+        if next_token:
+            query_string.append(("nextToken", next_token))
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        return client.open(self.url(cluster_name), method=self.method, headers=headers, query_string=query_string)
+
+    @pytest.mark.parametrize(
+        "filters, expected_prefix",
+        [(None, None), (["Name=private-dns-name,Values=ip-10-0-0-101"], "ip-10-0-0-101")],
+    )
+    def test_successful_search_cluster_logs_request(self, client, mocker, mock_cluster_stack, filters, expected_prefix):
+        mock_cluster_stack()
+
+        def _search_log_events(start_time, end_time, **kwargs):
+            # Every partition returns its matches in reverse order, with the first one duplicated
+            events = [
+                {"eventId": str(start_time), "timestamp": start_time, "message": "ERROR", "logStreamName": "stream"},
+                {"eventId": str(end_time), "timestamp": end_time, "message": "ERROR", "logStreamName": "stream"},
+            ]
+            return {"events": events[::-1] + events[:1]}
+
+        search_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.search_log_events", side_effect=_search_log_events
+        )
+
+        response = self._send_test_request(
+            client, "cluster", filters=filters, start_time="2021-01-01T00:00:00Z", end_time="2021-01-01T00:02:00Z"
+        )
+
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.get_json()).is_equal_to(
+            {
+                "events": [
+                    {"timestamp": timestamp, "message": "ERROR", "logStreamName": "stream"}
+                    for timestamp in [
+                        "2021-01-01T00:00:00.000Z",
+                        "2021-01-01T00:00:59.999Z",
+                        "2021-01-01T00:01:00.000Z",
+                        "2021-01-01T00:01:59.999Z",
+                    ]
+                ]
+            }
+        )
+        assert_that(search_log_events_mock.call_count).is_equal_to(2)
+        search_log_events_mock.assert_any_call(
+            log_group_name="log_group",
+            filter_pattern="ERROR",
+            start_time=1609459200000,
+            end_time=1609459259999,
+            log_stream_name_prefix=expected_prefix,
+            next_token=None,
+            limit=1000,
+        )
+
+    @pytest.mark.parametrize(
+        "pattern, start_time, end_time, next_token, expected_response",
+        [
+            (None, None, None, None, r"Missing query parameter 'pattern'"),
+            ("ERROR", "invalid", None, None, r".*start_time filter must be in the ISO 8601.*"),
+            ("ERROR", "2021-01-01", "2021-01-01", None, r"start_time filter must be earlier than end_time filter."),
+            ("ERROR", "2021-01-01", None, "invalid", r"The provided next token is not valid."),
+        ],
+        ids=["missing_pattern", "invalid_start_date", "start_equal_end", "invalid_next_token"],
+    )
+    def test_invalid_request(
+        self, client, mock_cluster_stack, pattern, start_time, end_time, next_token, expected_response
+    ):
+        mock_cluster_stack()
+        response = self._send_test_request(
+            client, "cluster", pattern, start_time=start_time, end_time=end_time, next_token=next_token
+        )
+        self._assert_invalid_response(response, expected_response)
+
+    @pytest.mark.parametrize(
+        "cluster_found, cluster_valid, logging_enabled, expected_response",
+        [
+            (False, True, True, r"does not exist"),
+            (True, False, True, r"belongs to an incompatible"),
+            (True, True, False, r"CloudWatch logging is not enabled"),
+        ],
+    )
+    def test_invalid_logging(
+        self, client, mock_cluster_stack, cluster_found, cluster_valid, logging_enabled, expected_response
+    ):
+        mock_cluster_stack(cluster_found=cluster_found, cluster_valid=cluster_valid, logging_enabled=logging_enabled)
+        response = self._send_test_request(client, "cluster")
+        self._assert_invalid_response(response, expected_response, 400 if cluster_found else 404)
+
+    @staticmethod
+    def _assert_invalid_response(response, expected_response, response_code=400):
+        assert_that(response.status_code).is_equal_to(response_code)
+        out = response.get_json()
+        assert_that(out).contains("message")
+        assert_that(out["message"]).matches(expected_response)
@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import threading
 from datetime import datetime
 
 import pytest
@@ -1100,6 +1101,43 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_sub_query_timeout(self, client, mocker):
+        """Verify that the lookups not completing in time are reported with degraded values."""
+        mocker.patch("pcluster.api.controllers.cluster_operations_controller.DESCRIBE_CLUSTER_SUB_QUERY_TIMEOUT", 0.5)
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value=cfn_describe_stack_mock_response({"StackStatus": "ROLLBACK_COMPLETE"}),
+        )
+        release = threading.Event()
+
+        def _slow_lookup(*_, **__):
+            release.wait(5)
+            return ComputeFleetStatus.RUNNING
+
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = _slow_lookup
+        mocker.patch("pcluster.models.cluster_resources.get_all_stack_events", side_effect=_slow_lookup)
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=_slow_lookup)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+
+        try:
+            response = self._send_test_request(client)
+        finally:
+            release.set()
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_content = response.get_json()
+            assert_that(response_content).does_not_contain_key("headNode")
+            assert_that(response_content["computeFleetStatus"]).is_equal_to("UNKNOWN")
+            assert_that(response_content["clusterConfiguration"]).is_equal_to({"url": "presigned-url"})
+            assert_that(response_content["failures"]).is_equal_to(
+                [{"failureCode": "ClusterCreationFailure", "failureReason": "Failed to create the cluster."}]
+            )
+
     @pytest.mark.parametrize(
         "error_type, error_code, http_code",
         [
@@ -1123,6 +1161,148 @@ class TestDescribeCluster:
             assert_that(response.get_json()).is_equal_to(expected_response)
 
 
+class TestDescribeClusters:
+    url = "/v3/clusterdescriptions"
+    method = "GET"
+
+    def _send_test_request(self, client, cluster_names, region="us-east-1"):
+        query_string = [("region", region)] + [("clusterNames", cluster_name) for cluster_name in cluster_names]
+        headers = {"Accept": "application/json"}
+        return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
+
+    @staticmethod
+    def _stack(cluster_name, status="CREATE_COMPLETE", version=None):
+        return cfn_describe_stack_mock_response(
+            {
+                "StackId": f"arn:aws:cloudformation:us-east-1:123:stack/{cluster_name}/123",
+                "StackName": cluster_name,
+                "StackStatus": status,
+                "Tags": [{"Key": "parallelcluster:version", "Value": version or get_installed_version()}],
+            }
+        )
+
+    def test_successful_request(self, mocker, client):
+        describe_root_stacks_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_root_stacks",
+            return_value={
+                "cluster1": self._stack("cluster1"),
+                "cluster2": self._stack("cluster2", status="ROLLBACK_COMPLETE"),
+                "old-cluster": self._stack("old-cluster", version="2.11.0"),
+            },
+        )
+        head_node = {
+            "InstanceId": "i-123",
+            "InstanceType": "t2.micro",
+            "LaunchTime": datetime(2021, 5, 10, 13, 55, 48),
+            "PrivateIpAddress": "192.168.61.109",
+            "State": {"Code": 16, "Name": "running"},
+            "Tags": [{"Key": "parallelcluster:cluster-name", "Value": "cluster1"}],
+        }
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([head_node], None)
+        )
+        fleet_statuses_mock = mocker.patch(
+            "pcluster.models.cluster.ComputeFleetStatusManager.get_statuses", return_value=[ComputeFleetStatus.RUNNING]
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+        mocker.patch("pcluster.models.cluster_resources.get_all_stack_events", return_value=[])
+
+        response = self._send_test_request(client, ["cluster1", "cluster2", "missing", "old-cluster"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_content = response.get_json()
+            assert_that([cluster["clusterName"] for cluster in response_content["clusters"]]).is_equal_to(
+                ["cluster1", "cluster2"]
+            )
+            cluster1, cluster2 = response_content["clusters"]
+            assert_that(cluster1["computeFleetStatus"]).is_equal_to("RUNNING")
+            assert_that(cluster1["headNode"]["instanceId"]).is_equal_to("i-123")
+            assert_that(cluster1["clusterConfiguration"]).is_equal_to({"url": "presigned-url"})
+            assert_that(cluster2["clusterStatus"]).is_equal_to("CREATE_FAILED")
+            assert_that(cluster2["computeFleetStatus"]).is_equal_to("UNKNOWN")
+            assert_that(cluster2["failures"]).is_equal_to(
+                [{"failureCode": "ClusterCreationFailure", "failureReason": "Failed to create the cluster."}]
+            )
+            assert_that(cluster2).does_not_contain_key("headNode")
+            assert_that(response_content["errors"]).is_equal_to(
+                [
+                    {
+                        "clusterName": "missing",
+                        "message": "Cluster 'missing' does not exist or belongs to an incompatible ParallelCluster "
+                        "major version.",
+                    },
+                    {
+                        "clusterName": "old-cluster",
+                        "message": "Bad Request: Cluster 'old-cluster' belongs to an incompatible ParallelCluster "
+                        "major version.",
+                    },
+                ]
+            )
+        # The stacks, the head nodes and the compute fleet statuses are retrieved once for all the clusters
+        describe_root_stacks_mock.assert_called_once_with(["cluster1", "cluster2", "missing", "old-cluster"])
+        describe_instances_mock.assert_called_once()
+        assert_that(describe_instances_mock.call_args.args[0][0]["Values"]).is_equal_to(["cluster1", "cluster2"])
+        fleet_statuses_mock.assert_called_once()
+
+    def test_batched_lookups_failure(self, mocker, client):
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_root_stacks",
+            return_value={"cluster1": self._stack("cluster1"), "cluster2": self._stack("cluster2")},
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=AWSClientError("describe_instances", "error message"),
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.get_compute_fleet_statuses",
+            side_effect=AWSClientError("get_compute_environment_state", "error message"),
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+        mocker.patch("pcluster.models.cluster_resources.get_all_stack_events", return_value=[])
+
+        response = self._send_test_request(client, ["cluster1", "cluster2"])
+
+        # The clusters are described without head node and compute fleet status
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_content = response.get_json()
+            assert_that(response_content["clusters"]).is_length(2)
+            for cluster in response_content["clusters"]:
+                assert_that(cluster).does_not_contain_key("headNode")
+                assert_that(cluster["computeFleetStatus"]).is_equal_to("UNKNOWN")
+            assert_that(response_content["errors"]).is_empty()
+
+    @pytest.mark.parametrize(
+        "cluster_names, expected_response",
+        [
+            ([], {"message": "Bad Request: Missing query parameter 'clusterNames'"}),
+            (["aaaaa.aaa"], {"message": "Bad Request: 'aaaaa.aaa' does not match '^[a-zA-Z][a-zA-Z0-9-]+$'"}),
+        ],
+        ids=["missing_cluster_names", "invalid_cluster_name"],
+    )
+    def test_malformed_request(self, client, cluster_names, expected_response):
+        response = self._send_test_request(client, cluster_names)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+    def test_error_conversion(self, client, mocker):
+        error = LimitExceededError("describe_root_stacks", "error message", "Throttling")
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_root_stacks", side_effect=error)
+
+        response = self._send_test_request(client, ["cluster"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(429)
+            assert_that(response.get_json()).is_equal_to({"message": "error message"})
+
+
 class TestListClusters:
     url = "/v3/clusters"
     method = "GET"
@@ -1296,13 +1476,21 @@ class TestListClusters:
     def test_successful_request(
         self, mocker, client, region, next_token, cluster_status, existing_stacks, expected_response
     ):
-        mocker.patch("pcluster.aws.cfn.CfnClient.list_pcluster_stacks", return_value=(existing_stacks, next_token))
+        list_stacks_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks", return_value=(existing_stacks, next_token)
+        )
 
         response = self._send_test_request(client, region, next_token, cluster_status)
 
         with soft_assertions():
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
+        stack_statuses = list_stacks_mock.call_args.kwargs["stack_statuses"]
+        if cluster_status:
+            assert_that(stack_statuses).contains(*cluster_status)
+            assert_that(stack_statuses).does_not_contain("CREATE_COMPLETE", "DELETE_COMPLETE")
+        else:
+            assert_that(stack_statuses).is_none()
 
     @pytest.mark.parametrize(
         "region, next_token, cluster_status, expected_response",
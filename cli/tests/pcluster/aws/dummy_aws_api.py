@@ -171,6 +171,15 @@ class _DummyEc2Client(Ec2Client):
             "Throughput": 123,
         }
 
+    def get_instance_types_info(self, instance_types):
+        return {instance_type: self.get_instance_type_info(instance_type) for instance_type in instance_types}
+
+    def describe_images_by_ids(self, ami_ids):
+        return [self.describe_image(ami_id) for ami_id in ami_ids]
+
+    def describe_volumes(self, volume_ids):
+        return [self.describe_volume(volume_id) for volume_id in volume_ids]
+
     def get_subnet_vpc(self, subnet_id):
         return "vpc-123"
 
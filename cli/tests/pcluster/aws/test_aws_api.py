@@ -17,6 +17,8 @@ from datetime import datetime
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws import aws_api
+from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
@@ -92,7 +94,10 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
     ]
     client = boto3_stubber("cloudformation", mocked_requests)
     describe_stack_resources(client)
-    sleep_mock.assert_called_with(5)
+    # Exponential backoff with jitter, capped to 5 seconds
+    assert_that(sleep_mock.call_count).is_equal_to(2)
+    for call in sleep_mock.call_args_list:
+        assert_that(call.args[0]).is_between(0, 5)
 
 
 FAKE_SSM_PARAMETER = "fake-ssm-parameter-name"
@@ -122,3 +127,53 @@ def test_ssm_get_parameter(mocker, response):
     mock_aws_api(mocker)
     mocker.patch("pcluster.aws.ssm.SsmClient.get_parameter", side_effect=response)
     assert_that(_DummyAWSApi().instance().ssm.get_parameter(FAKE_SSM_PARAMETER)).is_equal_to(response)
+
+
+def test_aws_api_instances_pool(set_env, mocker):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    set_env("AWS_ACCESS_KEY_ID", "key-1")
+    mocker.patch("pcluster.aws.aws_api.MAX_POOLED_INSTANCES", 2)
+    boto3_mock = mocker.patch("pcluster.aws.common.boto3")
+    boto3_mock.session.Session.side_effect = lambda: mocker.MagicMock()
+
+    us_east_1 = AWSApi.instance()
+    assert_that(AWSApi.instance()).is_same_as(us_east_1)
+    assert_that(us_east_1.cfn).is_same_as(us_east_1.cfn)
+    assert_that(us_east_1.ec2).is_not_none()
+    # All the clients of an instance are created from its own session, never from the default one
+    boto3_mock.session.Session.assert_called_once()
+    boto3_mock.client.assert_not_called()
+    us_east_1_session = us_east_1._session
+    assert_that(us_east_1_session.client.call_count).is_equal_to(2)
+    assert_that(us_east_1_session.client.call_args.kwargs["region_name"]).is_equal_to("us-east-1")
+
+    # Switching region does not rebuild the instances of the other regions
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    eu_west_1 = AWSApi.instance()
+    assert_that(eu_west_1).is_not_same_as(us_east_1)
+    assert_that(eu_west_1.aws_region).is_equal_to("eu-west-1")
+    assert_that(eu_west_1.cfn).is_not_same_as(us_east_1.cfn)
+    assert_that(eu_west_1._session).is_not_same_as(us_east_1_session)
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    assert_that(AWSApi.instance()).is_same_as(us_east_1)
+
+    # Different credentials get a different instance, the least recently used instance is discarded
+    set_env("AWS_ACCESS_KEY_ID", "key-2")
+    assert_that(AWSApi.instance()).is_not_same_as(us_east_1)
+    assert_that(AWSApi.instances()).is_length(aws_api.MAX_POOLED_INSTANCES)
+    assert_that(AWSApi.instances()).does_not_contain(eu_west_1)
+
+    AWSApi.reset()
+    assert_that(AWSApi.instances()).is_empty()
+
+
+def test_aws_api_clear_caches(mocker):
+    mocker.patch("pcluster.aws.common.boto3")
+    api = AWSApi(region="us-east-1")
+    api.ec2.subnets_cache["subnet-1"] = {"SubnetId": "subnet-1"}
+    api.ec2.additional_instance_types_data["t2.micro"] = {"InstanceType": "t2.micro"}
+    api.fsx.volume_cache["fsvol-1"] = {"VolumeId": "fsvol-1"}
+    api.clear_caches()
+    assert_that(api.ec2.subnets_cache).is_empty()
+    assert_that(api.ec2.additional_instance_types_data).is_empty()
+    assert_that(api.fsx.volume_cache).is_empty()
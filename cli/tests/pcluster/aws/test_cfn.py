@@ -9,10 +9,11 @@ from datetime import datetime
 
 import pytest
 from assertpy import assert_that
+from botocore.exceptions import ClientError
 
 from pcluster import utils as utils
-from pcluster.aws.cfn import CfnClient
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.cfn import STACK_STATUSES_WITHOUT_DELETED, CfnClient
+from pcluster.aws.common import AWSClientError, Cache
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
 
@@ -23,80 +24,129 @@ def boto3_stubber_path():
 
 
 class TestCfnClient:
-    @pytest.mark.parametrize(
-        "next_token, describe_stacks_response, expected_stacks",
-        [
-            (None, {"Stacks": []}, set()),
-            (
-                None,
-                {
-                    "Stacks": [
-                        {
-                            "StackName": "name1",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
-                        },
-                        {"StackName": "name2", "CreationTime": datetime.now(), "StackStatus": "CREATE_IN_PROGRESS"},
-                        {
-                            "StackName": "name3",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
-                            "ParentId": "id",
-                        },
-                    ],
-                },
-                {"name1"},
-            ),
-            (
-                "token",
-                {
-                    "Stacks": [
-                        {
-                            "StackName": "name1",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
-                        },
-                        {
-                            "StackName": "name2",
-                            "CreationTime": datetime.now(),
-                            "StackStatus": "CREATE_IN_PROGRESS",
-                            "Tags": [{"Key": "parallelcluster:version", "Value": "2.0.0"}],
-                        },
-                    ],
-                    "NextToken": "token",
-                },
-                {"name1", "name2"},
-            ),
-            ("invalid", Exception(), set()),
-        ],
-    )
-    def test_list_pcluster_stacks(self, set_env, boto3_stubber, next_token, describe_stacks_response, expected_stacks):
+    @staticmethod
+    def _stack_summary(stack_id, status="CREATE_COMPLETE", parent_id=None, last_updated_time=None):
+        summary = {
+            "StackId": stack_id,
+            "StackName": stack_id,
+            "CreationTime": datetime(2022, 1, 1),
+            "StackStatus": status,
+        }
+        if parent_id:
+            summary["ParentId"] = parent_id
+        if last_updated_time:
+            summary["LastUpdatedTime"] = last_updated_time
+        return summary
+
+    @staticmethod
+    def _mock_cfn_client(mocker, stack_summaries, stacks, next_token=None):
+        client = mocker.MagicMock()
+        client.list_stacks.return_value = {"StackSummaries": stack_summaries, "NextToken": next_token}
+
+        def _describe_stacks(StackName):  # noqa: N803
+            if StackName not in stacks:
+                raise ClientError({"Error": {"Code": "ValidationError", "Message": "does not exist"}}, "DescribeStacks")
+            return {"Stacks": [stacks[StackName]]}
+
+        client.describe_stacks.side_effect = _describe_stacks
+        cfn_client = CfnClient()
+        cfn_client._client = client
+        return cfn_client, client
+
+    @pytest.mark.parametrize("next_token, stack_statuses", [(None, None), ("token", ["CREATE_COMPLETE"])])
+    def test_list_pcluster_stacks(self, set_env, mocker, next_token, stack_statuses):
         set_env("AWS_DEFAULT_REGION", "us-east-1")
+        Cache.clear_all()
+        version_tag = {"Key": "parallelcluster:version", "Value": "3.0.0"}
+        image_tag = {"Key": "parallelcluster:image_id", "Value": "image"}
+        stack_summaries = [
+            self._stack_summary("cluster1"),
+            self._stack_summary("cluster2", status="UPDATE_COMPLETE", last_updated_time=datetime(2022, 1, 2)),
+            self._stack_summary("cluster1-nested", parent_id="cluster1"),
+            self._stack_summary("image"),
+            self._stack_summary("other"),
+            self._stack_summary("deleted"),
+        ]
+        stacks = {
+            "cluster1": {"StackName": "cluster1", "Tags": [version_tag]},
+            "cluster2": {"StackName": "cluster2", "Tags": [version_tag]},
+            "image": {"StackName": "image", "Tags": [version_tag, image_tag]},
+            "other": {"StackName": "other", "Tags": []},
+        }
+        cfn_client, client = self._mock_cfn_client(mocker, stack_summaries, stacks, next_token="next")
 
-        expected_describe_stacks_params = {} if not next_token else {"NextToken": next_token}
-        generate_error = isinstance(describe_stacks_response, Exception)
+        clusters, returned_token = cfn_client.list_pcluster_stacks(next_token=next_token, stack_statuses=stack_statuses)
+
+        assert_that(returned_token).is_equal_to("next")
+        assert_that([stack["StackName"] for stack in clusters]).is_equal_to(["cluster1", "cluster2"])
+        expected_params = {"StackStatusFilter": stack_statuses or STACK_STATUSES_WITHOUT_DELETED}
+        if next_token:
+            expected_params["NextToken"] = next_token
+        client.list_stacks.assert_called_once_with(**expected_params)
+        # Nested stacks are never described
+        assert_that({call.kwargs["StackName"] for call in client.describe_stacks.call_args_list}).is_equal_to(
+            {"cluster1", "cluster2", "image", "other", "deleted"}
+        )
+
+    def test_list_pcluster_stacks_index_cache(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        Cache.clear_all()
+        stacks = {"cluster": {"StackName": "cluster", "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}]}}
+        cfn_client, client = self._mock_cfn_client(mocker, [self._stack_summary("cluster")], stacks)
+
+        cfn_client.list_pcluster_stacks()
+        cfn_client.list_pcluster_stacks()
+        assert_that(client.describe_stacks.call_count).is_equal_to(1)
+
+        # A stack whose status changed is described again
+        client.list_stacks.return_value = {"StackSummaries": [self._stack_summary("cluster", status="UPDATE_COMPLETE")]}
+        clusters, _ = cfn_client.list_pcluster_stacks()
+        assert_that(client.describe_stacks.call_count).is_equal_to(2)
+        assert_that(clusters).is_length(1)
+
+    def test_list_pcluster_stacks_error(self, set_env, boto3_stubber):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
         mocked_requests = [
             MockedBoto3Request(
-                method="describe_stacks",
-                response=describe_stacks_response if not generate_error else "error",
-                expected_params=expected_describe_stacks_params,
-                generate_error=generate_error,
-                error_code="error" if generate_error else None,
+                method="list_stacks",
+                response="error",
+                expected_params={"StackStatusFilter": STACK_STATUSES_WITHOUT_DELETED},
+                generate_error=True,
+                error_code="error",
             )
         ]
         boto3_stubber("cloudformation", mocked_requests)
 
-        if not generate_error:
-            stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
-            assert_that(next_token).is_equal_to(describe_stacks_response.get("NextToken"))
-            assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
-        else:
-            with pytest.raises(AWSClientError) as e:
-                CfnClient().list_pcluster_stacks(next_token=next_token)
-            assert_that(e.value.error_code).is_equal_to("error")
+        with pytest.raises(AWSClientError) as e:
+            CfnClient().list_pcluster_stacks()
+        assert_that(e.value.error_code).is_equal_to("error")
+
+    def test_describe_root_stacks(self, set_env, boto3_stubber):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        def _stack(name, parent_id=None):
+            stack = {"StackName": name, "CreationTime": datetime(2022, 1, 1), "StackStatus": "CREATE_COMPLETE"}
+            if parent_id:
+                stack["ParentId"] = parent_id
+            return stack
+
+        mocked_requests = [
+            MockedBoto3Request(
+                method="describe_stacks",
+                response={"Stacks": [_stack("other"), _stack("cluster1"), _stack("cluster2", "id")], "NextToken": "t"},
+                expected_params={},
+            ),
+            # The listing stops once all the stacks are found
+            MockedBoto3Request(
+                method="describe_stacks",
+                response={"Stacks": [_stack("cluster2"), _stack("cluster3")], "NextToken": "t2"},
+                expected_params={"NextToken": "t"},
+            ),
+        ]
+        boto3_stubber("cloudformation", mocked_requests)
+
+        stacks = CfnClient().describe_root_stacks(["cluster1", "cluster2"])
+        assert_that(stacks).is_equal_to({"cluster1": _stack("cluster1"), "cluster2": _stack("cluster2")})
 
     def test_get_stack_events_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -117,7 +167,7 @@ class TestCfnClient:
         ]
         boto3_stubber("cloudformation", mocked_requests)
         assert_that(CfnClient().get_stack_events(FAKE_NAME)["StackEvents"]).is_equal_to(expected_events)
-        sleep_mock.assert_called_with(5)
+        assert_that(sleep_mock.call_args.args[0]).is_between(0, 5)
 
     def test_get_stack_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -139,7 +189,7 @@ class TestCfnClient:
         boto3_stubber("cloudformation", mocked_requests)
         stack = CfnClient().describe_stack(FAKE_NAME)
         assert_that(stack).is_equal_to(expected_stack)
-        sleep_mock.assert_called_with(5)
+        assert_that(sleep_mock.call_args.args[0]).is_between(0, 5)
 
     def test_verify_stack_status_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -240,5 +290,5 @@ class TestCfnClient:
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
-                CfnClient().list_pcluster_stacks(next_token=next_token)
+                CfnClient().get_imagebuilder_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
@@ -0,0 +1,155 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import Cache
+
+
+@pytest.fixture()
+def monotonic(mocker):
+    clock = mocker.patch("pcluster.aws.common.time.monotonic")
+    clock.return_value = 1000.0
+    return clock
+
+
+def _counting_function(**cached_kwargs):
+    calls = []
+
+    @Cache.cached(**cached_kwargs)
+    def _function(*args, **kwargs):
+        calls.append((args, kwargs))
+        return len(calls)
+
+    return _function, calls
+
+
+def test_cached_without_arguments():
+    calls = []
+
+    @Cache.cached
+    def _function(value):
+        calls.append(value)
+        return value * 2
+
+    assert_that(_function(2)).is_equal_to(4)
+    assert_that(_function(2)).is_equal_to(4)
+    assert_that(calls).is_equal_to([2])
+    assert_that(_function.cache.stats.to_dict()).contains_entry({"hits": 1}, {"misses": 1}, {"size": 1})
+
+
+@pytest.mark.parametrize(
+    "first_args, second_args",
+    [
+        (([1, 2],), ((1, 2),)),
+        (({"a": 1},), ((("a", 1),),)),
+        ((1, 2), (2, 1)),
+        (((1, 2), 3), ((1, 3), 2)),
+        (({"a": [1]},), ({"a": (1,)},)),
+        ((1,), (1.0,)),
+        ((1,), (True,)),
+        ((1.0,), (True,)),
+        (({"a": 1},), ({"a": True},)),
+        (({1: "a"},), ({True: "a"},)),
+    ],
+)
+def test_make_key_does_not_collide(first_args, second_args):
+    function, calls = _counting_function()
+    function(*first_args)
+    function(*second_args)
+    assert_that(calls).is_length(2)
+
+
+def test_cached_key_binds_arguments():
+    calls = []
+
+    @Cache.cached
+    def _function(first, second="default"):
+        calls.append((first, second))
+        return len(calls)
+
+    assert_that(_function("a")).is_equal_to(1)
+    assert_that(_function(first="a")).is_equal_to(1)
+    assert_that(_function("a", "default")).is_equal_to(1)
+    assert_that(_function(second="default", first="a")).is_equal_to(1)
+    assert_that(_function("a", second="other")).is_equal_to(2)
+    assert_that(calls).is_length(2)
+
+    # Seeded results are found regardless of how the arguments are passed
+    _function.seed(10, first="b")
+    assert_that(_function.is_cached("b")).is_true()
+    assert_that(_function("b", "default")).is_equal_to(10)
+    assert_that(calls).is_length(2)
+
+
+def test_cached_ttl(monotonic):
+    function, calls = _counting_function(ttl=10)
+    assert_that(function("key")).is_equal_to(1)
+    monotonic.return_value += 9
+    assert_that(function("key")).is_equal_to(1)
+    monotonic.return_value += 1
+    assert_that(function("key")).is_equal_to(2)
+    assert_that(function.cache.stats.to_dict()).contains_entry({"hits": 1}, {"misses": 2}, {"expirations": 1})
+
+
+def test_cached_lru_eviction():
+    function, calls = _counting_function(maxsize=2)
+    function("a")
+    function("b")
+    function("a")  # "b" becomes the least recently used entry
+    function("c")
+    assert_that(function.cache.stats.evictions).is_equal_to(1)
+    assert_that(len(function.cache)).is_equal_to(2)
+
+    function("a")
+    assert_that(calls).is_length(3)
+    function("b")
+    assert_that(calls).is_length(4)
+    assert_that(function.cache.entry_hits()).contains_key((tuple, ((tuple, ((str, "a"),)), (dict, ()))))
+
+
+def test_cached_releases_key_mutexes():
+    function, _ = _counting_function()
+    for value in range(10):
+        function(value)
+    assert_that(function.cache._mutexes).is_empty()
+
+
+def test_cache_disabled(mocker):
+    mocker.patch.dict(os.environ, {"PCLUSTER_CACHE_DISABLED": "true"})
+    function, calls = _counting_function()
+    function("key")
+    function("key")
+    assert_that(calls).is_length(2)
+    assert_that(function.cache).is_length(0)
+
+
+def test_clear_all():
+    function, calls = _counting_function()
+    function("key")
+    Cache.clear_all()
+    function("key")
+    assert_that(calls).is_length(2)
+    assert_that([stats["name"] for stats in Cache.stats()]).contains(function.__qualname__)
+
+
+def test_clear_without_ttl():
+    function, calls = _counting_function()
+    function_with_ttl, calls_with_ttl = _counting_function(ttl=60)
+    function("key")
+    function_with_ttl("key")
+    Cache.clear_without_ttl()
+    function("key")
+    function_with_ttl("key")
+    assert_that(calls).is_length(2)
+    assert_that(calls_with_ttl).is_length(1)
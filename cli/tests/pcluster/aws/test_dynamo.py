@@ -10,6 +10,7 @@
 # limitations under the License.
 
 import pytest
+from assertpy import assert_that
 from boto3.dynamodb.conditions import Attr
 
 from pcluster.aws.dynamo import DynamoResource
@@ -66,3 +67,47 @@ class TestDynamoDBResource:
             ExpressionAttributeValues=expression_attribute_values,
             ConditionExpression=condition_expression,
         )
+
+    def test_batch_get_items(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        sleep_mock = mocker.patch("pcluster.aws.dynamo.time.sleep")
+        resource_mock = mocker.patch("boto3.resource").return_value
+        key = {"Id": "COMPUTE_FLEET"}
+        resource_mock.batch_get_item.side_effect = [
+            {
+                "Responses": {"table1": [{"Id": "COMPUTE_FLEET", "Status": "RUNNING"}]},
+                "UnprocessedKeys": {"table2": {"Keys": [key], "ConsistentRead": True}},
+            },
+            {"Responses": {"table2": [{"Id": "COMPUTE_FLEET", "Status": "STOPPED"}]}, "UnprocessedKeys": {}},
+        ]
+
+        items = DynamoResource().batch_get_items([("table1", key), ("table2", key)])
+
+        assert_that(items).is_equal_to(
+            {
+                "table1": [{"Id": "COMPUTE_FLEET", "Status": "RUNNING"}],
+                "table2": [{"Id": "COMPUTE_FLEET", "Status": "STOPPED"}],
+            }
+        )
+        resource_mock.batch_get_item.assert_has_calls(
+            [
+                mocker.call(
+                    RequestItems={
+                        "table1": {"Keys": [key], "ConsistentRead": True},
+                        "table2": {"Keys": [key], "ConsistentRead": True},
+                    }
+                ),
+                mocker.call(RequestItems={"table2": {"Keys": [key], "ConsistentRead": True}}),
+            ]
+        )
+        sleep_mock.assert_called_once()
+
+    def test_batch_get_items_chunks(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        resource_mock = mocker.patch("boto3.resource").return_value
+        resource_mock.batch_get_item.return_value = {"Responses": {}}
+
+        DynamoResource().batch_get_items([(f"table{index}", {"Id": "COMPUTE_FLEET"}) for index in range(150)])
+
+        request_sizes = [len(call.kwargs["RequestItems"]) for call in resource_mock.batch_get_item.call_args_list]
+        assert_that(request_sizes).is_equal_to([100, 50])
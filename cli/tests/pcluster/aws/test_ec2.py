@@ -619,3 +619,84 @@ def test_describe_volume(boto3_stubber):
     response = AWSApi.instance().ec2.describe_volume(volume_id)
 
     assert_that(response["AvailabilityZone"] == az).is_true()
+
+
+def test_describe_volumes_cache(boto3_stubber):
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_volumes",
+            response={
+                "Volumes": [
+                    {"VolumeId": "vol-1", "AvailabilityZone": "az-1"},
+                    {"VolumeId": "vol-2", "AvailabilityZone": "az-2"},
+                ]
+            },
+            expected_params={"VolumeIds": ["vol-1", "vol-2"]},
+        ),
+        get_describe_volumes_mocked_request("vol-3", "az-3"),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    response = AWSApi.instance().ec2.describe_volumes(["vol-1", "vol-2"])
+    assert_that([volume["AvailabilityZone"] for volume in response]).is_equal_to(["az-1", "az-2"])
+
+    # Volumes retrieved by the batched call are not described again
+    assert_that(AWSApi.instance().ec2.describe_volume("vol-2")["AvailabilityZone"]).is_equal_to("az-2")
+    response = AWSApi.instance().ec2.describe_volumes(["vol-1", "vol-3"])
+    assert_that([volume["AvailabilityZone"] for volume in response]).is_equal_to(["az-1", "az-3"])
+
+
+def test_describe_images_by_ids_cache(boto3_stubber):
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_images",
+            response={"Images": [{"ImageId": "ami-1", "Name": "image-1"}, {"ImageId": "ami-2", "Name": "image-2"}]},
+            expected_params={"ImageIds": ["ami-1", "ami-2"]},
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    response = AWSApi.instance().ec2.describe_images_by_ids(["ami-1", "ami-2"])
+    assert_that([image.name for image in response]).is_equal_to(["image-1", "image-2"])
+
+    # Images retrieved by the batched call are not described again, whether passed positionally or by keyword
+    assert_that(AWSApi.instance().ec2.describe_image("ami-2").name).is_equal_to("image-2")
+    assert_that(AWSApi.instance().ec2.describe_image(ami_id="ami-2").name).is_equal_to("image-2")
+    assert_that(AWSApi.instance().ec2.describe_images_by_ids(["ami-1"])[0].name).is_equal_to("image-1")
+
+
+def test_get_instance_types_info_cache(boto3_stubber):
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": [{"InstanceType": "t2.micro"}, {"InstanceType": "c5.xlarge"}]},
+            expected_params={"InstanceTypes": ["t2.micro", "c5.xlarge"]},
+        ),
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": [{"InstanceType": "m5.large"}]},
+            expected_params={"InstanceTypes": ["m5.large"]},
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    response = AWSApi.instance().ec2.get_instance_types_info(["t2.micro", "c5.xlarge"])
+    assert_that(response).contains_only("t2.micro", "c5.xlarge")
+    assert_that(response["c5.xlarge"].instance_type()).is_equal_to("c5.xlarge")
+
+    # Instance types retrieved by the batched call are not described again
+    assert_that(AWSApi.instance().ec2.get_instance_type_info("t2.micro").instance_type()).is_equal_to("t2.micro")
+    response = AWSApi.instance().ec2.get_instance_types_info(["c5.xlarge", "m5.large"])
+    assert_that(response).contains_only("c5.xlarge", "m5.large")
+
+
+def test_get_instance_types_info_chunks(boto3_stubber):
+    instance_types = [f"c5.{size}xlarge" for size in range(150)]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in chunk]},
+            expected_params={"InstanceTypes": chunk},
+        )
+        for chunk in [instance_types[:100], instance_types[100:]]
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    response = AWSApi.instance().ec2.get_instance_types_info(instance_types)
+    assert_that(response).is_length(150)
@@ -0,0 +1,103 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import Cache
+from pcluster.aws.persistent_cache import PersistentCache
+
+
+@pytest.fixture()
+def persistent_cache(mocker, set_env, tmp_path):
+    set_env("PCLUSTER_PERSISTENT_CACHE", "true")
+    set_env("PCLUSTER_CACHE_DIR", str(tmp_path))
+    mocker.patch("pcluster.aws.persistent_cache.PersistentCache.scope", return_value="123456789012/us-east-1")
+    return PersistentCache.instance()
+
+
+def test_get_put(persistent_cache, mocker):
+    time_mock = mocker.patch("pcluster.aws.persistent_cache.time.time", return_value=1000.0)
+    assert_that(persistent_cache.get("scope", "name", "key")).is_equal_to((False, None))
+
+    persistent_cache.put("scope", "name", "key", {"value": [1, 2]}, ttl=10)
+    assert_that(persistent_cache.get("scope", "name", "key")).is_equal_to((True, {"value": [1, 2]}))
+    assert_that(persistent_cache.get("other-scope", "name", "key")).is_equal_to((False, None))
+
+    time_mock.return_value = 1010.0
+    assert_that(persistent_cache.get("scope", "name", "key")).is_equal_to((False, None))
+    assert_that(persistent_cache.purge_expired()).is_equal_to(1)
+
+
+def test_put_not_serializable(persistent_cache):
+    persistent_cache.put("scope", "name", "key", object())
+    assert_that(persistent_cache.get("scope", "name", "key")).is_equal_to((False, None))
+
+
+def test_clear(persistent_cache):
+    persistent_cache.put("123456789012/us-east-1", "name", "key", "value")
+    persistent_cache.put("123456789012/eu-west-1", "name", "key", "value")
+    assert_that(persistent_cache.clear(region="eu-west-1")).is_equal_to(1)
+    assert_that(persistent_cache.get("123456789012/us-east-1", "name", "key")).is_equal_to((True, "value"))
+    assert_that(persistent_cache.clear()).is_equal_to(1)
+
+
+def test_path_is_versioned(persistent_cache, tmp_path, mocker):
+    mocker.patch.object(PersistentCache, "_installed_version", return_value="9.9.9")
+    assert_that(PersistentCache.default_path()).is_equal_to(str(tmp_path / "aws-metadata-v1-9.9.9.sqlite"))
+
+
+def test_scope(mocker, set_env):
+    mocker.patch.dict(PersistentCache._scopes, clear=True)
+    get_account_id_mock = mocker.patch("pcluster.aws.sts.StsClient.get_account_id", return_value="123456789012")
+
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    assert_that(PersistentCache.scope()).is_equal_to("123456789012/us-east-1")
+    assert_that(PersistentCache.scope()).is_equal_to("123456789012/us-east-1")
+    assert_that(get_account_id_mock.call_count).is_equal_to(1)
+
+    # The account is retrieved again when the region or the credentials change
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    assert_that(PersistentCache.scope()).is_equal_to("123456789012/eu-west-1")
+    set_env("AWS_PROFILE", "other-profile")
+    assert_that(PersistentCache.scope()).is_equal_to("123456789012/eu-west-1")
+    assert_that(get_account_id_mock.call_count).is_equal_to(3)
+
+
+def test_scope_does_not_hold_lock(mocker, set_env):
+    mocker.patch.dict(PersistentCache._scopes, clear=True)
+    lock_states = []
+
+    def _get_account_id():
+        lock_states.append(PersistentCache._lock.locked())
+        return "123456789012"
+
+    mocker.patch("pcluster.aws.sts.StsClient.get_account_id", side_effect=_get_account_id)
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    assert_that(PersistentCache.scope()).is_equal_to("123456789012/us-east-1")
+    assert_that(lock_states).is_equal_to([False])
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_cached_persistent(persistent_cache, set_env, enabled):
+    if not enabled:
+        set_env("PCLUSTER_PERSISTENT_CACHE", "")
+    calls = []
+
+    class _Client:
+        @Cache.cached(persistent=True)
+        def describe(self, name):
+            calls.append(name)
+            return {"Name": name}
+
+    # Every client instance has its own in-memory entries, while the persistent ones are shared
+    assert_that(_Client().describe("name")).is_equal_to({"Name": "name"})
+    assert_that(_Client().describe("name")).is_equal_to({"Name": "name"})
+    assert_that(calls).is_length(1 if enabled else 2)
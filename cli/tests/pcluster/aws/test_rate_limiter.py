@@ -0,0 +1,130 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from assertpy import assert_that
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError
+
+from pcluster.aws.common import RETRY_ON_THROTTLING_MAX_ATTEMPTS, AWSExceptionHandler, Boto3Client
+from pcluster.aws.rate_limiter import MIN_REQUEST_RATE, RateLimiter, TokenBucket, backoff_delay
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter(mocker):
+    RateLimiter.reset()
+    mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("botocore.endpoint.time.sleep")
+    yield
+    RateLimiter.reset()
+
+
+def test_token_bucket():
+    bucket = TokenBucket(max_rate=4)
+    assert_that(bucket.rate).is_equal_to(4)
+
+    bucket.on_throttle()
+    assert_that(bucket.rate).is_equal_to(2)
+    for _ in range(10):
+        bucket.on_throttle()
+    assert_that(bucket.rate).is_equal_to(MIN_REQUEST_RATE)
+
+    bucket.on_success()
+    assert_that(bucket.rate).is_greater_than(MIN_REQUEST_RATE)
+    for _ in range(10):
+        bucket.on_success()
+    assert_that(bucket.rate).is_equal_to(4)
+
+
+def test_token_bucket_acquire(mocker):
+    sleep_mock = mocker.patch("pcluster.aws.rate_limiter.time.sleep")
+    bucket = TokenBucket(max_rate=2)
+    assert_that([bucket.acquire() for _ in range(2)]).is_equal_to([0, 0])
+    # Once the burst capacity is consumed, the callers wait for the tokens in order
+    assert_that(bucket.acquire()).is_close_to(0.5, 0.05)
+    assert_that(bucket.acquire()).is_close_to(1, 0.05)
+    assert_that(sleep_mock.call_count).is_equal_to(2)
+
+
+@pytest.mark.parametrize("attempt, max_delay", [(1, 0.5), (2, 1), (4, 4), (10, 20)])
+def test_backoff_delay(attempt, max_delay):
+    for _ in range(20):
+        assert_that(backoff_delay(attempt)).is_between(0, max_delay)
+
+
+def test_rate_limiter_disabled(set_env):
+    set_env("PCLUSTER_AWS_MAX_REQUEST_RATE", "0")
+    assert_that(RateLimiter.bucket("ec2")).is_none()
+
+
+def test_rate_limiter_boto3_client(set_env, mocker):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    set_env("AWS_ACCESS_KEY_ID", "dummy")
+    set_env("AWS_SECRET_ACCESS_KEY", "dummy")
+    throttling_response = (
+        b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code><Message>Rate exceeded</Message></Error>"
+        b"</ErrorResponse>"
+    )
+    success_response = (
+        b"<GetCallerIdentityResponse><GetCallerIdentityResult><Account>123456789012</Account>"
+        b"</GetCallerIdentityResult></GetCallerIdentityResponse>"
+    )
+    responses = [(400, throttling_response), (400, throttling_response), (200, success_response)]
+
+    def send(**kwargs):
+        status_code, body = responses.pop(0)
+        response = AWSResponse(url="https://sts.amazonaws.com", status_code=status_code, headers={}, raw=None)
+        response._content = body
+        return response
+
+    client = Boto3Client("sts")
+    client._client.meta.events.register_last("before-send.sts.*", send)
+    assert_that(client._client.get_caller_identity()["Account"]).is_equal_to("123456789012")
+
+    stats = RateLimiter.stats()["sts"]
+    assert_that(stats).contains_entry({"requests": 3}, {"throttles": 2}, {"retries": 2})
+    assert_that(stats["rate"]).is_less_than(RateLimiter.max_request_rate())
+
+
+def test_retry_on_boto3_throttling():
+    calls = []
+
+    class DummyClient:
+        @AWSExceptionHandler.retry_on_boto3_throttling
+        def describe(self):
+            calls.append(1)
+            if len(calls) < 3:
+                raise ClientError({"Error": {"Code": "RequestLimitExceeded", "Message": "Rate exceeded"}}, "Describe")
+            return "result"
+
+        @AWSExceptionHandler.retry_on_boto3_throttling
+        def fail(self):
+            raise ClientError({"Error": {"Code": "ValidationError", "Message": "Invalid"}}, "Fail")
+
+    assert_that(DummyClient().describe()).is_equal_to("result")
+    assert_that(calls).is_length(3)
+    assert_that(RateLimiter.stats()["unknown"]).contains_entry({"throttles": 2}, {"retries": 2})
+    with pytest.raises(ClientError):
+        DummyClient().fail()
+
+
+def test_retry_on_boto3_throttling_max_attempts(mocker):
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    calls = []
+
+    @AWSExceptionHandler.retry_on_boto3_throttling
+    def describe():
+        calls.append(1)
+        raise ClientError({"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "Describe")
+
+    with pytest.raises(ClientError, match="Rate exceeded"):
+        describe()
+    assert_that(calls).is_length(RETRY_ON_THROTTLING_MAX_ATTEMPTS)
+    assert_that(sleep_mock.call_count).is_equal_to(RETRY_ON_THROTTLING_MAX_ATTEMPTS - 1)
@@ -0,0 +1,43 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.cli.entrypoint import run
+
+
+@pytest.fixture()
+def cache_dir(mocker, set_env, tmp_path):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    set_env("PCLUSTER_CACHE_DIR", str(tmp_path))
+    mocker.patch("pcluster.aws.persistent_cache.PersistentCache.scope", return_value="123456789012/us-east-1")
+    return tmp_path
+
+
+class TestCacheCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = ["pcluster", "cache", "--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    def test_warm_and_clear(self, mocker, cache_dir):
+        describe_offerings_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client._paginate_results",
+            return_value=[{"InstanceType": "t2.micro"}, {"InstanceType": "c5.xlarge"}],
+        )
+        mocker.patch("pcluster.aws.ec2.Ec2Client.get_default_instance_type", return_value="t2.micro")
+        mocker.patch("pcluster.aws.ec2.Ec2Client.get_official_images", return_value=[])
+
+        out = run(["cache", "warm"])
+        assert_that(out).contains_entry({"region": "us-east-1"}, {"instanceTypes": 2})
+        assert_that(out["path"]).starts_with(str(cache_dir))
+        describe_offerings_mock.assert_called_once()
+
+        assert_that(run(["cache", "clear", "--region", "us-east-1"])).contains_entry({"removedEntries": 1})
+        assert_that(run(["cache", "clear"])).contains_entry({"removedEntries": 0})
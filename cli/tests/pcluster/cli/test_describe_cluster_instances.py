@@ -5,9 +5,13 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import json
+
 import pytest
 from assertpy import assert_that
 
+from pcluster.cli.entrypoint import run
+
 
 class TestDescribeClusterInstancesCommand:
     def test_helper(self, test_datadir, run_cli, assert_out_err):
@@ -38,3 +42,45 @@ class TestDescribeClusterInstancesCommand:
 
         out, err = capsys.readouterr()
         assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "pages",
+        [
+            [{"instances": []}],
+            [
+                {"instances": [{"instanceId": "i-1", "state": "running"}], "nextToken": "token"},
+                {"instances": [], "nextToken": "other-token"},
+                {"instances": [{"instanceId": "i-2", "state": "pending"}, {"instanceId": "i-3", "state": "running"}]},
+            ],
+        ],
+        ids=["empty", "many_pages"],
+    )
+    def test_all_pages(self, mocker, capsys, pages):
+        describe_cluster_instances_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_instances_controller.describe_cluster_instances",
+            side_effect=pages,
+            autospec=True,
+        )
+
+        assert_that(run(["describe-cluster-instances", "--cluster-name", "cluster", "--all-pages"])).is_none()
+
+        # The streamed output is the JSON document of the instances of all the pages
+        expected_instances = [instance for page in pages for instance in page["instances"]]
+        assert_that(capsys.readouterr().out).is_equal_to(json.dumps({"instances": expected_instances}, indent=2) + "\n")
+        assert_that([call.kwargs["next_token"] for call in describe_cluster_instances_mock.call_args_list]).is_equal_to(
+            [None] + [page["nextToken"] for page in pages[:-1]]
+        )
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            (["--next-token", "token"], "--next-token cannot be used with --all-pages."),
+            (["--query", "instances"], "--query cannot be used with --all-pages."),
+        ],
+    )
+    def test_invalid_all_pages_args(self, args, error_message, run_cli, capsys):
+        command = ["pcluster", "describe-cluster-instances", "--cluster-name", "cluster", "--all-pages"] + args
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
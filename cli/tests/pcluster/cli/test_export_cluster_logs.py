@@ -27,7 +27,7 @@ class TestExportClusterLogsCommand:
 
     @pytest.mark.parametrize(
         "args, error_message",
-        [({"output_file": "path"}, "the following arguments are required: -n/--cluster-name, --bucket")],
+        [({"output_file": "path"}, "the following arguments are required: -n/--cluster-name")],
     )
     def test_required_args(self, args, error_message, run_cli, capsys):
         command = BASE_COMMAND + self._build_cli_args(args)
@@ -42,6 +42,7 @@ class TestExportClusterLogsCommand:
             ({"filters": ["Name=wrong,Value=test"]}, "filters parameter must be in the form"),
             ({"filters": ["private-dns-name=test"]}, "filters parameter must be in the form"),
             ({"filters": "private-dns-name=test"}, "filters parameter must be in the form"),
+            ({"export_mode": "wrong"}, "argument --export-mode: invalid choice"),
         ],
     )
     def test_invalid_args(self, args, error_message, run_cli, capsys):
@@ -51,6 +52,17 @@ class TestExportClusterLogsCommand:
         out, err = capsys.readouterr()
         assert_that(out + err).contains(error_message)
 
+    @pytest.mark.parametrize(
+        "args", [{}, {"export_mode": "direct"}, {"export_mode": "export-task", "output_file": "path"}]
+    )
+    def test_bucket_required(self, args, run_cli):
+        command = BASE_COMMAND + self._build_cli_args({"cluster_name": "clustername", **args})
+        run_cli(
+            command,
+            expect_failure=True,
+            expect_message="--bucket is required, unless --export-mode is direct and --output-file is provided",
+        )
+
     @pytest.mark.parametrize(
         "args",
         [
@@ -84,11 +96,13 @@ class TestExportClusterLogsCommand:
                 "end_time": "2021-06-07",
                 "filters": "Name=node-type,Values=HeadNode",
             },
+            {"bucket": None, "output_file": "output-path", "export_mode": "direct"},
+            {"bucket": "bucket-name", "export_mode": "direct"},
         ],
     )
     def test_execute(self, mocker, set_env, args):
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.cluster_logs.Cluster.export_logs",
+            "pcluster.models.cluster.Cluster.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
@@ -110,6 +124,7 @@ class TestExportClusterLogsCommand:
             "filters": None,
             "start_time": None,
             "end_time": None,
+            "export_mode": "export-task",
         }
         expected_params.update(args)
         expected_params.update(
@@ -126,5 +141,7 @@ class TestExportClusterLogsCommand:
     def _build_cli_args(args):
         cli_args = []
         for k, val in args.items():
+            if val is None:
+                continue
             cli_args.extend([f"--{to_kebab_case(k)}", str(val)])
         return cli_args
@@ -144,9 +144,61 @@ class TestGetClusterLogEventsCommand:
         }
         get_cluster_log_events_mock.assert_called_with(**kwargs)
 
+    @pytest.mark.parametrize(
+        "args, expected_kwargs, expected_out",
+        [
+            (
+                {},
+                {"start_time": None, "start_from_head": False, "limit": None},
+                "2021-06-04T10:33:10.248Z message 1\n2021-06-04T10:33:10.390Z message 2\n",
+            ),
+            (
+                {"additional_log_stream_names": "other-stream", "start_time": "2021-06-02", "limit": "5"},
+                {"start_time": to_utc_datetime("2021-06-02"), "start_from_head": False, "limit": 5},
+                "2021-06-04T10:33:10.248Z log-stream-name message 1\n"
+                "2021-06-04T10:33:10.390Z other-stream message 2\n",
+            ),
+        ],
+    )
+    def test_follow(self, mocker, set_env, capsys, args, expected_kwargs, expected_out):
+        def _follow_log_events(log_stream_names, **kwargs):
+            yield {"timestamp": 1622802790248, "message": "message 1", "logStreamName": log_stream_names[0]}
+            yield {"timestamp": 1622802790390, "message": "message 2", "logStreamName": log_stream_names[-1]}
+            raise KeyboardInterrupt()
+
+        follow_log_events_mock = mocker.patch(
+            "pcluster.models.cluster.Cluster.follow_log_events", side_effect=_follow_log_events
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        command = ["get-cluster-log-events", "--follow"] + self._build_cli_args({**REQUIRED_ARGS, **args})
+        assert_that(run(command)).is_none()
+
+        log_stream_names = ["log-stream-name"]
+        if "additional_log_stream_names" in args:
+            log_stream_names.append(args["additional_log_stream_names"])
+        follow_log_events_mock.assert_called_with(log_stream_names, **expected_kwargs)
+        assert_that(capsys.readouterr().out).is_equal_to(expected_out)
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            ({"additional_log_stream_names": "other-stream"}, "--additional-log-stream-names can only be used with"),
+            ({"follow": None, "end_time": "2021-06-02"}, "--end-time cannot be used with --follow"),
+            ({"follow": None, "next_token": "f/1234"}, "--next-token cannot be used with --follow"),
+            ({"follow": None, "limit": "0"}, "'limit' must be a positive integer"),
+        ],
+    )
+    def test_invalid_follow_args(self, args, error_message, run_cli, capsys):
+        command = BASE_COMMAND + self._build_cli_args({**REQUIRED_ARGS, **args})
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
     @staticmethod
     def _build_cli_args(args):
         cli_args = []
         for k, val in args.items():
-            cli_args.extend([f"--{to_kebab_case(k)}", val])
+            cli_args.extend([f"--{to_kebab_case(k)}", val] if val is not None else [f"--{to_kebab_case(k)}"])
         return cli_args
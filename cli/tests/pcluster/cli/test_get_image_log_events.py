@@ -148,6 +148,26 @@ class TestGetImageLogEventsCommand:
         }
         get_image_log_events_mock.assert_called_with("log-stream-name", **kwargs)
 
+    def test_follow(self, mocker, set_env, capsys):
+        def _follow_log_events(log_stream_names, **kwargs):
+            yield {"timestamp": 1622802790248, "message": "message 1", "logStreamName": log_stream_names[0]}
+            raise KeyboardInterrupt()
+
+        follow_log_events_mock = mocker.patch(
+            "pcluster.models.imagebuilder.ImageBuilder.follow_log_events", side_effect=_follow_log_events
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        command = ["get-image-log-events", "--follow", "--start-from-head", "true"] + self._build_cli_args(
+            REQUIRED_ARGS
+        )
+        assert_that(run(command)).is_none()
+
+        follow_log_events_mock.assert_called_with(
+            ["log-stream-name"], start_time=None, start_from_head=True, limit=None
+        )
+        assert_that(capsys.readouterr().out).is_equal_to("2021-06-04T10:33:10.248Z message 1\n")
+
     @staticmethod
     def _build_cli_args(args):
         cli_args = []
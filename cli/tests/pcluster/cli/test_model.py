@@ -9,6 +9,7 @@
 import pytest
 from assertpy import assert_that
 
+from pcluster.cli import model as cli_model
 from pcluster.cli.entrypoint import ParameterException, gen_parser
 
 
@@ -93,3 +94,43 @@ class TestCliModel:
         path = str(test_datadir / "notfound")
         with pytest.raises(ParameterException):
             _run_model(model, ["op", "--file", path])
+
+
+class TestCachedModel:
+    def test_load_cached_model(self, mocker, tmpdir, set_env):
+        set_env("PCLUSTER_CACHE_DIR", str(tmpdir))
+        load_model_spy = mocker.spy(cli_model, "load_model")
+
+        model = cli_model.load_cached_model()
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+        assert_that(tmpdir.listdir()).is_length(1)
+        assert_that(model).is_equal_to(cli_model.load_model(cli_model.package_spec()))
+        load_model_spy.reset_mock()
+
+        # The compiled model is read from the cache by the following invocations
+        assert_that(cli_model.load_cached_model()).is_equal_to(model)
+        load_model_spy.assert_not_called()
+
+        # A corrupted model is compiled again
+        tmpdir.listdir()[0].write("{")
+        assert_that(cli_model.load_cached_model()).is_equal_to(model)
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+
+        # The models compiled for other versions are deleted when a new model is written
+        current_model = tmpdir.listdir()[0]
+        tmpdir.join("cli-model-v1-3.6.0-0123456789abcdef.json").write("{}")
+        mocker.patch("pcluster.cli.model.get_installed_version", return_value="99.0.0")
+        cli_model.load_cached_model()
+        assert_that(tmpdir.listdir()).is_length(1)
+        assert_that(tmpdir.listdir()[0].basename).contains("-99.0.0-")
+        assert_that(current_model.exists()).is_false()
+
+    def test_load_cached_model_disabled(self, mocker, tmpdir, set_env):
+        set_env("PCLUSTER_CACHE_DIR", str(tmpdir))
+        set_env("PCLUSTER_CACHE_DISABLED", "true")
+        load_model_spy = mocker.spy(cli_model, "load_model")
+
+        cli_model.load_cached_model()
+        cli_model.load_cached_model()
+        assert_that(load_model_spy.call_count).is_equal_to(2)
+        assert_that(tmpdir.listdir()).is_empty()
@@ -0,0 +1,74 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import builtins
+import sys
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.cli import profiling
+from pcluster.cli.profiling import StartupProfiler
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    yield
+    profiling.print_report()
+
+
+@pytest.mark.parametrize(
+    "environ, args, expected",
+    [
+        ({}, ["version"], False),
+        ({}, ["version", "--profile-startup"], True),
+        ({"PCLUSTER_PROFILE_IMPORTS": "1"}, ["version"], True),
+    ],
+)
+def test_is_requested(set_env, unset_env, environ, args, expected):
+    unset_env("PCLUSTER_PROFILE_IMPORTS")
+    for key, value in environ.items():
+        set_env(key, value)
+    assert_that(profiling.is_requested(args)).is_equal_to(expected)
+
+
+def test_remove_flag():
+    assert_that(profiling.remove_flag(["--profile-startup", "version", "--debug"])).is_equal_to(["version", "--debug"])
+
+
+def test_startup_profiler():
+    original_import = builtins.__import__
+    profiler = StartupProfiler()
+    profiler.start_import_tracking()
+    sys.modules.pop("json.tool", None)
+    import json.tool  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+
+    profiler.end_phase("imports")
+    with profiler.phase("parse"):
+        pass
+    profiler.stop_import_tracking()
+    assert_that(builtins.__import__).is_equal_to(original_import)
+
+    report = profiler.report()
+    assert_that(dict(report["imports"])).contains_key("json.tool")
+    assert_that([name for name, _ in report["phases"]]).is_equal_to(["imports", "parse"])
+    assert_that(report["total"]).is_greater_than_or_equal_to(report["phases"][0][1])
+
+
+def test_print_report(capsys):
+    assert_that(profiling.start_if_requested(["version"])).is_none()
+    profiling.print_report()
+    assert_that(capsys.readouterr().err).is_empty()
+
+    profiler = profiling.start_if_requested(["--profile-startup", "version"])
+    assert_that(profiler).is_not_none()
+    with profiling.phase("dispatch"):
+        pass
+    profiling.print_report()
+    err = capsys.readouterr().err
+    assert_that(err).contains("Startup profile", "dispatch", "Slowest imports")
+    assert_that(profiling.start_if_requested(["version"])).is_none()
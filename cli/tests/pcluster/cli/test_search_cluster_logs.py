@@ -0,0 +1,129 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.cli.entrypoint import run
+from pcluster.models.common import FilteredLogEvents
+from pcluster.utils import to_kebab_case, to_utc_datetime
+from tests.pcluster.test_utils import FAKE_NAME
+
+BASE_COMMAND = ["pcluster", "search-cluster-logs", "--region", "us-east-1"]
+REQUIRED_ARGS = {"cluster_name": FAKE_NAME, "pattern": "ERROR"}
+
+
+class TestSearchClusterLogsCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = BASE_COMMAND + ["--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    @pytest.mark.parametrize(
+        "args, error_message", [({}, "the following arguments are required: -n/--cluster-name, --pattern")]
+    )
+    def test_required_args(self, args, error_message, run_cli, capsys):
+        command = BASE_COMMAND + self._build_cli_args(args)
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            ({"start_time": "wrong"}, "start_time filter must be in the ISO 8601 format"),
+            ({"end_time": "1622802790248"}, "end_time filter must be in the ISO 8601 format"),
+            (
+                {"start_time": "2021-06-02", "end_time": "2021-06-02"},
+                "start_time filter must be earlier than end_time filter.",
+            ),
+            ({"filters": "Name=wrong,Values=test"}, "provided filters parameter 'Name=wrong,Values=test' must be"),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = BASE_COMMAND + self._build_cli_args({**REQUIRED_ARGS, **args})
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "args, next_token",
+        [
+            ({}, None),
+            (
+                {
+                    "filters": "Name=private-dns-name,Values=ip-10-0-0-102",
+                    "start_time": "2021-06-02T15:55:10+02:00",
+                    "end_time": "2021-06-02T17:56:10+02:00",
+                    "next_token": "token",
+                },
+                "next-token",
+            ),
+        ],
+    )
+    def test_execute(self, mocker, mock_cluster_stack, set_env, args, next_token):
+        search_log_events_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_logs_controller.Cluster.search_log_events",
+            return_value=FilteredLogEvents(
+                [
+                    {
+                        "eventId": "1",
+                        "timestamp": 1622802790248,
+                        "message": "ERROR 1",
+                        "logStreamName": "ip-10-0-0-102.i-1.slurmd",
+                        "ingestionTime": 1622802842382,
+                    },
+                    {
+                        "eventId": "2",
+                        "timestamp": 1622802790390,
+                        "message": "ERROR 2",
+                        "logStreamName": "ip-10-0-0-102.i-1.cloud-init",
+                        "ingestionTime": 1622802842382,
+                    },
+                ],
+                next_token,
+            ),
+        )
+
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mock_cluster_stack()
+        out = run(["search-cluster-logs"] + self._build_cli_args({**REQUIRED_ARGS, **args}))
+
+        expected = {
+            "events": [
+                {
+                    "timestamp": "2021-06-04T10:33:10.248Z",
+                    "message": "ERROR 1",
+                    "logStreamName": "ip-10-0-0-102.i-1.slurmd",
+                },
+                {
+                    "timestamp": "2021-06-04T10:33:10.390Z",
+                    "message": "ERROR 2",
+                    "logStreamName": "ip-10-0-0-102.i-1.cloud-init",
+                },
+            ]
+        }
+        if next_token:
+            expected["nextToken"] = next_token
+        assert_that(out).is_equal_to(expected)
+        search_log_events_mock.assert_called_with(
+            filter_pattern="ERROR",
+            start_time=args.get("start_time") and to_utc_datetime(args["start_time"]),
+            end_time=args.get("end_time") and to_utc_datetime(args["end_time"]),
+            filters=args.get("filters") and [args["filters"]],
+            next_token=args.get("next_token"),
+        )
+
+    @staticmethod
+    def _build_cli_args(args):
+        cli_args = []
+        for k, val in args.items():
+            cli_args.extend([f"--{to_kebab_case(k)}", val] if val is not None else [f"--{to_kebab_case(k)}"])
+        return cli_args
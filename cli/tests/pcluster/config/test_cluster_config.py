@@ -2,6 +2,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.aws.aws_resources import InstanceTypeInfo
+from pcluster.aws.common import AWSClientError
 from pcluster.config.cluster_config import (
     AmiSearchFilters,
     BaseClusterConfig,
@@ -493,6 +494,45 @@ class TestBaseClusterConfig:
         )
         assert_that(queue.get_tags()).is_equal_to(tags)
 
+    def test_prefetch_aws_resources(self, aws_api_mock):
+        cluster_config = SlurmClusterConfig(
+            cluster_name="clustername",
+            image=Image("alinux2", custom_ami="ami-custom"),
+            head_node=HeadNode("c5.xlarge", HeadNodeNetworking("subnet-1", security_groups=["sg-1"])),
+            scheduling=SlurmScheduling(
+                [
+                    SlurmQueue(
+                        name="queue0",
+                        networking=SlurmQueueNetworking(
+                            subnet_ids=["subnet-1", "subnet-2"], additional_security_groups=["sg-1", "sg-2"]
+                        ),
+                        compute_resources=[
+                            SlurmComputeResource(name="compute_resource_1", instance_type="c5.xlarge"),
+                            SlurmFlexibleComputeResource(
+                                [FlexibleInstanceType(instance_type="c5n.18xlarge")], name="compute_resource_2"
+                            ),
+                        ],
+                        image=QueueImage(custom_ami="ami-queue"),
+                    )
+                ]
+            ),
+            shared_storage=[
+                SharedEbs(mount_dir="/ebs1", name="ebs1", volume_id="vol-1"),
+                SharedEbs(mount_dir="/ebs2", name="ebs2"),
+            ],
+        )
+        aws_api_mock.ec2.describe_security_groups.side_effect = AWSClientError("describe_security_groups", "error")
+        cluster_config.prefetch_aws_resources()
+
+        aws_api_mock.ec2.describe_subnets.assert_called_once_with(["subnet-1", "subnet-2"])
+        aws_api_mock.ec2.describe_security_groups.assert_called_once_with(["sg-1", "sg-2"])
+        aws_api_mock.ec2.get_instance_types_info.assert_called_once_with(["c5.xlarge", "c5n.18xlarge"])
+        aws_api_mock.ec2.describe_images_by_ids.assert_called_once_with(["ami-custom", "ami-queue"])
+        aws_api_mock.ec2.describe_volumes.assert_called_once_with(["vol-1"])
+        aws_api_mock.fsx.describe_volumes.assert_not_called()
+        aws_api_mock.fsx.get_file_systems_info.assert_not_called()
+        aws_api_mock.fsx.describe_file_caches.assert_not_called()
+
 
 class TestSharedEbs:
     @pytest.mark.parametrize(
@@ -9,13 +9,14 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import threading
+import time
 from typing import List
-from unittest.mock import MagicMock
 
 import pytest
 from assertpy import assert_that
 
-from pcluster.config.common import Resource, TypeMatchValidatorsSuppressor
+from pcluster.config.common import Resource, TypeMatchValidatorsSuppressor, ValidationScheduler
 from pcluster.validators.common import (
     AsyncValidator,
     FailureLevel,
@@ -171,8 +172,9 @@ def test_async_resource_validation():
     assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value other-value.")
 
 
-def test_async_resource_validation_waited_at_top_level():
+def test_async_resource_validation_waited_at_top_level(mocker):
     """Verify that async validators are awaited once and suppressible."""
+    run_spy = mocker.spy(ValidationScheduler, "run")
 
     class FakeResource(Resource):
         """Fake resource class to test validators."""
@@ -181,7 +183,6 @@ def test_async_resource_validation_waited_at_top_level():
             super().__init__()
             self.fake_attribute = f"fake-{name}"
             self.other_attribute = f"other-{name}"
-            self._await_async_validators = MagicMock(wraps=self._await_async_validators)
 
         def _register_validators(self, context: ValidatorContext = None):
             self._register_validator(FakeErrorValidator, param=self.fake_attribute)
@@ -199,9 +200,7 @@ def test_async_resource_validation_waited_at_top_level():
         ]
     )
 
-    fake_resource._await_async_validators.assert_called_once()
-    fake_resource.nested1._await_async_validators.assert_not_called()
-    fake_resource.nested2._await_async_validators.assert_not_called()
+    run_spy.assert_called_once()
 
     assert_validation_result(validation_failures[0], FailureLevel.ERROR, "Error fake-nested1.")
     assert_validation_result(validation_failures[1], FailureLevel.ERROR, "Error fake-nested2.")
@@ -214,6 +213,50 @@ def test_async_resource_validation_waited_at_top_level():
     assert_validation_result(validation_failures[8], FailureLevel.ERROR, "Error async 2 fake-root.")
 
 
+class FakeEc2Validator(Validator):
+    """Dummy validator calling EC2, tracking the number of concurrent executions."""
+
+    aws_services = ("ec2",)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def _validate(self, param, delay):
+        with FakeEc2Validator.lock:
+            FakeEc2Validator.running += 1
+            FakeEc2Validator.max_running = max(FakeEc2Validator.max_running, FakeEc2Validator.running)
+        time.sleep(delay)
+        with FakeEc2Validator.lock:
+            FakeEc2Validator.running -= 1
+        self._add_failure(f"Ec2 {param}.", FailureLevel.WARNING)
+
+
+@pytest.mark.parametrize(
+    "max_concurrency, service_max_concurrency, expected_max_running", [(8, 2, 2), (8, 8, 7), (4, 8, 4), (1, 8, 1)]
+)
+def test_validation_scheduler(max_concurrency, service_max_concurrency, expected_max_running):
+    """Verify that validators calling AWS run concurrently within limits and failures keep a deterministic order."""
+    FakeEc2Validator.max_running = 0
+    jobs = [
+        (FakeEc2Validator, {"param": "slow", "delay": 0.3}),
+        (FakeErrorValidator, {"param": "sync"}),
+        (FakeAsyncInfoValidator, {"param": "async"}),
+        (FakeFaultyValidator, {"param": "faulty"}),
+    ] + [(FakeEc2Validator, {"param": i, "delay": 0.2}) for i in range(6)]
+
+    failures = ValidationScheduler(
+        max_concurrency=max_concurrency, service_max_concurrency=service_max_concurrency
+    ).run(jobs)
+
+    assert_that([failure.message for failure in failures]).is_equal_to(
+        ["Ec2 slow.", "Error sync.", "dummy fault"] + [f"Ec2 {i}." for i in range(6)] + ["Wrong async value async."]
+    )
+    # The exact overlap of the executions depends on the load of the machine, only the upper bound is guaranteed
+    assert_that(FakeEc2Validator.max_running).is_less_than_or_equal_to(expected_max_running)
+    if expected_max_running > 1:
+        assert_that(FakeEc2Validator.max_running).is_greater_than(1)
+
+
 def test_async_resource_validation_with_timeout():
     """Verify that async validators can fail due to timeout."""
 
@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import os
 import shutil
 
@@ -1004,3 +1005,57 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+def _slurm_config(queues):
+    return {
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": queue_name,
+                    "ComputeResources": [
+                        {
+                            "Name": compute_resource_name,
+                            "InstanceType": "c5.xlarge",
+                            "MinCount": 0,
+                            "MaxCount": max_count,
+                        }
+                        for compute_resource_name, max_count in compute_resources
+                    ],
+                }
+                for queue_name, compute_resources in queues
+            ],
+        }
+    }
+
+
+def test_list_changes_on_large_config():
+    base_queues = [(f"queue{q}", [(f"cr{c}", 10) for c in range(50)]) for q in range(100)]
+    # Change a compute resource in the last queue, remove the first queue and add a new one
+    target_queues = [(name, list(crs)) for name, crs in base_queues[1:]]
+    target_queues[-1][1][-1] = ("cr49", 20)
+    target_queues.append(("queue100", [("cr0", 10)]))
+    base_config = _slurm_config(base_queues)
+    target_config = _slurm_config(target_queues)
+    base_config_copy = copy.deepcopy(base_config)
+    target_config_copy = copy.deepcopy(target_config)
+
+    patch = ConfigPatch(dummy_cluster(), base_config=base_config, target_config=target_config)
+
+    changes = sorted(patch.changes, key=lambda change: (change.path, change.key, change.new_value is None))
+    assert_that(changes).is_length(3)
+    assert_that(changes[0].path).is_equal_to(["Scheduling"])
+    assert_that(changes[0].key).is_equal_to("SlurmQueues")
+    assert_that(changes[0].old_value).is_none()
+    assert_that(changes[0].new_value["Name"]).is_equal_to("queue100")
+    assert_that(changes[1].path).is_equal_to(["Scheduling"])
+    assert_that(changes[1].old_value["Name"]).is_equal_to("queue0")
+    assert_that(changes[1].new_value).is_none()
+    assert_that(changes[2].path).is_equal_to(["Scheduling", "SlurmQueues[queue99]", "ComputeResources[cr49]"])
+    assert_that(changes[2].key).is_equal_to("MaxCount")
+    assert_that(changes[2].old_value).is_equal_to(10)
+    assert_that(changes[2].new_value).is_equal_to(20)
+    # The configurations are not modified by the comparison
+    assert_that(base_config).is_equal_to(base_config_copy)
+    assert_that(target_config).is_equal_to(target_config_copy)
@@ -8,12 +8,16 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import time
+
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.aws_api import AWSApi
 from pcluster.config.cluster_config import QueueUpdateStrategy
 from pcluster.config.config_patch import Change, ConfigPatch
 from pcluster.config.update_policy import (
+    UpdateCheckContext,
     UpdatePolicy,
     actions_needed_managed_fsx,
     condition_checker_managed_fsx,
@@ -23,6 +27,8 @@ from pcluster.config.update_policy import (
     is_managed_placement_group_deletion,
 )
 from pcluster.models.cluster import Cluster
+from pcluster.models.cluster_resources import ClusterStack
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.test_utils import dummy_cluster
 
 
@@ -48,6 +54,7 @@ def test_max_count_policy(mocker, is_fleet_stopped, old_max, new_max, expected_r
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
     change_mock = mocker.MagicMock()
     change_mock.new_value = new_max
     change_mock.old_value = old_max
@@ -281,6 +288,7 @@ def test_queue_update_strategy_condition_checker(
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
     patch_mock.target_config = (
         {"Scheduling": {"SlurmSettings": {"QueueUpdateStrategy": update_strategy}}}
         if update_strategy
@@ -401,6 +409,7 @@ def test_compute_fleet_stop_on_remove_condition_checker(
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
 
     change_mock = mocker.MagicMock()
     change_mock.path = path
@@ -435,6 +444,7 @@ def test_queue_update_strategy_fail_reason_and_actions_needed(
     cluster = dummy_cluster()
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -473,6 +483,7 @@ def test_compute_fleet_stop_on_remove_fail_reason_and_actions_needed(
     cluster = dummy_cluster()
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -514,6 +525,7 @@ def test_compute_fleet_stop_fail_reason_and_actions_needed(
     cluster = dummy_cluster()
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -851,6 +863,7 @@ def test_shared_storage_update_policy_condition_checker(
     )
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.context = UpdateCheckContext(cluster)
     if scheduler == "slurm":
         patch_mock.target_config = (
             {"Scheduling": {"SlurmSettings": {"QueueUpdateStrategy": update_strategy}}}
@@ -1678,3 +1691,68 @@ def test_condition_checker_managed_fsx(
     assert_that(condition_checker_managed_fsx(change, patch)).is_equal_to(expected_subnet_updated)
     assert_that(fail_reason_managed_fsx(change, patch)).is_equal_to(expected_fail_reason)
     assert_that(actions_needed_managed_fsx(change, patch)).is_equal_to(expected_action_needed)
+
+
+def test_update_check_context_reads_cluster_facts_once(mocker):
+    cluster = dummy_cluster()
+    has_running_capacity_mock = mocker.patch.object(cluster, "has_running_capacity", return_value=True)
+    get_running_capacity_mock = mocker.patch.object(cluster, "get_running_capacity", return_value=4)
+    head_node_instance_mock = mocker.patch.object(
+        Cluster, "head_node_instance", new_callable=mocker.PropertyMock, return_value=mocker.MagicMock(state="stopped")
+    )
+    patch = ConfigPatch(cluster=cluster, base_config={}, target_config={})
+    patch.changes = [
+        Change(["Scheduling", f"SlurmQueues[queue{index}]"], "MaxCount", 10, 9, UpdatePolicy.MAX_COUNT, is_list=False)
+        for index in range(100)
+    ] + [
+        Change(["HeadNode"], f"Param{index}", "old", "new", UpdatePolicy.HEAD_NODE_STOP, is_list=False)
+        for index in range(10)
+    ]
+
+    patch_allowed, rows = patch.check()
+
+    assert_that(patch_allowed).is_false()
+    assert_that(rows).is_length(111)
+    has_running_capacity_mock.assert_called_once()
+    head_node_instance_mock.assert_called_once()
+    # Facts not needed by the changes are not retrieved
+    get_running_capacity_mock.assert_not_called()
+
+    with patch.context.record_used_facts() as used_facts:
+        UpdatePolicy.COMPUTE_FLEET_STOP.check(patch.changes[0], patch)
+    assert_that(used_facts).is_equal_to({UpdateCheckContext.HAS_RUNNING_CAPACITY: True})
+    has_running_capacity_mock.assert_called_once()
+
+
+def test_update_check_context_derives_awsbatch_has_running_capacity(mocker):
+    mock_aws_api(mocker)
+    cluster = dummy_cluster(
+        stack=ClusterStack(
+            {
+                "StackName": "clustername",
+                "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "awsbatch"}],
+                "Outputs": [{"OutputKey": "BatchComputeEnvironmentArn", "OutputValue": "ce"}],
+            }
+        )
+    )
+
+    def _get_compute_environment_capacity(ce_name):
+        # Slow enough for concurrent lookups to overlap
+        time.sleep(0.2)
+        return 4
+
+    get_capacity_mock = mocker.patch.object(
+        AWSApi.instance().batch,
+        "get_compute_environment_capacity",
+        create=True,
+        side_effect=_get_compute_environment_capacity,
+    )
+    context = UpdateCheckContext(cluster)
+
+    context.gather([UpdateCheckContext.HAS_RUNNING_CAPACITY, UpdateCheckContext.RUNNING_CAPACITY])
+
+    # The compute environment is looked up once for both facts
+    get_capacity_mock.assert_called_once_with(ce_name="ce")
+    assert_that(context.running_capacity).is_equal_to(4)
+    assert_that(context.has_running_capacity).is_true()
+    get_capacity_mock.assert_called_once()
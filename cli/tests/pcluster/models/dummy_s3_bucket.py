@@ -8,8 +8,11 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from pcluster.aws.common import AWSClientError
 from pcluster.models.s3_bucket import S3Bucket
 
+ASSET_NOT_FOUND_ERROR = AWSClientError("get_object", "The specified key does not exist.")
+
 
 def dummy_cluster_bucket(
     bucket_name="parallelcluster-a69601b5ee1fc2f2-v1-do-not-delete",
@@ -83,6 +86,7 @@ def mock_bucket_object_utils(
     upload_template_side_effect=None,
     upload_asset_side_effect=None,
     get_template_side_effect=None,
+    get_asset_side_effect=ASSET_NOT_FOUND_ERROR,
     upload_resources_side_effect=None,
     delete_s3_artifacts_side_effect=None,
     upload_bootstrapped_file_side_effect=None,
@@ -111,6 +115,10 @@ def mock_bucket_object_utils(
         side_effect=get_template_side_effect,
     )
 
+    get_cfn_asset_mock = mocker.patch(
+        "pcluster.models.s3_bucket.S3Bucket.get_cfn_asset", side_effect=get_asset_side_effect
+    )
+
     # mock calls from custom resources
     upload_resources_mock = mocker.patch(
         "pcluster.models.s3_bucket.S3Bucket.upload_resources", side_effect=upload_resources_side_effect
@@ -136,6 +144,7 @@ def mock_bucket_object_utils(
         "upload_cfn_template": upload_cfn_template_mock,
         "upload_cfn_asset": upload_cfn_asset_mock,
         "get_cfn_template": get_cfn_template_mock,
+        "get_cfn_asset": get_cfn_asset_mock,
         "upload_resources": upload_resources_mock,
         "delete_s3_artifacts": delete_s3_artifacts_mock,
         "upload_bootstrapped_file": upload_bootstrapped_file_mock,
@@ -9,6 +9,7 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import itertools
 import json
 from copy import deepcopy
 from io import BytesIO
@@ -21,6 +22,7 @@ from botocore.response import StreamingBody
 from dateutil import tz
 
 from pcluster.api.models import ClusterStatus
+from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import ImageInfo
 from pcluster.aws.common import AWSClientError
 from pcluster.config.cluster_config import Tag
@@ -92,6 +94,115 @@ class TestCluster:
         instances, _ = cluster.describe_instances(node_type=node_type)
         assert_that(instances).is_length(expected_instances)
 
+    def test_iter_instances(self, cluster, mocker):
+        """Verify that the instances of all the pages are returned, not only the ones of the first page."""
+        mock_aws_api(mocker)
+        pages = [
+            ([{"InstanceId": f"i-{index}"} for index in range(1000)], "token"),
+            ([{"InstanceId": "i-1000"}, {"InstanceId": "i-1001"}], None),
+        ]
+        describe_instances_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=pages * 3)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.stack", new_callable=PropertyMock
+        ).return_value.scheduler = "slurm"
+
+        assert_that([instance.id for instance in cluster.iter_instances(NodeType.COMPUTE)]).is_equal_to(
+            [f"i-{index}" for index in range(1002)]
+        )
+        assert_that(cluster.compute_instances).is_length(1002)
+        assert_that(cluster.get_running_capacity()).is_equal_to(1002)
+
+        expected_filters = cluster._get_instance_filters(NodeType.COMPUTE)
+        describe_instances_mock.assert_has_calls(
+            [
+                mocker.call(expected_filters, None, max_results=1000),
+                mocker.call(expected_filters, "token", max_results=1000),
+            ]
+        )
+
+    def test_get_head_node_instances(self, mocker):
+        mock_aws_api(mocker)
+
+        def _head_node(cluster_name):
+            return {
+                "InstanceId": f"i-{cluster_name}",
+                "Tags": [
+                    {"Key": PCLUSTER_CLUSTER_NAME_TAG, "Value": cluster_name},
+                    {"Key": "parallelcluster:node-type", "Value": "HeadNode"},
+                ],
+            }
+
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=[([_head_node("cluster1")], "token"), ([_head_node("cluster2")], None)],
+        )
+
+        clusters = [Cluster("cluster1"), Cluster("cluster2"), Cluster("cluster3")]
+        head_nodes = Cluster.get_head_node_instances(clusters)
+
+        assert_that({name: instance.id for name, instance in head_nodes.items()}).is_equal_to(
+            {"cluster1": "i-cluster1", "cluster2": "i-cluster2"}
+        )
+        expected_filters = [
+            {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": ["cluster1", "cluster2", "cluster3"]},
+            {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+            {"Name": "tag:parallelcluster:node-type", "Values": ["HeadNode"]},
+        ]
+        describe_instances_mock.assert_has_calls(
+            [mocker.call(expected_filters, None), mocker.call(expected_filters, "token")]
+        )
+
+    def test_get_compute_fleet_statuses(self, mocker):
+        mock_aws_api(mocker)
+        get_statuses_mock = mocker.patch(
+            "pcluster.models.cluster.ComputeFleetStatusManager.get_statuses", return_value=[ComputeFleetStatus.RUNNING]
+        )
+
+        def _get_compute_environment_state(compute_environment):
+            if compute_environment == "failing-ce":
+                raise AWSClientError("describe_compute_environments", "error")
+            return "ENABLED"
+
+        mocker.patch.object(
+            AWSApi.instance().batch,
+            "get_compute_environment_state",
+            create=True,
+            side_effect=_get_compute_environment_state,
+        )
+
+        def _cluster(name, status, scheduler, compute_environment="ce"):
+            return Cluster(
+                name,
+                stack=ClusterStack(
+                    {
+                        "StackName": name,
+                        "StackStatus": status,
+                        "Tags": [{"Key": PCLUSTER_VERSION_TAG, "Value": "3.6.0"}],
+                        "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": scheduler}],
+                        "Outputs": [{"OutputKey": "BatchComputeEnvironmentArn", "OutputValue": compute_environment}],
+                    }
+                ),
+            )
+
+        clusters = [
+            _cluster("slurm", "CREATE_COMPLETE", "slurm"),
+            _cluster("batch", "CREATE_COMPLETE", "awsbatch"),
+            _cluster("deleting", "DELETE_IN_PROGRESS", "slurm"),
+            _cluster("failing-batch", "CREATE_COMPLETE", "awsbatch", compute_environment="failing-ce"),
+        ]
+        statuses = Cluster.get_compute_fleet_statuses(clusters)
+
+        assert_that(statuses).is_equal_to(
+            {
+                "slurm": ComputeFleetStatus.RUNNING,
+                "batch": ComputeFleetStatus.ENABLED,
+                "deleting": ComputeFleetStatus.UNKNOWN,
+                "failing-batch": ComputeFleetStatus.UNKNOWN,
+            }
+        )
+        managers = get_statuses_mock.call_args.args[0]
+        assert_that([manager._table_name for manager in managers]).is_equal_to(["parallelcluster-slurm"])
+
     @pytest.mark.parametrize(
         "existing_tags",
         [
@@ -295,6 +406,33 @@ class TestCluster:
 
         assert_that(persist_cloudwatch_log_groups_mock.called).is_equal_to(persist_called)
 
+    @pytest.mark.parametrize("failing_batch", [None, 1])
+    def test_terminate_nodes(self, cluster, mocker, failing_batch):
+        """Verify that the compute nodes are terminated with concurrent batches of 100 instances."""
+        mock_aws_api(mocker)
+        instance_ids = [f"i-{index}" for index in range(250)]
+        mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", return_value=instance_ids)
+        batches = [tuple(instance_ids[:100]), tuple(instance_ids[100:200]), tuple(instance_ids[200:])]
+
+        def _terminate_instances(ids):
+            if failing_batch is not None and ids == batches[failing_batch]:
+                raise AWSClientError("terminate_instances", "error")
+
+        terminate_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances
+        )
+
+        if failing_batch is None:
+            cluster.terminate_nodes()
+        else:
+            with pytest.raises(ClusterActionError, match="Unable to delete running EC2 instances with error: error"):
+                cluster.terminate_nodes()
+
+        # All the batches are submitted even when one of them fails
+        assert_that(sorted(call.args[0] for call in terminate_instances_mock.call_args_list)).is_equal_to(
+            sorted(batches)
+        )
+
     @pytest.mark.parametrize(
         "template, expected_retain, fail_on_persist",
         [
@@ -466,6 +604,10 @@ class TestCluster:
             (True, True, "", {"keep_s3_objects": True}),
             (True, True, "", {"output_file": "path"}),
             (True, True, "", {"bucket_prefix": "test_prefix"}),
+            (True, True, "", {"bucket": None, "output_file": "path", "export_mode": "direct"}),
+            (True, True, "", {"output_file": "path", "export_mode": "direct"}),
+            (True, True, "A bucket is required", {"bucket": None, "output_file": "path"}),
+            (True, True, "A bucket is required", {"bucket": None, "export_mode": "direct"}),
         ],
     )
     def test_export_logs(
@@ -482,8 +624,7 @@ class TestCluster:
         set_env("AWS_DEFAULT_REGION", "us-east-2")
         stack_exists_mock = mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=stack_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.cluster.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.cluster.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.cluster.upload_archive")
+        logs_archive_mock = mocker.patch("pcluster.models.cluster.open_logs_archive")
         presign_mock = mocker.patch("pcluster.models.cluster.create_s3_presigned_url")
         mocker.patch(
             "pcluster.models.cluster.ClusterStack.log_group_name",
@@ -496,8 +637,13 @@ class TestCluster:
             return_value=_MockExportClusterLogsFiltersParser(),
         )
         cw_logs_exporter_mock = mocker.patch("pcluster.models.cluster.CloudWatchLogsExporter", autospec=True)
+        cw_logs_puller_mock = mocker.patch("pcluster.models.cluster.CloudWatchLogsPuller", autospec=True)
+        if kwargs.get("export_mode") == "direct":
+            cw_logs_exporter_mock, unused_logs_exporter_mock = cw_logs_puller_mock, cw_logs_exporter_mock
+        else:
+            unused_logs_exporter_mock = cw_logs_puller_mock
 
-        kwargs.update({"bucket": "bucket_name"})
+        kwargs = {"bucket": "bucket_name", **kwargs}
         if expected_error:
             with pytest.raises(ClusterActionError, match=expected_error):
                 cluster.export_logs(**kwargs)
@@ -505,22 +651,29 @@ class TestCluster:
             cluster.export_logs(**kwargs)
             # check archive steps
             download_stack_events_mock.assert_called()
-            create_logs_archive_mock.assert_called()
+            logs_archive_mock.return_value.__enter__.return_value.add_directory.assert_called()
 
             # check preliminary steps
             stack_exists_mock.assert_called_with(cluster.stack_name)
 
+            unused_logs_exporter_mock.assert_not_called()
             if logging_enabled:
                 cw_logs_exporter_mock.assert_called()
                 logs_filter_mock.assert_called()
+                # CloudWatch logs are streamed into the archive
+                assert_that(cw_logs_exporter_mock.return_value.execute.call_args.kwargs["archive"]).is_equal_to(
+                    logs_archive_mock.return_value.__enter__.return_value
+                )
             else:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
 
+            logs_archive_mock.assert_called_with(
+                mocker.ANY, kwargs.get("output_file"), kwargs["bucket"], kwargs.get("bucket_prefix")
+            )
             if "output_file" not in kwargs:
-                print("kwargs", kwargs)
-                upload_archive_mock.assert_called()
-                presign_mock.assert_called()
+                # The archive is streamed to S3 while being created
+                presign_mock.assert_called_with(logs_archive_mock.return_value.__enter__.return_value.path)
 
     @pytest.mark.parametrize(
         "stack_exists, logging_enabled, client_error, expected_error",
@@ -617,6 +770,44 @@ class TestCluster:
 
         stack_exists_mock.assert_called_with(cluster.stack_name)
 
+    @pytest.mark.parametrize(
+        "stack_exists, logging_enabled, client_error, expected_error",
+        [
+            (False, False, False, "Cluster .* does not exist"),
+            (True, False, False, "CloudWatch logging is not enabled"),
+            (True, True, True, "Unexpected error when retrieving log events"),
+            (True, True, False, ""),
+        ],
+    )
+    def test_follow_log_events(
+        self, cluster, mocker, set_env, stack_exists, logging_enabled, client_error, expected_error
+    ):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        stack_exists_mock = mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=stack_exists)
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name" if logging_enabled else None),
+        )
+        get_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=AWSClientError("get_log_events", "error") if client_error else None,
+            return_value={"events": [{"timestamp": 1, "message": "message"}], "nextForwardToken": "f/1"},
+        )
+        mocker.patch("pcluster.models.common.time.sleep")
+
+        events = cluster.follow_log_events(["stream-1", "stream-2"])
+        if expected_error:
+            with pytest.raises(ClusterActionError, match=expected_error):
+                next(events)
+        else:
+            assert_that([event["logStreamName"] for event in itertools.islice(events, 4)]).is_equal_to(
+                ["stream-1", "stream-2", "stream-1", "stream-2"]
+            )
+            # The stack is checked once, then only log events are polled
+            stack_exists_mock.assert_called_once()
+            assert_that(get_log_events_mock.call_count).is_equal_to(4)
+
     @pytest.mark.parametrize("force", [False, True])
     def test_validate_empty_change_set(self, mocker, force):
         mock_aws_api(mocker)
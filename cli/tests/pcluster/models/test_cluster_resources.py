@@ -29,6 +29,47 @@ def mock_head_node():
     return ClusterInstance({"PrivateDnsName": "ip-10-0-0-102.eu-west2.compute.internal"})
 
 
+def test_cluster_instance_projection():
+    """Verify that only the fields used for the cluster instances are kept from the describe_instances data."""
+    instance = ClusterInstance(
+        {
+            "InstanceId": "i-123",
+            "InstanceType": "c5.xlarge",
+            "LaunchTime": datetime.datetime(2021, 6, 4, 10, 23, 20),
+            "PrivateDnsName": "ip-10-0-0-102.eu-west2.compute.internal",
+            "PrivateIpAddress": "10.0.0.102",
+            "State": {"Code": 16, "Name": "running"},
+            "BlockDeviceMappings": [{"DeviceName": "/dev/xvda"}],
+            "NetworkInterfaces": [{"NetworkInterfaceId": "eni-123"}],
+            "Tags": [
+                {"Key": "parallelcluster:queue-name", "Value": "queue1"},
+                {"Key": "parallelcluster:attributes", "Value": "alinux2, slurm, 3.7.0, x86_64"},
+                {"Key": "Name", "Value": "Compute"},
+            ],
+        }
+    )
+
+    assert_that(instance._instance_data).is_equal_to(
+        {
+            "InstanceId": "i-123",
+            "InstanceType": "c5.xlarge",
+            "LaunchTime": datetime.datetime(2021, 6, 4, 10, 23, 20),
+            "PrivateDnsName": "ip-10-0-0-102.eu-west2.compute.internal",
+            "PrivateIpAddress": "10.0.0.102",
+            "State": {"Name": "running"},
+            "Tags": [
+                {"Key": "parallelcluster:queue-name", "Value": "queue1"},
+                {"Key": "parallelcluster:attributes", "Value": "alinux2, slurm, 3.7.0, x86_64"},
+            ],
+        }
+    )
+    assert_that(instance.state).is_equal_to("running")
+    assert_that(instance.public_ip).is_none()
+    assert_that(instance.queue_name).is_equal_to("queue1")
+    assert_that(instance.os).is_equal_to("alinux2")
+    assert_that(hasattr(instance, "__dict__")).is_false()
+
+
 class TestClusterLogsFiltersParser:
     @pytest.mark.parametrize(
         "filters, expected_error",
@@ -9,18 +9,30 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
+import itertools
 import os
+import tarfile
 import time
+from unittest.mock import ANY
 
 import pytest
 from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
 from pcluster.models.common import (
+    BadRequest,
     CloudWatchLogsExporter,
+    CloudWatchLogsPuller,
     FiltersParserError,
+    LogEventsFollower,
+    LogEventsSearch,
     LogGroupTimeFiltersParser,
+    LogsArchive,
     LogsExporterError,
+    S3UploadStream,
+    open_logs_archive,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -264,7 +276,7 @@ class TestCloudWatchLogsExporter:
             bucket_prefix = params.get("bucket_prefix", None)
 
             if bucket_prefix:
-                download_objects_mock.assert_called_with("task_id", os.path.join("output_dir", "cloudwatch-logs"))
+                download_objects_mock.assert_called_with("task_id", os.path.join("output_dir", "cloudwatch-logs"), None)
 
             if not params.get("keep_s3_objects", False):
                 delete_objects_mock.assert_called()
@@ -307,8 +319,51 @@ class TestCloudWatchLogsExporter:
         expected_call_count = len(task_statuses)
         mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
 
+        sleep_mock = mocker.patch("pcluster.models.common.time.sleep")
+
         cw_logs_exporter._wait_for_task_completion("task_id")
         assert_that(wait_for_task_mock.call_count).is_equal_to(expected_call_count)
+        # The status is polled with exponential backoff
+        expected_sleeps = [min(2**attempt, 15) for attempt in range(expected_call_count)]
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to(expected_sleeps)
+
+    @pytest.mark.parametrize("stream_to_archive", [False, True])
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmp_path, stream_to_archive):
+        mock_aws_api(mocker)
+        logs = {
+            f"{cw_logs_exporter.bucket_prefix}/task_id/{stream}/000000.gz": f"{stream} events\n" * 1000
+            for stream in ["ip-10-0-0-1.i-1.cfn-init", "ip-10-0-0-2.i-2.slurmd"]
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=key) for key in logs],
+        )
+        mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(logs[key].encode()))},
+        )
+        root_dir = tmp_path / "clustername-logs"
+        log_streams_dir = root_dir / "cloudwatch-logs"
+
+        if stream_to_archive:
+            with LogsArchive(str(root_dir)) as archive:
+                cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(log_streams_dir), archive)
+            with tarfile.open(archive.path) as tar:
+                files = {member.name: tar.extractfile(member).read().decode() for member in tar.getmembers()}
+            assert_that(log_streams_dir.exists()).is_false()
+        else:
+            cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(log_streams_dir))
+            files = {
+                os.path.join("clustername-logs", "cloudwatch-logs", path.name): path.read_text()
+                for path in log_streams_dir.iterdir()
+            }
+
+        assert_that(files).is_equal_to(
+            {
+                os.path.join("clustername-logs", "cloudwatch-logs", key.split("/")[-2]): content
+                for key, content in logs.items()
+            }
+        )
 
     @pytest.mark.parametrize("task_result", ["COMPLETED", "ERROR"])
     def test_export_logs_to_s3(self, cw_logs_exporter, mocker, task_result):
@@ -326,3 +381,456 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_logs_archive_removed_on_failure(tmp_path, fail):
+    root_dir = tmp_path / "clustername-logs"
+    output_file = tmp_path / "output" / "logs.tar.gz"
+    output_file.parent.mkdir()
+
+    def _export(archive):
+        archive.add_stream(io.BytesIO(b"events"), str(root_dir / "cloudwatch-logs" / "stream"))
+        if fail:
+            raise LogsExporterError("export task failed")
+
+    if fail:
+        with pytest.raises(LogsExporterError, match="export task failed"):
+            with LogsArchive(str(root_dir), str(output_file)) as archive:
+                _export(archive)
+        # An incomplete archive is not left at the output path
+        assert_that(output_file.exists()).is_false()
+    else:
+        with LogsArchive(str(root_dir), str(output_file)) as archive:
+            _export(archive)
+        with tarfile.open(output_file) as tar:
+            assert_that(tar.getnames()).is_equal_to([os.path.join("clustername-logs", "cloudwatch-logs", "stream")])
+
+
+class TestCloudWatchLogsPuller:
+    @pytest.mark.parametrize("stream_to_archive", [False, True])
+    def test_execute(self, mocker, tmp_path, stream_to_archive):
+        mock_aws_api(mocker)
+        start_time = datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 3, tzinfo=datetime.timezone.utc)
+        start_ms, end_ms = int(start_time.timestamp() * 1000), int(end_time.timestamp() * 1000)
+        log_streams_pages = {
+            None: {
+                "logStreams": [
+                    {"logStreamName": "ip-10-0-0-1.i-1.cfn-init", "firstEventTimestamp": start_ms - 10},
+                    {"logStreamName": "ip-10-0-0-1.i-1.empty"},
+                ],
+                "nextToken": "page2",
+            },
+            "page2": {
+                "logStreams": [
+                    {
+                        "logStreamName": "ip-10-0-0-1.i-1.slurmd",
+                        "firstEventTimestamp": start_ms,
+                        "lastIngestionTime": end_ms,
+                    },
+                    {
+                        "logStreamName": "ip-10-0-0-1.i-1.old",
+                        "firstEventTimestamp": 0,
+                        "lastIngestionTime": start_ms - 1,
+                    },
+                    {"logStreamName": "ip-10-0-0-1.i-1.new", "firstEventTimestamp": end_ms + 1},
+                ]
+            },
+        }
+        describe_log_streams_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_streams",
+            side_effect=lambda log_group_name, log_stream_name_prefix, next_token: log_streams_pages[next_token],
+        )
+
+        def _get_log_events(log_stream_name, next_token, **kwargs):
+            # Two pages of events, then the end of the stream is signaled by returning the same token
+            if next_token == "end":
+                return {"events": [], "nextForwardToken": "end"}
+            page = 1 if next_token else 0
+            return {
+                "events": [
+                    {"timestamp": start_ms + page * 1000 + i, "message": f"{log_stream_name} {page} {i}"}
+                    for i in range(2)
+                ],
+                "nextForwardToken": "end" if page else "page1",
+            }
+
+        get_log_events_mock = mocker.patch("pcluster.aws.logs.LogsClient.get_log_events", side_effect=_get_log_events)
+
+        root_dir = tmp_path / "clustername-logs"
+        log_streams_dir = root_dir / "cloudwatch-logs"
+        puller = CloudWatchLogsPuller(log_group_name="log-group", output_dir=str(root_dir))
+        if stream_to_archive:
+            with LogsArchive(str(root_dir)) as archive:
+                log_streams_count = puller.execute("ip-10-0-0-1", start_time, end_time, archive=archive)
+            with tarfile.open(archive.path) as tar:
+                files = {member.name: tar.extractfile(member).read().decode() for member in tar.getmembers()}
+            assert_that(log_streams_dir.exists()).is_false()
+        else:
+            log_streams_count = puller.execute("ip-10-0-0-1", start_time, end_time)
+            files = {
+                os.path.join("clustername-logs", "cloudwatch-logs", path.name): path.read_text()
+                for path in log_streams_dir.iterdir()
+            }
+
+        assert_that(log_streams_count).is_equal_to(2)
+        assert_that(describe_log_streams_mock.call_count).is_equal_to(2)
+        # Three requests per stream: two pages of events and the final empty one
+        assert_that(get_log_events_mock.call_count).is_equal_to(6)
+        get_log_events_mock.assert_any_call(
+            log_group_name="log-group",
+            log_stream_name="ip-10-0-0-1.i-1.slurmd",
+            start_time=start_ms,
+            end_time=end_ms,
+            start_from_head=True,
+            next_token=None,
+        )
+        assert_that(files).is_equal_to(
+            {
+                os.path.join("clustername-logs", "cloudwatch-logs", stream): (
+                    f"2021-06-02T00:00:00.000Z {stream} 0 0\n"
+                    f"2021-06-02T00:00:00.001Z {stream} 0 1\n"
+                    f"2021-06-02T00:00:01.000Z {stream} 1 0\n"
+                    f"2021-06-02T00:00:01.001Z {stream} 1 1\n"
+                )
+                for stream in ["ip-10-0-0-1.i-1.cfn-init", "ip-10-0-0-1.i-1.slurmd"]
+            }
+        )
+
+    def test_execute_error(self, mocker, tmp_path):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_streams",
+            side_effect=AWSClientError("describe_log_streams", "error"),
+        )
+        puller = CloudWatchLogsPuller(log_group_name="log-group", output_dir=str(tmp_path))
+        with pytest.raises(LogsExporterError, match="Unexpected error when retrieving log events: error"):
+            puller.execute()
+
+
+class TestS3UploadStream:
+    @pytest.fixture()
+    def uploaded_objects(self, aws_api_mock):
+        uploaded_objects = {}
+
+        def _upload_fileobj(bucket_name, file_obj, key, part_size, max_concurrency):
+            # Read the stream in parts, as the S3 transfer manager does with non-seekable streams
+            parts = []
+            part = file_obj.read(part_size)
+            while part:
+                assert_that(len(part)).is_less_than_or_equal_to(part_size)
+                parts.append(part)
+                part = file_obj.read(part_size)
+            uploaded_objects[f"s3://{bucket_name}/{key}"] = b"".join(parts)
+
+        aws_api_mock.s3.upload_fileobj.side_effect = _upload_fileobj
+        return uploaded_objects
+
+    @pytest.mark.parametrize(
+        "environ, expected_part_size, expected_concurrency",
+        [
+            ({}, 16 * 1024 * 1024, 4),
+            ({"PCLUSTER_LOGS_UPLOAD_PART_SIZE": "8", "PCLUSTER_LOGS_UPLOAD_CONCURRENCY": "2"}, 8 * 1024 * 1024, 2),
+            ({"PCLUSTER_LOGS_UPLOAD_PART_SIZE": "1", "PCLUSTER_LOGS_UPLOAD_CONCURRENCY": "x"}, 5 * 1024 * 1024, 4),
+        ],
+    )
+    def test_settings(self, set_env, unset_env, environ, expected_part_size, expected_concurrency):
+        unset_env("PCLUSTER_LOGS_UPLOAD_PART_SIZE")
+        unset_env("PCLUSTER_LOGS_UPLOAD_CONCURRENCY")
+        for key, value in environ.items():
+            set_env(key, value)
+        upload = S3UploadStream("bucket", "key")
+        assert_that(upload.part_size).is_equal_to(expected_part_size)
+        assert_that(upload.max_concurrency).is_equal_to(expected_concurrency)
+        assert_that(upload.s3_path).is_equal_to("s3://bucket/key")
+
+    def test_upload(self, aws_api_mock, uploaded_objects):
+        data = os.urandom(5 * 1024 * 1024 + 1)
+        with S3UploadStream("bucket", "prefix/key", part_size=5 * 1024 * 1024) as upload:
+            for offset in range(0, len(data), 100000):
+                upload.write(data[offset : offset + 100000])  # noqa: E203
+
+        assert_that(uploaded_objects).is_equal_to({"s3://bucket/prefix/key": data})
+        aws_api_mock.s3.upload_fileobj.assert_called_with(
+            "bucket", ANY, "prefix/key", part_size=5 * 1024 * 1024, max_concurrency=4
+        )
+
+    def test_upload_aborted(self, uploaded_objects):
+        with pytest.raises(RuntimeError, match="archive failure"):
+            with S3UploadStream("bucket", "key") as upload:
+                upload.write(b"partial content")
+                raise RuntimeError("archive failure")
+        assert_that(uploaded_objects).is_empty()
+
+    def test_upload_failure(self, aws_api_mock):
+        aws_api_mock.s3.upload_fileobj.side_effect = AWSClientError("upload_fileobj", "Access Denied")
+        with pytest.raises(LogsExporterError, match="Unable to upload archive to s3://bucket/key: Access Denied"):
+            with S3UploadStream("bucket", "key") as upload:
+                # Writes fail as soon as the pipe is closed by the failed upload
+                while True:
+                    upload.write(b"x" * 1024 * 1024)
+
+
+@pytest.mark.parametrize("output_file", [None, "output.tar.gz"])
+def test_open_logs_archive(aws_api_mock, tmp_path, output_file):
+    uploaded_objects = {}
+    aws_api_mock.s3.upload_fileobj.side_effect = lambda bucket_name, file_obj, key, **kwargs: uploaded_objects.update(
+        {key: file_obj.read()}
+    )
+    root_dir = tmp_path / "clustername-logs"
+    root_dir.mkdir()
+    (root_dir / "stack-events").write_text("events")
+    output_file = output_file and str(tmp_path / output_file)
+
+    with open_logs_archive(str(root_dir), output_file, "bucket", "prefix") as archive:
+        archive.add_stream(io.BytesIO(b"log events"), str(root_dir / "cloudwatch-logs" / "stream"))
+        archive.add_directory()
+
+    if output_file:
+        assert_that(archive.path).is_equal_to(output_file)
+        assert_that(uploaded_objects).is_empty()
+        archive_file = output_file
+    else:
+        assert_that(archive.path).is_equal_to("s3://bucket/prefix/clustername-logs.tar.gz")
+        archive_file = io.BytesIO(uploaded_objects["prefix/clustername-logs.tar.gz"])
+    with tarfile.open(archive_file) if output_file else tarfile.open(fileobj=archive_file) as tar:
+        files = {member.name: tar.extractfile(member).read() for member in tar.getmembers() if member.isfile()}
+    assert_that(files).is_equal_to(
+        {
+            os.path.join("clustername-logs", "cloudwatch-logs", "stream"): b"log events",
+            os.path.join("clustername-logs", "stack-events"): b"events",
+        }
+    )
+
+
+class TestLogEventsFollower:
+    @staticmethod
+    def _event(timestamp, message):
+        return {"timestamp": timestamp, "message": message, "ingestionTime": timestamp}
+
+    def test_follow(self, mocker):
+        mock_aws_api(mocker)
+        responses = {
+            ("head-node.cfn-init", None): {"events": [self._event(1, "init 1"), self._event(4, "init 4")]},
+            ("head-node.cfn-init", "f/init-1"): {"events": []},
+            ("head-node.cfn-init", "f/init-2"): {"events": [self._event(6, "init 6")]},
+            ("head-node.clustermgtd", None): {"events": [self._event(2, "mgtd 2")]},
+            ("head-node.clustermgtd", "f/mgtd-1"): {"events": [self._event(5, "mgtd 5")]},
+            ("head-node.clustermgtd", "f/mgtd-2"): {"events": []},
+        }
+        next_tokens = {
+            ("head-node.cfn-init", None): "f/init-1",
+            ("head-node.cfn-init", "f/init-1"): "f/init-2",
+            ("head-node.clustermgtd", None): "f/mgtd-1",
+            ("head-node.clustermgtd", "f/mgtd-1"): "f/mgtd-2",
+        }
+
+        def _get_log_events(log_group_name, log_stream_name, next_token=None, **kwargs):
+            if log_stream_name == "compute.slurmd":
+                raise AWSClientError("get_log_events", "The specified log stream does not exist.")
+            key = (log_stream_name, next_token)
+            return {**responses[key], "nextForwardToken": next_tokens.get(key, next_token)}
+
+        get_log_events_mock = mocker.patch("pcluster.aws.logs.LogsClient.get_log_events", side_effect=_get_log_events)
+        sleep_mock = mocker.patch("pcluster.models.common.time.sleep")
+
+        follower = LogEventsFollower(
+            "log-group", ["head-node.cfn-init", "head-node.clustermgtd", "compute.slurmd"], limit=5
+        )
+        events = list(itertools.islice(follower.follow(), 5))
+
+        # Events are merged by timestamp at every poll
+        assert_that([(event["logStreamName"], event["message"]) for event in events]).is_equal_to(
+            [
+                ("head-node.cfn-init", "init 1"),
+                ("head-node.clustermgtd", "mgtd 2"),
+                ("head-node.cfn-init", "init 4"),
+                ("head-node.clustermgtd", "mgtd 5"),
+                ("head-node.cfn-init", "init 6"),
+            ]
+        )
+        # The first poll returns the last events, the following ones use the forward tokens
+        get_log_events_mock.assert_any_call(
+            log_group_name="log-group",
+            log_stream_name="head-node.cfn-init",
+            start_from_head=False,
+            next_token=None,
+            limit=5,
+        )
+        get_log_events_mock.assert_any_call(
+            log_group_name="log-group",
+            log_stream_name="head-node.cfn-init",
+            start_from_head=True,
+            next_token="f/init-1",
+        )
+        assert_that(sleep_mock.call_count).is_equal_to(2)
+
+    @pytest.mark.parametrize(
+        "start_time, start_from_head, limit, expected_kwargs",
+        [
+            (None, False, None, {"start_from_head": False, "limit": 10}),
+            (None, True, None, {"start_from_head": True, "limit": None}),
+            (
+                datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc),
+                False,
+                20,
+                {"start_from_head": True, "start_time": 1622592000000, "limit": 20},
+            ),
+        ],
+    )
+    def test_first_poll(self, mocker, start_time, start_from_head, limit, expected_kwargs):
+        mock_aws_api(mocker)
+        get_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events", return_value={"events": [], "nextForwardToken": "f/1"}
+        )
+        follower = LogEventsFollower("log-group", ["stream"], start_time, start_from_head, limit)
+        assert_that(follower._poll("stream")).is_empty()
+        get_log_events_mock.assert_called_with(
+            log_group_name="log-group", log_stream_name="stream", next_token=None, **expected_kwargs
+        )
+
+    def test_adaptive_poll_interval(self, mocker):
+        mock_aws_api(mocker)
+        # Events are found at the third poll only
+        polls = iter([[], [], [self._event(1, "message")]] + [[]] * 10)
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=lambda **kwargs: {"events": next(polls), "nextForwardToken": "f/1"},
+        )
+        sleep_mock = mocker.patch("pcluster.models.common.time.sleep", side_effect=[None] * 8 + [StopIteration])
+
+        with pytest.raises(RuntimeError):
+            # StopIteration raised in a generator is turned into a RuntimeError
+            list(LogEventsFollower("log-group", ["stream"]).follow())
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([2, 4, 1, 2, 4, 8, 16, 16, 16])
+
+
+class TestLogEventsSearch:
+    start_time = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    start_ms = 1609459200000
+    minute = 60 * 1000
+
+    @staticmethod
+    def _event(event_id, timestamp):
+        return {"eventId": event_id, "timestamp": timestamp, "message": "ERROR", "logStreamName": "stream"}
+
+    def _mock_search_log_events(self, mocker, responses):
+        def _search_log_events(start_time, next_token=None, **kwargs):
+            return responses[((start_time - self.start_ms) // self.minute, next_token)]
+
+        mock_aws_api(mocker)
+        return mocker.patch("pcluster.aws.logs.LogsClient.search_log_events", side_effect=_search_log_events)
+
+    def test_search_pages(self, mocker):
+        start = self.start_ms
+        responses = {
+            (0, None): {"events": [self._event("a", start + 10)], "nextToken": "p0-1"},
+            (0, "p0-1"): {"events": [self._event("b", start + 20)]},
+            (1, None): {"events": []},
+            # Duplicated matches are returned once
+            (2, None): {"events": [self._event("c", start + 2 * self.minute + 5)] * 2},
+            (3, None): {"events": [self._event("d", start + 3 * self.minute + 1)], "nextToken": "p3-1"},
+            (3, "p3-1"): {"events": []},
+        }
+        search_log_events_mock = self._mock_search_log_events(mocker, responses)
+        search = LogEventsSearch(
+            "log-group", "ERROR", self.start_time, self.start_time + datetime.timedelta(minutes=4), "ip-10-0-0-101"
+        )
+
+        # The matches of a partition are returned once the previous partitions are completed
+        pages = [search.search()]
+        while pages[-1].next_token:
+            pages.append(search.search(pages[-1].next_token))
+        assert_that([[event["eventId"] for event in page.events] for page in pages]).is_equal_to(
+            [["a"], ["b"], ["c"], ["d"], []]
+        )
+        # Only the partitions whose matches could not be returned yet are searched again from the same position
+        assert_that(search_log_events_mock.call_count).is_equal_to(len(responses) + 2)
+        assert_that(
+            [
+                call.kwargs["start_time"]
+                for call in search_log_events_mock.call_args_list
+                if not call.kwargs["next_token"]
+            ]
+        ).is_equal_to([start + index * self.minute for index in [0, 1, 2, 3, 2, 3]])
+        search_log_events_mock.assert_any_call(
+            log_group_name="log-group",
+            filter_pattern="ERROR",
+            start_time=start + 3 * self.minute,
+            end_time=start + 4 * self.minute - 1,
+            log_stream_name_prefix="ip-10-0-0-101",
+            next_token="p3-1",
+            limit=1000,
+        )
+
+    def test_search_page_size(self, mocker):
+        start = self.start_ms
+        responses = {
+            (0, None): {"events": [self._event("a", start + 10), self._event("b", start + 20)]},
+            (1, None): {"events": [self._event("c", start + self.minute)]},
+            (2, None): {"events": [self._event("d", start + 2 * self.minute)]},
+        }
+        search_log_events_mock = self._mock_search_log_events(mocker, responses)
+        search = LogEventsSearch("log-group", "ERROR", self.start_time, self.start_time + datetime.timedelta(minutes=3))
+        search.max_page_bytes = 3 * len("ERROR")
+
+        # The pages of completed partitions are added until the page is full
+        page = search.search()
+        assert_that([event["eventId"] for event in page.events]).is_equal_to(["a", "b", "c"])
+        next_page = search.search(page.next_token)
+        assert_that([event["eventId"] for event in next_page.events]).is_equal_to(["d"])
+        assert_that(next_page.next_token).is_none()
+        assert_that(search_log_events_mock.call_count).is_equal_to(4)
+
+    def test_search_skips_empty_rounds(self, mocker):
+        start = self.start_ms
+        responses = {
+            (0, None): {"events": [], "nextToken": "p0-1"},
+            (0, "p0-1"): {"events": [self._event("b", start + 20)]},
+            (1, None): {"events": [], "nextToken": "p1-1"},
+            (1, "p1-1"): {"events": [self._event("a", start + self.minute)], "nextToken": "p1-2"},
+            (1, "p1-2"): {"events": []},
+        }
+        search_log_events_mock = self._mock_search_log_events(mocker, responses)
+        search = LogEventsSearch("log-group", "ERROR", self.start_time, self.start_time + datetime.timedelta(minutes=2))
+
+        # The rounds without matches are not returned as empty pages
+        page = search.search()
+        assert_that([event["eventId"] for event in page.events]).is_equal_to(["b", "a"])
+        assert_that(search_log_events_mock.call_count).is_equal_to(4)
+
+        # The next page resumes only the partitions not completed yet
+        search_log_events_mock.reset_mock()
+        next_page = search.search(page.next_token)
+        assert_that(next_page.events).is_empty()
+        assert_that(next_page.next_token).is_none()
+        search_log_events_mock.assert_called_once()
+        assert_that(search_log_events_mock.call_args.kwargs["next_token"]).is_equal_to("p1-2")
+
+    def test_default_window(self, mocker):
+        search_log_events_mock = self._mock_search_log_events(mocker, {(0, None): {"events": []}})
+        mocker.patch("pcluster.aws.logs.LogsClient.describe_log_group", return_value={"creationTime": self.start_ms})
+
+        search = LogEventsSearch("log-group", "ERROR", end_time=self.start_time + datetime.timedelta(seconds=30))
+        assert_that(search.search().events).is_empty()
+        search_log_events_mock.assert_called_once_with(
+            log_group_name="log-group",
+            filter_pattern="ERROR",
+            start_time=self.start_ms,
+            end_time=self.start_ms + 30 * 1000 - 1,
+            log_stream_name_prefix=None,
+            next_token=None,
+            limit=1000,
+        )
+
+    @pytest.mark.parametrize("next_token", ["invalid", "eyJ3aW5kb3ciOlsxLDBdLCJ0b2tlbnMiOltudWxsXX0="])
+    def test_invalid_next_token(self, mocker, next_token):
+        mock_aws_api(mocker)
+        with pytest.raises(BadRequest, match="The provided next token is not valid."):
+            LogEventsSearch("log-group", "ERROR").search(next_token)
+
+    def test_invalid_window(self, mocker):
+        mock_aws_api(mocker)
+        with pytest.raises(FiltersParserError, match="Start time must be earlier than end time."):
+            LogEventsSearch("log-group", "ERROR", self.start_time, self.start_time).search()
@@ -4,6 +4,7 @@ import os
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
 from pcluster.models.compute_fleet_status_manager import (
     ComputeFleetStatus,
     ComputeFleetStatusManager,
@@ -195,3 +196,53 @@ class TestComputeFleetStatusManager:
     def test_get_manager(self, version, scheduler, expected_compute_fleet_status_manager_instance):
         compute_fleet_status_manager = ComputeFleetStatusManager.get_manager("cluster-name", version, scheduler)
         assert_that(compute_fleet_status_manager).is_instance_of(expected_compute_fleet_status_manager_instance)
+
+    def test_get_statuses(self, mocker, compute_fleet_status_manager):
+        batch_get_items_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_items",
+            return_value={
+                "parallelcluster-cluster-name": [{"Id": "COMPUTE_FLEET", "Data": {"status": "RUNNING"}}],
+                "parallelcluster-legacy": [{"Id": "COMPUTE_FLEET", "Status": "STOPPED"}],
+                "parallelcluster-invalid": [{"Id": "COMPUTE_FLEET", "Status": "WRONG"}],
+            },
+        )
+        managers = [
+            compute_fleet_status_manager,
+            PlainTextComputeFleetStatusManager("legacy"),
+            PlainTextComputeFleetStatusManager("invalid"),
+            JsonComputeFleetStatusManager("missing"),
+        ]
+
+        statuses = ComputeFleetStatusManager.get_statuses(managers)
+
+        assert_that(statuses).is_equal_to(
+            [
+                ComputeFleetStatus.RUNNING,
+                ComputeFleetStatus.STOPPED,
+                ComputeFleetStatus.UNKNOWN,
+                ComputeFleetStatus.UNKNOWN,
+            ]
+        )
+        batch_get_items_mock.assert_called_once_with(
+            [
+                ("parallelcluster-cluster-name", {"Id": "COMPUTE_FLEET"}),
+                ("parallelcluster-legacy", {"Id": "COMPUTE_FLEET"}),
+                ("parallelcluster-invalid", {"Id": "COMPUTE_FLEET"}),
+                ("parallelcluster-missing", {"Id": "COMPUTE_FLEET"}),
+            ]
+        )
+
+    def test_get_statuses_fallback(self, mocker, compute_fleet_status_manager):
+        mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_items",
+            side_effect=AWSClientError("batch_get_item", "Requested resource not found", "ResourceNotFoundException"),
+        )
+        get_item_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.get_item",
+            return_value={"Item": {"Id": "COMPUTE_FLEET", "Data": {"status": "STOPPING"}}},
+        )
+
+        statuses = ComputeFleetStatusManager.get_statuses([compute_fleet_status_manager])
+
+        assert_that(statuses).is_equal_to([ComputeFleetStatus.STOPPING])
+        get_item_mock.assert_called_once_with("parallelcluster-cluster-name", {"Id": "COMPUTE_FLEET"})
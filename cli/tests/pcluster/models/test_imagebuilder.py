@@ -484,8 +484,7 @@ class TestImageBuilder:
         )
         mocker.patch("pcluster.aws.logs.LogsClient.log_group_exists", return_value=log_group_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.imagebuilder.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.imagebuilder.upload_archive")
+        logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.open_logs_archive")
         presign_mock = mocker.patch("pcluster.models.imagebuilder.create_s3_presigned_url")
 
         # Following mocks are used only if CW loggins is enabled
@@ -513,11 +512,11 @@ class TestImageBuilder:
             else:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
-            create_logs_archive_mock.assert_called()
+            logs_archive_mock.return_value.__enter__.return_value.add_directory.assert_called()
 
         if "output_file" not in kwargs:
-            upload_archive_mock.assert_called()
-            presign_mock.assert_called()
+            # The archive is streamed to S3 while being created
+            presign_mock.assert_called_with(logs_archive_mock.return_value.__enter__.return_value.path)
 
     @pytest.mark.parametrize(
         "log_group_exists, client_error, expected_error",
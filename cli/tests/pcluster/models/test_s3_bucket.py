@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
 import textwrap
 
@@ -15,7 +16,14 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
-from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType, format_content
+from pcluster.models import s3_bucket
+from pcluster.models.s3_bucket import (
+    CONTENT_HASH_METADATA_KEY,
+    S3Bucket,
+    S3FileFormat,
+    S3FileType,
+    format_content,
+)
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket
 
@@ -292,6 +300,7 @@ def test_upload_file(mocker, content, file_name, file_type, s3_file_format, expe
     bucket_name = "test-bucket"
     artifact_directory = "pcluster_artifact_directory"
     bucket = dummy_cluster_bucket(bucket_name=bucket_name, artifact_directory=artifact_directory)
+    mocker.patch("pcluster.aws.s3.S3Client.head_object", side_effect=AWSClientError("head_object", "Not Found", 404))
     s3_put_object_patch = mocker.patch("pcluster.aws.s3.S3Client.put_object")
 
     bucket.upload_file(content, file_name, file_type, s3_file_format)
@@ -300,4 +309,63 @@ def test_upload_file(mocker, content, file_name, file_type, s3_file_format, expe
         bucket_name=bucket_name,
         body=expected_object_body,
         key=f"{artifact_directory}/{expected_object_key}",
+        metadata={CONTENT_HASH_METADATA_KEY: hashlib.sha256(expected_object_body.encode("utf-8")).hexdigest()},
+    )
+
+
+@pytest.mark.parametrize(
+    "stored_digest, expect_upload",
+    [
+        pytest.param(hashlib.sha256(b"Test: Content\n").hexdigest(), False, id="unchanged content"),
+        pytest.param("stale-digest", True, id="changed content"),
+    ],
+)
+def test_upload_file_skips_unchanged_content(mocker, stored_digest, expect_upload):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object",
+        return_value={
+            "ETag": "etag",
+            "VersionId": "stored-version",
+            "Metadata": {CONTENT_HASH_METADATA_KEY: stored_digest},
+        },
+    )
+    s3_put_object_patch = mocker.patch(
+        "pcluster.aws.s3.S3Client.put_object", return_value={"ETag": "etag", "VersionId": "new-version"}
+    )
+
+    result = bucket.upload_file({"Test": "Content"}, "test_file_name", S3FileType.ASSETS, S3FileFormat.YAML)
+
+    assert_that(s3_put_object_patch.called).is_equal_to(expect_upload)
+    assert_that(result["VersionId"]).is_equal_to("new-version" if expect_upload else "stored-version")
+
+
+def test_upload_resources(mocker, tmpdir):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+
+    resource_dir = tmpdir.mkdir("resources")
+    resource_dir.mkdir("custom_resource").join("handler.py").write("print('hello')")
+    resource_dir.join("script.sh").write("echo hello")
+
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    put_object_if_changed_patch = mocker.patch("pcluster.models.s3_bucket.S3Bucket._put_object_if_changed")
+    zip_dir_spy = mocker.spy(s3_bucket, "zip_dir")
+
+    for _ in range(2):
+        bucket.upload_resources(str(resource_dir), "custom_resources", cache_archives=True)
+
+    uploaded_keys = sorted(call.args[1] for call in put_object_if_changed_patch.call_args_list)
+    assert_that(uploaded_keys).is_equal_to(
+        [
+            "pcluster_artifact_directory/custom_resources/custom_resources",
+            "pcluster_artifact_directory/custom_resources/custom_resources",
+            "pcluster_artifact_directory/custom_resources/script.sh",
+            "pcluster_artifact_directory/custom_resources/script.sh",
+        ]
     )
+    # The archive of the directory is built once and reused for the second upload
+    assert_that(zip_dir_spy.call_count).is_equal_to(1)
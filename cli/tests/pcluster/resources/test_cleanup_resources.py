@@ -0,0 +1,207 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib
+import json
+import os
+import sys
+
+import pytest
+from assertpy import assert_that
+
+import pcluster
+
+CUSTOM_RESOURCES_CODE_DIR = os.path.join(
+    os.path.dirname(pcluster.__file__), "resources", "custom_resources", "custom_resources_code"
+)
+FUNCTION_TIMEOUT = 900  # seconds
+START_TIME = 1000000.0
+
+
+class _FakeClock:
+    """Clock advanced only by sleep, so that the clean-up deadlines are reached without waiting."""
+
+    def __init__(self):
+        self.now = START_TIME
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _FakeLambdaContext:
+    invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:cleanup"
+    aws_request_id = "request-id"
+
+    def __init__(self, clock):
+        self._clock = clock
+
+    def get_remaining_time_in_millis(self):
+        return int((START_TIME + FUNCTION_TIMEOUT - self._clock.now) * 1000)
+
+
+@pytest.fixture()
+def cleanup_resources(mocker, set_env):
+    # The region is required by the CfnResource created when the module is imported
+    set_env("AWS_REGION", "us-east-1")
+    mocker.patch.object(sys, "path", [CUSTOM_RESOURCES_CODE_DIR, *sys.path])
+    return importlib.import_module("cleanup_resources")
+
+
+@pytest.fixture()
+def clock(mocker, cleanup_resources):
+    clock = _FakeClock()
+    mocker.patch.object(cleanup_resources, "time", clock)
+    return clock
+
+
+@pytest.fixture()
+def boto3_clients(mocker, cleanup_resources):
+    clients = {"ec2": mocker.MagicMock(), "lambda": mocker.MagicMock()}
+    mocker.patch.object(cleanup_resources.boto3, "client", side_effect=lambda service, **_: clients[service])
+    return clients
+
+
+def _mock_cluster_instances(ec2, instance_states_per_call):
+    """Return the given instance states at every call of DescribeInstances, the last ones for the following calls."""
+    pages = [
+        [{"Reservations": [{"Instances": [{"InstanceId": id, "State": {"Name": state}} for id, state in states]}]}]
+        for states in instance_states_per_call
+    ]
+    ec2.get_paginator.return_value.paginate.side_effect = lambda **_: pages.pop(0) if len(pages) > 1 else pages[0]
+
+
+def _event(**kwargs):
+    return {
+        "RequestType": "Delete",
+        "ResponseURL": "https://cloudformation-response",
+        "StackId": "arn:aws:cloudformation:us-east-1:123456789012:stack/clustername/123",
+        "RequestId": "request-id",
+        "LogicalResourceId": "TerminateComputeFleetCustomResource",
+        "PhysicalResourceId": "physical-id",
+        "ResourceProperties": {"Action": "TERMINATE_EC2_INSTANCES", "StackName": "clustername"},
+        **kwargs,
+    }
+
+
+def _run_handler(mocker, cleanup_resources, clock, event):
+    send_mock = mocker.patch.object(cleanup_resources.helper, "_send")
+    cleanup_resources.handler(event, _FakeLambdaContext(clock))
+    return send_mock
+
+
+def test_cleanup_completed(mocker, cleanup_resources, clock, boto3_clients):
+    ec2 = boto3_clients["ec2"]
+    _mock_cluster_instances(ec2, [[("i-1", "running"), ("i-2", "shutting-down")], []])
+    ec2.describe_instance_status.return_value = {
+        "InstanceStatuses": [
+            {"InstanceId": "i-1", "InstanceState": {"Name": "terminated"}},
+            {"InstanceId": "i-2", "InstanceState": {"Name": "terminated"}},
+        ]
+    }
+
+    send_mock = _run_handler(mocker, cleanup_resources, clock, _event())
+
+    ec2.terminate_instances.assert_called_once_with(InstanceIds=["i-1"])
+    assert_that(ec2.describe_instance_status.call_args.kwargs["InstanceIds"]).contains_only("i-1", "i-2")
+    boto3_clients["lambda"].invoke.assert_not_called()
+    # The response is sent to CloudFormation after waiting for the placement groups to be updated
+    send_mock.assert_called_once_with()
+    assert_that(cleanup_resources.helper.Status).is_equal_to("SUCCESS")
+    assert_that(clock.sleeps).is_equal_to([cleanup_resources.POLL_INITIAL_INTERVAL, 30])
+
+
+def test_cleanup_describe_instance_status_fallback(mocker, cleanup_resources, clock, boto3_clients):
+    ec2 = boto3_clients["ec2"]
+    # Listed for the termination, for the fallback of the first poll, for the second poll and after the termination
+    _mock_cluster_instances(
+        ec2, [[("i-1", "running")], [("i-1", "shutting-down"), ("i-3", "running")], [("i-3", "running")], []]
+    )
+    ec2.describe_instance_status.side_effect = Exception("Not authorized to perform ec2:DescribeInstanceStatus")
+
+    send_mock = _run_handler(mocker, cleanup_resources, clock, _event())
+
+    ec2.terminate_instances.assert_called_once_with(InstanceIds=["i-1"])
+    # Only the terminated instances are waited for, not the other ones listed in the fallback
+    assert_that(ec2.describe_instance_status.call_count).is_equal_to(2)
+    assert_that(clock.sleeps).is_equal_to([2, 4, 30])
+    send_mock.assert_called_once_with()
+    assert_that(cleanup_resources.helper.Status).is_equal_to("SUCCESS")
+
+
+def test_cleanup_handed_off(mocker, cleanup_resources, clock, boto3_clients):
+    ec2 = boto3_clients["ec2"]
+    _mock_cluster_instances(ec2, [[("i-1", "running")], [("i-1", "shutting-down")]])
+    ec2.describe_instance_status.return_value = {
+        "InstanceStatuses": [{"InstanceId": "i-1", "InstanceState": {"Name": "shutting-down"}}]
+    }
+    invocation_times = []
+    boto3_clients["lambda"].invoke.side_effect = lambda **_: invocation_times.append(clock.now)
+
+    send_mock = _run_handler(mocker, cleanup_resources, clock, _event())
+
+    # The work is handed off before the function times out, leaving the margin for the hand-off
+    handoff_deadline = START_TIME + FUNCTION_TIMEOUT - cleanup_resources.HANDOFF_TIME_MARGIN
+    assert_that(invocation_times).is_length(1)
+    assert_that(invocation_times[0]).is_less_than_or_equal_to(handoff_deadline)
+    assert_that(invocation_times[0] + cleanup_resources.POLL_MAX_INTERVAL).is_greater_than_or_equal_to(handoff_deadline)
+    invoke_kwargs = boto3_clients["lambda"].invoke.call_args.kwargs
+    assert_that(invoke_kwargs["FunctionName"]).is_equal_to(_FakeLambdaContext.invoked_function_arn)
+    assert_that(invoke_kwargs["InvocationType"]).is_equal_to("Event")
+    payload = json.loads(invoke_kwargs["Payload"])
+    assert_that(payload[cleanup_resources.INVOCATION_KEY]).is_equal_to(2)
+    assert_that(payload).does_not_contain_key(cleanup_resources.HANDED_OFF_KEY)
+    assert_that(payload["ResourceProperties"]).is_equal_to(_event()["ResourceProperties"])
+    # The new invocation replies to CloudFormation
+    send_mock.assert_not_called()
+
+
+def test_cleanup_not_handed_off(mocker, cleanup_resources, clock, boto3_clients):
+    ec2 = boto3_clients["ec2"]
+    _mock_cluster_instances(ec2, [[("i-1", "running")], [("i-1", "shutting-down")], []])
+    ec2.describe_instance_status.return_value = {
+        "InstanceStatuses": [{"InstanceId": "i-1", "InstanceState": {"Name": "shutting-down"}}]
+    }
+    boto3_clients["lambda"].invoke.side_effect = Exception("Not authorized to perform lambda:InvokeFunction")
+
+    send_mock = _run_handler(mocker, cleanup_resources, clock, _event())
+
+    # The clean-up goes on in the same invocation when the function cannot be invoked
+    boto3_clients["lambda"].invoke.assert_called_once()
+    send_mock.assert_called_once_with()
+    assert_that(cleanup_resources.helper.Status).is_equal_to("SUCCESS")
+
+
+def test_cleanup_max_invocations(mocker, cleanup_resources, clock, boto3_clients):
+    ec2 = boto3_clients["ec2"]
+    _mock_cluster_instances(ec2, [[("i-1", "running")], [("i-1", "shutting-down")]])
+    ec2.describe_instance_status.return_value = {
+        "InstanceStatuses": [{"InstanceId": "i-1", "InstanceState": {"Name": "shutting-down"}}]
+    }
+
+    event = _event(**{cleanup_resources.INVOCATION_KEY: cleanup_resources.MAX_INVOCATIONS})
+    send_mock = _run_handler(mocker, cleanup_resources, clock, event)
+
+    boto3_clients["lambda"].invoke.assert_not_called()
+    send_mock.assert_called_once_with()
+    assert_that(cleanup_resources.helper.Status).is_equal_to("FAILED")
+    assert_that(cleanup_resources.helper.Reason).contains(f"after {cleanup_resources.MAX_INVOCATIONS} invocations")
+
+
+def test_cleanup_resource_response_override(mocker, cleanup_resources):
+    # The response is skipped by overriding a private method of the vendored crhelper
+    assert_that(cleanup_resources.CleanupResource.can_skip_response()).is_true()
+    mocker.patch.object(cleanup_resources.CfnResource, "_cfn_response", None)
+    assert_that(cleanup_resources.CleanupResource.can_skip_response()).is_false()
+    assert_that(cleanup_resources._hand_off(_event(), _FakeLambdaContext(_FakeClock()))).is_false()
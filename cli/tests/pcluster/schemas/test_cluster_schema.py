@@ -24,6 +24,7 @@ from pcluster.aws.common import AWSClientError
 from pcluster.constants import NODE_BOOTSTRAP_TIMEOUT, SUPPORTED_OSES
 from pcluster.schemas.cluster_schema import (
     ClusterSchema,
+    ComputeFleetDeploymentSchema,
     HeadNodeCustomActionsSchema,
     HeadNodeIamSchema,
     HeadNodeRootVolumeSchema,
@@ -1196,6 +1197,33 @@ def test_timeouts_schema(head_node_bootstrap_timeout, compute_node_bootstrap_tim
         )
 
 
+@pytest.mark.parametrize(
+    "wave_size, max_concurrent_waves, failure_message",
+    [
+        (None, None, None),
+        (40, 2, None),
+        (150, 10, None),
+        (39, None, "Must be greater than or equal to 40 and less than or equal to 150."),
+        (151, None, "Must be greater than or equal to 40 and less than or equal to 150."),
+        (None, 0, "Must be greater than or equal to 1."),
+    ],
+)
+def test_compute_fleet_deployment_schema(wave_size, max_concurrent_waves, failure_message):
+    compute_fleet_deployment_schema = {}
+    if wave_size:
+        compute_fleet_deployment_schema["WaveSize"] = wave_size
+    if max_concurrent_waves is not None:
+        compute_fleet_deployment_schema["MaxConcurrentWaves"] = max_concurrent_waves
+
+    if failure_message:
+        with pytest.raises(ValidationError, match=failure_message):
+            ComputeFleetDeploymentSchema().load(compute_fleet_deployment_schema)
+    else:
+        compute_fleet_deployment = ComputeFleetDeploymentSchema().load(compute_fleet_deployment_schema)
+        assert_that(compute_fleet_deployment.wave_size).is_equal_to(wave_size or 150)
+        assert_that(compute_fleet_deployment.max_concurrent_waves).is_equal_to(max_concurrent_waves or 1)
+
+
 @pytest.mark.parametrize(
     "config_dict, failure_message, expected_queue_gpu_hc, expected_cr1_gpu_hc, expected_cr2_gpu_hc",
     [
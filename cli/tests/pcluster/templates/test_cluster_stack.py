@@ -37,6 +37,7 @@ from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_buc
 from tests.pcluster.utils import (
     assert_lambdas_have_expected_vpc_config_and_managed_policy,
     get_asset_content_with_resource_name,
+    get_resources,
     load_cluster_model_from_yaml,
 )
 
@@ -890,3 +891,52 @@ def test_cluster_resource_distribution_in_stacks(
     else:
         cluster_template, assets = _generate_template(cluster, capsys)
         assert_that(expected_no_of_nested_stacks).is_equal_to(len(assets))
+
+
+@pytest.mark.parametrize(
+    "max_concurrent_deployment_waves, expected_dependencies",
+    [
+        (1, {0: [], 1: [0], 2: [1]}),
+        (2, {0: [], 1: [], 2: [0]}),
+        (3, {0: [], 1: [], 2: []}),
+    ],
+)
+def test_compute_fleet_deployment_waves(
+    test_datadir,
+    pcluster_config_reader,
+    capsys,
+    mocker,
+    max_concurrent_deployment_waves,
+    expected_dependencies,
+):
+    mock_aws_api(mocker)
+    mock_bucket_object_utils(mocker)
+    # Every queue is deployed in its own wave, since two queues exceed the wave size
+    rendered_config_file = pcluster_config_reader(
+        "variable_queue_compute_resources.yaml",
+        no_of_compute_resources_per_queue={f"queue-{i}": 21 for i in range(3)},
+        wave_size=40,
+        max_concurrent_waves=max_concurrent_deployment_waves,
+    )
+    _, cluster = load_cluster_model_from_yaml(rendered_config_file, test_datadir)
+
+    cluster_template, assets = _generate_template(cluster, capsys)
+    assert_that(assets).is_length(3)
+    # Each wave only deploys the compute resources of its own queues
+    for asset in assets:
+        launch_templates = get_resources(asset, type="AWS::EC2::LaunchTemplate")
+        assert_that(launch_templates).is_length(21)
+
+    wave_stacks = {}
+    for resource_name, resource in cluster_template["Resources"].items():
+        match = re.match(r"ComputeFleetQueueBatch(\d+)QueueGroup0NestedStack", resource_name)
+        if match and resource["Type"] == "AWS::CloudFormation::Stack":
+            wave_stacks[int(match.group(1))] = (resource_name, resource)
+    assert_that(wave_stacks).is_length(3)
+    for wave, (_, resource) in wave_stacks.items():
+        dependencies = [
+            dependency_wave
+            for dependency_wave, (dependency_name, _) in wave_stacks.items()
+            if dependency_name in resource.get("DependsOn", [])
+        ]
+        assert_that(dependencies).is_equal_to(expected_dependencies[wave])
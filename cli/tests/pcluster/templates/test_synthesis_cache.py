@@ -0,0 +1,304 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+import datetime
+import io
+import json
+import os
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import AWSClientError
+from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.queue_group_stack import QueueGroupStack
+from pcluster.templates.synthesis_cache import CDKSynthesisCache, QueueGroupTemplateStore
+from pcluster.utils import load_yaml_dict
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket, mock_bucket_object_utils
+from tests.pcluster.utils import load_cluster_model_from_yaml
+
+
+@pytest.fixture()
+def persistent_cache(mocker, set_env, unset_env, tmp_path):
+    unset_env("PCLUSTER_CACHE_DISABLED")
+    unset_env("PCLUSTER_CDK_CACHE_S3_URI")
+    set_env("PCLUSTER_PERSISTENT_CACHE", "true")
+    set_env("PCLUSTER_CACHE_DIR", str(tmp_path))
+    mocker.patch("pcluster.aws.persistent_cache.PersistentCache.scope", return_value="123456789012/us-east-1")
+    return tmp_path
+
+
+CONFIG_VERSION = "8N4hbTuHJ4Lg8Tl2bWVRYQ7Rc4v4iNe0"
+ORIGINAL_CONFIG_VERSION = "tVtUlD7t2mFh0yjKlkKe.2Uy2CuvNMrN"
+
+
+def _load_uploaded_cluster(config_file_name="slurm.required.yaml"):
+    _, cluster = load_cluster_model_from_yaml(config_file_name)
+    cluster.config_version = CONFIG_VERSION
+    cluster.original_config_version = ORIGINAL_CONFIG_VERSION
+    return cluster
+
+
+def test_compute_key(mocker):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    cluster = _load_uploaded_cluster()
+    bucket = dummy_cluster_bucket()
+
+    key = CDKSynthesisCache.compute_key(cluster, bucket, "clustername")
+    assert_that(key).is_equal_to(CDKSynthesisCache.compute_key(cluster, bucket, "clustername"))
+    assert_that(key).is_not_equal_to(CDKSynthesisCache.compute_key(cluster, bucket, "othername"))
+    assert_that(key).is_not_equal_to(CDKSynthesisCache.compute_key(cluster, bucket, "clustername", "log-group"))
+
+    # The values that change at every upload of the configuration are not part of the key
+    cluster.config_version = "dhSqJ2lLjsQ0Mb0GHg2yPvcPUPyVx6Nz"
+    other_bucket = dummy_cluster_bucket(artifact_directory="parallelcluster/clusters/dummy-cluster-otherstring456")
+    assert_that(CDKSynthesisCache.compute_key(cluster, other_bucket, "clustername")).is_equal_to(key)
+
+    # The values retrieved from AWS are part of the key
+    cluster.managed_compute_security_group = "sg-12345678"
+    assert_that(CDKSynthesisCache.compute_key(cluster, bucket, "clustername")).is_not_equal_to(key)
+    cluster.managed_compute_security_group = None
+    mocker.patch.object(cluster, "get_instance_types_data", return_value={"t2.micro": {"VCpuInfo": {}}})
+    assert_that(CDKSynthesisCache.compute_key(cluster, bucket, "clustername")).is_not_equal_to(key)
+
+    # The cache is skipped when an input cannot be pinned down
+    mocker.patch.object(cluster, "get_instance_types_data", return_value={"t2.micro": object()})
+    assert_that(CDKSynthesisCache.compute_key(cluster, bucket, "clustername")).is_none()
+    cluster.source_config = None
+    assert_that(CDKSynthesisCache.compute_key(cluster, bucket, "clustername")).is_none()
+    assert_that(
+        CDKSynthesisCache.compute_key(_load_uploaded_cluster("awsbatch.simple.yaml"), bucket, "clustername")
+    ).is_none()
+
+
+@pytest.mark.parametrize(
+    "config_version, original_config_version, artifact_directory, expected_variables",
+    [
+        pytest.param(
+            CONFIG_VERSION,
+            ORIGINAL_CONFIG_VERSION,
+            "parallelcluster/clusters/dummy-cluster-randomstring123",
+            {
+                "artifactDirectory": "parallelcluster/clusters/dummy-cluster-randomstring123",
+                "configVersion": CONFIG_VERSION,
+                "originalConfigVersion": ORIGINAL_CONFIG_VERSION,
+                "timestamp": "20230101123456",
+                "logGroupTimestamp": "202301011234",
+            },
+            id="all variables",
+        ),
+        pytest.param(None, ORIGINAL_CONFIG_VERSION, "parallelcluster/clusters/dummy", None, id="not uploaded"),
+        pytest.param("null", "null", "parallelcluster/clusters/dummy", None, id="versioning disabled"),
+        pytest.param(CONFIG_VERSION, CONFIG_VERSION, "parallelcluster/clusters/dummy", None, id="ambiguous"),
+    ],
+)
+def test_get_variables(config_version, original_config_version, artifact_directory, expected_variables):
+    cluster = type("DummyClusterConfig", (), {})()
+    cluster.config_version = config_version
+    cluster.original_config_version = original_config_version
+    bucket = dummy_cluster_bucket(artifact_directory=artifact_directory)
+
+    variables = CDKSynthesisCache.get_variables(cluster, bucket, "20230101123456")
+    assert_that(variables).is_equal_to(expected_variables)
+    if variables:
+        # The log group of a cluster update is preserved
+        variables = CDKSynthesisCache.get_variables(cluster, bucket, "20230101123456", "/aws/parallelcluster/log")
+        assert_that(variables).does_not_contain_key("logGroupTimestamp")
+
+
+def test_normalize_and_restore():
+    variables = {
+        "artifactDirectory": "parallelcluster/clusters/dummy-cluster-randomstring123",
+        "timestamp": "20230101123456",
+        "logGroupTimestamp": "202301011234",
+    }
+    entry = {
+        "template": {
+            "ArtifactDirectory": "parallelcluster/clusters/dummy-cluster-randomstring123/configs",
+            "WaitCondition": "HeadNodeWaitCondition20230101123456",
+            "LogGroup": "/aws/parallelcluster/clustername-202301011234",
+        },
+        "assets": [],
+    }
+    normalized_entry = CDKSynthesisCache.normalize(entry, variables)
+    assert_that(json.dumps(normalized_entry)).does_not_contain(*variables.values())
+
+    new_variables = {
+        "artifactDirectory": "parallelcluster/clusters/dummy-cluster-otherstring456",
+        "timestamp": "20230202101010",
+        "logGroupTimestamp": "202302021010",
+    }
+    assert_that(CDKSynthesisCache.restore(normalized_entry, new_variables)).is_equal_to(
+        {
+            "template": {
+                "ArtifactDirectory": "parallelcluster/clusters/dummy-cluster-otherstring456/configs",
+                "WaitCondition": "HeadNodeWaitCondition20230202101010",
+                "LogGroup": "/aws/parallelcluster/clustername-202302021010",
+            },
+            "assets": [],
+        }
+    )
+    # Entries with unknown placeholders are not restored and entries with placeholders are not stored
+    assert_that(CDKSynthesisCache.restore(normalized_entry, {"timestamp": "20230202101010"})).is_none()
+    assert_that(CDKSynthesisCache.normalize(normalized_entry, variables)).is_none()
+
+
+def test_build_cluster_template_reuses_synthesis(mocker, persistent_cache):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    upload_cfn_asset_mock = mock_bucket_object_utils(mocker).get("upload_cfn_asset")
+    utcnow_mock = mocker.patch("pcluster.templates.cdk_builder.datetime").utcnow
+    utcnow_mock.return_value = datetime.datetime(2023, 1, 1, 12, 34, 56)
+    cluster = _load_uploaded_cluster()
+
+    template, assets_metadata = CDKTemplateBuilder().build_cluster_template(
+        cluster_config=cluster, bucket=dummy_cluster_bucket(), stack_name="clustername"
+    )
+    # The index of the queue group templates is uploaded along with the assets
+    assert_that(upload_cfn_asset_mock.call_count).is_equal_to(len(assets_metadata) + 1)
+    upload_cfn_asset_mock.reset_mock()
+
+    # The second build must not synthesize the stack again, but still upload the assets
+    mocker.patch("aws_cdk.core.App", side_effect=AssertionError("CDK synthesis not expected"))
+    cached_template, cached_assets_metadata = CDKTemplateBuilder().build_cluster_template(
+        cluster_config=cluster, bucket=dummy_cluster_bucket(), stack_name="clustername"
+    )
+    assert_that(cached_template["Parameters"]).is_equal_to(template["Parameters"])
+    assert_that(cached_assets_metadata).is_equal_to(assets_metadata)
+    assert_that(upload_cfn_asset_mock.call_count).is_equal_to(len(assets_metadata))
+
+    # The values that change at every upload of the configuration are replaced in the reused template
+    utcnow_mock.return_value = datetime.datetime(2023, 1, 2, 10, 20, 30)
+    cluster.config_version = "dhSqJ2lLjsQ0Mb0GHg2yPvcPUPyVx6Nz"
+    cluster.original_config_version = "Ax7w1R0Gm8uYmGzH1nXcTQp2tB1cXq9w"
+    other_bucket = dummy_cluster_bucket(artifact_directory="parallelcluster/clusters/dummy-cluster-otherstring456")
+    cached_template, _ = CDKTemplateBuilder().build_cluster_template(
+        cluster_config=cluster, bucket=other_bucket, stack_name="clustername"
+    )
+    parameters = cached_template["Parameters"]
+    assert_that(parameters["ArtifactS3RootDirectory"]["Default"]).is_equal_to(other_bucket.artifact_directory)
+    assert_that(parameters["ConfigVersion"]["Default"]).is_equal_to(cluster.original_config_version)
+    assert_that(parameters["ClusterCWLogGroup"]["Default"]).is_equal_to("/aws/parallelcluster/clustername-202301021020")
+    assert_that(json.dumps(cached_template)).does_not_contain(
+        CONFIG_VERSION, ORIGINAL_CONFIG_VERSION, dummy_cluster_bucket().artifact_directory
+    )
+
+
+def test_s3_store(aws_api_mock, set_env, unset_env):
+    unset_env("PCLUSTER_PERSISTENT_CACHE")
+    unset_env("PCLUSTER_CACHE_DISABLED")
+    set_env("PCLUSTER_CDK_CACHE_S3_URI", "s3://cache-bucket/ci/")
+    assert_that(CDKSynthesisCache.is_enabled()).is_true()
+
+    entry = {"template": {"Resources": {}}, "assets": []}
+    CDKSynthesisCache.put("abc", entry)
+    aws_api_mock.s3.put_object.assert_called_with("cache-bucket", json.dumps(entry), "ci/cdk-synthesis-v1/abc.json")
+
+    aws_api_mock.s3.get_object.return_value = {"Body": io.BytesIO(json.dumps(entry).encode())}
+    assert_that(CDKSynthesisCache.get("abc")).is_equal_to(entry)
+    aws_api_mock.s3.get_object.assert_called_with("cache-bucket", "ci/cdk-synthesis-v1/abc.json")
+
+    aws_api_mock.s3.get_object.side_effect = AWSClientError("get_object", "Not found", "NoSuchKey")
+    assert_that(CDKSynthesisCache.get("abc")).is_none()
+
+    set_env("PCLUSTER_CACHE_DISABLED", "true")
+    assert_that(CDKSynthesisCache.is_enabled()).is_false()
+
+
+def _load_cluster_with_queues(queues_instance_types):
+    config = load_yaml_dict(os.path.join(os.path.dirname(__file__), "..", "example_configs", "slurm.required.yaml"))
+    queue = config["Scheduling"]["SlurmQueues"][0]
+    config["Scheduling"]["SlurmQueues"] = [
+        {
+            **copy.deepcopy(queue),
+            "Name": f"queue{queue_index}",
+            "ComputeResources": [
+                {"Name": f"compute-resource{index}", "InstanceType": instance_type} for index in range(15)
+            ],
+        }
+        for queue_index, instance_type in enumerate(queues_instance_types)
+    ]
+    return ClusterSchema(cluster_name="clustername").load(config)
+
+
+def test_build_cluster_template_reuses_queue_group_templates(mocker, set_env):
+    set_env("PCLUSTER_CACHE_DISABLED", "true")
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket_objects = {}
+
+    def _get_cfn_asset(asset_name, **_):
+        if asset_name not in bucket_objects:
+            raise AWSClientError("get_object", "The specified key does not exist.")
+        return copy.deepcopy(bucket_objects[asset_name])
+
+    mock_bucket_object_utils(
+        mocker,
+        upload_asset_side_effect=lambda asset_file_content, asset_name, **_: bucket_objects.update(
+            {asset_name: asset_file_content}
+        ),
+        get_asset_side_effect=_get_cfn_asset,
+    )
+    launch_template_spy = mocker.spy(QueueGroupStack, "_add_compute_resource_launch_template")
+
+    def _build_cluster_template(queues_instance_types):
+        launch_template_spy.reset_mock()
+        CDKTemplateBuilder().build_cluster_template(
+            cluster_config=_load_cluster_with_queues(queues_instance_types),
+            bucket=dummy_cluster_bucket(),
+            stack_name="clustername",
+            # The log group of a cluster update is preserved, otherwise a new name is generated every minute
+            log_group_name="/aws/parallelcluster/clustername-202301011234",
+        )
+        return bucket_objects[QueueGroupTemplateStore.INDEX_NAME]["queueGroups"]
+
+    # Queues 0 and 1 share the first queue group, queue 2 is in the second one
+    index = _build_cluster_template(["c5.2xlarge", "c5.2xlarge", "c5.2xlarge"])
+    assert_that(index).is_length(2)
+    assert_that(launch_template_spy.call_count).is_equal_to(45)
+    stored_templates = {entry["assetId"]: bucket_objects[entry["assetId"]] for entry in index.values()}
+
+    # Only the first launch template of each reused queue group is synthesized
+    assert_that(_build_cluster_template(["c5.2xlarge", "c5.2xlarge", "c5.2xlarge"])).is_equal_to(index)
+    assert_that(launch_template_spy.call_count).is_equal_to(2)
+    for asset_id, template in stored_templates.items():
+        assert_that(bucket_objects[asset_id]).is_equal_to(template)
+
+    # The queue group with a changed queue is synthesized again
+    updated_index = _build_cluster_template(["c5.2xlarge", "c5.2xlarge", "c5.xlarge"])
+    assert_that(launch_template_spy.call_count).is_equal_to(16)
+    updated_asset_ids = [entry["assetId"] for entry in updated_index.values()]
+    assert_that(updated_asset_ids).is_length(2)
+    assert_that(set(updated_asset_ids) & set(stored_templates)).is_length(1)
+
+
+def test_queue_group_template_store_compute_key(mocker):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    cluster = _load_cluster_with_queues(["c5.2xlarge", "c5.xlarge"])
+    store = QueueGroupTemplateStore(cluster, dummy_cluster_bucket(), "clustername")
+    queues = cluster.scheduling.queues
+
+    key = store.compute_key("clustername/QueueGroup0", queues[:1], "log-group")
+    assert_that(key).is_equal_to(store.compute_key("clustername/QueueGroup0", queues[:1], "log-group"))
+    assert_that(key).is_not_equal_to(store.compute_key("clustername/QueueGroup0", queues[1:], "log-group"))
+    assert_that(key).is_not_equal_to(store.compute_key("clustername/QueueGroup1", queues[:1], "log-group"))
+
+    # The queue groups whose inputs cannot be hashed deterministically are neither reused nor indexed
+    for log_group_name in [object(), "${Token[TOKEN.123]}"]:
+        assert_that(store.compute_key("clustername/QueueGroup0", queues[:1], log_group_name)).is_none()
+    assert_that(store.lookup(None)).is_none()
+    store.register("QueueGroup0.template.json", None)
+    assert_that(store.apply([{"path": "QueueGroup0.template.json", "id": "asset", "content": {}}])).is_length(1)
+    assert_that(store._new_index).is_empty()
@@ -147,7 +147,8 @@ class TestCache:
             assert_that(self._cached_method_1(1, arg2=2)).is_equal_to((1, 2))
             assert_that(self._cached_method_1(arg1=1, arg2=2)).is_equal_to((1, 2))
 
-        assert_that(self.invocations).is_length(5)
+        # Calls passing the same arguments positionally or by keyword share the cached result
+        assert_that(self.invocations).is_length(3)
 
     def test_disabled_cache(self, disabled_cache):
         assert_that(self._cached_method_1(1, 2)).is_equal_to((1, 2))
@@ -21,10 +21,12 @@ from pcluster.config.cluster_config import (
     BaseQueue,
     CapacityReservationTarget,
     Database,
+    FlexibleInstanceType,
     RootVolume,
     SchedulerPluginQueueNetworking,
     SharedEbs,
     SlurmComputeResource,
+    SlurmFlexibleComputeResource,
     SlurmQueue,
     SlurmQueueNetworking,
     SlurmScheduling,
@@ -37,6 +39,7 @@ from pcluster.validators.cluster_validators import (
     FSX_SUPPORTED_ARCHITECTURES_OSES,
     ArchitectureOsValidator,
     ClusterNameValidator,
+    ComputeResourceLaunchTemplateValidator,
     ComputeResourceSizeValidator,
     DcvValidator,
     DeletionPolicyValidator,
@@ -1578,6 +1581,82 @@ def test_build_launch_network_interfaces(
     assert_that(lt_network_interfaces).is_equal_to(expected_result)
 
 
+def test_compute_resource_launch_template_validator(aws_api_mock, get_region):
+    aws_api_mock.ec2.get_instance_type_info.return_value = InstanceTypeInfo({"InstanceType": "c5.xlarge"})
+    aws_api_mock.ec2.get_subnet_avail_zone.return_value = "us-east-1a"
+
+    def run_instances(**kwargs):
+        if kwargs["InstanceType"] == "c5n.18xlarge":
+            raise AWSClientError("run_instances", "No capacity", error_code="InsufficientInstanceCapacity")
+
+    aws_api_mock.ec2.run_instances.side_effect = run_instances
+    queues = [
+        SlurmQueue(
+            name=f"queue{index}",
+            networking=SlurmQueueNetworking(subnet_ids=["subnet-1"]),
+            compute_resources=[
+                SlurmComputeResource(name="cr1", instance_type="t2.micro"),
+                SlurmFlexibleComputeResource(
+                    [
+                        FlexibleInstanceType(instance_type="c5.xlarge"),
+                        FlexibleInstanceType(instance_type="c5n.18xlarge"),
+                    ],
+                    name="cr2",
+                ),
+            ],
+        )
+        for index in range(2)
+    ]
+
+    dry_runs = ComputeResourceLaunchTemplateValidator.build_dry_runs(
+        queues=queues,
+        os="alinux2",
+        ami_ids={"queue0": "ami-1", "queue1": "ami-1"},
+        tags=[],
+        imds_support="v2.0",
+    )
+
+    # Identical launch requests of the two queues are returned once, each one executed by its own validator
+    assert_that([dry_run["request"]["InstanceType"] for dry_run in dry_runs]).is_equal_to(
+        ["t2.micro", "c5.xlarge", "c5n.18xlarge"]
+    )
+    assert_that(dry_runs[2]["compute_resources"]).is_equal_to([("queue0", "cr2"), ("queue1", "cr2")])
+    actual_failures = []
+    for dry_run in dry_runs:
+        actual_failures.extend(ComputeResourceLaunchTemplateValidator().execute(**dry_run))
+
+    assert_that(aws_api_mock.ec2.run_instances.call_count).is_equal_to(3)
+    assert_that([failure.message for failure in actual_failures]).is_equal_to(
+        [
+            f"Compute resource cr2 in queue {queue_name}: There is not enough capacity to fulfill your request. "
+            "No capacity"
+            for queue_name in ["queue0", "queue1"]
+        ]
+    )
+
+
+def test_compute_resource_launch_template_validator_build_failure(aws_api_mock, get_region):
+    aws_api_mock.ec2.get_instance_type_info.side_effect = AWSClientError(
+        "describe_instance_types", "Invalid instance type"
+    )
+    queue = SlurmQueue(
+        name="queue1",
+        networking=SlurmQueueNetworking(subnet_ids=["subnet-1"]),
+        compute_resources=[SlurmComputeResource(name="cr1", instance_type="t2.invalid")],
+    )
+
+    dry_runs = ComputeResourceLaunchTemplateValidator.build_dry_runs(
+        queues=[queue], os="alinux2", ami_ids={"queue1": "ami-1"}, tags=[], imds_support="v2.0"
+    )
+
+    assert_that(dry_runs).is_length(1)
+    actual_failures = ComputeResourceLaunchTemplateValidator().execute(**dry_runs[0])
+    assert_failure_messages(
+        actual_failures, "Unable to validate configuration parameters for queue queue1. Invalid instance type"
+    )
+    aws_api_mock.ec2.run_instances.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "head_node_security_groups, queues, expect_warning",
     [